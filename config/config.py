@@ -21,18 +21,137 @@ MAX_PWM = 100  # Maximum PWM değeri
 MIN_PWM = 0    # Minimum PWM değeri
 BASLANGIC_HIZI = 50  # Başlangıç PWM değeri
 
+# Motor Sürücü Seçimi
+# "pwm": gerçek araç (değişmeyen çıkışlar yazılmaz, yazılım zamanlı PWM)
+# "gpiozero": gerçek araç (gpiozero Motor, yazılım PWM)
+# "null": donanımsız çalışma
+MOTOR_SURUCU = "pwm"
+MOTOR_PWM_FREKANS = 1000  # Hz
+# Denenecek gpiozero pin fabrikaları (sırayla); hiçbiri açılamazsa varsayılan kullanılır
+# Pi 5'te (RP1 GPIO) yalnızca "lgpio" çalışır; PWM'i yazılım zamanlıdır. "pigpio"
+# yalnızca Pi 4 ve öncesinde çalışır (DMA zamanlı PWM, pigpiod servisi gerekir)
+MOTOR_PIN_FABRIKALARI = ("lgpio",)
+
+# Motor ve Teker Özellikleri
+MOTOR_MAX_RPM = 280  # Tam PWM'de motor devri
+TEKER_CAPI = 6.5  # cm
+
+# Gecikme Telafisi (komut tabanlı ölü hesap)
+GECIKME_TELAFISI = True  # Şerit sapması motor komutunun uygulanacağı ana taşınır
+MOTOR_AKTUASYON_GECIKMESI = 0.02  # saniye (komuttan teker tepkisinin başlamasına)
+ODOMETRI_MOTOR_ZAMAN_SABITI = 0.08  # saniye (teker hızının komuta yaklaşma süresi)
+
+# Algı Bekçisi (src/control/perception_watchdog.py)
+# Son kare / şerit tespiti eskidikçe hız düşürülür, sınır aşılınca motorlar durdurulur
+BEKCI_AKTIF = True
+BEKCI_KONTROL_ARALIGI = 0.02  # saniye (bekçinin yaşları denetleme aralığı)
+BEKCI_SURELERI = {  # kaynak: (yavaşlamaya başlama, durdurma) saniye
+    'kare': (0.25, 0.75),
+    'serit': (0.5, 1.5)
+}
+BEKCI_MIN_HIZ_CARPANI = 0.3  # Durdurma sınırına yaklaşırken inilen en düşük hız çarpanı
+
+# Acil Durdurma (src/control/emergency_stop.py)
+# Sinyal, algı bekçisi veya API ile tetiklenir; motorlar ayrı iş parçacığından doğrudan durdurulur
+ACIL_DURUS_SURE_SINIRI = 0.01  # saniye (tetiklemeden çıkışların sıfırlanmasına izin verilen en uzun süre)
+ACIL_DURUS_KILIT_BEKLEMESI = 0.05  # saniye (doğrudan yazmadan sonra motor kilidiyle teyit için en fazla bekleme)
+ACIL_DURUS_ONCELIGI = 50  # SCHED_FIFO önceliği (yetki yoksa normal öncelikle çalışır; 0 ise değiştirilmez)
+
 # Kamera Ayarları
 KAMERA_COZUNURLUK = (640, 480)
-KAMERA_FPS = 30
-KAMERA_EXPOSURE = 'auto'
+KAMERA_ALGILAMA_COZUNURLUK = (320, 240)  # ISP'de ölçeklenen YUV akışı (dedektörler; None ise ana akış küçültülür)
+ALGILAMA_RENK_UZAYI = 'bgr'  # 'bgr' veya 'yuv' (dedektörler YUV akışının Y/UV düzlemlerinde, BGR/HSV dönüşümü olmadan çalışır)
+KAMERA_FPS = 30  # Sensör kare süresi bu hıza sabitlenir (FrameDurationLimits)
+KAMERA_POZLAMA_MODU = 'otomatik'  # 'otomatik' (üst sınırlı), 'sabit' veya 'kilitli' (yakınsayınca sabitlenir)
+KAMERA_MAX_POZLAMA = 10000  # µs (otomatik modda pozlama üst sınırı; aşılırsa kazanç artırılır)
+KAMERA_POZLAMA_SURESI = 6000  # µs (sabit mod pozlama süresi)
+KAMERA_KAZANC = 2.0  # Analog kazanç (sabit mod)
+KAMERA_YAKINSAMA_SURESI = 3.0  # saniye (kilitli modda pozlama yakınsamazsa bu süre sonunda kilitlenir)
+
+# Kamera Montaj Geometrisi
+KAMERA_YUKSEKLIK = 25  # cm (zeminden lens merkezine)
+KAMERA_EGIM = 15  # derece (yataydan aşağı doğru)
+KAMERA_YATAY_GORUS_ACISI = 66  # derece (Camera Module 3 standart lens)
+KAMERA_ILERI_KONUM = 10  # cm (araç merkezinden ileri)
+
+# Uyarlanabilir Kalite (src/utils/quality_governor.py)
+# Seviyeler yüksekten düşüğe: olcek çalışma çözünürlüğü çarpanı, on_isleme
+# 'tam' (bulanıklaştırma + CLAHE), 'hafif' (yalnızca bulanıklaştırma) veya 'yok',
+# isik_araligi trafik ışığı dedektörünün kaç karede bir çalışacağı
+KALITE_SEVIYELERI = (
+    {'ad': 'yuksek', 'olcek': 1.0, 'on_isleme': 'tam', 'isik_araligi': 1},
+    {'ad': 'orta', 'olcek': 1.0, 'on_isleme': 'hafif', 'isik_araligi': 2},
+    {'ad': 'dusuk', 'olcek': 0.75, 'on_isleme': 'hafif', 'isik_araligi': 3},
+    {'ad': 'en_dusuk', 'olcek': 0.5, 'on_isleme': 'yok', 'isik_araligi': 4}
+)
+KALITE_YONETICISI = True
+HEDEF_DONGU_HIZI = 20  # Hz (algılama süresi bütçesi 1/HEDEF_DONGU_HIZI)
+KALITE_DEGERLENDIRME_ARALIGI = 2.0  # saniye
+KALITE_YUKSELTME_BEKLEMESI = 10.0  # saniye (son değişiklikten sonra üst seviyeye çıkmadan önce)
+KALITE_ASIM_ORANI = 0.2  # Bütçeyi aşan kare oranı bu değeri geçerse seviye düşer
+KALITE_SICAKLIK_UYARI = 75  # °C (Pi 5 80 °C'de kısmaya başlar)
+KALITE_SICAKLIK_KRITIK = 82  # °C (doğrudan en düşük seviyeye inilir)
+KALITE_CPU_SINIRI = 0.9  # Toplam CPU kullanım oranı
 
 # Görüntü İşleme Parametreleri
 SERIT_HSV_ALT = (0, 0, 200)  # Beyaz şerit için HSV alt sınır
 SERIT_HSV_UST = (180, 30, 255)  # Beyaz şerit için HSV üst sınır
+SERIT_YUV_Y_MIN = 190  # Beyaz şerit için Y alt sınırı (ALGILAMA_RENK_UZAYI = 'yuv'; ön işlemesiz karelerde HSV eşiğiyle birebir)
+SERIT_YUV_RENK_MAX = 15  # Beyaz şerit için U ve V'nin 128'den en fazla sapması
+
+# Şerit Algılama Motoru (src/detection/lane_engines.py)
+# "satir_ortalamasi": maskenin her satırında beyaz piksel ortalaması
+# "kayan_pencere": alt yarı histogramından başlayan kayan pencere takibi
+# "hough": gri görüntüde Canny kenarları ve olasılıksal Hough doğru parçaları
+SERIT_MOTORU = "satir_ortalamasi"
+SERIT_PENCERE_SAYISI = 9  # Kayan pencere: dikey pencere sayısı
+SERIT_PENCERE_PAYI = 0.08  # Kayan pencere: pencere yarı genişliği (kare genişliğine oran)
+SERIT_PENCERE_MIN_PIKSEL = 20  # Kayan pencere: merkezi kaydırmak için gereken en az piksel
+SERIT_HOUGH_ESIGI = 20  # Hough: bir doğru için gereken en az oy
+SERIT_HOUGH_MIN_UZUNLUK = 0.05  # Hough: en kısa doğru parçası (kare genişliğine oran)
+SERIT_HOUGH_MAX_BOSLUK = 0.03  # Hough: birleştirilecek en büyük boşluk (kare genişliğine oran)
+SERIT_HOUGH_MIN_EGIM = 0.3  # Hough: |dy/dx| bundan küçük (yataya yakın) parçalar atılır
+
+# Kalibrasyon (src/utils/calibration_tool.py)
+KALIBRASYON_PROFILI = "config/kalibrasyon_profili.json"  # Canlı ayarlanan eşikler ve noktalar
+KALIBRASYON_ONIZLEME_FPS = 10  # Önizleme pencerelerinin güncellenme hızı
+KALIBRASYON_ONIZLEME_OLCEK = 0.5  # Önizleme pencerelerinin çözünürlük çarpanı
 
 # Nesne Tanıma Parametreleri
 TRAFIK_ISIGI_MIN_BOYUT = (20, 40)  # piksel
 TRAFIK_ISIGI_MAX_BOYUT = (100, 200)  # piksel
+ISIK_LAMBA_CAPI = 8  # cm (mesafe tahmininde lambanın gerçek boyutu)
+ISIK_LAMBA_YUKSEKLIKLERI = {  # cm (zeminden lamba merkezine; pistteki ışığa göre ölçülmeli)
+    'kirmizi': 39,
+    'sari': 30,
+    'yesil': 21
+}
+ISIK_YUV_ARALIKLARI = {  # YUV alt ve üst sınırlar (ALGILAMA_RENK_UZAYI = 'yuv'; kontrol sırası kırmızı, sarı, yeşil)
+    'kirmizi': [((0, 70, 165), (255, 135, 255))],
+    'sari': [((100, 15, 135), (255, 100, 200))],
+    'yesil': [((60, 30, 0), (255, 130, 120))]
+}
+
+# Tabela Renk Önerisi (kenar/şekil analizi yalnızca tabela renkli bölgelerde yapılır)
+TABELA_RENK_ONERISI = False  # Fark testinde referansla birebir olmadıkça açılmaz
+TABELA_ONERI_RENK_KENARI = False  # Öneri bölgesinin renk maskesi Canny kenarlarına eklensin mi
+TABELA_RENK_ARALIKLARI = {  # HSV alt ve üst sınırlar
+    'kirmizi': [((0, 100, 70), (10, 255, 255)), ((170, 100, 70), (180, 255, 255))],
+    'mavi': [((100, 120, 50), (130, 255, 255))]
+}
+TABELA_YUV_ARALIKLARI = {  # YUV alt ve üst sınırlar (ALGILAMA_RENK_UZAYI = 'yuv')
+    'kirmizi': [((20, 65, 160), (255, 135, 255))],
+    'mavi': [((0, 145, 0), (255, 255, 150))]
+}
+TABELA_ONERI_OLCEK = 0.5  # Renk maskesinin hesaplandığı çözünürlük çarpanı
+
+# Tabela Takibi (src/detection/sign_tracker.py)
+TABELA_TAKIBI = True
+TABELA_TAM_TESPIT_ARALIGI = 5  # Tam kare tespitinin kaç karede bir çalışacağı (arada pencerede doğrulama)
+TABELA_ONAY_SAYISI = 3  # Tabelanın onaylanması için gereken isabet
+TABELA_KAYIP_SINIRI = 3  # Bu kadar ardışık karede bulunamayan iz silinir
+TABELA_IOU_ESIGI = 0.3  # Tespit-iz eşleşmesi için en düşük IoU
+TABELA_PENCERE_PAYI = 0.5  # Doğrulama penceresinin tahmini kutuya göre her yöndeki payı
 
 # Mesafe ve Güvenlik Parametreleri
 MIN_DURMA_MESAFESI = 50  # cm (trafik ışığı için)
@@ -45,13 +164,78 @@ PARK_YERI_MIN_DERINLIK = 40  # cm
 YAYA_GECIDI_BEKLEME_SURESI = 5  # saniye
 HEMZEMIN_GECIT_BEKLEME_SURESI = 5  # saniye
 
+# Hata Ayıklama Yayını (src/utils/debug_stream.py)
+DEBUG_YAYINI = False  # Açıkken sürüş döngüsünün kareleri MJPEG olarak yayınlanır
+DEBUG_YAYIN_ADRESI = "127.0.0.1"  # Başka bilgisayardan izlemek için "0.0.0.0"
+DEBUG_YAYIN_PORTU = 8080
+DEBUG_YAYIN_FPS = 5  # Yayına aktarılan en yüksek kare hızı
+DEBUG_YAYIN_JPEG_KALITESI = 70
+
+# Kara Kutu Kayıt (src/utils/frame_recorder.py)
+KAYIT_AKTIF = True
+KAYIT_DIZINI = "logs/kayitlar"
+KAYIT_FPS = 10  # Kaydedilen en yüksek kare hızı
+KAYIT_PENCERE_SURESI = 10.0  # saniye (olay öncesi bellekte tutulan süre)
+KAYIT_OLAY_SONRASI_SURESI = 2.0  # saniye (olaydan sonra arşive eklenen süre)
+KAYIT_KUYRUK_BOYUTU = 32  # Kodlanmayı bekleyen en fazla kare (dolunca en eskisi düşer)
+KAYIT_PARCA_KARE_SAYISI = 100  # Arşiv parçası başına kare
+KAYIT_JPEG_KALITESI = 80
+KAYIT_SUREKLI = False  # True ise tüm sürüş parça parça arşivlenir
+KAYIT_MAX_BOYUT_MB = 500  # Kayıt dizini sınırı (aşılırsa en eski arşivler silinir)
+KAYIT_SAPMA_ESIGI = 200  # piksel (tam çözünürlük; aşılırsa şeritten çıkma olayı)
+KAYIT_OLAY_ARALIGI = 10.0  # saniye (aynı tür olaylar arası en kısa süre)
+
+# Çalışma Anında Profil Alma (SIGUSR1: cProfile, SIGUSR2: örnekleme; tekrar gönderilince durur)
+PROFIL_DIZINI = "logs/profil"
+PROFIL_ORNEKLEME_ARALIGI = 0.005  # saniye (örnekleyici yığın okuma aralığı)
+PROFIL_RAPOR_SATIRI = 40  # Özet raporlarda listelenen fonksiyon sayısı
+ASAMA_ORNEK_SAYISI = 500  # Aşama zamanlayıcısında aşama başına tutulan son ölçüm
+
+# Uzun Süreli Dayanıklılık Testi (src/utils/soak_test.py)
+SOAK_ORNEK_ARALIGI = 10.0  # saniye (bellek, döngü hızı ve GC ölçüm penceresi)
+SOAK_ISINMA_SURESI = 60.0  # saniye (tampon ve önbelleklerin dolması; eğilime katılmaz)
+SOAK_MAX_RSS_ARTISI = 20.0  # MB (ısınmadan sonra test boyunca izin verilen RSS eğilimi)
+SOAK_MAX_SURE_ARTISI = 0.2  # Döngü işlem süresindeki eğilimin başlangıca oranı
+SOAK_MAX_HIZ_DUSUSU = 0.2  # Döngü hızındaki düşüş eğiliminin başlangıca oranı
+SOAK_TRACEMALLOC = True  # Bellek ayırma kaynakları izlensin mi (döngüyü yavaşlatır)
+SOAK_TRACEMALLOC_DERINLIK = 5  # Ayırma başına saklanan yığın derinliği
+SOAK_SENTETIK_HIZ = 30.0  # cm/s (sentetik karelerde aracın pist üzerindeki hızı)
+SOAK_MAX_KAYIT_KARESI = 1000  # Kayıttan belleğe yüklenen en fazla kare
+
+# Dedektör Fark Testi (src/utils/detector_diff.py)
+FARK_REFERANS_REVIZYONU = "5f949f3"  # Referans dedektörlerin alındığı git revizyonu (optimizasyonlardan önceki commit) veya dondurulmuş kopyanın kök dizini
+FARK_KARE_SAYISI = 300  # Sentetik karelerin sayısı (pist bir tur taranır)
+FARK_SERIT_TOLERANSI = 1.0  # piksel (ROI satırlarında şerit eğrileri arasındaki en büyük fark)
+FARK_SAPMA_TOLERANSI = 1.0  # piksel (ROI alt satırındaki şerit merkezi farkı)
+FARK_ISIK_TOLERANSI = 2.0  # piksel (ışık merkezi farkı; durumlar birebir aynı olmalı)
+FARK_TABELA_TOLERANSI = 2.0  # piksel (eşleşen tabela kutularının kenar farkı)
+
 # Log Ayarları
 LOG_DOSYA = "logs/otonom_arac.log"
 LOG_SEVIYESI = "INFO"
+LOG_KUYRUK_BOYUTU = 10000  # Bekleyen maksimum mesaj (dolarsa yenileri düşürülür)
+LOG_TOPLU_YAZMA_BOYUTU = 256  # Tek yazmada maksimum mesaj
+LOG_YAZMA_ARALIGI = 1.0  # saniye (dosyaya en geç bu aralıkla yazılır)
+LOG_TEKRAR_ARALIGI = 5.0  # saniye (aynı mesaj metni en fazla bu aralıkla yazılır)
+LOG_ANAHTAR_MIN_ARALIK = 0.5  # saniye (aynı `anahtar` ile bağlanmış mesajlar arası minimum süre)
 
 # Park Yeri Renk Kodları (BGR)
 PARK_YERI_RENKLER = {
     'kirmizi': ([0, 0, 100], [80, 80, 255]),  # BGR alt ve üst sınırlar
     'mavi': ([100, 0, 0], [255, 80, 80]),
     'yesil': ([0, 100, 0], [80, 255, 80])
-} 
\ No newline at end of file
+}
+
+# Park Yeri Algılama (src/detection/parking_detector.py)
+PARK_ALGILAMA = True
+PARK_TARAMA_ARALIGI = (50, 100)  # cm (ileri mesafe bandı; araç ilerledikçe yalnızca yeni şerit taranır)
+PARK_MIN_PIKSEL = 10  # Taranan şeritte bileşen başına en az renkli piksel
+PARK_BIRLESTIRME_PAYI = 5  # cm (şerit parçaları arası bu kadar boşluk varsa da aynı yer sayılır)
+PARK_HARITA_UZUNLUGU = 500  # cm (aracın bu kadar gerisinde kalan yerler haritadan silinir)
+
+# Simülasyon Ayarları (src/simulation)
+SIM_DUZ_UZUNLUK = 200  # cm (oval pistin düz kısımları)
+SIM_VIRAJ_YARICAPI = 100  # cm (pist orta çizgisinin viraj yarıçapı)
+SIM_KESIKLI_CIZGI = (20, 10)  # cm (orta çizgi periyodu ve dolu kısım uzunluğu)
+SIM_MOTOR_ZAMAN_SABITI = 0.08  # saniye (teker hızının komuta yaklaşma süresi)
+SIM_ISIK_DONGUSU = (("kirmizi", 3.0), ("yesil", 6.0), ("sari", 1.0))  # (durum, saniye)
@@ -5,34 +5,63 @@ import sys
 import signal
 from loguru import logger
 from src.control.vehicle_controller import VehicleController
+from src.utils.logging_setup import log_ayarla, log_kapat
+from src.utils.profiler import RuntimeProfiler
+
+# Sinyal yakalayıcının durduracağı araç kontrolcüsü (başlatılınca atanır)
+_controller = None
 
 def signal_handler(signum, frame):
-    """Sinyal yakalayıcı."""
-    logger.info("Program sonlandırılıyor...")
-    sys.exit(0)
+    """Sinyal yakalayıcı.
+    
+    Motorlar acil durdurma iş parçacığından hemen durdurulur; ana döngüden
+    normal kapanış istenir. Kontrolcü henüz yoksa veya ikinci sinyal gelirse
+    program doğrudan sonlandırılır.
+    
+    Sinyal ana iş parçacığı log yazarken gelebilir; loguru bu durumda
+    kilitlenmemek için hata verdiğinden burada log yazılmaz. Durdurma
+    nedeni acil durdurma iş parçacığında loglanır.
+    """
+    if _controller is None:
+        sys.exit(0)
+    _controller.acil_dur(f"sinyal_{signal.Signals(signum).name}")
+    if not _controller.calisiyor:
+        sys.exit(0)
+    _controller.durdur()
 
 def main():
     """Ana program."""
+    global _controller
+    profil = None
     try:
         # Sinyal yakalayıcıyı ayarla
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
         
         # Log ayarlarını yapılandır
-        logger.add("logs/otonom_arac.log",
-                  rotation="1 day",
-                  format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}")
+        log_ayarla()
         
         # Başlangıç mesajı
         logger.info("Otonom araç kontrol sistemi başlatılıyor...")
         
         # Araç kontrolcüsünü başlat
-        controller = VehicleController()
+        controller = _controller = VehicleController()
+        
+        # SIGUSR1/SIGUSR2 ile çalışma anında profil alma
+        profil = RuntimeProfiler(controller.zamanlayici, gecikme=controller.gecikme)
+        profil.sinyalleri_kur()
+        
         controller.calistir()
         
     except Exception as e:
         logger.error(f"Program hatası: {str(e)}")
         sys.exit(1)
+    finally:
+        # Açık kalan profilin raporunu yaz
+        if profil is not None:
+            profil.kapat()
+        # Kuyrukta bekleyen log mesajlarını diske yaz
+        log_kapat()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -1,59 +1,357 @@
 """
 Kamera Kontrol Modülü
 """
-import cv2
+import time
 import numpy as np
-from picamera2 import Picamera2
 from loguru import logger
+from src.camera.frame import Frame, YuvImage, i420_duzlemleri
+from src.utils.lazy_import import LazyModule
+from src.utils.buffer_pool import BufferPool
 from config.config import (
     KAMERA_COZUNURLUK,
+    KAMERA_ALGILAMA_COZUNURLUK,
+    ALGILAMA_RENK_UZAYI,
     KAMERA_FPS,
-    KAMERA_EXPOSURE
+    KAMERA_POZLAMA_MODU,
+    KAMERA_MAX_POZLAMA,
+    KAMERA_POZLAMA_SURESI,
+    KAMERA_KAZANC,
+    KAMERA_YAKINSAMA_SURESI
 )
 
+# OpenCV ilk kullanımda yüklenir
+cv2 = LazyModule("cv2")
+
+# Sensör zaman damgası teslim anından bu kadar farklıysa saat tabanı farklı sayılır
+_MAX_SENSOR_SAPMASI = 1.0  # saniye
+
+_POZLAMA_MODLARI = ('otomatik', 'sabit', 'kilitli')
+
+# Otomatik modda üst sınıra sabitlenen pozlama, kazanç bu değere inince serbest bırakılır
+_SERBEST_BIRAKMA_KAZANCI = 1.05
+
+# Ölçülen kare süresi bu karede bir kez istenenle karşılaştırılır
+_KARE_SURESI_KONTROLU = 30
+_KARE_SURESI_TOLERANSI = 0.05  # İstenen süreye göre izin verilen sapma oranı
+
 class CameraController:
     """Raspberry Pi Kamera kontrolü için sınıf."""
     
-    def __init__(self):
-        """Kamera ayarlarını başlatır."""
+    def __init__(self, buffer_havuzu=None):
+        """Kamera ayarlarını başlatır.
+        
+        Args:
+            buffer_havuzu (BufferPool): Ara görüntüler için ortak tampon havuzu
+        """
         try:
+            self._tampon_ayarla(buffer_havuzu)
+            
+            # Picamera2 yalnızca gerçek kamera açılırken yüklenir
+            from picamera2 import Picamera2
+            
+            self._pozlama_ayarla(KAMERA_POZLAMA_MODU)
+            
             self.camera = Picamera2()
             
-            # Kamera konfigürasyonu
-            config = self.camera.create_still_configuration(
-                main={"size": KAMERA_COZUNURLUK},
-                controls={"FrameRate": KAMERA_FPS,
-                         "ExposureTime": KAMERA_EXPOSURE}
+            # Sürekli akış için video konfigürasyonu: kare süresi sensörde
+            # sabitlenir, capture_request bekleyen eski kare yerine bir
+            # sonraki kareyi verir (queue=False). Dedektörler için ISP'de
+            # ölçeklenen ikinci (lores, YUV420) akış açılır. Picamera2'nin
+            # "RGB888" biçimi bellekte B, G, R sırasındadır; kare OpenCV'ye
+            # dönüştürülmeden verilir.
+            lores = None
+            if self.dusuk_cozunurluk is not None:
+                lores = {"size": self.dusuk_cozunurluk, "format": "YUV420"}
+            config = self.camera.create_video_configuration(
+                main={"size": KAMERA_COZUNURLUK, "format": "RGB888"},
+                lores=lores,
+                controls=self._baslangic_kontrolleri(),
+                queue=False
             )
             self.camera.configure(config)
+            if lores is not None:
+                # ISP satırları hizalayabilir; kopyalarken satır adımı atlanır
+                self._yuv_adimi = self.camera.camera_config["lores"]["stride"]
             
             # Kamerayı başlat
             self.camera.start()
             
-            logger.info("Kamera sistemi başlatıldı")
+            logger.info(f"Kamera sistemi başlatıldı (pozlama: {self.pozlama_modu}, "
+                        f"kare süresi {self.kare_suresi_us} µs, "
+                        f"algılama akışı: {self.dusuk_cozunurluk or 'yok'})")
             
         except Exception as e:
             logger.error(f"Kamera başlatılamadı: {str(e)}")
             raise
     
-    def capture_frame(self):
-        """Kameradan bir kare yakalar ve numpy dizisi olarak döndürür.
+    def _pozlama_ayarla(self, mod):
+        """Pozlama modunu ve mod durumunu hazırlar.
+        
+        Args:
+            mod (str): 'otomatik', 'sabit' veya 'kilitli'
+        """
+        if mod not in _POZLAMA_MODLARI:
+            raise ValueError(f"Geçersiz pozlama modu: {mod}")
+        self.pozlama_modu = mod
+        self.kare_suresi_us = int(round(1e6 / KAMERA_FPS))
+        
+        # Otomatik mod: pozlama üst sınıra sabitlendi mi
+        self.pozlama_sinirda = False
+        # Kilitli mod: kilitlenme durumu ve yakınsama için son süre
+        self.pozlama_kilitli = False
+        self._kilit_zamani = time.monotonic() + KAMERA_YAKINSAMA_SURESI
+    
+    def _baslangic_kontrolleri(self):
+        """Pozlama moduna göre başlangıç kamera kontrollerini oluşturur.
         
         Returns:
-            numpy.ndarray: BGR formatında görüntü verisi
+            dict: libcamera kontrolleri
+        """
+        # Alt ve üst sınır aynı: sensör sabit kare hızında çalışır ve
+        # otomatik pozlama kare süresinden uzun pozlama seçemez
+        kontroller = {"FrameDurationLimits": (self.kare_suresi_us, self.kare_suresi_us)}
+        
+        if self.pozlama_modu == 'sabit':
+            pozlama = min(KAMERA_POZLAMA_SURESI, self.kare_suresi_us)
+            if pozlama < KAMERA_POZLAMA_SURESI:
+                logger.warning(f"Pozlama süresi kare süresine indirildi: {pozlama} µs")
+            kontroller.update({"AeEnable": False, "ExposureTime": pozlama,
+                               "AnalogueGain": KAMERA_KAZANC})
+        else:
+            kontroller["AeEnable"] = True
+        return kontroller
+    
+    def _pozlamayi_izle(self, metadata):
+        """Kare metadata'sına göre pozlama modunu uygular.
+        
+        Otomatik modda pozlama `KAMERA_MAX_POZLAMA` değerini aşarsa bu değere
+        sabitlenir (otomatik kazanç açık kaldığından eksik ışık kazançla
+        telafi edilir); kazanç en alta inince pozlama yeniden serbest
+        bırakılır. Kilitli modda otomatik pozlama yakınsadığında (AeLocked)
+        veya `KAMERA_YAKINSAMA_SURESI` dolduğunda o anki pozlama, kazanç ve
+        renk kazançları sabitlenir.
+        
+        Args:
+            metadata (dict): Kare metadata'sı
+        """
+        if self.pozlama_modu == 'otomatik':
+            pozlama = metadata.get("ExposureTime")
+            if pozlama is None:
+                return
+            if not self.pozlama_sinirda and pozlama > KAMERA_MAX_POZLAMA:
+                self.camera.set_controls({"ExposureTime": KAMERA_MAX_POZLAMA})
+                self.pozlama_sinirda = True
+                logger.info(f"Pozlama üst sınıra sabitlendi: {pozlama} -> "
+                            f"{KAMERA_MAX_POZLAMA} µs")
+            elif self.pozlama_sinirda and \
+                    metadata.get("AnalogueGain", _SERBEST_BIRAKMA_KAZANCI) < _SERBEST_BIRAKMA_KAZANCI:
+                self.camera.set_controls({"ExposureTime": 0})
+                self.pozlama_sinirda = False
+                logger.info("Pozlama sınırı kaldırıldı")
+        
+        elif self.pozlama_modu == 'kilitli' and not self.pozlama_kilitli:
+            if not metadata.get("AeLocked") and time.monotonic() < self._kilit_zamani:
+                return
+            if "ExposureTime" not in metadata or "AnalogueGain" not in metadata:
+                return
+            kontroller = {"AeEnable": False,
+                          "ExposureTime": metadata["ExposureTime"],
+                          "AnalogueGain": metadata["AnalogueGain"]}
+            if "ColourGains" in metadata:
+                kontroller.update({"AwbEnable": False, "ColourGains": metadata["ColourGains"]})
+            self.camera.set_controls(kontroller)
+            self.pozlama_kilitli = True
+            logger.info(f"Pozlama kilitlendi: {metadata['ExposureTime']} µs, "
+                        f"kazanç {metadata['AnalogueGain']:.2f}"
+                        + ("" if metadata.get("AeLocked") else " (yakınsama beklenmedi)"))
+    
+    def _kare_suresini_dogrula(self, metadata):
+        """Sensörün bildirdiği kare süresini istenenle karşılaştırır."""
+        sure = metadata.get("FrameDuration")
+        if sure is None:
+            return
+        if abs(sure - self.kare_suresi_us) > self.kare_suresi_us * _KARE_SURESI_TOLERANSI:
+            logger.warning(f"Kare süresi istenenden farklı: {sure} µs "
+                           f"(istenen {self.kare_suresi_us} µs)")
+        else:
+            logger.info(f"Kare süresi doğrulandı: {sure} µs")
+    
+    def _tampon_ayarla(self, buffer_havuzu):
+        """Tampon havuzunu ve kare başına kullanılan nesneleri hazırlar."""
+        self.tamponlar = buffer_havuzu if buffer_havuzu is not None else BufferPool()
+        self.kare_sayisi = 0
+        self._saat_uyarisi = False
+        
+        kare = self.tamponlar.kare_boyutu
+        kanal = self.tamponlar.maske_boyutu
+        self.tamponlar.onceden_ayir({
+            'kamera_bgr': kare,
+            'kamera_blur': kare,
+            'kamera_lab': kare,
+            'kamera_l': kanal,
+            'kamera_cl': kanal,
+            'kamera_onislenmis': kare
+        })
+        
+        # Düşük çözünürlüklü algılama akışı (I420: Y düzlemi + yarım U ve V)
+        self.dusuk_cozunurluk = tuple(KAMERA_ALGILAMA_COZUNURLUK) \
+            if KAMERA_ALGILAMA_COZUNURLUK else None
+        if self.dusuk_cozunurluk is not None:
+            genislik, yukseklik = self.dusuk_cozunurluk
+            self._yuv_adimi = genislik
+            self.tamponlar.onceden_ayir({
+                'kamera_yuv': (yukseklik * 3 // 2, genislik),
+                'kamera_algilama': (yukseklik, genislik, 3)
+            })
+        
+        # CLAHE nesnesi her karede yeniden oluşturulmaz
+        self.clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8, 8))
+    
+    def kare_yakala(self):
+        """Kameradan bir kare ve sensör zaman damgasını yakalar.
+        
+        Returns:
+            Frame: BGR görüntü (`make_array` kopyası; istek serbest
+                bırakıldıktan sonra da geçerlidir), sensör zamanı ve kamera
+                metadata'sı; hata durumunda None
         """
         try:
-            frame = self.camera.capture_array()
-            return cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+            istek = self.camera.capture_request()
+            try:
+                bgr = istek.make_array("main")
+                metadata = istek.get_metadata()
+                yuv = None
+                if self.dusuk_cozunurluk is not None:
+                    yuv = self._yuv_kopyala(istek.make_array("lores"))
+            finally:
+                istek.release()
+            teslim = time.monotonic()
+            
+            self.kare_sayisi += 1
+            self._pozlamayi_izle(metadata)
+            if self.kare_sayisi == _KARE_SURESI_KONTROLU:
+                self._kare_suresini_dogrula(metadata)
+            return Frame(bgr, self._sensor_zamani(metadata, teslim), teslim,
+                         self.kare_sayisi, metadata, yuv)
         except Exception as e:
             logger.error(f"Kare yakalanamadı: {str(e)}")
             return None
     
+    def _yuv_kopyala(self, dizi):
+        """ISP'nin satır adımlı YUV420 dizisini sıkışık I420 havuz tamponuna kopyalar.
+        
+        Args:
+            dizi (numpy.ndarray): `make_array("lores")` çıktısı
+            
+        Returns:
+            numpy.ndarray: (yükseklik * 3 / 2, genişlik) I420 görüntü (havuz tamponu)
+        """
+        genislik, yukseklik = self.dusuk_cozunurluk
+        adim = self._yuv_adimi
+        kaynak = dizi.reshape(-1)
+        hedef = self.tamponlar.al('kamera_yuv', (yukseklik * 3 // 2, genislik))
+        duz = hedef.reshape(-1)
+        
+        # Y düzlemi
+        np.copyto(hedef[:yukseklik],
+                  kaynak[:yukseklik * adim].reshape(yukseklik, adim)[:, :genislik])
+        
+        # U ve V düzlemleri (yarım çözünürlük, yarım satır adımı)
+        yarim_h, yarim_w, yarim_adim = yukseklik // 2, genislik // 2, adim // 2
+        ceyrek, kaynak_ceyrek = yarim_h * yarim_w, yarim_h * yarim_adim
+        for i in range(2):
+            bas = yukseklik * adim + i * kaynak_ceyrek
+            hedef_bas = genislik * yukseklik + i * ceyrek
+            np.copyto(duz[hedef_bas:hedef_bas + ceyrek].reshape(yarim_h, yarim_w),
+                      kaynak[bas:bas + kaynak_ceyrek].reshape(yarim_h, yarim_adim)[:, :yarim_w])
+        return hedef
+    
+    def _isp_benzet(self, bgr):
+        """Düşük çözünürlüklü ISP akışını BGR ana görüntüden üretir (simüle ve kayıtlı kameralar).
+        
+        Args:
+            bgr (numpy.ndarray): Ana akış görüntüsü
+            
+        Returns:
+            numpy.ndarray: I420 görüntü (havuz tamponu; akış kapalıysa None)
+        """
+        if self.dusuk_cozunurluk is None:
+            return None
+        genislik, yukseklik = self.dusuk_cozunurluk
+        kucuk = cv2.resize(bgr, self.dusuk_cozunurluk, interpolation=cv2.INTER_AREA,
+                           dst=self.tamponlar.al('kamera_isp', (yukseklik, genislik, 3)))
+        return cv2.cvtColor(kucuk, cv2.COLOR_BGR2YUV_I420,
+                            dst=self.tamponlar.al('kamera_yuv', (yukseklik * 3 // 2, genislik)))
+    
+    def algilama_karesi(self, kare, olcek=1.0, renk_uzayi=ALGILAMA_RENK_UZAYI):
+        """Dedektörlerin kullanacağı görüntüyü hazırlar.
+        
+        Düşük çözünürlüklü akış varsa görüntü ISP'de ölçeklenmiş YUV kareden
+        elde edilir; tam çözünürlüklü ana görüntü küçültülmez. 'yuv' modunda
+        düzlemler BGR'ye dönüştürülmeden `YuvImage` olarak verilir.
+        
+        Args:
+            kare (Frame): Kamera karesi
+            olcek (float): Kalite seviyesinin çözünürlük çarpanı
+            renk_uzayi (str): 'bgr' veya 'yuv'
+            
+        Returns:
+            tuple: (goruntu, olcek) - Çalışma çözünürlüğündeki BGR görüntü veya
+                `YuvImage` (havuz tamponu) ve bu görüntünün ana akışa göre ölçeği
+        """
+        if renk_uzayi == 'yuv':
+            frame = self.olcekle(self._yuv_goruntusu(kare), olcek)
+        elif kare.yuv is None:
+            frame = self.olcekle(kare.goruntu, olcek)
+        else:
+            genislik, yukseklik = kare.dusuk_cozunurluk()
+            bgr = cv2.cvtColor(kare.yuv, cv2.COLOR_YUV2BGR_I420,
+                               dst=self.tamponlar.al('kamera_algilama',
+                                                     (yukseklik, genislik, 3)))
+            frame = self.olcekle(bgr, olcek)
+        return frame, frame.shape[1] / kare.goruntu.shape[1]
+    
+    def _yuv_goruntusu(self, kare):
+        """Karenin YUV düzlemleri; düşük çözünürlüklü akış yoksa ana görüntü bir kez dönüştürülür."""
+        if kare.yuv is not None:
+            return kare.yuv_goruntusu()
+        yukseklik, genislik = kare.goruntu.shape[:2]
+        i420 = cv2.cvtColor(kare.goruntu, cv2.COLOR_BGR2YUV_I420,
+                            dst=self.tamponlar.al('kamera_yuv_tam',
+                                                  (yukseklik * 3 // 2, genislik)))
+        return YuvImage(*i420_duzlemleri(i420))
+    
+    def _sensor_zamani(self, metadata, teslim):
+        """SensorTimestamp (ns) değerini `time.monotonic` saniyesine çevirir.
+        
+        Metadata'da yoksa veya saat tabanı uyuşmuyorsa teslim zamanı kullanılır;
+        bu durumda ölçülen gecikmeler sensör-teslim süresini içermez.
+        """
+        zaman = metadata.get("SensorTimestamp")
+        if zaman is not None:
+            zaman = zaman / 1e9
+            if 0.0 <= teslim - zaman <= _MAX_SENSOR_SAPMASI:
+                return zaman
+        if not self._saat_uyarisi:
+            self._saat_uyarisi = True
+            logger.warning("Sensör zaman damgası kullanılamıyor, teslim zamanı kullanılacak")
+        return teslim
+    
+    def capture_frame(self):
+        """Kameradan bir kare yakalar ve numpy dizisi olarak döndürür.
+        
+        Returns:
+            numpy.ndarray: BGR formatında görüntü verisi (havuz tamponu,
+                sonraki karede üzerine yazılır)
+        """
+        kare = self.kare_yakala()
+        return kare.goruntu if kare is not None else None
+    
     def apply_roi(self, frame, top_percent=60, bottom_percent=100):
         """Görüntüde ilgilenilen bölgeyi (ROI) belirler.
         
         Args:
-            frame (numpy.ndarray): İşlenecek görüntü
+            frame (numpy.ndarray): İşlenecek görüntü (BGR veya `YuvImage`)
             top_percent (int): Üstten başlama yüzdesi
             bottom_percent (int): Alttan bitiş yüzdesi
             
@@ -67,37 +365,107 @@ class CameraController:
         y_start = int(height * top_percent / 100)
         y_end = int(height * bottom_percent / 100)
         
+        if isinstance(frame, YuvImage):
+            # Renk düzlemleriyle hizalı kalması için sınırlar çift satıra yuvarlanır
+            y_start, y_end = y_start - y_start % 2, y_end - y_end % 2
+            return frame.kirp(0, y_start, frame.shape[1], y_end), (y_start, y_end)
+        
         return frame[y_start:y_end, :], (y_start, y_end)
     
-    def preprocess_frame(self, frame):
+    def olcekle(self, frame, olcek):
+        """Kareyi çalışma çözünürlüğüne küçültür.
+        
+        Args:
+            frame (numpy.ndarray): Kaynak görüntü (BGR veya `YuvImage`)
+            olcek (float): Çözünürlük çarpanı (1.0 ise kare olduğu gibi döner)
+            
+        Returns:
+            numpy.ndarray: Ölçeklenmiş görüntü (havuz tamponu)
+        """
+        if frame is None or olcek >= 1.0:
+            return frame
+        
+        yukseklik, genislik = frame.shape[:2]
+        if isinstance(frame, YuvImage):
+            # Renk düzlemleri yarım çözünürlükte kalacak şekilde boyut çift tutulur
+            boyut = (max(2, int(genislik * olcek)) & ~1, max(2, int(yukseklik * olcek)) & ~1)
+            yarim = (boyut[0] // 2, boyut[1] // 2)
+            return YuvImage(*(cv2.resize(duzlem, b, interpolation=cv2.INTER_AREA,
+                                         dst=self.tamponlar.al(ad, (b[1], b[0])))
+                              for duzlem, b, ad in ((frame.y, boyut, 'kamera_olcekli_y'),
+                                                    (frame.u, yarim, 'kamera_olcekli_u'),
+                                                    (frame.v, yarim, 'kamera_olcekli_v'))))
+        
+        boyut = (max(1, int(genislik * olcek)), max(1, int(yukseklik * olcek)))
+        hedef = self.tamponlar.al('kamera_olcekli', (boyut[1], boyut[0]) + frame.shape[2:])
+        return cv2.resize(frame, boyut, dst=hedef, interpolation=cv2.INTER_AREA)
+    
+    def preprocess_frame(self, frame, mod='tam'):
         """Görüntüyü ön işlemden geçirir.
         
         Args:
-            frame (numpy.ndarray): İşlenecek görüntü
+            frame (numpy.ndarray): İşlenecek görüntü (BGR veya `YuvImage`)
+            mod (str): 'tam' (bulanıklaştırma + kontrast), 'hafif' (yalnızca
+                bulanıklaştırma) veya 'yok'
             
         Returns:
-            numpy.ndarray: İşlenmiş görüntü
+            numpy.ndarray: İşlenmiş görüntü (havuz tamponu; girdiyle aynı tür)
         """
-        if frame is None:
-            return None
+        if frame is None or mod == 'yok':
+            return frame
+        if isinstance(frame, YuvImage):
+            return self._yuv_on_isle(frame, mod)
             
         try:
+            kare = frame.shape
+            kanal = frame.shape[:2]
+            
             # Gürültü azaltma
-            blurred = cv2.GaussianBlur(frame, (5, 5), 0)
+            blurred = cv2.GaussianBlur(frame, (5, 5), 0,
+                                       dst=self.tamponlar.al('kamera_blur', kare))
+            if mod == 'hafif':
+                return blurred
             
-            # Kontrast artırma
-            lab = cv2.cvtColor(blurred, cv2.COLOR_BGR2LAB)
-            l, a, b = cv2.split(lab)
-            clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8, 8))
-            cl = clahe.apply(l)
-            enhanced = cv2.merge((cl, a, b))
+            # Kontrast artırma (yalnızca L kanalı işlenir, split/merge yerine
+            # kanal yerinde güncellenir)
+            lab = cv2.cvtColor(blurred, cv2.COLOR_BGR2LAB,
+                               dst=self.tamponlar.al('kamera_lab', kare))
+            l = cv2.extractChannel(lab, 0, dst=self.tamponlar.al('kamera_l', kanal))
+            cl = self.clahe.apply(l, dst=self.tamponlar.al('kamera_cl', kanal))
+            cv2.insertChannel(cl, lab, 0)
             
-            return cv2.cvtColor(enhanced, cv2.COLOR_LAB2BGR)
+            return cv2.cvtColor(lab, cv2.COLOR_LAB2BGR,
+                                dst=self.tamponlar.al('kamera_onislenmis', kare))
             
         except Exception as e:
             logger.error(f"Görüntü ön işleme hatası: {str(e)}")
             return frame
     
+    def _yuv_on_isle(self, frame, mod):
+        """`preprocess_frame` karşılığı; renk dönüşümü olmadan düzlemlerde çalışır.
+        
+        Y düzlemi 5x5, yarım çözünürlüklü renk düzlemleri 3x3 çekirdekle
+        bulanıklaştırılır; 'tam' modda CLAHE yalnızca Y düzlemine uygulanır
+        (LAB'daki L kanalının karşılığı).
+        
+        Returns:
+            YuvImage: İşlenmiş görüntü (havuz tamponları)
+        """
+        try:
+            y = cv2.GaussianBlur(frame.y, (5, 5), 0,
+                                 dst=self.tamponlar.al('kamera_y_blur', frame.y.shape))
+            u = cv2.GaussianBlur(frame.u, (3, 3), 0,
+                                 dst=self.tamponlar.al('kamera_u_blur', frame.u.shape))
+            v = cv2.GaussianBlur(frame.v, (3, 3), 0,
+                                 dst=self.tamponlar.al('kamera_v_blur', frame.v.shape))
+            if mod == 'tam':
+                y = self.clahe.apply(y, dst=self.tamponlar.al('kamera_y_cl', y.shape))
+            return YuvImage(y, u, v)
+            
+        except Exception as e:
+            logger.error(f"YUV ön işleme hatası: {str(e)}")
+            return frame
+    
     def close(self):
         """Kamera sistemini kapatır."""
         try:
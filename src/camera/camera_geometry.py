@@ -0,0 +1,119 @@
+"""
+Kamera Geometrisi Modülü
+------------------------
+Aracın üzerine sabitlenmiş iğne deliği (pinhole) kamera modeli. Piksel
+koordinatları ile araç koordinat sistemi arasındaki dönüşümleri sağlar.
+
+Araç koordinat sistemi (cm): orijin araç merkezinin zemindeki izdüşümü,
+`ileri` aracın burnu yönünde, `sol` aracın soluna doğru, `yukari` zeminden
+yukarı doğrudur.
+"""
+import math
+import numpy as np
+from config.config import (
+    KAMERA_COZUNURLUK,
+    KAMERA_YUKSEKLIK,
+    KAMERA_EGIM,
+    KAMERA_YATAY_GORUS_ACISI,
+    KAMERA_ILERI_KONUM
+)
+
+
+class CameraGeometry:
+    """Montaj yüksekliği, eğim ve görüş açısından oluşan kamera modeli."""
+
+    def __init__(self, cozunurluk=KAMERA_COZUNURLUK, kamera_yuksekligi=KAMERA_YUKSEKLIK,
+                 egim=KAMERA_EGIM, yatay_gorus_acisi=KAMERA_YATAY_GORUS_ACISI,
+                 ileri_konum=KAMERA_ILERI_KONUM):
+        """
+        Args:
+            cozunurluk (tuple): Görüntü çözünürlüğü (genişlik, yükseklik)
+            kamera_yuksekligi (float): Lensin zeminden yüksekliği (cm)
+            egim (float): Optik eksenin yataydan aşağı eğimi (derece)
+            yatay_gorus_acisi (float): Yatay görüş açısı (derece)
+            ileri_konum (float): Kameranın araç merkezine göre ileri konumu (cm)
+        """
+        self.genislik, self.yukseklik = cozunurluk
+        self.kamera_yuksekligi = float(kamera_yuksekligi)
+        self.ileri_konum = float(ileri_konum)
+        self.egim = math.radians(egim)
+
+        self.odak = (self.genislik / 2) / math.tan(math.radians(yatay_gorus_acisi) / 2)
+        self.cx = (self.genislik - 1) / 2
+        self.cy = (self.yukseklik - 1) / 2
+
+        self._cos = math.cos(self.egim)
+        self._sin = math.sin(self.egim)
+
+    def olceklenmis(self, cozunurluk):
+        """Aynı montaj geometrisine sahip, farklı çözünürlüklü kamera modeli döndürür."""
+        oran = cozunurluk[0] / self.genislik
+        yeni = CameraGeometry.__new__(CameraGeometry)
+        yeni.__dict__.update(self.__dict__)
+        yeni.genislik, yeni.yukseklik = cozunurluk
+        yeni.odak = self.odak * oran
+        yeni.cx = (yeni.genislik - 1) / 2
+        yeni.cy = (yeni.yukseklik - 1) / 2
+        return yeni
+
+    @property
+    def ufuk_satiri(self):
+        """Yatay bakış doğrultusunun görüntüdeki satırı (görüntü dışında olabilir)."""
+        return self.cy - self.odak * math.tan(self.egim)
+
+    def zemin_koordinatlari(self, u, v, yukseklik=0.0):
+        """Piksellerin gösterdiği zemin (veya yatay düzlem) noktalarını hesaplar.
+
+        Args:
+            u (numpy.ndarray): Piksel sütunları
+            v (numpy.ndarray): Piksel satırları
+            yukseklik (float): Kesişilecek yatay düzlemin zeminden yüksekliği (cm);
+                0 zemin, örneğin trafik ışığı lambası için lamba merkezi yüksekliği
+
+        Returns:
+            tuple: (ileri, sol) - Araç koordinatlarında düzlem noktaları (cm);
+                ışını düzlemi kesmeyen pikseller için NaN
+        """
+        u = np.asarray(u, dtype=np.float32)
+        v = np.asarray(v, dtype=np.float32)
+
+        # Kamera koordinatlarında ışın (z optik eksen, y aşağı, x sağ)
+        x = (u - self.cx) / self.odak
+        y = (v - self.cy) / self.odak
+
+        # Araç koordinatlarına döndür
+        ileri = self._cos - y * self._sin
+        yukari = -self._sin - y * self._cos
+
+        # Işın boyunca düzleme kadar olan ölçek (yalnızca kameranın önünde geçerli)
+        fark = yukseklik - self.kamera_yuksekligi
+        with np.errstate(divide='ignore', invalid='ignore'):
+            olcek = np.where(yukari * fark > 0, fark / yukari, np.nan)
+
+        return (olcek * ileri + self.ileri_konum).astype(np.float32), \
+               (olcek * -x).astype(np.float32)
+
+    def projekte_et(self, ileri, sol, yukari):
+        """Araç koordinatlarındaki 3B noktaları görüntüye izdüşürür.
+
+        Args:
+            ileri (numpy.ndarray): İleri mesafe (cm)
+            sol (numpy.ndarray): Sola mesafe (cm)
+            yukari (numpy.ndarray): Zeminden yükseklik (cm)
+
+        Returns:
+            tuple: (u, v, derinlik) - Piksel koordinatları ve optik eksen boyunca
+                derinlik (cm); derinliği pozitif olmayan noktalar kameranın arkasındadır
+        """
+        ileri = np.asarray(ileri, dtype=np.float64) - self.ileri_konum
+        sol = np.asarray(sol, dtype=np.float64)
+        yukari = np.asarray(yukari, dtype=np.float64) - self.kamera_yuksekligi
+
+        derinlik = ileri * self._cos - yukari * self._sin
+        y = -ileri * self._sin - yukari * self._cos
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            u = self.cx + self.odak * -sol / derinlik
+            v = self.cy + self.odak * y / derinlik
+
+        return u, v, derinlik
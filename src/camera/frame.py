@@ -0,0 +1,148 @@
+"""
+Kare Modülü
+-----------
+Kameradan alınan görüntüyü zaman bilgileriyle birlikte taşır. Sensör zaman
+damgası karenin ışığı aldığı anı gösterir; kontrol döngüsünün gecikme
+telafisi, algı bekçisi ve motor komutlarının gecikme ölçümü bu zamanı
+kullanır.
+
+Kamera ISP'de ölçeklenmiş düşük çözünürlüklü akış verirse kare, ana
+görüntünün yanında bu akışın YUV420 (I420) düzlemlerini de taşır; ana
+görüntü kayıt ve hata ayıklama yayınında, düşük çözünürlüklü akış
+dedektörlerde kullanılır. `YuvImage` bu düzlemleri, BGR'ye dönüştürmeden
+çalışan dedektörlere (ALGILAMA_RENK_UZAYI = 'yuv') görüntü gibi taşır.
+
+Tüm zamanlar `time.monotonic` tabanındadır (Linux'ta CLOCK_MONOTONIC;
+libcamera'nın SensorTimestamp değeri de bu saattedir).
+"""
+import time
+from src.utils.lazy_import import LazyModule
+
+# OpenCV ilk kullanımda yüklenir
+cv2 = LazyModule("cv2")
+
+
+def i420_duzlemleri(dizi):
+    """Sıkışık I420 dizisinin Y, U ve V düzlemlerini (görünüm) ayırır.
+
+    Args:
+        dizi (numpy.ndarray): (yükseklik * 3 / 2, genişlik) I420 görüntü
+
+    Returns:
+        tuple: (y, u, v)
+    """
+    yukseklik, genislik = dizi.shape[0] * 2 // 3, dizi.shape[1]
+    ceyrek = (yukseklik // 2) * (genislik // 2)
+    duz = dizi.reshape(-1)[genislik * yukseklik:]
+    return (dizi[:yukseklik],
+            duz[:ceyrek].reshape(yukseklik // 2, genislik // 2),
+            duz[ceyrek:2 * ceyrek].reshape(yukseklik // 2, genislik // 2))
+
+
+class Frame:
+    """Görüntü ve yakalama zamanlarını birlikte taşıyan kare."""
+
+    def __init__(self, goruntu, sensor_zamani, teslim_zamani=None, kare_no=0, metadata=None,
+                 yuv=None):
+        """
+        Args:
+            goruntu (numpy.ndarray): BGR görüntü (havuz tamponu olabilir;
+                sonraki karede üzerine yazılır)
+            sensor_zamani (float): Sensörün kareyi pozladığı an (saniye)
+            teslim_zamani (float): Karenin programa ulaştığı an (None ise şimdi)
+            kare_no (int): Kamera açıldığından beri kare sırası
+            metadata (dict): Kamera metadata'sı (pozlama süresi, kazanç vb.)
+            yuv (numpy.ndarray): Düşük çözünürlüklü akışın (yükseklik * 3 / 2,
+                genişlik) boyutlu I420 görüntüsü (akış yoksa None; havuz tamponu)
+        """
+        self.goruntu = goruntu
+        self.sensor_zamani = sensor_zamani
+        self.teslim_zamani = time.monotonic() if teslim_zamani is None else teslim_zamani
+        self.kare_no = kare_no
+        self.metadata = metadata if metadata is not None else {}
+        self.yuv = yuv
+
+    def dusuk_cozunurluk(self):
+        """Düşük çözünürlüklü akışın (genişlik, yükseklik) boyutu (akış yoksa None)."""
+        if self.yuv is None:
+            return None
+        return self.yuv.shape[1], self.yuv.shape[0] * 2 // 3
+
+    def y_duzlemi(self):
+        """Parlaklık (Y) düzlemi; gri görüntü olarak kullanılabilir (görünüm)."""
+        return self.yuv[:self.yuv.shape[0] * 2 // 3]
+
+    def uv_duzlemleri(self):
+        """Yarım çözünürlüklü renk (U, V) düzlemleri (görünüm).
+
+        Returns:
+            tuple: (u, v) - Her biri (yükseklik / 2, genişlik / 2) boyutlu
+        """
+        return i420_duzlemleri(self.yuv)[1:]
+
+    def yuv_goruntusu(self):
+        """Düşük çözünürlüklü akışın düzlemlerini `YuvImage` olarak döndürür (akış yoksa None)."""
+        if self.yuv is None:
+            return None
+        return YuvImage(*i420_duzlemleri(self.yuv))
+
+    def yas(self, simdi=None):
+        """Karenin sensör zamanından bu yana geçen süre (saniye)."""
+        return (time.monotonic() if simdi is None else simdi) - self.sensor_zamani
+
+
+class YuvImage:
+    """Y ve yarım çözünürlüklü U, V düzlemlerinden oluşan (I420) görüntü.
+
+    Dedektörlerin kullandığı `shape`, `size` ve bölge kırpma işlemlerini
+    destekler; düzlemler kopyalanmaz (görünüm veya havuz tamponu olabilir).
+    """
+
+    def __init__(self, y, u, v):
+        """
+        Args:
+            y (numpy.ndarray): (yükseklik, genişlik) parlaklık düzlemi
+            u (numpy.ndarray): (yükseklik / 2, genişlik / 2) U düzlemi
+            v (numpy.ndarray): (yükseklik / 2, genişlik / 2) V düzlemi
+        """
+        self.y = y
+        self.u = u
+        self.v = v
+
+    @property
+    def shape(self):
+        """BGR görüntüyle aynı biçimde (yükseklik, genişlik, 3)."""
+        return self.y.shape[:2] + (3,)
+
+    @property
+    def size(self):
+        """Y düzlemindeki piksel sayısı."""
+        return self.y.size
+
+    def kirp(self, x0, y0, x1, y1):
+        """Bir bölgenin görünümü.
+
+        Args:
+            x0, y0, x1, y1 (int): Bölge sınırları; renk düzlemleriyle hizalı
+                kalması için çift olmalı
+
+        Returns:
+            YuvImage: Kırpılmış görüntü
+        """
+        return YuvImage(self.y[y0:y1, x0:x1], self.u[y0 // 2:y1 // 2, x0 // 2:x1 // 2],
+                        self.v[y0 // 2:y1 // 2, x0 // 2:x1 // 2])
+
+    def yarim_birlesik(self, y_hedef, hedef):
+        """Y düzlemini renk düzlemlerinin çözünürlüğüne indirip üç kanallı YUV görüntü oluşturur.
+
+        Args:
+            y_hedef (numpy.ndarray): Küçültülmüş Y düzleminin yazılacağı tampon
+            hedef (numpy.ndarray): (yükseklik / 2, genişlik / 2, 3) sonuç tamponu
+
+        Returns:
+            numpy.ndarray: `hedef`
+        """
+        yukseklik, genislik = self.u.shape
+        y = cv2.resize(self.y, (genislik, yukseklik), dst=y_hedef,
+                       interpolation=cv2.INTER_NEAREST)
+        return cv2.merge((y, self.u, self.v), dst=hedef)
@@ -0,0 +1,186 @@
+"""
+Zemin Mesafe Tablosu Modülü
+---------------------------
+Kamera montaj geometrisinden (`CameraGeometry`) her çözünürlük ve düzlem
+yüksekliği için bir kez hesaplanan satır tabloları sağlar. Yatay bir
+düzlemde ileri mesafe yalnızca satıra, yanal mesafe ise satırdaki ölçek ile
+sütunun çarpımına bağlıdır; bu nedenle satır başına iki değer tüm pikselleri
+kapsar. Dedektörler mesafe için kendi formüllerini yazmak yerine bu tabloyu
+kullanır.
+
+Tüm mesafeler `CameraGeometry` araç koordinatlarındadır (cm, araç merkezinin
+zemindeki izdüşümünden).
+"""
+import numpy as np
+from src.camera.camera_geometry import CameraGeometry
+
+
+class GroundDistanceTable:
+    """Çözünürlük ve düzlem yüksekliği başına önbelleklenen mesafe tabloları."""
+
+    def __init__(self, geometri=None):
+        """
+        Args:
+            geometri (CameraGeometry): Kamera modeli (None ise config değerleriyle)
+        """
+        self.geometri = geometri if geometri is not None else CameraGeometry()
+        self._geometriler = {}
+        self._tablolar = {}
+        self._haritalar = {}
+
+    def kamera_modeli(self, cozunurluk):
+        """Verilen çözünürlükteki kamera modelini döndürür (önbellekli).
+
+        Args:
+            cozunurluk (tuple): Görüntü çözünürlüğü (genişlik, yükseklik)
+
+        Returns:
+            CameraGeometry: Aynı montaj geometrisine sahip kamera modeli
+        """
+        cozunurluk = (int(cozunurluk[0]), int(cozunurluk[1]))
+        geometri = self._geometriler.get(cozunurluk)
+        if geometri is None:
+            geometri = self.geometri
+            if cozunurluk != (geometri.genislik, geometri.yukseklik):
+                geometri = geometri.olceklenmis(cozunurluk)
+            self._geometriler[cozunurluk] = geometri
+        return geometri
+
+    def satir_tablosu(self, cozunurluk, yukseklik=0.0):
+        """Satır başına ileri mesafe, yanal ölçek ve mesafe duyarlılığı tablosu.
+
+        Args:
+            cozunurluk (tuple): Görüntü çözünürlüğü (genişlik, yükseklik)
+            yukseklik (float): Yatay düzlemin zeminden yüksekliği (cm)
+
+        Returns:
+            tuple: (ileri, yanal, duyarlilik) - Her satır için ileri mesafe (cm),
+                sütun başına yanal mesafe (cm/piksel) ve bir satırlık hatanın
+                ileri mesafede yarattığı değişim (cm/piksel); düzlemi kesmeyen
+                satırlar NaN
+        """
+        anahtar = (int(cozunurluk[0]), int(cozunurluk[1]), float(yukseklik))
+        tablo = self._tablolar.get(anahtar)
+        if tablo is None:
+            geometri = self.kamera_modeli(cozunurluk)
+            satirlar = np.arange(geometri.yukseklik, dtype=np.float64)
+            ileri, sol = geometri.zemin_koordinatlari(
+                np.full_like(satirlar, geometri.cx + 1), satirlar, yukseklik)
+
+            ileri = ileri.astype(np.float64)
+            yanal = -sol.astype(np.float64)
+            duyarlilik = np.abs(np.gradient(ileri)) if len(ileri) > 1 \
+                else np.full_like(ileri, np.nan)
+            tablo = (ileri, yanal, duyarlilik)
+            self._tablolar[anahtar] = tablo
+        return tablo
+
+    def zemin_haritasi(self, cozunurluk, yukseklik=0.0):
+        """Piksel başına (ileri, sol) haritaları (önbellekli).
+
+        Returns:
+            tuple: (ileri, sol) - (yükseklik, genişlik) boyutlu float32 diziler
+        """
+        anahtar = (int(cozunurluk[0]), int(cozunurluk[1]), float(yukseklik))
+        harita = self._haritalar.get(anahtar)
+        if harita is None:
+            geometri = self.kamera_modeli(cozunurluk)
+            ileri, yanal, _ = self.satir_tablosu(cozunurluk, yukseklik)
+            sutunlar = geometri.cx - np.arange(geometri.genislik, dtype=np.float64)
+            harita = (np.repeat(ileri[:, None], geometri.genislik, axis=1).astype(np.float32),
+                      (yanal[:, None] * sutunlar[None, :]).astype(np.float32))
+            self._haritalar[anahtar] = harita
+        return harita
+
+    def noktalar(self, u, v, cozunurluk, yukseklik=0.0):
+        """Piksel koordinatlarını düzlem noktalarına çevirir (satırlar arası doğrusal).
+
+        Args:
+            u (numpy.ndarray): Piksel sütunları
+            v (numpy.ndarray): Piksel satırları
+            cozunurluk (tuple): Koordinatların ait olduğu görüntü çözünürlüğü
+            yukseklik (float): Noktaların bulunduğu düzlemin yüksekliği (cm)
+
+        Returns:
+            tuple: (ileri, sol) - Araç koordinatlarında noktalar (cm); görüntü
+                dışındaki veya düzlemi kesmeyen noktalar NaN
+        """
+        geometri = self.kamera_modeli(cozunurluk)
+        ileri_tablo, yanal_tablo, _ = self.satir_tablosu(cozunurluk, yukseklik)
+        u = np.asarray(u, dtype=np.float64)
+        v = np.asarray(v, dtype=np.float64)
+
+        satirlar = np.arange(len(ileri_tablo))
+        ileri = np.interp(v, satirlar, ileri_tablo, left=np.nan, right=np.nan)
+        sol = np.interp(v, satirlar, yanal_tablo, left=np.nan, right=np.nan) * (geometri.cx - u)
+        return ileri, sol
+
+    def boyuttan_mesafe(self, u, v, piksel_boyutu, gercek_boyut, cozunurluk):
+        """Bilinen gerçek boyuttaki nesnelerin ileri mesafesini hesaplar.
+
+        Kameraya dönük bir nesnenin görüntüdeki boyutu optik eksen boyunca
+        derinlikle ters orantılıdır; derinlik piksel ışını üzerinden ileri
+        mesafeye çevrilir.
+
+        Args:
+            u (numpy.ndarray): Nesne merkezlerinin sütunları
+            v (numpy.ndarray): Nesne merkezlerinin satırları
+            piksel_boyutu (numpy.ndarray): Görüntüdeki boyut (piksel)
+            gercek_boyut (float): Aynı doğrultudaki gerçek boyut (cm)
+            cozunurluk (tuple): Koordinatların ait olduğu görüntü çözünürlüğü
+
+        Returns:
+            numpy.ndarray: İleri mesafe (cm); boyutu pozitif olmayanlar NaN
+        """
+        geometri = self.kamera_modeli(cozunurluk)
+        v = np.asarray(v, dtype=np.float64)
+        piksel_boyutu = np.asarray(piksel_boyutu, dtype=np.float64)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            derinlik = np.where(piksel_boyutu > 0,
+                                geometri.odak * gercek_boyut / piksel_boyutu, np.nan)
+        y = (v - geometri.cy) / geometri.odak
+        ileri_yon = np.cos(geometri.egim) - y * np.sin(geometri.egim)
+        return derinlik * ileri_yon + geometri.ileri_konum
+
+    def mesafe_tahmini(self, u, v, cozunurluk, yukseklik=0.0, piksel_boyutu=None,
+                       gercek_boyut=None):
+        """Düzlem yüksekliği ve (varsa) nesne boyutundan ileri mesafe tahmini.
+
+        İki tahmin, bir piksellik ölçüm hatasının yarattığı mesafe değişiminin
+        karesiyle ters ağırlıklandırılarak birleştirilir: ufka yakın satırlarda
+        boyut tahmini, yakın ve büyük nesnelerde satır tahmini baskın olur.
+
+        Args:
+            u (numpy.ndarray): Nesne merkezlerinin sütunları
+            v (numpy.ndarray): Nesne merkezlerinin satırları
+            cozunurluk (tuple): Koordinatların ait olduğu görüntü çözünürlüğü
+            yukseklik (float): Nesne merkezinin zeminden yüksekliği (cm)
+            piksel_boyutu (numpy.ndarray): Görüntüdeki boyut (piksel, opsiyonel)
+            gercek_boyut (float): Gerçek boyut (cm, opsiyonel)
+
+        Returns:
+            numpy.ndarray: İleri mesafe (cm); tahmin yapılamayanlar NaN
+        """
+        ileri_tablo, _, duyarlilik_tablo = self.satir_tablosu(cozunurluk, yukseklik)
+        v = np.asarray(v, dtype=np.float64)
+        satirlar = np.arange(len(ileri_tablo))
+        satir_mesafe = np.interp(v, satirlar, ileri_tablo, left=np.nan, right=np.nan)
+        if piksel_boyutu is None or gercek_boyut is None:
+            return satir_mesafe
+
+        boyut_mesafe = self.boyuttan_mesafe(u, v, piksel_boyutu, gercek_boyut, cozunurluk)
+        satir_hatasi = np.interp(v, satirlar, duyarlilik_tablo, left=np.nan, right=np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            boyut_hatasi = boyut_mesafe / np.asarray(piksel_boyutu, dtype=np.float64)
+            satir_agirlik = np.nan_to_num(1.0 / satir_hatasi ** 2, nan=0.0, posinf=0.0)
+            boyut_agirlik = np.nan_to_num(1.0 / boyut_hatasi ** 2, nan=0.0, posinf=0.0)
+            satir_agirlik = np.where(np.isfinite(satir_mesafe), satir_agirlik, 0.0)
+            boyut_agirlik = np.where(np.isfinite(boyut_mesafe), boyut_agirlik, 0.0)
+
+            toplam = satir_agirlik + boyut_agirlik
+            return np.where(
+                toplam > 0,
+                (np.nan_to_num(satir_mesafe) * satir_agirlik
+                 + np.nan_to_num(boyut_mesafe) * boyut_agirlik) / toplam,
+                np.nan)
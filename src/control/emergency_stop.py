@@ -0,0 +1,160 @@
+"""
+Acil Durdurma Modülü
+--------------------
+Motorları ana döngüden bağımsız, süresi sınırlı bir yoldan durdurur. Ana
+döngü yavaş bir karede veya bir dedektörde beklerken de durdurma gecikmesi
+bu döngüye bağlı kalmaz.
+
+Tetikleme (sinyal, algı bekçisi veya API) yalnızca bir kuyruğa istek
+bırakır; `queue.SimpleQueue.put` yeniden girişe dayanıklı olduğundan sinyal
+yakalayıcıdan da güvenle çağrılabilir. Yüksek öncelikli (yetki varsa
+SCHED_FIFO) ayrı bir iş parçacığı isteği alır ve:
+
+    1. Kalıcı durdurmada motor kontrolcüsünü kilitler; sonraki hız
+       komutları ve süren rampa çıkışa yazılmaz
+    2. Motor arka ucunun `dur()` yöntemini kilit beklemeden doğrudan çağırır
+    3. Motor kilidini en fazla `ACIL_DURUS_KILIT_BEKLEMESI` bekleyip
+       çıkışları kilit altında bir kez daha sıfırlar (o sırada süren bir
+       yazmanın durdurmanın üzerine yazmaması için)
+
+Tetiklemeden ikinci adımın bitişine kadar geçen süre her durdurmada
+ölçülür; `ACIL_DURUS_SURE_SINIRI` aşılırsa hata loglanır. Python iş
+parçacıkları GIL'i paylaştığından ana iş parçacığı saf Python kodu
+çalıştırırken gecikme en fazla `sys.getswitchinterval()` kadar artabilir.
+"""
+import os
+import time
+import queue
+import threading
+from loguru import logger
+from config.config import (
+    ACIL_DURUS_SURE_SINIRI,
+    ACIL_DURUS_KILIT_BEKLEMESI,
+    ACIL_DURUS_ONCELIGI
+)
+
+
+class EmergencyStop:
+    """Motorları ayrı iş parçacığından, ölçülen ve sınırlı sürede durduran sınıf."""
+
+    def __init__(self, motors, sure_siniri=ACIL_DURUS_SURE_SINIRI,
+                 kilit_bekleme=ACIL_DURUS_KILIT_BEKLEMESI, oncelik=ACIL_DURUS_ONCELIGI,
+                 saat=time.monotonic):
+        """
+        Args:
+            motors (MotorController): Durdurulacak motor kontrolcüsü
+            sure_siniri (float): Tetiklemeden çıkışların sıfırlanmasına izin
+                verilen en uzun süre (saniye)
+            kilit_bekleme (float): Teyit yazımı için motor kilidini bekleme süresi (saniye)
+            oncelik (int): İş parçacığının SCHED_FIFO önceliği (0 ise değiştirilmez)
+            saat (callable): Monoton saat
+        """
+        self.motors = motors
+        self.sure_siniri = sure_siniri
+        self.kilit_bekleme = kilit_bekleme
+        self.oncelik = oncelik
+        self.saat = saat
+
+        # İstatistik: durdurma sayısı ve gecikmeleri (saniye)
+        self.durdurma_sayisi = 0
+        self.son_gecikme = None
+        self.en_buyuk_gecikme = 0.0
+        self.sinir_asimi = 0
+        self.son_neden = None
+
+        # Her durdurmadan sonra (neden, gecikme) ile çağrılır
+        self.dinleyiciler = []
+
+        self._kuyruk = queue.SimpleQueue()
+        self._thread = None
+
+    def tetikle(self, neden="api", kalici=True):
+        """Acil durdurma ister; bloklamaz, sinyal yakalayıcıdan çağrılabilir.
+
+        Args:
+            neden (str): Loglarda ve olaylarda görünecek neden
+            kalici (bool): True ise `sifirla` çağrılana kadar yeni hız komutları
+                uygulanmaz; False ise yalnızca çıkışlar sıfırlanır (algı bekçisi
+                gibi kendi toparlanmasını yöneten tetikleyiciler için)
+        """
+        zaman = self.saat()
+        if kalici:
+            # Ana döngünün bundan sonraki yazmaları iş parçacığı uyanmadan engellenir
+            self.motors.acil_durdu = True
+        self._kuyruk.put((neden, kalici, zaman))
+
+    def sifirla(self):
+        """Kalıcı durdurmayı kaldırır; motorlar bir sonraki komutla yeniden sürülür."""
+        self.motors.acil_durus_sifirla()
+
+    def baslat(self):
+        """Durdurma iş parçacığını başlatır."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._calis, name="acil-durus", daemon=True)
+        self._thread.start()
+
+    def _oncelik_ayarla(self):
+        """Çağıran iş parçacığını gerçek zamanlı önceliğe alır (yetki yoksa uyarır)."""
+        if not self.oncelik:
+            return "normal"
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(self.oncelik))
+            return f"SCHED_FIFO {self.oncelik}"
+        except (AttributeError, OSError) as e:
+            logger.warning(f"Acil durdurma önceliği ayarlanamadı, normal öncelik: {str(e)}")
+            return "normal"
+
+    def _calis(self):
+        """Kuyruktaki durdurma isteklerini işler."""
+        oncelik = self._oncelik_ayarla()
+        logger.info(f"Acil durdurma başlatıldı - öncelik: {oncelik}, "
+                    f"sınır {self.sure_siniri * 1000:.1f} ms")
+        while True:
+            istek = self._kuyruk.get()
+            if istek is None:
+                break
+            try:
+                self._durdur(*istek)
+            except Exception as e:
+                logger.error(f"Acil durdurma hatası: {str(e)}")
+
+    def _durdur(self, neden, kalici, zaman):
+        """Çıkışları doğrudan sıfırlar, gecikmeyi ölçer ve kilit altında teyit eder."""
+        self.motors.backend.dur()
+        gecikme = self.saat() - zaman
+        teyit = self.motors.cikislari_durdur(self.kilit_bekleme)
+
+        self.durdurma_sayisi += 1
+        self.son_gecikme = gecikme
+        self.en_buyuk_gecikme = max(self.en_buyuk_gecikme, gecikme)
+        self.son_neden = neden
+
+        mesaj = (f"Acil durdurma ({neden}{', kalıcı' if kalici else ''}): "
+                 f"motorlar {gecikme * 1000:.2f} ms'de durduruldu")
+        if gecikme > self.sure_siniri:
+            self.sinir_asimi += 1
+            logger.error(f"{mesaj} - sınır {self.sure_siniri * 1000:.1f} ms aşıldı")
+        else:
+            logger.warning(mesaj)
+        if not teyit:
+            logger.error(f"Acil durdurma: motor kilidi {self.kilit_bekleme * 1000:.0f} ms "
+                         f"içinde alınamadı, teyit yazımı yapılamadı")
+
+        for dinleyici in self.dinleyiciler:
+            try:
+                dinleyici(neden, gecikme)
+            except Exception as e:
+                logger.error(f"Acil durdurma dinleyici hatası: {str(e)}")
+
+    def kapat(self):
+        """İş parçacığını durdurur ve durdurma özetini loglar."""
+        if self._thread is None:
+            return
+        self._kuyruk.put(None)
+        self._thread.join(timeout=1.0)
+        self._thread = None
+        if self.durdurma_sayisi:
+            logger.info(f"Acil durdurma kapatıldı - {self.durdurma_sayisi} durdurma, "
+                        f"en büyük gecikme {self.en_buyuk_gecikme * 1000:.2f} ms, "
+                        f"sınır aşımı: {self.sinir_asimi}")
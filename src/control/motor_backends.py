@@ -0,0 +1,290 @@
+"""
+Motor Sürücü Arka Uçları
+------------------------
+`MotorController` hız rampası ve komut mantığını yürütür; çıkışların
+gerçekte nereye yazılacağı (GPIO, simülasyon, hiçbir yer) bu modüldeki
+arka uçlar tarafından belirlenir.
+
+Tüm arka uçlar aynı arayüzü sağlar:
+    uygula(sol_oran, sag_oran): İşaretli görev oranları (-1.0 ile 1.0 arası)
+    dur(): Her iki motoru durdurur
+    kapat(): Donanım kaynaklarını serbest bırakır
+"""
+from loguru import logger
+from config.config import (
+    MOTOR_SOL_ILERI, MOTOR_SOL_GERI,
+    MOTOR_SAG_ILERI, MOTOR_SAG_GERI,
+    MOTOR_SOL_PWM, MOTOR_SAG_PWM,
+    MOTOR_SURUCU,
+    MOTOR_PWM_FREKANS,
+    MOTOR_PIN_FABRIKALARI
+)
+
+# gpiozero pin fabrikalarının modül ve sınıf adları
+_PIN_FABRIKALARI = {
+    "pigpio": ("gpiozero.pins.pigpio", "PiGPIOFactory"),
+    "lgpio": ("gpiozero.pins.lgpio", "LGPIOFactory"),
+    "rpigpio": ("gpiozero.pins.rpigpio", "RPiGPIOFactory"),
+    "native": ("gpiozero.pins.native", "NativeFactory")
+}
+
+
+def pin_fabrikasi_olustur(adlar=MOTOR_PIN_FABRIKALARI):
+    """Açılabilen ilk gpiozero pin fabrikasını oluşturur.
+    
+    Args:
+        adlar (tuple): Sırayla denenecek fabrika adları
+        
+    Returns:
+        tuple: (ad, fabrika) - Hiçbiri açılamazsa (None, None); bu durumda
+            gpiozero kendi varsayılan fabrikasını kullanır
+    """
+    import importlib
+    
+    for ad in adlar:
+        try:
+            modul_adi, sinif_adi = _PIN_FABRIKALARI[ad]
+            fabrika = getattr(importlib.import_module(modul_adi), sinif_adi)()
+            return ad, fabrika
+        except Exception as e:
+            logger.warning(f"Pin fabrikası açılamadı ({ad}): {str(e)}")
+    
+    return None, None
+
+
+class GpiozeroMotorBackend:
+    """gpiozero `Motor` nesneleri ile L298N sürücüsüne yazan arka uç."""
+
+    def __init__(self):
+        """Motor nesnelerini oluşturur."""
+        # gpiozero yalnızca motorlar gerçekten açılırken yüklenir
+        from gpiozero import Motor
+
+        self.sol_motor = None
+        self.sag_motor = None
+
+        try:
+            # Sol ve sağ motorları oluştur
+            self.sol_motor = Motor(
+                forward=MOTOR_SOL_ILERI,
+                backward=MOTOR_SOL_GERI,
+                enable=MOTOR_SOL_PWM
+            )
+
+            self.sag_motor = Motor(
+                forward=MOTOR_SAG_ILERI,
+                backward=MOTOR_SAG_GERI,
+                enable=MOTOR_SAG_PWM
+            )
+        except Exception:
+            # Açılabilen pinleri serbest bırak
+            self.kapat()
+            raise
+
+    @staticmethod
+    def _motora_yaz(motor, oran):
+        """İşaretli görev oranını tek bir motora uygular."""
+        if oran >= 0:
+            motor.forward(oran)
+        else:
+            motor.backward(-oran)
+
+    def uygula(self, sol_oran, sag_oran):
+        """Her iki motora işaretli görev oranlarını uygular.
+
+        Args:
+            sol_oran (float): Sol motor görev oranı (-1.0 ile 1.0 arası)
+            sag_oran (float): Sağ motor görev oranı (-1.0 ile 1.0 arası)
+        """
+        self._motora_yaz(self.sol_motor, sol_oran)
+        self._motora_yaz(self.sag_motor, sag_oran)
+
+    def dur(self):
+        """Her iki motoru durdurur."""
+        self.sol_motor.stop()
+        self.sag_motor.stop()
+
+    def kapat(self):
+        """GPIO kaynaklarını serbest bırakır."""
+        for motor in (self.sol_motor, self.sag_motor):
+            if motor is not None:
+                motor.close()
+
+
+class _MotorKanali:
+    """Tek bir L298N kanalının çıkışları ve son yazılan durumu."""
+
+    def __init__(self, ileri_pin, geri_pin, pwm_pin, pin_factory):
+        from gpiozero import DigitalOutputDevice, PWMOutputDevice
+
+        self.ileri = None
+        self.geri = None
+        self.pwm = None
+        try:
+            self.ileri = DigitalOutputDevice(ileri_pin, pin_factory=pin_factory)
+            self.geri = DigitalOutputDevice(geri_pin, pin_factory=pin_factory)
+            self.pwm = PWMOutputDevice(pwm_pin, frequency=MOTOR_PWM_FREKANS,
+                                       pin_factory=pin_factory)
+        except Exception:
+            self.kapat()
+            raise
+
+        # Son yazılan değerler: yön (1, -1, 0) ve görev oranı (0.0-1.0)
+        self.yon = 0
+        self.gorev = 0.0
+
+    def kapat(self):
+        for cihaz in (self.pwm, self.ileri, self.geri):
+            if cihaz is not None:
+                cihaz.close()
+
+
+class PwmMotorBackend:
+    """Yön ve PWM çıkışlarını ayrı cihazlarla süren, tekrar yazmayan arka uç.
+
+    Her kanalın son yazılan yönü ve görev oranı saklanır; yalnızca değişen
+    çıkışlar yazılır. İki kanal birlikte güncellenir: önce yönü değişen
+    kanalların PWM'i kesilir, sonra yön pinleri, en son görev oranları
+    yazılır. Pin fabrikası `MOTOR_PIN_FABRIKALARI` sırasıyla seçilir.
+    Pi 5'teki lgpio fabrikasında PWM yazılım zamanlıdır (görev oranı
+    değişmedikçe Python tarafında ek iş yapılmaz); MOTOR_SOL_PWM/MOTOR_SAG_PWM
+    pinleri donanım PWM kanallarına bağlı değildir.
+    """
+
+    def __init__(self):
+        """Pin fabrikasını ve motor kanallarını oluşturur."""
+        self.fabrika_adi, self.pin_factory = pin_fabrikasi_olustur()
+        self.kanallar = []
+
+        # İstatistikler
+        self.yazma_sayisi = 0
+        self.atlanan_komut = 0
+
+        # Kanallar tek tek eklenir; biri açılamazsa açılmış olanlar kapat() ile bırakılır
+        try:
+            for pinler in ((MOTOR_SOL_ILERI, MOTOR_SOL_GERI, MOTOR_SOL_PWM),
+                           (MOTOR_SAG_ILERI, MOTOR_SAG_GERI, MOTOR_SAG_PWM)):
+                self.kanallar.append(_MotorKanali(*pinler, self.pin_factory))
+        except Exception:
+            self.kapat()
+            raise
+
+        logger.info(f"PWM motor arka ucu: fabrika={self.fabrika_adi or 'varsayılan'}, "
+                    f"frekans={MOTOR_PWM_FREKANS} Hz")
+
+    @staticmethod
+    def _durum(oran):
+        """İşaretli görev oranını (yön, görev) çiftine çevirir."""
+        if oran > 0:
+            return 1, min(1.0, oran)
+        if oran < 0:
+            return -1, min(1.0, -oran)
+        return 0, 0.0
+
+    def _yaz(self, hedefler):
+        """Kanallara yalnızca değişen çıkışları yazar.
+
+        Args:
+            hedefler (list): Her kanal için (yön, görev) çifti
+        """
+        degisenler = [(kanal, yon, gorev)
+                      for kanal, (yon, gorev) in zip(self.kanallar, hedefler)
+                      if kanal.yon != yon or kanal.gorev != gorev]
+        if not degisenler:
+            self.atlanan_komut += 1
+            return
+
+        # Yön değişirken köprü kısa süre bile ters yönde sürülmesin
+        for kanal, yon, _ in degisenler:
+            if kanal.yon != yon and kanal.gorev != 0.0:
+                kanal.pwm.value = 0.0
+                kanal.gorev = 0.0
+                self.yazma_sayisi += 1
+
+        for kanal, yon, _ in degisenler:
+            if kanal.yon != yon:
+                kanal.ileri.value = yon > 0
+                kanal.geri.value = yon < 0
+                kanal.yon = yon
+                self.yazma_sayisi += 2
+
+        for kanal, _, gorev in degisenler:
+            if kanal.gorev != gorev:
+                kanal.pwm.value = gorev
+                kanal.gorev = gorev
+                self.yazma_sayisi += 1
+
+    def uygula(self, sol_oran, sag_oran):
+        """Her iki motora işaretli görev oranlarını uygular.
+
+        Args:
+            sol_oran (float): Sol motor görev oranı (-1.0 ile 1.0 arası)
+            sag_oran (float): Sağ motor görev oranı (-1.0 ile 1.0 arası)
+        """
+        self._yaz([self._durum(sol_oran), self._durum(sag_oran)])
+
+    def dur(self):
+        """Her iki motoru durdurur."""
+        self._yaz([(0, 0.0), (0, 0.0)])
+
+    def kapat(self):
+        """GPIO kaynaklarını ve pin fabrikasını serbest bırakır."""
+        for kanal in self.kanallar:
+            kanal.kapat()
+        if self.pin_factory is not None:
+            self.pin_factory.close()
+        logger.debug(f"PWM motor arka ucu: {self.yazma_sayisi} yazma, "
+                     f"{self.atlanan_komut} tekrar komut atlandı")
+
+
+class NullMotorBackend:
+    """Hiçbir donanıma yazmayan arka uç (masa başı testleri ve soak testi için).
+
+    Son uygulanan oranları saklar; böylece testler komutları doğrulayabilir.
+    """
+
+    def __init__(self):
+        """Son komut değerlerini sıfırlar."""
+        self.sol_oran = 0.0
+        self.sag_oran = 0.0
+        self.komut_sayisi = 0
+
+    def uygula(self, sol_oran, sag_oran):
+        """Oranları yalnızca kaydeder."""
+        self.sol_oran = sol_oran
+        self.sag_oran = sag_oran
+        self.komut_sayisi += 1
+
+    def dur(self):
+        """Kayıtlı oranları sıfırlar."""
+        self.uygula(0.0, 0.0)
+
+    def kapat(self):
+        """Serbest bırakılacak kaynak yoktur."""
+        pass
+
+
+# Yapılandırmadan seçilebilen arka uçlar
+MOTOR_ARKA_UCLARI = {
+    "pwm": PwmMotorBackend,
+    "gpiozero": GpiozeroMotorBackend,
+    "null": NullMotorBackend
+}
+
+
+def motor_backend_olustur(ad=MOTOR_SURUCU):
+    """Adı verilen motor arka ucunu oluşturur.
+
+    Args:
+        ad (str): Arka uç adı (MOTOR_ARKA_UCLARI anahtarlarından biri)
+
+    Returns:
+        object: Motor arka ucu
+    """
+    try:
+        sinif = MOTOR_ARKA_UCLARI[ad]
+    except KeyError:
+        raise ValueError(f"Bilinmeyen motor sürücüsü: {ad}")
+
+    logger.debug(f"Motor arka ucu: {ad}")
+    return sinif()
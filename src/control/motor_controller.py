@@ -2,38 +2,66 @@
 Motor Kontrol Modülü
 """
 import time
-from gpiozero import Motor, OutputDevice
+import threading
 from loguru import logger
+from src.control.motor_backends import motor_backend_olustur
 from config.config import (
-    MOTOR_SOL_ILERI, MOTOR_SOL_GERI,
-    MOTOR_SAG_ILERI, MOTOR_SAG_GERI,
-    MOTOR_SOL_PWM, MOTOR_SAG_PWM,
     MAX_PWM, MIN_PWM, BASLANGIC_HIZI
 )
 
+# Motor komutları her karede verilir; log filtresi bu anahtarı seyreltir
+_komut_logu = logger.bind(anahtar="motor_komutu")
+
 class MotorController:
-    """gpiozero ile DC motorların kontrolü için sınıf."""
+    """DC motorların hız ve yön kontrolü için sınıf.
+    
+    Çıkışlar bir motor arka ucuna (gpiozero, simülasyon, null) yazılır;
+    arka uç verilmezse `MOTOR_SURUCU` ayarına göre oluşturulur. Yumuşak hız
+    rampası çağıranı bekletmez: `hiz_ayarla` hedefi değiştirir, rampa
+    adımları `rampa_bekleme` aralıklarla ayrı bir iş parçacığında yazılır.
+    """
     
-    def __init__(self):
-        """Motor nesnelerini başlatır."""
+    def __init__(self, backend=None):
+        """Motor nesnelerini başlatır.
+        
+        Args:
+            backend: Motor arka ucu (None ise yapılandırmadan oluşturulur)
+        """
+        # Komutlara uygulanan hız çarpanı (algı bekçisi veriler eskidikçe düşürür)
+        # Ana döngü ve bekçi iş parçacığı çıkışlara kilit altında yazar
+        self.hiz_carpani = 1.0
+        self._kilit = threading.RLock()
+        
+        # Kalıcı acil durdurma (EmergencyStop): True iken hız komutları çıkışa yazılmaz
+        self.acil_durdu = False
+        
+        # Yumuşak rampa: hedef hızlar (None ise rampa yok), hedefin karesi ve
+        # adımlar arası en kısa süre; adımları "motor-rampa" iş parçacığı yazar
+        self.rampa_bekleme = 0.05
+        self._hedef = None
+        self._hedef_karesi = None
+        self._ilk_etki_bekliyor = False
+        self._son_adim_zamani = 0.0
+        self._rampa_olayi = threading.Event()
+        self._rampa_kapat = False
+        self._rampa_thread = None
+        
         try:
-            # Sol ve sağ motorları oluştur
-            self.sol_motor = Motor(
-                forward=MOTOR_SOL_ILERI,
-                backward=MOTOR_SOL_GERI,
-                enable=MOTOR_SOL_PWM
-            )
-            
-            self.sag_motor = Motor(
-                forward=MOTOR_SAG_ILERI,
-                backward=MOTOR_SAG_GERI,
-                enable=MOTOR_SAG_PWM
-            )
+            self.backend = backend if backend is not None else motor_backend_olustur()
             
             # Mevcut hız değerlerini sakla
             self.sol_hiz = 0
             self.sag_hiz = 0
             
+            # Uygulanan her komuttan haberdar edilecek fonksiyonlar
+            # (sol_hiz, sag_hiz) argümanlarıyla çağrılır
+            self.dinleyiciler = []
+            
+            # Komutun türetildiği kare (gecikme ölçümü için); kare verilen komutlar
+            # çıkışa yazıldığında (kare, olay, zaman) argümanlarıyla çağrılır
+            self.komut_karesi = None
+            self.etki_dinleyicileri = []
+            
             logger.info("Motor kontrol sistemi başlatıldı")
             
         except Exception as e:
@@ -45,6 +73,57 @@ class MotorController:
         """PWM değerini sınırlar içinde tutar."""
         return max(MIN_PWM/100.0, min(MAX_PWM/100.0, abs(hiz)/100.0))
     
+    def _oran(self, hiz):
+        """Hızı (-100..100) işaretli görev oranına (-1.0..1.0) çevirir."""
+        oran = self._hiz_sinirla(hiz)
+        return oran if hiz >= 0 else -oran
+    
+    def _uygula(self, sol_hiz, sag_hiz):
+        """Hızları çarpanla ölçekleyip arka uca yazar ve dinleyicileri bilgilendirir."""
+        with self._kilit:
+            if self.acil_durdu:
+                return
+            sol_hiz *= self.hiz_carpani
+            sag_hiz *= self.hiz_carpani
+            self.backend.uygula(self._oran(sol_hiz), self._oran(sag_hiz))
+            for dinleyici in self.dinleyiciler:
+                dinleyici(sol_hiz, sag_hiz)
+    
+    def hiz_carpani_ayarla(self, carpan):
+        """Komutlara uygulanan hız çarpanını değiştirir.
+        
+        Çarpan düşürüldüğünde mevcut komut yeni çarpanla hemen yeniden yazılır
+        (bir sonraki komutu beklemeden yavaşlanır). Çarpan 0 ise motorlar
+        rampasız durdurulur; çarpan yükseltildiğinde eski komut yeniden
+        uygulanmaz, bir sonraki komut beklenir.
+        
+        Args:
+            carpan (float): 0.0 (dur) ile 1.0 (tam hız) arası
+        """
+        carpan = max(0.0, min(1.0, carpan))
+        with self._kilit:
+            onceki, self.hiz_carpani = self.hiz_carpani, carpan
+            if carpan <= 0.0:
+                self.dur()
+            elif carpan < onceki:
+                self._uygula(self.sol_hiz, self.sag_hiz)
+    
+    def _etki_bildir(self, kare, olay):
+        """Karenin motor çıkışına ulaştığını etki dinleyicilerine bildirir.
+        
+        Args:
+            kare (Frame): Komutun türetildiği kare (None ise bildirilmez)
+            olay (str): 'ilk_etki' (ilk çıkış yazımı) veya 'hedef' (hedef hıza ulaşıldı)
+        """
+        if kare is None:
+            return
+        zaman = time.monotonic()
+        for dinleyici in self.etki_dinleyicileri:
+            try:
+                dinleyici(kare, olay, zaman)
+            except Exception as e:
+                logger.error(f"Etki dinleyicisi hatası: {str(e)}")
+    
     def _yumusak_hizlanma(self, mevcut_hiz, hedef_hiz, adim=5, bekleme=0.05):
         """Motorları kademeli olarak hızlandırır/yavaşlatır."""
         if mevcut_hiz < hedef_hiz:
@@ -53,50 +132,114 @@ class MotorController:
             return max(mevcut_hiz - adim, hedef_hiz)
         return mevcut_hiz
     
-    def hiz_ayarla(self, sol_hiz, sag_hiz, yumusak=True):
+    def _rampa_adimi(self):
+        """Rampayı, son adımdan beri `rampa_bekleme` geçtiyse bir adım ilerletir.
+        
+        Kilit altında çağrılır; etki bildirimleri kilit dışında yapılsın diye döndürülür.
+        
+        Returns:
+            list: Bildirilecek (kare, olay) çiftleri
+        """
+        if self._hedef is None:
+            return []
+        # Bekçi veya acil durdurma motorları durdurduysa rampa sürdürülmez
+        if self.hiz_carpani <= 0.0 or self.acil_durdu:
+            self._hedef = None
+            return []
+        
+        olaylar = []
+        sol_hedef, sag_hedef = self._hedef
+        if (self.sol_hiz, self.sag_hiz) != self._hedef:
+            simdi = time.monotonic()
+            if simdi - self._son_adim_zamani < self.rampa_bekleme:
+                return []
+            self._son_adim_zamani = simdi
+            self.sol_hiz = self._yumusak_hizlanma(self.sol_hiz, sol_hedef)
+            self.sag_hiz = self._yumusak_hizlanma(self.sag_hiz, sag_hedef)
+            self._uygula(self.sol_hiz, self.sag_hiz)
+            if self._ilk_etki_bekliyor:
+                olaylar.append((self._hedef_karesi, "ilk_etki"))
+                self._ilk_etki_bekliyor = False
+        
+        if (self.sol_hiz, self.sag_hiz) == self._hedef:
+            olaylar.append((self._hedef_karesi, "hedef"))
+            self._hedef = None
+        return olaylar
+    
+    def _rampa_calis(self):
+        """Hedefe ulaşılana kadar rampa adımlarını yazar; sonra yeni hedefi bekler."""
+        while True:
+            self._rampa_olayi.wait()
+            self._rampa_olayi.clear()
+            if self._rampa_kapat:
+                return
+            try:
+                while not self._rampa_kapat:
+                    with self._kilit:
+                        if self._hedef is None:
+                            break
+                        bekle = self._son_adim_zamani + self.rampa_bekleme - time.monotonic()
+                        olaylar = self._rampa_adimi() if bekle <= 0 else []
+                    for kare, olay in olaylar:
+                        self._etki_bildir(kare, olay)
+                    if bekle > 0:
+                        time.sleep(bekle)
+            except Exception as e:
+                logger.error(f"Hız rampası hatası: {str(e)}")
+                self.dur()
+    
+    def _rampa_baslat(self):
+        """Rampa iş parçacığını ilk yumuşak komutta başlatır ve uyandırır."""
+        if self._rampa_thread is None:
+            self._rampa_thread = threading.Thread(target=self._rampa_calis,
+                                                  name="motor-rampa", daemon=True)
+            self._rampa_thread.start()
+        self._rampa_olayi.set()
+    
+    def hiz_ayarla(self, sol_hiz, sag_hiz, yumusak=True, kare=None):
         """Her iki motorun hızını ve yönünü ayarlar.
         
+        Yumuşak geçişte bloklamaz: hedef değiştirilir, izin veriliyorsa ilk adım
+        hemen yazılır ve kalan adımlar rampa iş parçacığında sürer. Rampa
+        bitmeden gelen yeni komut hedefi mevcut hızdan devam ederek değiştirir.
+        
         Args:
             sol_hiz (int): Sol motor hızı (-100 ile 100 arası)
             sag_hiz (int): Sağ motor hızı (-100 ile 100 arası)
             yumusak (bool): Yumuşak hızlanma/yavaşlama kullanılsın mı
+            kare (Frame): Komutun türetildiği kare (gecikme ölçümü için)
         """
         try:
+            # Kalıcı acil durdurmada komut, hız durumu değiştirilmeden yok sayılır
+            if self.acil_durdu:
+                return
+            
+            # Çıkış zaten MAX_PWM ile sınırlı; sınır dışı hedefe rampa döngüyü boşuna bekletir
+            sol_hiz = max(-MAX_PWM, min(MAX_PWM, sol_hiz))
+            sag_hiz = max(-MAX_PWM, min(MAX_PWM, sag_hiz))
             if yumusak:
-                # Yumuşak hızlanma/yavaşlama
-                while (self.sol_hiz != sol_hiz) or (self.sag_hiz != sag_hiz):
-                    self.sol_hiz = self._yumusak_hizlanma(self.sol_hiz, sol_hiz)
-                    self.sag_hiz = self._yumusak_hizlanma(self.sag_hiz, sag_hiz)
-                    
-                    # Sol motor kontrolü
-                    if self.sol_hiz >= 0:
-                        self.sol_motor.forward(self._hiz_sinirla(self.sol_hiz))
-                    else:
-                        self.sol_motor.backward(self._hiz_sinirla(self.sol_hiz))
-                    
-                    # Sağ motor kontrolü
-                    if self.sag_hiz >= 0:
-                        self.sag_motor.forward(self._hiz_sinirla(self.sag_hiz))
-                    else:
-                        self.sag_motor.backward(self._hiz_sinirla(self.sag_hiz))
-                    
-                    time.sleep(0.05)  # Yumuşak geçiş için bekleme
+                # Yumuşak hızlanma/yavaşlama: hedef değişir, adımları rampa yazar
+                with self._kilit:
+                    self.komut_karesi = kare
+                    self._hedef = (sol_hiz, sag_hiz)
+                    self._hedef_karesi = kare
+                    self._ilk_etki_bekliyor = True
+                    olaylar = self._rampa_adimi()
+                    devam = self._hedef is not None
+                for olay_karesi, olay in olaylar:
+                    self._etki_bildir(olay_karesi, olay)
+                if devam:
+                    self._rampa_baslat()
             else:
-                # Direkt hız değişimi
-                self.sol_hiz = sol_hiz
-                self.sag_hiz = sag_hiz
-                
-                # Sol motor kontrolü
-                if sol_hiz >= 0:
-                    self.sol_motor.forward(self._hiz_sinirla(sol_hiz))
-                else:
-                    self.sol_motor.backward(self._hiz_sinirla(sol_hiz))
-                
-                # Sağ motor kontrolü
-                if sag_hiz >= 0:
-                    self.sag_motor.forward(self._hiz_sinirla(sag_hiz))
-                else:
-                    self.sag_motor.backward(self._hiz_sinirla(sag_hiz))
+                # Direkt hız değişimi (süren rampa iptal edilir)
+                with self._kilit:
+                    self._hedef = None
+                    self.komut_karesi = kare
+                    self.sol_hiz = sol_hiz
+                    self.sag_hiz = sag_hiz
+                    self._uygula(sol_hiz, sag_hiz)
+                self._etki_bildir(kare, "ilk_etki")
+                self._etki_bildir(kare, "hedef")
                     
         except Exception as e:
             logger.error(f"Hız ayarlama hatası: {str(e)}")
@@ -105,40 +248,81 @@ class MotorController:
     def ileri(self, hiz=BASLANGIC_HIZI):
         """Aracı ileri yönde hareket ettirir."""
         self.hiz_ayarla(hiz, hiz)
-        logger.debug(f"İleri hareket: Hız={hiz}")
+        _komut_logu.debug("İleri hareket: Hız={}", hiz)
     
     def geri(self, hiz=BASLANGIC_HIZI):
         """Aracı geri yönde hareket ettirir."""
         self.hiz_ayarla(-hiz, -hiz)
-        logger.debug(f"Geri hareket: Hız={hiz}")
+        _komut_logu.debug("Geri hareket: Hız={}", hiz)
     
     def sola_don(self, hiz=BASLANGIC_HIZI):
         """Aracı sola döndürür."""
         self.hiz_ayarla(-hiz, hiz)
-        logger.debug(f"Sola dönüş: Hız={hiz}")
+        _komut_logu.debug("Sola dönüş: Hız={}", hiz)
     
     def saga_don(self, hiz=BASLANGIC_HIZI):
         """Aracı sağa döndürür."""
         self.hiz_ayarla(hiz, -hiz)
-        logger.debug(f"Sağa dönüş: Hız={hiz}")
+        _komut_logu.debug("Sağa dönüş: Hız={}", hiz)
     
-    def dur(self):
-        """Tüm motorları durdurur."""
+    def dur(self, kare=None):
+        """Tüm motorları durdurur.
+        
+        Args:
+            kare (Frame): Durdurma kararının türetildiği kare (gecikme ölçümü için)
+        """
         try:
-            self.sol_motor.stop()
-            self.sag_motor.stop()
-            self.sol_hiz = 0
-            self.sag_hiz = 0
-            logger.debug("Araç durduruldu")
+            with self._kilit:
+                self.backend.dur()
+                self._hedef = None
+                self.sol_hiz = 0
+                self.sag_hiz = 0
+                self.komut_karesi = kare
+                for dinleyici in self.dinleyiciler:
+                    dinleyici(0, 0)
+            self._etki_bildir(kare, "ilk_etki")
+            self._etki_bildir(kare, "hedef")
+            _komut_logu.debug("Araç durduruldu")
         except Exception as e:
             logger.error(f"Durdurma hatası: {str(e)}")
     
+    def cikislari_durdur(self, bekleme):
+        """Motor kilidini en fazla `bekleme` saniye bekleyip motorları durdurur.
+        
+        Acil durdurma, kilitsiz doğrudan yazmasından sonra o sırada süren bir
+        komutun durdurmanın üzerine yazmadığını bununla garanti eder.
+        
+        Args:
+            bekleme (float): Kilit için en fazla bekleme süresi (saniye)
+            
+        Returns:
+            bool: Kilit alınıp motorlar durduruldu mu
+        """
+        if not self._kilit.acquire(timeout=bekleme):
+            return False
+        try:
+            self.dur()
+        finally:
+            self._kilit.release()
+        return True
+    
+    def acil_durus_sifirla(self):
+        """Kalıcı acil durdurmayı kaldırır; bir sonraki hız komutu yeniden uygulanır."""
+        with self._kilit:
+            if self.acil_durdu:
+                self.acil_durdu = False
+                logger.info("Acil durdurma kaldırıldı")
+    
     def temizle(self):
         """Motor nesnelerini temizler."""
         try:
+            if self._rampa_thread is not None:
+                self._rampa_kapat = True
+                self._rampa_olayi.set()
+                self._rampa_thread.join(timeout=1.0)
+                self._rampa_thread = None
             self.dur()
-            self.sol_motor.close()
-            self.sag_motor.close()
+            self.backend.kapat()
             logger.info("Motor kontrol sistemi kapatıldı")
         except Exception as e:
-            logger.error(f"Temizleme hatası: {str(e)}") 
\ No newline at end of file
+            logger.error(f"Temizleme hatası: {str(e)}")
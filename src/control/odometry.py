@@ -0,0 +1,138 @@
+"""
+Komut Tabanlı Odometri Modülü
+-----------------------------
+Motorlara gönderilen hız komutlarından ölü hesap (dead reckoning) ile
+aracın kısa süreli hareketini tahmin eder. Kare yakalama anında ölçülen
+şerit sapmasını, motorların komutu uygulayacağı ana taşımak için kullanılır.
+"""
+import math
+import time
+import threading
+from collections import deque
+from config.config import (
+    ARAC_GENISLIK,
+    MOTOR_MAX_RPM,
+    TEKER_CAPI,
+    ODOMETRI_MOTOR_ZAMAN_SABITI
+)
+
+# Tam görev oranında teker çevresel hızı (cm/s)
+MAX_TEKER_HIZI = MOTOR_MAX_RPM / 60.0 * math.pi * TEKER_CAPI
+
+# İntegrasyon adımı (saniye)
+_ADIM = 0.005
+
+
+class OdometryPredictor:
+    """Komut geçmişinden diferansiyel sürüş hareketi tahmini."""
+
+    def __init__(self, teker_yolu=ARAC_GENISLIK, zaman_sabiti=ODOMETRI_MOTOR_ZAMAN_SABITI,
+                 gecmis_suresi=1.0, saat=time.monotonic):
+        """
+        Args:
+            teker_yolu (float): Sol ve sağ teker arası mesafe (cm)
+            zaman_sabiti (float): Teker hızının komuta yaklaşma zaman sabiti (saniye)
+            gecmis_suresi (float): Saklanacak komut geçmişi (saniye)
+            saat (callable): Saniye cinsinden monoton zaman kaynağı
+        """
+        self.teker_yolu = teker_yolu
+        self.zaman_sabiti = zaman_sabiti
+        self.gecmis_suresi = gecmis_suresi
+        self.saat = saat
+
+        self._komutlar = deque()  # (zaman, sol_cm_s, sag_cm_s)
+        self._kilit = threading.Lock()
+
+    @staticmethod
+    def _teker_hizi(hiz):
+        """Motor hızını (-100..100) teker çevresel hızına (cm/s) çevirir."""
+        return max(-100.0, min(100.0, hiz)) / 100.0 * MAX_TEKER_HIZI
+
+    def komut_kaydet(self, sol_hiz, sag_hiz):
+        """Uygulanan motor komutunu kaydeder (`MotorController` dinleyicisi).
+
+        Args:
+            sol_hiz (float): Sol motor hızı (-100 ile 100 arası)
+            sag_hiz (float): Sağ motor hızı (-100 ile 100 arası)
+        """
+        simdi = self.saat()
+        with self._kilit:
+            self._komutlar.append((simdi, self._teker_hizi(sol_hiz), self._teker_hizi(sag_hiz)))
+
+            # Eski komutları at; sınırdan önceki son komut başlangıç durumu için tutulur
+            sinir = simdi - self.gecmis_suresi
+            while len(self._komutlar) > 1 and self._komutlar[1][0] <= sinir:
+                self._komutlar.popleft()
+
+    def hareket(self, baslangic, bitis):
+        """İki zaman arasındaki araç hareketini tahmin eder.
+
+        Args:
+            baslangic (float): Başlangıç zamanı (saat() ile aynı zaman tabanı)
+            bitis (float): Bitiş zamanı
+
+        Returns:
+            tuple: (ileri, sol, aci) - Başlangıç anındaki araç eksenlerinde yer
+                değiştirme (cm) ve sola pozitif yön değişimi (radyan)
+        """
+        with self._kilit:
+            komutlar = list(self._komutlar)
+
+        if not komutlar or bitis <= baslangic:
+            return 0.0, 0.0, 0.0
+
+        # Teker hızları gecikmeli olarak komutu takip eder; durum birkaç zaman
+        # sabiti öncesinden başlatılır
+        t = max(komutlar[0][0], baslangic - 5 * self.zaman_sabiti)
+        i = 0
+        while i + 1 < len(komutlar) and komutlar[i + 1][0] <= t:
+            i += 1
+        sol_teker, sag_teker = komutlar[i][1], komutlar[i][2]
+
+        x = y = aci = 0.0
+        while t < bitis:
+            while i + 1 < len(komutlar) and komutlar[i + 1][0] <= t:
+                i += 1
+            sol_komut, sag_komut = komutlar[i][1], komutlar[i][2]
+
+            dt = min(_ADIM, bitis - t)
+            alfa = 1.0 - math.exp(-dt / self.zaman_sabiti)
+            sol_teker += (sol_komut - sol_teker) * alfa
+            sag_teker += (sag_komut - sag_teker) * alfa
+
+            if t >= baslangic:
+                v = (sol_teker + sag_teker) / 2
+                x += v * math.cos(aci) * dt
+                y += v * math.sin(aci) * dt
+                aci += (sag_teker - sol_teker) / self.teker_yolu * dt
+            t += dt
+
+        return x, y, aci
+
+    def sapma_tahmini(self, merkez_sapma, olcum_zamani, hedef_zamani,
+                      bakis_mesafesi, cm_piksel, serit_acisi=0.0):
+        """Ölçülen şerit sapmasını hedef zamana taşır.
+
+        Sapma, araç merkezinin `bakis_mesafesi` kadar önündeki noktada
+        ölçülmüştür. Aracın ölçümden bu yana yanal kayması ve dönüşü, aynı
+        bakış noktasındaki sapmayı değiştirir.
+
+        Args:
+            merkez_sapma (float): Ölçülen sapma (piksel, pozitif: şerit merkezi sağda)
+            olcum_zamani (float): Karenin yakalandığı zaman
+            hedef_zamani (float): Komutun tekerlere ulaşacağı zaman
+            bakis_mesafesi (float): Sapmanın ölçüldüğü noktanın ileri mesafesi (cm)
+            cm_piksel (float): Ölçüm satırında bir pikselin yanal karşılığı (cm)
+            serit_acisi (float): Şeridin araç eksenine göre açısı (radyan, sola pozitif)
+
+        Returns:
+            tuple: (tahmini_sapma, tahmini_aci) - Hedef zamandaki sapma (piksel)
+                ve şeride göre yön farkı (radyan)
+        """
+        ileri, sol, aci = self.hareket(olcum_zamani, hedef_zamani)
+
+        # Bakış noktasının yeni konumu ile şerit merkezinin yanal farkı
+        kayma = sol + bakis_mesafesi * math.sin(aci) \
+            - (ileri + bakis_mesafesi * (math.cos(aci) - 1.0)) * math.tan(serit_acisi)
+
+        return merkez_sapma + kayma / cm_piksel, serit_acisi - aci
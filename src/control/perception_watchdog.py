@@ -0,0 +1,183 @@
+"""
+Algı Bekçisi Modülü
+-------------------
+Kontrol döngüsünden bağımsız bir iş parçacığında son kare ve son şerit
+tespitinin yaşını izler. Kamera veya bir dedektör takılırsa ana döngü son
+motor komutunu çalışır halde bırakır; bekçi veriler eskidikçe motor hız
+çarpanını düşürür ve bir kaynağın yaşı durdurma sınırını aşınca motorları
+durdurur. Böylece takılan bir hatta tepki süresi `BEKCI_SURELERI` ile
+`BEKCI_KONTROL_ARALIGI` toplamıyla sınırlıdır.
+
+Her tetiklenme (yavaşlama, durdurma) ve düzelme loglanır; dinleyicilere
+tetiklenme nedeni bildirilir.
+"""
+import time
+import threading
+from loguru import logger
+from config.config import (
+    BEKCI_KONTROL_ARALIGI,
+    BEKCI_SURELERI,
+    BEKCI_MIN_HIZ_CARPANI
+)
+
+# Çarpan bu kadar değişmedikçe motorlara yeniden yazılmaz
+_CARPAN_ADIMI = 0.05
+
+# Durumların ağırlık sırası (yalnızca ağırlaşan geçişler tetiklenme sayılır)
+_DURUM_SIRASI = {"normal": 0, "yavas": 1, "durdu": 2}
+
+
+class PerceptionWatchdog:
+    """Algı verilerinin tazeliğine göre motor hızını sınırlayan bekçi."""
+
+    def __init__(self, motors, sureler=BEKCI_SURELERI, min_carpan=BEKCI_MIN_HIZ_CARPANI,
+                 aralik=BEKCI_KONTROL_ARALIGI, saat=time.monotonic):
+        """
+        Args:
+            motors (MotorController): Hız çarpanı ayarlanacak motor kontrolcüsü
+            sureler (dict): {kaynak: (yavaşlama, durdurma)} yaş sınırları (saniye)
+            min_carpan (float): Durdurma sınırına yaklaşırken inilen en düşük çarpan
+            aralik (float): Denetleme aralığı (saniye)
+            saat (callable): Kaynak zamanlarıyla aynı tabanlı monoton saat
+        """
+        self.motors = motors
+        self.sureler = dict(sureler)
+        self.min_carpan = min_carpan
+        self.aralik = aralik
+        self.saat = saat
+
+        # Kaynakların son taze veri zamanları (ilk bildirimden önce izlenmez)
+        self._zamanlar = {}
+
+        self.durum = "normal"  # normal, yavas, durdu
+        self.carpan = 1.0
+        self.tetiklenme_sayilari = {"yavas": 0, "durdu": 0}
+        self.en_buyuk_yaslar = {}
+        self._tetiklenme_zamani = None
+
+        # Tetiklenmede neden ("bekci_yavas_<kaynak>" gibi) ile çağrılır
+        self.dinleyiciler = []
+
+        self._dur = threading.Event()
+        self._thread = None
+
+    def bildir(self, kaynak, zaman=None):
+        """Kaynaktan taze veri geldiğini bildirir.
+
+        Args:
+            kaynak (str): `sureler` içindeki kaynak adı ('kare', 'serit')
+            zaman (float): Verinin ait olduğu an (None ise şimdi); kare için
+                yakalama zamanı verilmelidir
+        """
+        self._zamanlar[kaynak] = self.saat() if zaman is None else zaman
+
+    def yaslar(self, simdi=None):
+        """Bildirim almış kaynakların yaşlarını döndürür.
+
+        Returns:
+            dict: {kaynak: yaş (saniye)}
+        """
+        simdi = self.saat() if simdi is None else simdi
+        return {kaynak: simdi - zaman for kaynak, zaman in list(self._zamanlar.items())}
+
+    def _kaynak_carpani(self, kaynak, yas):
+        """Bir kaynağın yaşına karşılık gelen hız çarpanı (yavaşlama sınırından sonra doğrusal)."""
+        yavas, dur = self.sureler[kaynak]
+        if yas <= yavas:
+            return 1.0
+        if yas >= dur:
+            return 0.0
+        return 1.0 - (yas - yavas) / (dur - yavas) * (1.0 - self.min_carpan)
+
+    def kontrol(self, simdi=None):
+        """Yaşları bir kez denetler; gerekirse hız çarpanını değiştirir.
+
+        Args:
+            simdi (float): Denetleme anı (None ise şimdi)
+
+        Returns:
+            float: Uygulanan hız çarpanı
+        """
+        yaslar = {kaynak: yas for kaynak, yas in self.yaslar(simdi).items()
+                  if kaynak in self.sureler}
+        if not yaslar:
+            return self.carpan
+
+        for kaynak, yas in yaslar.items():
+            self.en_buyuk_yaslar[kaynak] = max(self.en_buyuk_yaslar.get(kaynak, 0.0), yas)
+
+        carpanlar = {kaynak: self._kaynak_carpani(kaynak, yas) for kaynak, yas in yaslar.items()}
+        en_kotu = min(carpanlar, key=carpanlar.get)
+        carpan = carpanlar[en_kotu]
+        durum = "durdu" if carpan <= 0.0 else "yavas" if carpan < 1.0 else "normal"
+
+        if durum != self.durum:
+            self._durum_degisti(durum, en_kotu, yaslar)
+
+        # Ara değerler adım adım, tam hız ve durdurma hemen yazılır
+        if abs(carpan - self.carpan) >= _CARPAN_ADIMI \
+                or (carpan in (0.0, 1.0) and carpan != self.carpan):
+            self.motors.hiz_carpani_ayarla(carpan)
+            self.carpan = carpan
+        self.durum = durum
+        return carpan
+
+    def _durum_degisti(self, durum, kaynak, yaslar):
+        """Durum geçişini raporlar ve dinleyicileri bilgilendirir."""
+        yas_metni = ", ".join(f"{ad}={yas * 1000:.0f} ms" for ad, yas in yaslar.items())
+        if durum == "normal":
+            sure = self.saat() - self._tetiklenme_zamani if self._tetiklenme_zamani else 0.0
+            logger.info(f"Algı bekçisi: veriler tazelendi, tam hıza izin verildi "
+                        f"({sure:.2f} sn sonra; {yas_metni})")
+            self._tetiklenme_zamani = None
+            return
+        if _DURUM_SIRASI[durum] < _DURUM_SIRASI[self.durum]:
+            logger.info(f"Algı bekçisi: veriler kısmen tazelendi, düşük hızla devam ({yas_metni})")
+            return
+
+        # Yavaştan durmaya geçiş de ayrı bir tetiklenmedir
+        self.tetiklenme_sayilari[durum] += 1
+        if self._tetiklenme_zamani is None:
+            self._tetiklenme_zamani = self.saat()
+        if durum == "durdu":
+            logger.error(f"Algı bekçisi: {kaynak} verisi çok eski, motorlar durduruldu "
+                         f"({yas_metni})")
+        else:
+            logger.warning(f"Algı bekçisi: {kaynak} verisi eskidi, hız düşürülüyor ({yas_metni})")
+
+        for dinleyici in self.dinleyiciler:
+            try:
+                dinleyici(f"bekci_{durum}_{kaynak}")
+            except Exception as e:
+                logger.error(f"Algı bekçisi dinleyici hatası: {str(e)}")
+
+    def baslat(self):
+        """Denetleme iş parçacığını başlatır."""
+        if self._thread is not None:
+            return
+        self._dur.clear()
+        self._thread = threading.Thread(target=self._calis, name="algi-bekcisi", daemon=True)
+        self._thread.start()
+        logger.info("Algı bekçisi başlatıldı - sınırlar: " + ", ".join(
+            f"{ad} {yavas * 1000:.0f}/{dur * 1000:.0f} ms"
+            for ad, (yavas, dur) in self.sureler.items()))
+
+    def _calis(self):
+        """`aralik` saniyede bir yaşları denetler."""
+        while not self._dur.wait(self.aralik):
+            try:
+                self.kontrol()
+            except Exception as e:
+                logger.error(f"Algı bekçisi hatası: {str(e)}")
+
+    def kapat(self):
+        """İş parçacığını durdurur ve tetiklenme özetini loglar."""
+        if self._thread is None:
+            return
+        self._dur.set()
+        self._thread.join(timeout=1.0)
+        self._thread = None
+        logger.info(f"Algı bekçisi kapatıldı - yavaşlama: {self.tetiklenme_sayilari['yavas']}, "
+                    f"durdurma: {self.tetiklenme_sayilari['durdu']}, en büyük yaşlar: " +
+                    ", ".join(f"{ad}={yas * 1000:.0f} ms"
+                              for ad, yas in self.en_buyuk_yaslar.items()))
@@ -1,48 +1,212 @@
 """
 Ana Araç Kontrol Modülü
 """
+import math
 import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 from loguru import logger
 from config.config import (
     MIN_DURMA_MESAFESI,
     YAYA_GECIDI_DURMA_MESAFESI,
     YAYA_GECIDI_BEKLEME_SURESI,
-    SOLLAMA_MIN_MESAFE
+    SOLLAMA_MIN_MESAFE,
+    GECIKME_TELAFISI,
+    MOTOR_AKTUASYON_GECIKMESI,
+    KALITE_YONETICISI,
+    KALITE_SEVIYELERI,
+    DEBUG_YAYINI,
+    KAYIT_AKTIF,
+    KAYIT_SAPMA_ESIGI,
+    KAYIT_OLAY_ARALIGI,
+    PARK_ALGILAMA,
+    BEKCI_AKTIF,
+    TABELA_TAKIBI,
+    ALGILAMA_RENK_UZAYI
 )
 from src.camera.camera_controller import CameraController
+from src.camera.camera_geometry import CameraGeometry
+from src.camera.ground_distance import GroundDistanceTable
+from src.control.emergency_stop import EmergencyStop
 from src.control.motor_controller import MotorController
-from src.detection.lane_detector import LaneDetector
-from src.detection.traffic_light_detector import TrafficLightDetector
+from src.control.odometry import OdometryPredictor
+from src.control.perception_watchdog import PerceptionWatchdog
+from src.detection.lane_detector import LaneDetector, YuvLaneDetector
+from src.detection.parking_detector import ParkingDetector
+from src.detection.sign_detector import SignDetector, YuvSignDetector
+from src.detection.sign_tracker import SignTracker
+from src.detection.traffic_light_detector import TrafficLightDetector, YuvTrafficLightDetector
+from src.utils.buffer_pool import BufferPool
+from src.utils.frame_recorder import FrameRecorder
+from src.utils.profiler import StageTimer, LatencyTracker
+from src.utils.quality_governor import QualityGovernor
 
 class VehicleController:
     """Ana araç kontrol sınıfı."""
     
-    def __init__(self):
-        """Tüm alt sistemleri başlatır."""
+    def __init__(self, camera=None, motors=None, kalite=None, kayit_aktif=KAYIT_AKTIF):
+        """Tüm alt sistemleri başlatır.
+        
+        Args:
+            camera: Kullanılacak kamera (None ise `CameraController` oluşturulur;
+                simülasyonda `SimCameraController` verilir)
+            motors: Kullanılacak motor kontrolcüsü (None ise `MotorController`
+                yapılandırmadaki sürücü ile oluşturulur)
+            kalite (QualityGovernor): Kalite yöneticisi (None ise
+                `KALITE_YONETICISI` açıksa sistem ölçümleriyle oluşturulur)
+            kayit_aktif (bool): Kara kutu kaydedicisi çalışsın mı (başsız
+                araçlar - simülasyon, soak testi - varsayılan olarak kapatır)
+        """
+        self.baslatma_zamani = time.perf_counter()
+        self.baslatma_sureleri = {}
+        self.ilk_kare_alindi = False
+        self.camera = camera
+        self.motors = motors
+        
+        # Döngü kontrolü ve sayacı
+        self.calisiyor = False
+        self.dongu_sayisi = 0
+        self.zamanlayici = StageTimer()  # Aşama süreleri (profil raporlarında yazılır)
+        self.gecikme = LatencyTracker()  # Sensör zamanından motor çıkışına gecikme
+        
         try:
+            # Görüntü hattının ara tamponları (tüm alt sistemler paylaşır)
+            self.tamponlar = BufferPool()
+            
+            # Montaj geometrisi ve ondan türetilen mesafe tabloları (dedektörler paylaşır)
+            self.geometri = CameraGeometry()
+            self.mesafe_tablosu = GroundDistanceTable(self.geometri)
+            
+            # 'yuv' ise dedektörler kameranın Y/UV düzlemlerinde dönüşümsüz çalışır
+            self.yuv_algilama = ALGILAMA_RENK_UZAYI == 'yuv'
+            
             # Alt sistemleri başlat
-            self.camera = CameraController()
-            self.motors = MotorController()
-            self.lane_detector = LaneDetector()
-            self.traffic_light_detector = TrafficLightDetector()
+            self._alt_sistemleri_baslat()
+            
+            # Acil durdurma: motorlar ana döngüden bağımsız, ölçülen sürede durdurulur
+            self.acil_durus = EmergencyStop(self.motors)
+            self.acil_durus.dinleyiciler.append(self._acil_durus_bildir)
+            self.acil_durus.baslat()
+            
+            # Gecikme telafisi: motor komutlarından ölü hesap
+            self.odometri = OdometryPredictor()
+            self.motors.dinleyiciler.append(self.odometri.komut_kaydet)
+            self.motors.etki_dinleyicileri.append(self.gecikme.etki_kaydet)
+            
+            # Park yerleri: ilerledikçe yalnızca yeni zemin şeridi taranır
+            self.park_detector = None
+            if PARK_ALGILAMA:
+                self.park_detector = self._alt_sistem_baslat(
+                    "park", ParkingDetector, self.tamponlar, self.mesafe_tablosu, self.odometri)
+            
+            # Tabelalar: tam tespit seyrek, arada izler küçük pencerelerde doğrulanır
+            self.tabela_takipcisi = None
+            self.son_tabelalar = []
+            if TABELA_TAKIBI:
+                self.tabela_takipcisi = self._alt_sistem_baslat(
+                    "tabela", self._tabela_takipcisi_olustur, self._algilama_cozunurlugu())
+            self._olcum_geometrisi_onbellek = (None, None)
+            self.boru_hatti_gecikmesi = None  # saniye (kare yakalama -> komut, EMA)
+            
+            # Döngü süresi ve sıcaklığa göre çözünürlük/ön işleme/dedektör sıklığı
+            if kalite is None and KALITE_YONETICISI:
+                kalite = QualityGovernor()
+            self.kalite = kalite
+            
+            # Annotasyonlu kareler ayrı süreçte çizilip MJPEG olarak yayınlanır
+            self.debug_yayini = None
+            if DEBUG_YAYINI:
+                from src.utils.debug_stream import DebugStream
+                self.debug_yayini = DebugStream()
+            
+            # Kara kutu: son saniyeler olay anında arşivlenir
+            self.kayit = FrameRecorder() if kayit_aktif else None
+            self._son_olaylar = {}
+            
+            # Algı bekçisi: kare/şerit verisi eskidikçe yavaşla, sınırda dur
+            self.bekci = None
+            if BEKCI_AKTIF:
+                self.bekci = PerceptionWatchdog(self.motors)
+                self.bekci.dinleyiciler.append(self._olay_bildir)
+                self.bekci.dinleyiciler.append(self._bekci_tetiklendi)
             
             # Durum değişkenleri
             self.durum = "hazir"  # hazir, hareket, durma, sollama, park
             self.son_trafik_isigi = None
+            self.son_isik_tespiti = (None, None)
             self.bekleme_baslangic = None
             
-            logger.info("Araç kontrol sistemi başlatıldı")
+            self.baslatma_sureleri["toplam"] = time.perf_counter() - self.baslatma_zamani
+            logger.info("Araç kontrol sistemi başlatıldı - Başlatma süreleri (ms): " +
+                        ", ".join(f"{ad}={sure * 1000:.0f}"
+                                  for ad, sure in self.baslatma_sureleri.items()))
             
         except Exception as e:
             logger.error(f"Araç kontrol sistemi başlatılamadı: {str(e)}")
             self.temizle()
             raise
     
-    def _serit_takibi(self, merkez_sapma):
+    def _alt_sistem_baslat(self, ad, fabrika, *args):
+        """Bir alt sistemi oluşturur ve başlatma süresini kaydeder.
+        
+        Args:
+            ad (str): Başlatma raporunda kullanılacak alt sistem adı
+            fabrika (callable): Alt sistemi oluşturan sınıf veya fonksiyon
+            
+        Returns:
+            object: Oluşturulan alt sistem
+        """
+        baslangic = time.perf_counter()
+        try:
+            return fabrika(*args)
+        finally:
+            self.baslatma_sureleri[ad] = time.perf_counter() - baslangic
+    
+    def _alt_sistemleri_baslat(self):
+        """Kamera ve motorları paralel, dedektörleri ana iş parçacığında başlatır.
+        
+        Kamera ve motor başlatması çoğunlukla donanım ve içe aktarma beklemesidir;
+        bu sürede dedektörler (ve OpenCV yüklemesi) ana iş parçacığında hazırlanır.
+        Bir alt sistem başarısız olsa bile başarılı olanlar atanır ki `temizle`
+        onları kapatabilsin.
+        """
+        hatalar = []
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="baslatma") as havuz:
+            # Dışarıdan verilen alt sistemler yeniden oluşturulmaz
+            isler = {}
+            if self.camera is None:
+                isler["camera"] = havuz.submit(self._alt_sistem_baslat, "kamera",
+                                               CameraController, self.tamponlar)
+            if self.motors is None:
+                isler["motors"] = havuz.submit(self._alt_sistem_baslat, "motor",
+                                               MotorController)
+            
+            try:
+                self.lane_detector = self._alt_sistem_baslat(
+                    "serit", YuvLaneDetector if self.yuv_algilama else LaneDetector,
+                    self.tamponlar)
+                self.traffic_light_detector = self._alt_sistem_baslat(
+                    "trafik_isigi",
+                    YuvTrafficLightDetector if self.yuv_algilama else TrafficLightDetector,
+                    self.tamponlar, self.mesafe_tablosu)
+            except Exception as e:
+                hatalar.append(e)
+            
+            for oznitelik, is_ in isler.items():
+                try:
+                    setattr(self, oznitelik, is_.result())
+                except Exception as e:
+                    hatalar.append(e)
+        
+        if hatalar:
+            raise hatalar[0]
+    
+    def _serit_takibi(self, merkez_sapma, kare=None):
         """Şerit takibi için motor kontrolü yapar.
         
         Args:
-            merkez_sapma (float): Şerit merkezinden sapma miktarı (piksel)
+            merkez_sapma (float): Şerit merkezinden sapma miktarı (piksel, pozitif: şerit merkezi sağda)
+            kare (Frame): Sapmanın ölçüldüğü kare (motor komutu bununla damgalanır)
         """
         try:
             # PID kontrol parametreleri (deneysel olarak ayarlanmalı)
@@ -53,24 +217,178 @@ class VehicleController:
             # Temel hız
             temel_hiz = 50
             
-            # Sapma miktarına göre motor hızlarını ayarla
+            # Sapma miktarına göre motor hızlarını ayarla; pozitif sapmada
+            # şerit merkezi sağdadır, sol teker hızlanarak sağa dönülür
             sapma_duzeltme = Kp * merkez_sapma
             
-            sol_hiz = temel_hiz - sapma_duzeltme
-            sag_hiz = temel_hiz + sapma_duzeltme
+            sol_hiz = temel_hiz + sapma_duzeltme
+            sag_hiz = temel_hiz - sapma_duzeltme
             
             # Hızları uygula
-            self.motors.hiz_ayarla(sol_hiz, sag_hiz)
+            self.motors.hiz_ayarla(sol_hiz, sag_hiz, kare=kare)
             
         except Exception as e:
             logger.error(f"Şerit takibi hatası: {str(e)}")
             self.motors.dur()
     
-    def _trafik_isigi_kontrolu(self, frame):
+    def _olcum_geometrisi(self, roi_koordinatlari, frame_shape):
+        """Sapmanın ölçüldüğü satırın zemin geometrisini döndürür.
+        
+        Args:
+            roi_koordinatlari (tuple): ROI'nin (y_start, y_end) koordinatları
+            frame_shape (tuple): Tam kare boyutları
+            
+        Returns:
+            tuple: (geometri, bakis_mesafesi, cm_piksel) - Kare çözünürlüğündeki
+                kamera modeli, ölçüm satırının ileri mesafesi (cm) ve yanal ölçeği (cm/piksel)
+        """
+        anahtar = (tuple(roi_koordinatlari), frame_shape[:2])
+        if self._olcum_geometrisi_onbellek[0] != anahtar:
+            yukseklik, genislik = frame_shape[:2]
+            geometri = self.geometri
+            if (genislik, yukseklik) != (geometri.genislik, geometri.yukseklik):
+                geometri = geometri.olceklenmis((genislik, yukseklik))
+            
+            v = roi_koordinatlari[1] - 1
+            ileri, sol = geometri.zemin_koordinatlari([geometri.cx, geometri.cx + 1], [v, v])
+            self._olcum_geometrisi_onbellek = (
+                anahtar, (geometri, float(ileri[0]), abs(float(sol[0] - sol[1]))))
+        
+        return self._olcum_geometrisi_onbellek[1]
+    
+    def _serit_acisi(self, sol_serit, sag_serit, roi_koordinatlari, geometri):
+        """Şerit merkez eğrisinin zemin düzlemindeki açısını hesaplar.
+        
+        Returns:
+            float: Şeridin araç eksenine göre açısı (radyan, sola pozitif)
+        """
+        if sol_serit is None or sag_serit is None:
+            return 0.0
+        
+        y_start, y_end = roi_koordinatlari
+        satirlar = np.array([y_end - y_start - 1, 0], dtype=np.float64)
+        merkez = (np.polyval(sol_serit, satirlar) + np.polyval(sag_serit, satirlar)) / 2
+        ileri, sol = geometri.zemin_koordinatlari(merkez, satirlar + y_start)
+        
+        aci = math.atan2(float(sol[1] - sol[0]), float(ileri[1] - ileri[0]))
+        return aci if math.isfinite(aci) else 0.0
+    
+    def _serit_sapmasi(self, sol_serit, sag_serit, roi_boyutu):
+        """Şerit merkezinin ROI'nin alt satırındaki sapmasını hesaplar.
+        
+        Sapma, gecikme telafisinin ölçüm geometrisiyle (`_olcum_geometrisi`)
+        aynı satırda ölçülür. Dedektörün döndürdüğü `merkez_sapma` eğrileri
+        ROI yüksekliği yerine kare genişliğine karşılık gelen satırda
+        değerlendirdiğinden (ROI dışına taşan tahmin) kontrolde kullanılmaz.
+        
+        Args:
+            sol_serit, sag_serit: Şerit eğrisi katsayıları (ROI koordinatlarında)
+            roi_boyutu (tuple): ROI görüntüsünün boyutları
+            
+        Returns:
+            float: Sapma (piksel, pozitif: şerit merkezi sağda; şeritlerden biri yoksa 0)
+        """
+        if sol_serit is None or sag_serit is None:
+            return 0.0
+        yukseklik, genislik = roi_boyutu[:2]
+        y = yukseklik - 1
+        serit_merkezi = (np.polyval(sol_serit, y) + np.polyval(sag_serit, y)) / 2
+        return float(serit_merkezi - genislik / 2)
+    
+    def _gecikme_telafisi(self, merkez_sapma, kare_zamani, sol_serit, sag_serit,
+                          roi_koordinatlari, frame_shape):
+        """Karede ölçülen sapmayı motor komutunun uygulanacağı ana taşır.
+        
+        Args:
+            merkez_sapma (float): Karede ölçülen sapma (piksel)
+            kare_zamani (float): Karenin sensör zamanı (time.monotonic)
+            sol_serit, sag_serit: Şerit eğrisi katsayıları (ROI koordinatlarında)
+            roi_koordinatlari (tuple): ROI'nin (y_start, y_end) koordinatları
+            frame_shape (tuple): Tam kare boyutları
+            
+        Returns:
+            float: Tahmini sapma (piksel)
+        """
+        try:
+            simdi = time.monotonic()
+            gecikme = simdi - kare_zamani
+            if self.boru_hatti_gecikmesi is None:
+                self.boru_hatti_gecikmesi = gecikme
+            else:
+                self.boru_hatti_gecikmesi += 0.1 * (gecikme - self.boru_hatti_gecikmesi)
+            
+            geometri, bakis_mesafesi, cm_piksel = self._olcum_geometrisi(
+                roi_koordinatlari, frame_shape)
+            serit_acisi = self._serit_acisi(sol_serit, sag_serit, roi_koordinatlari, geometri)
+            
+            tahmini_sapma, _ = self.odometri.sapma_tahmini(
+                merkez_sapma, kare_zamani, simdi + MOTOR_AKTUASYON_GECIKMESI,
+                bakis_mesafesi, cm_piksel, serit_acisi)
+            
+            logger.bind(anahtar="gecikme_telafisi").debug("Gecikme telafisi: gecikme={:.1f} ms, sapma {:.1f} -> {:.1f} px",
+                         gecikme * 1000, merkez_sapma, tahmini_sapma)
+            return tahmini_sapma
+            
+        except Exception as e:
+            logger.error(f"Gecikme telafisi hatası: {str(e)}")
+            return merkez_sapma
+    
+    def _algilama_cozunurlugu(self):
+        """Dedektörlerin en yüksek kalitede çalışacağı çözünürlük (varsa ISP'de ölçeklenen akış)."""
+        return getattr(self.camera, 'dusuk_cozunurluk', None) \
+            or (self.tamponlar.genislik, self.tamponlar.yukseklik)
+    
+    def _tabela_takipcisi_olustur(self, cozunurluk):
+        """Verilen çalışma çözünürlüğü için tabela dedektörü ve takipçisi oluşturur."""
+        sinif = YuvSignDetector if self.yuv_algilama else SignDetector
+        dedektor = sinif(kamera_cozunurluk=cozunurluk, buffer_havuzu=self.tamponlar,
+                         mesafe_tablosu=self.mesafe_tablosu)
+        takipci = SignTracker(dedektor)
+        takipci.dinleyiciler.append(self._tabela_onaylandi)
+        return takipci
+    
+    def _tabela_takibi(self, frame):
+        """Tabela izlerini günceller (çözünürlük değişirse dedektör ve izler ölçeklenir).
+        
+        Args:
+            frame (numpy.ndarray): Çalışma çözünürlüğündeki görüntü
+        """
+        try:
+            self.tabela_takipcisi.cozunurluk_ayarla((frame.shape[1], frame.shape[0]))
+            self.tabela_takipcisi.guncelle(frame)
+            self.son_tabelalar = self.tabela_takipcisi.tespitler()
+        except Exception as e:
+            logger.error(f"Tabela takibi hatası: {str(e)}")
+    
+    def _tabela_onaylandi(self, iz):
+        """Yeni onaylanan tabelayı mesafesiyle loglar.
+        
+        Args:
+            iz (SignTrack): Onaylanan iz
+        """
+        dedektor = self.tabela_takipcisi.dedektor
+        mesafe = dedektor.tabela_mesafeleri([(iz.tabela_tipi, iz.alan, iz.bbox())])[0]
+        logger.info(f"Tabela: {iz.tabela_tipi} (mesafe ~{mesafe:.0f} cm)")
+    
+    def _olay_bildir(self, neden):
+        """Kara kutuya olay bildirir (aynı neden için `KAYIT_OLAY_ARALIGI` sınırı ile).
+        
+        Args:
+            neden (str): Olay nedeni
+        """
+        if self.kayit is None:
+            return
+        simdi = time.monotonic()
+        if simdi - self._son_olaylar.get(neden, -KAYIT_OLAY_ARALIGI) >= KAYIT_OLAY_ARALIGI:
+            self._son_olaylar[neden] = simdi
+            self.kayit.olay_bildir(neden)
+    
+    def _trafik_isigi_kontrolu(self, frame, kare=None):
         """Trafik ışığı durumunu kontrol eder ve gerekli aksiyonu alır.
         
         Args:
             frame (numpy.ndarray): İşlenecek görüntü
+            kare (Frame): Görüntünün ait olduğu kare (durdurma komutu bununla damgalanır)
             
         Returns:
             bool: Devam edilip edilmeyeceği
@@ -78,29 +396,31 @@ class VehicleController:
         try:
             # Trafik ışığı durumunu al
             isik_durumu, koordinatlar = self.traffic_light_detector.isik_durumunu_tespit_et(frame)
+            self.son_isik_tespiti = (isik_durumu, koordinatlar)
             
             if isik_durumu is not None:
                 # Mesafeyi tahmin et
-                mesafe = self.traffic_light_detector.mesafe_tahmin_et(frame, koordinatlar)
+                mesafe = self.traffic_light_detector.mesafe_tahmin_et(frame, koordinatlar,
+                                                                      isik_durumu)
                 
                 # Duruma göre aksiyon al
                 if isik_durumu == "kirmizi":
                     if mesafe <= MIN_DURMA_MESAFESI:
-                        self.motors.dur()
+                        self.motors.dur(kare)
                         self.durum = "durma"
-                        logger.info("Kırmızı ışık: Araç durduruluyor")
+                        logger.bind(anahtar="isik_kirmizi").info("Kırmızı ışık: Araç durduruluyor")
                         return False
                         
                 elif isik_durumu == "sari":
                     if mesafe <= MIN_DURMA_MESAFESI:
-                        self.motors.dur()
+                        self.motors.dur(kare)
                         self.durum = "durma"
-                        logger.info("Sarı ışık: Araç durduruluyor")
+                        logger.bind(anahtar="isik_sari").info("Sarı ışık: Araç durduruluyor")
                         return False
                         
                 elif isik_durumu == "yesil":
                     self.durum = "hareket"
-                    logger.info("Yeşil ışık: Araç hareket ediyor")
+                    logger.bind(anahtar="isik_yesil").info("Yeşil ışık: Araç hareket ediyor")
                     return True
                 
                 self.son_trafik_isigi = isik_durumu
@@ -158,26 +478,131 @@ class VehicleController:
             logger.error(f"Sollama kontrolü hatası: {str(e)}")
             self.motors.dur()
     
+    def _bekci_tetiklendi(self, neden):
+        """Bekçinin durdurma kararını acil durdurma yolundan da uygular.
+        
+        Bekçi hız çarpanıyla toparlanmayı kendisi yönettiğinden durdurma kalıcı değildir.
+        """
+        if neden.startswith("bekci_durdu"):
+            self.acil_durus.tetikle(neden, kalici=False)
+    
+    def _acil_durus_bildir(self, neden, gecikme):
+        """Acil durdurmayı kara kutuya olay olarak bildirir.
+
+        Bekçi kaynaklı durdurmalar bekçi dinleyicisince zaten bildirildiğinden
+        aynı pencere ikinci kez arşivlenmez.
+        """
+        if neden.startswith("bekci_"):
+            return
+        self._olay_bildir(f"acil_durus_{neden}")
+    
+    def acil_dur(self, neden="api"):
+        """Motorları acil durdurma yolundan kalıcı olarak durdurur (bloklamaz).
+        
+        Sinyal yakalayıcıdan çağrılabilir; motorlar `acil_durus.sifirla()`
+        çağrılana kadar yeni komut almaz.
+        
+        Args:
+            neden (str): Loglarda ve kara kutuda görünecek neden
+        """
+        self.acil_durus.tetikle(neden)
+    
+    def durdur(self):
+        """Ana kontrol döngüsünün bir sonraki turda bitmesini ister."""
+        self.calisiyor = False
+    
     def calistir(self):
         """Ana kontrol döngüsü."""
+        self.calisiyor = True
+        if self.bekci is not None:
+            self.bekci.baslat()
         try:
-            while True:
+            while self.calisiyor:
                 # Görüntü al
-                frame = self.camera.capture_frame()
-                if frame is None:
+                self.zamanlayici.baslat()
+                kare = self.camera.kare_yakala()
+                if kare is None:
                     continue
+                # Tüm yaş ve gecikme hesapları ışığın sensöre düştüğü andan yapılır
+                kare_zamani = kare.sensor_zamani
+                self.gecikme.kare_alindi(kare)
+                self.zamanlayici.isaretle("yakalama")
+                # Kalite yöneticisi kare beklemesini değil döngünün kendi işini ölçer
+                islem_baslangici = time.perf_counter()
+                if self.bekci is not None:
+                    self.bekci.bildir("kare", kare_zamani)
                 
-                # Görüntüyü ön işle
-                frame = self.camera.preprocess_frame(frame)
+                self.dongu_sayisi += 1
+                if not self.ilk_kare_alindi:
+                    self.ilk_kare_alindi = True
+                    logger.info(f"İlk kare alındı: başlatmadan itibaren "
+                                f"{(time.perf_counter() - self.baslatma_zamani) * 1000:.0f} ms")
+                
+                kalite = self.kalite.seviye if self.kalite is not None \
+                    else KALITE_SEVIYELERI[0]
+                
+                # Algılama görüntüsünü (varsa ISP'de ölçeklenmiş akıştan) çalışma
+                # çözünürlüğünde al ve ön işle; olcek ana akışa göre çarpandır
+                frame, olcek = self.camera.algilama_karesi(kare, kalite['olcek'])
+                frame = self.camera.preprocess_frame(frame, kalite['on_isleme'])
+                self.zamanlayici.isaretle("on_isleme")
                 
                 # ROI uygula
-                roi_frame, _ = self.camera.apply_roi(frame)
+                roi_frame, roi_koordinatlari = self.camera.apply_roi(frame)
                 
                 # Şeritleri tespit et
-                sol_serit, sag_serit, merkez_sapma = self.lane_detector.seritleri_bul(roi_frame)
+                sol_serit, sag_serit, _ = self.lane_detector.seritleri_bul(roi_frame)
+                merkez_sapma = self._serit_sapmasi(sol_serit, sag_serit, roi_frame.shape)
+                self.zamanlayici.isaretle("serit")
+                if self.bekci is not None and self.lane_detector.son_tespit_basarili:
+                    self.bekci.bildir("serit", kare_zamani)
+                
+                # Trafik ışığı kontrolü (düşük kalitede her karede çalışmaz)
+                devam = True
+                if self.dongu_sayisi % kalite['isik_araligi'] == 0:
+                    devam = self._trafik_isigi_kontrolu(frame, kare)
+                    self.zamanlayici.isaretle("isik")
+                
+                # Tabela takibi (tam tespit TABELA_TAM_TESPIT_ARALIGI karede bir)
+                if self.tabela_takipcisi is not None:
+                    self._tabela_takibi(frame)
+                    self.zamanlayici.isaretle("tabela")
                 
-                # Trafik ışığı kontrolü
-                if not self._trafik_isigi_kontrolu(frame):
+                # Park yeri haritası (her karede yalnızca yeni şerit; renk
+                # etiketleri BGR olduğundan YUV algılamada ana akış taranır)
+                if self.park_detector is not None:
+                    self.park_detector.guncelle(kare.goruntu if self.yuv_algilama else frame,
+                                                kare_zamani)
+                    self.zamanlayici.isaretle("park")
+                
+                if self.kalite is not None:
+                    self.kalite.dongu_bildir(time.perf_counter() - islem_baslangici)
+                # Yayın ve kayıt ana akışı kullanır
+                if self.debug_yayini is not None:
+                    self.debug_yayini.yayinla(kare.goruntu, sol_serit, sag_serit,
+                                              roi_koordinatlari, self.son_isik_tespiti,
+                                              merkez_sapma, olcek)
+                if self.kayit is not None:
+                    self.kayit.kaydet(kare.goruntu, {
+                        'durum': self.durum,
+                        'merkez_sapma': merkez_sapma,
+                        'sol_serit': sol_serit,
+                        'sag_serit': sag_serit,
+                        'serit_ms': round(self.lane_detector.son_sure * 1000, 3),
+                        'isik': self.son_isik_tespiti,
+                        'tabelalar': self.son_tabelalar,
+                        'motor': (self.motors.sol_hiz, self.motors.sag_hiz),
+                        'kalite': kalite['ad'],
+                        'algilama_olcegi': olcek,
+                        'kare_no': kare.kare_no,
+                        'sensor_zamani': kare.sensor_zamani,
+                        'gecikme': self.boru_hatti_gecikmesi
+                    })
+                    if self.durum == "hareket" \
+                            and abs(merkez_sapma / olcek) > KAYIT_SAPMA_ESIGI:
+                        self._olay_bildir("serit_disi")
+                self.zamanlayici.isaretle("yayin_kayit")
+                if not devam:
                     continue
                 
                 # Yaya geçidi kontrolü
@@ -189,7 +614,13 @@ class VehicleController:
                 
                 # Normal sürüş
                 if self.durum == "hareket":
-                    self._serit_takibi(merkez_sapma)
+                    if GECIKME_TELAFISI:
+                        merkez_sapma = self._gecikme_telafisi(
+                            merkez_sapma, kare_zamani, sol_serit, sag_serit,
+                            roi_koordinatlari, frame.shape)
+                    # Sapma tam çözünürlük pikseline çevrilir; kontrol kazancı ölçekten bağımsızdır
+                    self._serit_takibi(merkez_sapma / olcek, kare)
+                self.zamanlayici.isaretle("kontrol")
                 
                 time.sleep(0.05)  # CPU kullanımını azalt
                 
@@ -197,23 +628,58 @@ class VehicleController:
             logger.info("Program kullanıcı tarafından sonlandırıldı")
         except Exception as e:
             logger.error(f"Ana döngüde hata: {str(e)}")
+            self._olay_bildir("hata")
         finally:
             self.temizle()
     
+    def _gecikme_raporla(self):
+        """Sensörden motor çıkışına gecikme dağılımını loglar."""
+        ozet = self.gecikme.ozet() if getattr(self, 'gecikme', None) is not None else {}
+        if not ozet:
+            return
+        logger.info("Kamera-teker gecikmesi (ms): " + "; ".join(
+            f"{ad} p50={o['p50_ms']:.1f} p95={o['p95_ms']:.1f} p99={o['p99_ms']:.1f} "
+            f"max={o['max_ms']:.1f} (n={o['sayi']})" for ad, o in ozet.items()))
+    
     def temizle(self):
-        """Tüm sistemleri temizler ve kapatır."""
+        """Tüm sistemleri temizler ve kapatır.
+        
+        Önce motorlar durdurulur; her alt sistem ayrı kapatılır, böylece
+        birinin hatası diğerlerinin (özellikle motorların) kapanmasını atlatmaz.
+        """
+        try:
+            if getattr(self, 'motors', None) is not None:
+                self.motors.dur()
+        except Exception as e:
+            logger.error(f"Temizleme sırasında motor durdurma hatası: {str(e)}")
+        
+        # Bekçi ve acil durdurma motorlara yazmayı motorlar kapanmadan önce bırakır
+        for ad, yontem in (('bekci', 'kapat'), ('acil_durus', 'kapat'), ('motors', 'temizle'),
+                           ('camera', 'close'), ('debug_yayini', 'kapat'), ('kayit', 'kapat')):
+            sistem = getattr(self, ad, None)
+            if sistem is None:
+                continue
+            try:
+                getattr(sistem, yontem)()
+            except Exception as e:
+                logger.error(f"Temizleme sırasında hata ({ad}): {str(e)}")
+        
         try:
-            if hasattr(self, 'motors'):
-                self.motors.temizle()
-            if hasattr(self, 'camera'):
-                self.camera.close()
+            if getattr(self, 'lane_detector', None) is not None \
+                    and self.lane_detector.maliyet['kare']:
+                ozet = self.lane_detector.maliyet_ozeti()
+                logger.info(f"Şerit motoru {ozet['motor']}: {ozet['kare']} kare, "
+                            f"ortalama {ozet['ortalama_ms']:.2f} ms, en fazla {ozet['max_ms']:.2f} ms")
+            self._gecikme_raporla()
             logger.info("Tüm sistemler kapatıldı")
         except Exception as e:
             logger.error(f"Temizleme sırasında hata: {str(e)}")
 
 if __name__ == "__main__":
+    from src.utils.logging_setup import log_ayarla
+
     # Log ayarlarını yapılandır
-    logger.add("logs/otonom_arac.log", rotation="1 day")
+    log_ayarla()
     
     # Araç kontrolcüsünü başlat
     controller = VehicleController()
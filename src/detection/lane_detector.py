@@ -1,28 +1,50 @@
 """
 Şerit Algılama Modülü
 """
-import cv2
+import time
 import numpy as np
 from loguru import logger
+from src.utils.lazy_import import LazyModule
+from src.utils.buffer_pool import BufferPool
+from src.utils.calibration_profile import profil_yukle
+from src.detection.lane_engines import serit_motoru_olustur
 from config.config import (
-    SERIT_HSV_ALT,
-    SERIT_HSV_UST,
-    SERIT_GENISLIK
+    SERIT_GENISLIK,
+    SERIT_MOTORU,
+    SERIT_YUV_Y_MIN,
+    SERIT_YUV_RENK_MAX
 )
 
+# OpenCV ilk kullanımda yüklenir
+cv2 = LazyModule("cv2")
+
 class LaneDetector:
     """Şerit algılama ve takibi için sınıf."""
     
-    def __init__(self):
-        """Şerit algılama parametrelerini başlatır."""
-        # Şerit algılama için eşik değerleri
-        self.hsv_alt = np.array(SERIT_HSV_ALT)
-        self.hsv_ust = np.array(SERIT_HSV_UST)
+    def __init__(self, buffer_havuzu=None, profil=None, motor=SERIT_MOTORU):
+        """Şerit algılama parametrelerini başlatır.
+        
+        Args:
+            buffer_havuzu (BufferPool): Ara görüntüler için ortak tampon havuzu
+            profil (dict): Kalibrasyon profili (None ise profil dosyasından yüklenir)
+            motor (str): Şerit noktalarını bulan motor (SERIT_MOTORLARI anahtarı)
+        """
+        # Şerit algılama için eşik değerleri ve perspektif noktaları
+        self.profil_uygula(profil if profil is not None else profil_yukle())
+        
+        # Ara görüntü tamponları ve morfoloji çekirdeği (bir kez oluşturulur)
+        self.tamponlar = buffer_havuzu if buffer_havuzu is not None else BufferPool()
+        self.kernel = np.ones((5,5), np.uint8)
         
         # Şerit bilgileri
         self.son_sol_serit = None
         self.son_sag_serit = None
         self.serit_genislik = SERIT_GENISLIK
+        # Son çağrıda en az bir şerit yeni ölçüldü mü (False ise eski eğriler döner)
+        self.son_tespit_basarili = False
+        
+        # Şerit noktalarını bulan motor ve kare başına maliyeti (saniye)
+        self.motor_sec(motor)
         
         # Perspektif dönüşümü için matrisler
         self.perspektif_matrix = None
@@ -33,6 +55,48 @@ class LaneDetector:
         
         logger.info("Şerit algılama sistemi başlatıldı")
     
+    def motor_sec(self, ad):
+        """Şerit algılama motorunu değiştirir ve maliyet istatistiğini sıfırlar.
+        
+        Args:
+            ad (str): Motor adı (SERIT_MOTORLARI anahtarı)
+        """
+        self.motor = serit_motoru_olustur(self, ad)
+        self.son_sure = 0.0
+        self.maliyet = {'kare': 0, 'toplam': 0.0, 'max': 0.0}
+    
+    def maliyet_ozeti(self):
+        """Seçili motorun kare başına maliyet özetini döndürür.
+        
+        Returns:
+            dict: Motor adı, kare sayısı, ortalama ve en büyük süre (ms)
+        """
+        kare = self.maliyet['kare']
+        return {
+            'motor': self.motor.ad,
+            'kare': kare,
+            'ortalama_ms': self.maliyet['toplam'] * 1000 / kare if kare else 0.0,
+            'max_ms': self.maliyet['max'] * 1000
+        }
+    
+    def profil_uygula(self, profil):
+        """Kalibrasyon profilindeki HSV ve Canny eşiklerini ve perspektif noktalarını uygular.
+        
+        Args:
+            profil (dict): Kalibrasyon profili
+        """
+        self.hsv_alt = np.array(profil['serit_hsv_alt'])
+        self.hsv_ust = np.array(profil['serit_hsv_ust'])
+        self.canny_alt = profil['canny_alt']
+        self.canny_ust = profil['canny_ust']
+        
+        noktalar = np.float32(profil['perspektif_noktalari'])
+        if getattr(self, 'perspektif_noktalari', None) is None \
+                or not np.array_equal(noktalar, self.perspektif_noktalari):
+            # Perspektif matrisi yalnızca noktalar değişince yeniden hesaplanır
+            self.perspektif_noktalari = noktalar
+            self.kalibre_edildi = False
+    
     def _serit_maske_olustur(self, frame):
         """Beyaz şeritleri algılamak için HSV maskesi oluşturur.
         
@@ -40,19 +104,24 @@ class LaneDetector:
             frame (numpy.ndarray): İşlenecek görüntü
             
         Returns:
-            numpy.ndarray: İkili maske görüntüsü
+            numpy.ndarray: İkili maske görüntüsü (havuz tamponu)
         """
         try:
+            kanal = frame.shape[:2]
+            
             # BGR'den HSV'ye dönüşüm
-            hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+            hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV,
+                               dst=self.tamponlar.al('serit_hsv', frame.shape))
             
             # Beyaz renk maskesi
-            mask = cv2.inRange(hsv, self.hsv_alt, self.hsv_ust)
+            ham = cv2.inRange(hsv, self.hsv_alt, self.hsv_ust,
+                              dst=self.tamponlar.al('serit_ham', kanal))
             
             # Morfolojik işlemler
-            kernel = np.ones((5,5), np.uint8)
-            mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel)
-            mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
+            acik = cv2.morphologyEx(ham, cv2.MORPH_OPEN, self.kernel,
+                                    dst=self.tamponlar.al('serit_acik', kanal))
+            mask = cv2.morphologyEx(acik, cv2.MORPH_CLOSE, self.kernel,
+                                    dst=self.tamponlar.al('serit_maske', kanal))
             
             return mask
             
@@ -60,51 +129,23 @@ class LaneDetector:
             logger.error(f"Maske oluşturma hatası: {str(e)}")
             return None
     
-    def _serit_noktalari_bul(self, mask):
-        """Maskedeki şerit noktalarını bulur.
+    def _gri_goruntu(self, frame):
+        """Hough motoru için gri tonlu görüntü.
         
         Args:
-            mask (numpy.ndarray): İkili maske görüntüsü
+            frame (numpy.ndarray): BGR görüntü
             
         Returns:
-            tuple: (sol_noktalar, sag_noktalar) - Şerit noktaları listeleri
+            numpy.ndarray: Gri görüntü (havuz tamponu)
         """
-        try:
-            # Görüntüyü dikey olarak böl
-            height, width = mask.shape
-            sol_bolge = mask[:, :width//2]
-            sag_bolge = mask[:, width//2:]
-            
-            # Her satır için şerit noktalarını bul
-            sol_noktalar = []
-            sag_noktalar = []
-            
-            for y in range(height):
-                # Sol şerit için noktalar
-                sol_satir = sol_bolge[y, :]
-                sol_beyaz = np.where(sol_satir == 255)[0]
-                if len(sol_beyaz) > 0:
-                    sol_x = int(np.mean(sol_beyaz))
-                    sol_noktalar.append((sol_x, y))
-                
-                # Sağ şerit için noktalar
-                sag_satir = sag_bolge[y, :]
-                sag_beyaz = np.where(sag_satir == 255)[0]
-                if len(sag_beyaz) > 0:
-                    sag_x = int(np.mean(sag_beyaz)) + width//2
-                    sag_noktalar.append((sag_x, y))
-            
-            return sol_noktalar, sag_noktalar
-            
-        except Exception as e:
-            logger.error(f"Şerit noktaları bulma hatası: {str(e)}")
-            return [], []
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY,
+                            dst=self.tamponlar.al('serit_gri', frame.shape[:2]))
     
     def _serit_egrisini_hesapla(self, noktalar, frame_shape):
         """Şerit noktalarına en uygun eğriyi hesaplar.
         
         Args:
-            noktalar (list): (x,y) koordinat çiftleri
+            noktalar (numpy.ndarray): (N, 2) boyutlu (x, y) koordinatlar
             frame_shape (tuple): Görüntü boyutları
             
         Returns:
@@ -115,8 +156,8 @@ class LaneDetector:
             
         try:
             # Noktaları x ve y dizilerine ayır
-            x = np.array([p[0] for p in noktalar])
-            y = np.array([p[1] for p in noktalar])
+            x = noktalar[:, 0]
+            y = noktalar[:, 1]
             
             # İkinci dereceden polinom uydur
             katsayilar = np.polyfit(y, x, 2)
@@ -128,7 +169,9 @@ class LaneDetector:
             return None
     
     def seritleri_bul(self, frame):
-        """Görüntüdeki şeritleri tespit eder.
+        """Görüntüdeki şeritleri seçili motorla tespit eder.
+        
+        Çağrının süresi `son_sure` ve `maliyet` içinde tutulur.
         
         Args:
             frame (numpy.ndarray): İşlenecek görüntü
@@ -136,17 +179,17 @@ class LaneDetector:
         Returns:
             tuple: (sol_serit, sag_serit, merkez_sapma) - Şerit eğrileri ve merkez sapması
         """
+        self.son_tespit_basarili = False
         if frame is None:
             return None, None, 0
-            
+        
+        baslangic = time.perf_counter()
         try:
-            # Şerit maskesi oluştur
-            mask = self._serit_maske_olustur(frame)
-            if mask is None:
-                return self.son_sol_serit, self.son_sag_serit, 0
-            
             # Şerit noktalarını bul
-            sol_noktalar, sag_noktalar = self._serit_noktalari_bul(mask)
+            noktalar = self.motor.noktalari_bul(frame)
+            if noktalar is None:
+                return self.son_sol_serit, self.son_sag_serit, 0
+            sol_noktalar, sag_noktalar = noktalar
             
             # Eğrileri hesapla
             sol_serit = self._serit_egrisini_hesapla(sol_noktalar, frame.shape)
@@ -157,6 +200,7 @@ class LaneDetector:
                 self.son_sol_serit = sol_serit
             if sag_serit is not None:
                 self.son_sag_serit = sag_serit
+            self.son_tespit_basarili = sol_serit is not None or sag_serit is not None
             
             # Merkez sapmasını hesapla
             merkez_sapma = self._merkez_sapmasini_hesapla(frame.shape[1])
@@ -166,6 +210,12 @@ class LaneDetector:
         except Exception as e:
             logger.error(f"Şerit bulma hatası: {str(e)}")
             return self.son_sol_serit, self.son_sag_serit, 0
+        
+        finally:
+            self.son_sure = time.perf_counter() - baslangic
+            self.maliyet['kare'] += 1
+            self.maliyet['toplam'] += self.son_sure
+            self.maliyet['max'] = max(self.maliyet['max'], self.son_sure)
     
     def _merkez_sapmasini_hesapla(self, frame_width):
         """Aracın şerit merkezinden sapmasını hesaplar.
@@ -240,14 +290,9 @@ class LaneDetector:
         try:
             height, width = frame.shape[:2]
             
-            # Kaynak noktaları (pistteki dörtgen)
-            # Bu değerler deneysel olarak ayarlanmalı
-            src_points = np.float32([
-                [width * 0.1, height * 0.8],  # Sol alt
-                [width * 0.4, height * 0.5],  # Sol üst
-                [width * 0.6, height * 0.5],  # Sağ üst
-                [width * 0.9, height * 0.8]   # Sağ alt
-            ])
+            # Kaynak noktaları (pistteki dörtgen, kalibrasyon profilinden)
+            # Sıra: sol alt, sol üst, sağ üst, sağ alt
+            src_points = self.perspektif_noktalari * np.float32([width, height])
             
             # Hedef noktaları (kuş bakışı görünüm)
             dst_points = np.float32([
@@ -299,13 +344,8 @@ class LaneDetector:
         try:
             height, width = frame.shape[:2]
             
-            # Referans noktaları
-            points = np.float32([
-                [width * 0.1, height * 0.8],  # Sol alt
-                [width * 0.4, height * 0.5],  # Sol üst
-                [width * 0.6, height * 0.5],  # Sağ üst
-                [width * 0.9, height * 0.8]   # Sağ alt
-            ])
+            # Referans noktaları (kalibrasyon profilinden)
+            points = self.perspektif_noktalari * np.float32([width, height])
             
             # Noktaları görüntü üzerine çiz
             kalibrasyon_goruntusu = frame.copy()
@@ -323,4 +363,71 @@ class LaneDetector:
             
         except Exception as e:
             logger.error(f"Kalibrasyon görüntüsü oluşturma hatası: {str(e)}")
-            return frame 
\ No newline at end of file
+            return frame 
+
+
+class YuvLaneDetector(LaneDetector):
+    """`YuvImage` düzlemleri üzerinde, HSV dönüşümü yapmadan çalışan şerit dedektörü.
+    
+    Beyaz şerit parlak (yüksek Y) ve renksizdir (U ve V 128'e yakın). Y eşiği
+    tam çözünürlükte, renk eşiği yarım çözünürlüklü U/V düzlemlerinde uygulanır.
+    """
+    
+    def __init__(self, buffer_havuzu=None, profil=None, y_min=SERIT_YUV_Y_MIN,
+                 renk_max=SERIT_YUV_RENK_MAX, motor=SERIT_MOTORU):
+        """
+        Args:
+            buffer_havuzu (BufferPool): Ara görüntüler için ortak tampon havuzu
+            profil (dict): Kalibrasyon profili (perspektif noktaları ve Canny eşikleri için)
+            y_min (int): Şerit için en düşük parlaklık
+            renk_max (int): U ve V'nin 128'den izin verilen en büyük sapması
+            motor (str): Şerit noktalarını bulan motor (SERIT_MOTORLARI anahtarı)
+        """
+        super().__init__(buffer_havuzu, profil, motor)
+        self.y_min = y_min
+        self.renk_alt = 128 - renk_max
+        self.renk_ust = 128 + renk_max
+    
+    def _serit_maske_olustur(self, frame):
+        """Beyaz şeritleri algılamak için Y ve UV eşikleriyle maske oluşturur.
+        
+        Args:
+            frame (YuvImage): İşlenecek görüntü
+            
+        Returns:
+            numpy.ndarray: İkili maske görüntüsü (havuz tamponu)
+        """
+        try:
+            kanal = frame.y.shape
+            yarim = frame.u.shape
+            
+            # Renksizlik: her iki renk düzlemi de 128 çevresinde (yarım çözünürlük)
+            u_maske = cv2.inRange(frame.u, self.renk_alt, self.renk_ust,
+                                  dst=self.tamponlar.al('serit_u', yarim))
+            v_maske = cv2.inRange(frame.v, self.renk_alt, self.renk_ust,
+                                  dst=self.tamponlar.al('serit_v', yarim))
+            renksiz = cv2.bitwise_and(u_maske, v_maske, dst=u_maske)
+            renksiz = cv2.resize(renksiz, (kanal[1], kanal[0]),
+                                 interpolation=cv2.INTER_NEAREST,
+                                 dst=self.tamponlar.al('serit_renksiz', kanal))
+            
+            # Parlaklık
+            ham = cv2.inRange(frame.y, self.y_min, 255,
+                              dst=self.tamponlar.al('serit_ham', kanal))
+            cv2.bitwise_and(ham, renksiz, dst=ham)
+            
+            # Morfolojik işlemler
+            acik = cv2.morphologyEx(ham, cv2.MORPH_OPEN, self.kernel,
+                                    dst=self.tamponlar.al('serit_acik', kanal))
+            mask = cv2.morphologyEx(acik, cv2.MORPH_CLOSE, self.kernel,
+                                    dst=self.tamponlar.al('serit_maske', kanal))
+            
+            return mask
+            
+        except Exception as e:
+            logger.error(f"YUV maske oluşturma hatası: {str(e)}")
+            return None
+    
+    def _gri_goruntu(self, frame):
+        """Y düzlemi (kopyalanmadan gri görüntü olarak kullanılır)."""
+        return frame.y
@@ -0,0 +1,293 @@
+"""
+Şerit Algılama Motorları
+------------------------
+`LaneDetector.seritleri_bul` görüntüden şerit noktalarını bu modüldeki
+motorlardan biriyle bulur; eğri uydurma, son eğrilerin tutulması ve merkez
+sapması tüm motorlar için dedektörde ortaktır. Farklı pistler ve ışık
+koşulları farklı motorlara uyar; `SERIT_MOTORU` ile seçilir.
+
+Tüm motorlar aynı arayüzü sağlar:
+    ad: Motorun `SERIT_MOTORLARI` anahtarı
+    noktalari_bul(frame): (sol_noktalar, sag_noktalar) - (N, 2) boyutlu (x, y)
+        dizileri; girdi görüntüsü oluşturulamadıysa None
+
+Motorlar girdi görüntülerini dedektörün `_serit_maske_olustur` ve
+`_gri_goruntu` yöntemlerinden alır; böylece `YuvLaneDetector` ile de
+değişiklik yapmadan çalışırlar.
+"""
+import numpy as np
+from loguru import logger
+from src.utils.lazy_import import LazyModule
+from config.config import (
+    SERIT_MOTORU,
+    SERIT_PENCERE_SAYISI,
+    SERIT_PENCERE_PAYI,
+    SERIT_PENCERE_MIN_PIKSEL,
+    SERIT_HOUGH_ESIGI,
+    SERIT_HOUGH_MIN_UZUNLUK,
+    SERIT_HOUGH_MAX_BOSLUK,
+    SERIT_HOUGH_MIN_EGIM
+)
+
+# OpenCV ilk kullanımda yüklenir
+cv2 = LazyModule("cv2")
+
+
+def _bos_noktalar():
+    """Boş (0, 2) nokta dizisi."""
+    return np.empty((0, 2), np.int64)
+
+
+class RowMeanEngine:
+    """Maskenin her satırında sol ve sağ yarıdaki beyaz piksellerin ortalamasını alan motor."""
+
+    ad = "satir_ortalamasi"
+
+    def __init__(self, dedektor):
+        """
+        Args:
+            dedektor (LaneDetector): Maskeyi oluşturan dedektör
+        """
+        self.dedektor = dedektor
+
+    def noktalari_bul(self, frame):
+        """Maskedeki şerit noktalarını bulur.
+
+        Args:
+            frame (numpy.ndarray): İşlenecek görüntü
+
+        Returns:
+            tuple: (sol_noktalar, sag_noktalar) - Şerit noktaları (maske yoksa None)
+        """
+        mask = self.dedektor._serit_maske_olustur(frame)
+        if mask is None:
+            return None
+
+        try:
+            # Görüntüyü dikey olarak böl
+            height, width = mask.shape
+            sol_bolge = mask[:, :width//2]
+            sag_bolge = mask[:, width//2:]
+
+            # Her satır için şerit noktalarını bul
+            sol_noktalar = []
+            sag_noktalar = []
+
+            for y in range(height):
+                # Sol şerit için noktalar
+                sol_satir = sol_bolge[y, :]
+                sol_beyaz = np.where(sol_satir == 255)[0]
+                if len(sol_beyaz) > 0:
+                    sol_x = int(np.mean(sol_beyaz))
+                    sol_noktalar.append((sol_x, y))
+
+                # Sağ şerit için noktalar
+                sag_satir = sag_bolge[y, :]
+                sag_beyaz = np.where(sag_satir == 255)[0]
+                if len(sag_beyaz) > 0:
+                    sag_x = int(np.mean(sag_beyaz)) + width//2
+                    sag_noktalar.append((sag_x, y))
+
+            return (np.array(sol_noktalar, np.int64).reshape(-1, 2),
+                    np.array(sag_noktalar, np.int64).reshape(-1, 2))
+
+        except Exception as e:
+            logger.error(f"Şerit noktaları bulma hatası: {str(e)}")
+            return _bos_noktalar(), _bos_noktalar()
+
+
+class SlidingWindowEngine:
+    """Alt yarının sütun histogramından başlayıp şeridi yukarı doğru pencerelerle izleyen motor.
+
+    Sol ve sağ yarıdaki histogram tepeleri şeritlerin alt uçlarıdır. Her
+    şerit için kare alttan üste `pencere_sayisi` dikey pencereye bölünür;
+    penceredeki beyaz pikseller şeridin noktalarıdır ve yeterince piksel
+    varsa sonraki pencere bunların ortalamasına kaydırılır. Şerit dışındaki
+    parlak lekeler (tabela, yansıma) pencereye girmedikçe sonuca katılmaz.
+    """
+
+    ad = "kayan_pencere"
+
+    def __init__(self, dedektor, pencere_sayisi=SERIT_PENCERE_SAYISI,
+                 pay=SERIT_PENCERE_PAYI, min_piksel=SERIT_PENCERE_MIN_PIKSEL):
+        """
+        Args:
+            dedektor (LaneDetector): Maskeyi oluşturan dedektör
+            pencere_sayisi (int): Dikey pencere sayısı
+            pay (float): Pencerenin yarı genişliği (kare genişliğine oran)
+            min_piksel (int): Pencere merkezini kaydırmak için gereken en az piksel
+        """
+        self.dedektor = dedektor
+        self.pencere_sayisi = pencere_sayisi
+        self.pay = pay
+        self.min_piksel = min_piksel
+
+    def noktalari_bul(self, frame):
+        """Maskedeki şerit piksellerini kayan pencerelerle toplar.
+
+        Args:
+            frame (numpy.ndarray): İşlenecek görüntü
+
+        Returns:
+            tuple: (sol_noktalar, sag_noktalar) - Şerit pikselleri (maske yoksa None)
+        """
+        mask = self.dedektor._serit_maske_olustur(frame)
+        if mask is None:
+            return None
+
+        try:
+            height, width = mask.shape
+            # Satır sırasıyla gelir; pencereler searchsorted ile dilimlenir
+            ys, xs = np.nonzero(mask)
+            if len(ys) == 0:
+                return _bos_noktalar(), _bos_noktalar()
+
+            # Başlangıç: alt yarının sütun histogramındaki tepeler
+            histogram = np.bincount(xs[ys >= height // 2], minlength=width)
+            orta = width // 2
+            merkezler = []
+            for baslangic, bitis in ((0, orta), (orta, width)):
+                bolge = histogram[baslangic:bitis]
+                merkezler.append(int(np.argmax(bolge)) + baslangic if bolge.any() else None)
+
+            pay = max(1, int(self.pay * width))
+            pencere_yuksekligi = -(-height // self.pencere_sayisi)
+            secimler = ([], [])
+            for i in range(self.pencere_sayisi):
+                y_alt = height - i * pencere_yuksekligi
+                y_ust = max(0, y_alt - pencere_yuksekligi)
+                bas, son = np.searchsorted(ys, (y_ust, y_alt))
+                pencere_x = xs[bas:son]
+                for taraf, merkez in enumerate(merkezler):
+                    if merkez is None:
+                        continue
+                    secim = np.flatnonzero(np.abs(pencere_x - merkez) < pay)
+                    if len(secim) == 0:
+                        continue
+                    secimler[taraf].append(secim + bas)
+                    if len(secim) >= self.min_piksel:
+                        merkezler[taraf] = int(pencere_x[secim].mean())
+
+            noktalar = []
+            for secim in secimler:
+                if not secim:
+                    noktalar.append(_bos_noktalar())
+                    continue
+                indeks = np.concatenate(secim)
+                noktalar.append(np.column_stack((xs[indeks], ys[indeks])))
+            return tuple(noktalar)
+
+        except Exception as e:
+            logger.error(f"Kayan pencere hatası: {str(e)}")
+            return _bos_noktalar(), _bos_noktalar()
+
+
+class HoughEngine:
+    """Gri görüntüde Canny kenarlarından olasılıksal Hough doğru parçaları çıkaran motor.
+
+    Renk eşiği kullanmadığından beyaz maskenin bozulduğu ışıkta (parlama,
+    loş pist) şeridi tutabilir. Canny eşikleri kalibrasyon profilinden
+    (`canny_alt`, `canny_ust`) gelir. Yataya yakın parçalar (dur çizgisi,
+    yaya geçidi) atılır; kalanlar orta noktalarına göre sol ve sağa ayrılır
+    ve her satırda örneklenerek nokta listesine çevrilir.
+    """
+
+    ad = "hough"
+
+    def __init__(self, dedektor, esik=SERIT_HOUGH_ESIGI, min_uzunluk=SERIT_HOUGH_MIN_UZUNLUK,
+                 max_bosluk=SERIT_HOUGH_MAX_BOSLUK, min_egim=SERIT_HOUGH_MIN_EGIM):
+        """
+        Args:
+            dedektor (LaneDetector): Gri görüntüyü ve Canny eşiklerini sağlayan dedektör
+            esik (int): Bir doğru için gereken en az oy
+            min_uzunluk (float): En kısa doğru parçası (kare genişliğine oran)
+            max_bosluk (float): Aynı doğruda birleştirilecek en büyük boşluk
+                (kare genişliğine oran)
+            min_egim (float): Kabul edilen en küçük |dy/dx|
+        """
+        self.dedektor = dedektor
+        self.esik = esik
+        self.min_uzunluk = min_uzunluk
+        self.max_bosluk = max_bosluk
+        self.min_egim = min_egim
+
+    @staticmethod
+    def _parca_noktalari(parcalar):
+        """Doğru parçalarını her satırda bir nokta olacak şekilde örnekler.
+
+        Args:
+            parcalar (numpy.ndarray): (M, 4) boyutlu (x1, y1, x2, y2) parçalar
+
+        Returns:
+            numpy.ndarray: (N, 2) boyutlu (x, y) noktalar
+        """
+        if len(parcalar) == 0:
+            return _bos_noktalar()
+        x1, y1, x2, y2 = parcalar.astype(np.float64).T
+        adim = np.abs(y2 - y1).astype(np.intp) + 1
+        indeks = np.repeat(np.arange(len(parcalar)), adim)
+        # Parça içindeki sıra / (adım - 1): 0 ile 1 arası
+        sira = np.arange(adim.sum()) - np.repeat(np.cumsum(adim) - adim, adim)
+        t = sira / np.maximum(adim[indeks] - 1, 1)
+        return np.column_stack((x1[indeks] + t * (x2 - x1)[indeks],
+                                y1[indeks] + t * (y2 - y1)[indeks]))
+
+    def noktalari_bul(self, frame):
+        """Kenar görüntüsündeki doğru parçalarından şerit noktalarını bulur.
+
+        Args:
+            frame (numpy.ndarray): İşlenecek görüntü
+
+        Returns:
+            tuple: (sol_noktalar, sag_noktalar) - Parça noktaları (gri görüntü yoksa None)
+        """
+        try:
+            gri = self.dedektor._gri_goruntu(frame)
+            height, width = gri.shape
+
+            kenarlar = cv2.Canny(gri, self.dedektor.canny_alt, self.dedektor.canny_ust,
+                                 edges=self.dedektor.tamponlar.al('serit_kenar', gri.shape))
+            parcalar = cv2.HoughLinesP(kenarlar, 1, np.pi / 180, self.esik,
+                                       minLineLength=max(1, int(self.min_uzunluk * width)),
+                                       maxLineGap=max(1, int(self.max_bosluk * width)))
+            if parcalar is None:
+                return _bos_noktalar(), _bos_noktalar()
+            parcalar = parcalar.reshape(-1, 4)
+
+            # Yataya yakın parçaları at
+            dx = np.abs(parcalar[:, 2] - parcalar[:, 0])
+            dy = np.abs(parcalar[:, 3] - parcalar[:, 1])
+            parcalar = parcalar[dy >= self.min_egim * dx]
+
+            sol = (parcalar[:, 0] + parcalar[:, 2]) < 2 * (width // 2)
+            return self._parca_noktalari(parcalar[sol]), self._parca_noktalari(parcalar[~sol])
+
+        except Exception as e:
+            logger.error(f"Hough şerit hatası: {str(e)}")
+            return None
+
+
+SERIT_MOTORLARI = {
+    RowMeanEngine.ad: RowMeanEngine,
+    SlidingWindowEngine.ad: SlidingWindowEngine,
+    HoughEngine.ad: HoughEngine
+}
+
+
+def serit_motoru_olustur(dedektor, ad=SERIT_MOTORU):
+    """Adı verilen şerit algılama motorunu oluşturur.
+
+    Args:
+        dedektor (LaneDetector): Motorun girdi görüntülerini sağlayan dedektör
+        ad (str): Motor adı (SERIT_MOTORLARI anahtarlarından biri)
+
+    Returns:
+        object: Şerit algılama motoru
+    """
+    try:
+        sinif = SERIT_MOTORLARI[ad]
+    except KeyError:
+        raise ValueError(f"Bilinmeyen şerit motoru: {ad}")
+
+    logger.debug(f"Şerit motoru: {ad}")
+    return sinif(dedektor)
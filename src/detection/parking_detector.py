@@ -0,0 +1,262 @@
+"""
+Park Yeri Algılama Modülü
+-------------------------
+`PARK_YERI_RENKLER` içindeki renkli park yerlerini tek geçişte etiketler ve
+araç ilerledikçe yol boyunca bir park yeri haritası oluşturur.
+
+Renk aralıkları BGR kanallarında kutu olduğundan her kanal için 256 girişli
+ve her rengin bir bitini taşıyan tablo, 24 bitlik tam BGR tablosuyla aynı
+sonucu verir: tek `cv2.LUT` çağrısı ve iki bit VE işlemiyle tüm renkler
+birlikte etiketlenir (renk başına ayrı `inRange` gerekmez).
+
+Görüntünün tamamı yerine `PARK_TARAMA_ARALIGI` bandının yalnızca son
+taramadan bu yana araca yaklaşan ince şeridi işlenir (satır-tarama kamerası
+gibi). Şeridin satırları zemin mesafe tablosuyla, ilerleme ise motor
+komutlarından (odometri) hesaplanır. Harita yol koordinatlarındadır:
+`baslangic`/`bitis` yol boyunca ilerleme (cm), `sol` araç eksenine göre yanal
+konumdur; virajlardaki yön değişimi yok sayılır.
+"""
+import numpy as np
+from loguru import logger
+from src.utils.lazy_import import LazyModule
+from src.utils.buffer_pool import BufferPool
+from src.camera.ground_distance import GroundDistanceTable
+from config.config import (
+    PARK_YERI_RENKLER,
+    PARK_YERI_MIN_GENISLIK,
+    PARK_YERI_MIN_DERINLIK,
+    PARK_TARAMA_ARALIGI,
+    PARK_MIN_PIKSEL,
+    PARK_BIRLESTIRME_PAYI,
+    PARK_HARITA_UZUNLUGU
+)
+
+# OpenCV ilk kullanımda yüklenir
+cv2 = LazyModule("cv2")
+
+
+class ParkingDetector:
+    """Renk etiketleme ve artımlı park yeri haritası."""
+
+    def __init__(self, buffer_havuzu=None, mesafe_tablosu=None, odometri=None,
+                 renkler=PARK_YERI_RENKLER, tarama_araligi=PARK_TARAMA_ARALIGI):
+        """
+        Args:
+            buffer_havuzu (BufferPool): Ara görüntüler için ortak tampon havuzu
+            mesafe_tablosu (GroundDistanceTable): Satır mesafeleri (None ise
+                config montaj geometrisiyle oluşturulur)
+            odometri (OdometryPredictor): Kareler arası ilerleme kaynağı (None ise
+                her karede tüm bant taranır ve harita tutulmaz)
+            renkler (dict): {renk: (BGR alt, BGR üst)}
+            tarama_araligi (tuple): Taranan ileri mesafe bandı (cm)
+        """
+        self.tamponlar = buffer_havuzu if buffer_havuzu is not None else BufferPool()
+        self.mesafe_tablosu = mesafe_tablosu if mesafe_tablosu is not None \
+            else GroundDistanceTable()
+        self.odometri = odometri
+        self.yakin, self.uzak = tarama_araligi
+
+        # Her kanal için renk bit maskesi tablosu (en fazla 8 renk)
+        self.renk_adlari = list(renkler)
+        self.lut = np.zeros((256, 1, 3), dtype=np.uint8)
+        for bit, (alt, ust) in enumerate(renkler.values()):
+            for kanal in range(3):
+                self.lut[alt[kanal]:ust[kanal] + 1, 0, kanal] |= 1 << bit
+
+        # Bit maskesinden renk indeksine (tek bitli değerler; diğerleri etiketsiz)
+        self._kod_sayisi = 1 << len(self.renk_adlari)
+        self._bit_renk = np.full(self._kod_sayisi, -1, dtype=np.int16)
+        for i in range(len(self.renk_adlari)):
+            self._bit_renk[1 << i] = i
+
+        # Harita durumu
+        self.yol = 0.0  # Başlangıçtan beri ilerleme (cm)
+        self._son_zaman = None
+        self._taranan = None  # Taranmış en uzak yol konumu (cm)
+        self.yerler = []  # Büyümekte olan ve tamamlanan park yerleri
+        self.bosluk_sayisi = 0  # Taranamadan geçilen şerit sayısı
+
+        logger.info(f"Park yeri algılama başlatıldı - renkler: {', '.join(self.renk_adlari)}, "
+                    f"tarama bandı: {self.yakin}-{self.uzak} cm")
+
+    def renkleri_etiketle(self, frame, ust=0, alt=None):
+        """Tüm park rengi piksellerini tek geçişte etiketler.
+
+        Args:
+            frame (numpy.ndarray): BGR görüntü
+            ust (int): Etiketlenecek ilk satır
+            alt (int): Etiketlenecek son satırın bir fazlası (None ise son satır)
+
+        Returns:
+            numpy.ndarray: Satırların renk bitleri (0: renk yok, 1 << i: i. renk);
+                tam kare havuz tamponunun görünümü
+        """
+        h, w = frame.shape[:2]
+        alt = h if alt is None else alt
+        bitler = cv2.LUT(frame[ust:alt], self.lut,
+                         dst=self.tamponlar.al('park_lut', frame.shape)[ust:alt])
+        etiket = self.tamponlar.al('park_etiket', (h, w))[ust:alt]
+        mavi, yesil, kirmizi = cv2.split(bitler)
+        cv2.bitwise_and(mavi, yesil, dst=etiket)
+        cv2.bitwise_and(etiket, kirmizi, dst=etiket)
+        return etiket
+
+    def _tarama_satirlari(self, cozunurluk, yakin, uzak):
+        """İleri mesafesi [yakin, uzak] aralığındaki satırları döndürür.
+
+        Returns:
+            tuple: (ust, alt) satır aralığı veya aralıkta satır yoksa None
+        """
+        ileri, _, _ = self.mesafe_tablosu.satir_tablosu(cozunurluk)
+        with np.errstate(invalid='ignore'):
+            satirlar = np.flatnonzero((ileri >= yakin) & (ileri <= uzak))
+        if len(satirlar) == 0:
+            return None
+        return int(satirlar[0]), int(satirlar[-1]) + 1
+
+    def guncelle(self, frame, kare_zamani=None):
+        """Yeni şeridi tarar ve park yeri haritasını günceller.
+
+        Args:
+            frame (numpy.ndarray): BGR görüntü
+            kare_zamani (float): Karenin yakalandığı zaman (odometri saatiyle aynı taban)
+
+        Returns:
+            list: Bu karede tamamlanan uygun park yerleri
+        """
+        if frame is None:
+            return []
+
+        try:
+            h, w = frame.shape[:2]
+
+            # Son taramadan bu yana ilerleme; yalnızca araca yaklaşan yeni bant taranır
+            yakin = self.yakin
+            if self.odometri is None:
+                self.yerler = []  # Odometri yoksa her karede yalnızca görünen bant
+            elif kare_zamani is not None:
+                if self._son_zaman is not None:
+                    self.yol += self.odometri.hareket(self._son_zaman, kare_zamani)[0]
+                self._son_zaman = kare_zamani
+                if self._taranan is not None:
+                    yakin = self._taranan - self.yol
+                    if yakin >= self.uzak:
+                        return self._tamamlananlar()  # Araç durmuş veya geri gidiyor
+                    if yakin < self.yakin:
+                        # Kareler arası ilerleme bandı aştı: aradaki zemin görülmedi
+                        self.bosluk_sayisi += 1
+                        yakin = self.yakin
+
+            satirlar = self._tarama_satirlari((w, h), yakin, self.uzak)
+            if satirlar is None:
+                return self._tamamlananlar()  # Şerit bir satırdan ince; sonraki karede
+            ust, alt = satirlar
+
+            etiket = self.renkleri_etiketle(frame, ust, alt)
+            self._seridi_isle(etiket, ust, (w, h))
+            self._taranan = self.yol + self.uzak
+            return self._tamamlananlar()
+
+        except Exception as e:
+            logger.error(f"Park yeri algılama hatası: {str(e)}")
+            return []
+
+    def _seridi_isle(self, etiket, ust, cozunurluk):
+        """Şeritteki renk bileşenlerini haritadaki park yerlerine ekler."""
+        sayi, bilesenler, istatistikler, _ = cv2.connectedComponentsWithStats(
+            etiket, connectivity=8)
+        if sayi <= 1:
+            return
+
+        # Bileşen başına baskın renk: (bileşen, renk bitleri) çiftlerinin tek bincount'u
+        renk_sayilari = np.bincount(
+            (bilesenler * self._kod_sayisi + etiket).ravel(),
+            minlength=sayi * self._kod_sayisi).reshape(sayi, self._kod_sayisi)
+        renk_sayilari[:, 0] = 0
+        baskin_bit = renk_sayilari.argmax(axis=1)
+
+        ileri, yanal, _ = self.mesafe_tablosu.satir_tablosu(cozunurluk)
+        cx = self.mesafe_tablosu.kamera_modeli(cozunurluk).cx
+
+        x, y, gen, yuk, alan = (istatistikler[1:, i].astype(np.int64) for i in range(5))
+        renk = self._bit_renk[baskin_bit[1:]]
+        gecerli = (alan >= PARK_MIN_PIKSEL) & (renk >= 0)
+
+        # Bileşen kutularının yol ve yanal konumları (tablolardan, tümü birlikte)
+        satir_ust = ust + y
+        satir_alt = ust + y + yuk - 1
+        satir_orta = (satir_ust + satir_alt) // 2
+        baslangic = self.yol + ileri[satir_alt]
+        bitis = self.yol + ileri[satir_ust]
+        sol_max = yanal[satir_orta] * (cx - x)
+        sol_min = yanal[satir_orta] * (cx - (x + gen - 1))
+
+        for i in np.flatnonzero(gecerli):
+            self._parca_ekle(self.renk_adlari[renk[i]], float(baslangic[i]), float(bitis[i]),
+                             float(sol_min[i]), float(sol_max[i]))
+
+    def _parca_ekle(self, renk, baslangic, bitis, sol_min, sol_max):
+        """Şerit parçasını uygun park yeriyle birleştirir veya yeni yer açar."""
+        pay = PARK_BIRLESTIRME_PAYI
+        for yer in self.yerler:
+            if yer['tamamlandi'] or yer['renk'] != renk:
+                continue
+            if baslangic <= yer['bitis'] + pay and sol_min <= yer['sol_max'] \
+                    and sol_max >= yer['sol_min']:
+                yer['baslangic'] = min(yer['baslangic'], baslangic)
+                yer['bitis'] = max(yer['bitis'], bitis)
+                yer['sol_min'] = min(yer['sol_min'], sol_min)
+                yer['sol_max'] = max(yer['sol_max'], sol_max)
+                return
+
+        self.yerler.append({'renk': renk, 'baslangic': baslangic, 'bitis': bitis,
+                            'sol_min': sol_min, 'sol_max': sol_max, 'tamamlandi': False})
+
+    def _tamamlananlar(self):
+        """Artık büyümeyecek yerleri tamamlar ve uygun olanları döndürür.
+
+        Bir yerin uzak kenarı son taranan şeridin gerisinde kaldıysa o yer
+        tamamlanmıştır. Harita uzunluğunun gerisinde kalan yerler silinir.
+        """
+        if self._taranan is None:
+            return []
+
+        yeni = []
+        for yer in self.yerler:
+            if not yer['tamamlandi'] and (self.odometri is None
+                                          or yer['bitis'] + PARK_BIRLESTIRME_PAYI
+                                          < self._taranan):
+                yer['tamamlandi'] = True
+                yer['genislik'] = yer['bitis'] - yer['baslangic']
+                yer['derinlik'] = yer['sol_max'] - yer['sol_min']
+                yer['uygun'] = yer['genislik'] >= PARK_YERI_MIN_GENISLIK \
+                    and yer['derinlik'] >= PARK_YERI_MIN_DERINLIK
+                if yer['uygun']:
+                    yeni.append(yer)
+                    logger.info(f"Park yeri bulundu: {yer['renk']}, "
+                                f"{yer['genislik']:.0f}x{yer['derinlik']:.0f} cm, "
+                                f"araç merkezine göre {yer['baslangic'] - self.yol:+.0f} cm")
+
+        self.yerler = [yer for yer in self.yerler
+                       if yer['bitis'] >= self.yol - PARK_HARITA_UZUNLUGU]
+        return yeni
+
+    def park_yerleri(self, sadece_uygun=True):
+        """Haritadaki tamamlanmış park yerlerini döndürür.
+
+        Args:
+            sadece_uygun (bool): Yalnızca boyut sınırlarını sağlayanlar mı
+
+        Returns:
+            list: Park yerleri (yol koordinatlarında, cm)
+        """
+        return [yer for yer in self.yerler
+                if yer['tamamlandi'] and (yer['uygun'] or not sadece_uygun)]
+
+    def sifirla(self):
+        """Haritayı ve ilerlemeyi sıfırlar."""
+        self.yol = 0.0
+        self._son_zaman = None
+        self._taranan = None
+        self.yerler = []
+        self.bosluk_sayisi = 0
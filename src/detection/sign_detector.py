@@ -1,15 +1,29 @@
 """
 Trafik Tabelası Algılama Modülü - Şekil Tabanlı Tespit
 """
-import cv2
 import numpy as np
 from loguru import logger
 import time
+from src.utils.buffer_pool import BufferPool
+from src.utils.lazy_import import LazyModule
+from src.utils.calibration_profile import profil_yukle
+from src.camera.ground_distance import GroundDistanceTable
+from config.config import (
+    TABELA_RENK_ONERISI,
+    TABELA_RENK_ARALIKLARI,
+    TABELA_YUV_ARALIKLARI,
+    TABELA_ONERI_OLCEK,
+    TABELA_ONERI_RENK_KENARI
+)
+
+# OpenCV ilk kullanımda yüklenir
+cv2 = LazyModule("cv2")
 
 class SignDetector:
     """Şekil tabanlı trafik tabelası algılama sınıfı."""
     
-    def __init__(self, kamera_cozunurluk=(640, 480), min_alan_oran=0.01, max_alan_oran=0.1):
+    def __init__(self, kamera_cozunurluk=(640, 480), min_alan_oran=0.01, max_alan_oran=0.1,
+                 buffer_havuzu=None, renk_onerisi=TABELA_RENK_ONERISI, mesafe_tablosu=None):
         """
         Tabela algılama sistemini başlatır.
         
@@ -17,32 +31,58 @@ class SignDetector:
             kamera_cozunurluk (tuple): Kamera çözünürlüğü (genişlik, yükseklik)
             min_alan_oran (float): Minimum şekil alanı oranı (görüntü alanına göre)
             max_alan_oran (float): Maximum şekil alanı oranı (görüntü alanına göre)
+            buffer_havuzu (BufferPool): Ara görüntüler için ortak tampon havuzu
+            renk_onerisi (bool): Kenar analizi yalnızca tabela renkli bölgelerde mi yapılsın
+            mesafe_tablosu (GroundDistanceTable): Ortak mesafe tablosu (None ise
+                config montaj geometrisiyle oluşturulur)
         """
-        # Kamera çözünürlüğü
-        self.genislik, self.yukseklik = kamera_cozunurluk
-        goruntu_alani = self.genislik * self.yukseklik
+        # Kamera çözünürlüğü ve şekil alanı sınırları (görüntü boyutuna göre dinamik)
+        self.min_alan_oran = min_alan_oran
+        self.max_alan_oran = max_alan_oran
+        self.cozunurluk_ayarla(kamera_cozunurluk)
         
-        # Şekil alanı sınırları (görüntü boyutuna göre dinamik)
-        self.min_alan = int(goruntu_alani * min_alan_oran)
-        self.max_alan = int(goruntu_alani * max_alan_oran)
-        
-        # Görüntü işleme parametreleri
+        # Görüntü işleme parametreleri (Canny eşikleri kalibrasyon profilinden)
+        profil = profil_yukle()
         self.blur_kernel = (5, 5)
-        self.canny_alt = 50
-        self.canny_ust = 150
+        self.canny_alt = profil['canny_alt']
+        self.canny_ust = profil['canny_ust']
         self.dilate_kernel = np.ones((5,5), np.uint8)
         self.dilate_iter = 1
         
+        # Ara görüntü tamponları
+        self.tamponlar = buffer_havuzu if buffer_havuzu is not None else BufferPool(kamera_cozunurluk)
+        self.tamponlar.onceden_ayir({ad: self.tamponlar.maske_boyutu for ad in (
+            'tabela_gri', 'tabela_blur', 'tabela_kenar', 'tabela_genis'
+        )})
+        
         # Şekil tespit parametreleri
         self.epsilon_oran = 0.04
         self.kare_oran_alt = 0.8
         self.kare_oran_ust = 1.2
         self.dairesellik_esik = 0.8
         
+        # Ucuz ön eleme sınırları (şekil analizinden önce toplu uygulanır)
+        self.min_nokta_sayisi = 3
+        self.bbox_oran_alt = 0.3
+        self.bbox_oran_ust = 3.0
+        
+        # Renk tabanlı bölge önerisi
+        self.renk_onerisi = renk_onerisi
+        self.renk_araliklari = [(np.array(alt), np.array(ust))
+                                for araliklar in TABELA_RENK_ARALIKLARI.values()
+                                for alt, ust in araliklar]
+        self.oneri_olcek = TABELA_ONERI_OLCEK
+        self.oneri_kernel = np.ones((3, 3), np.uint8)
+        self.oneri_doluluk = 0.1  # Renkli piksel / kutu alanı alt sınırı
+        self.oneri_pay = 0.2  # Öneri kutusunun her yönde genişletilme oranı
+        self.oneri_renk_kenari = TABELA_ONERI_RENK_KENARI
+        
         # Tabela bilgileri (cm)
         self.direk_yukseklik = 20
         self.tabela_yukseklik = 13
         self.toplam_yukseklik = self.direk_yukseklik + self.tabela_yukseklik
+        self.mesafe_tablosu = mesafe_tablosu if mesafe_tablosu is not None \
+            else GroundDistanceTable()
         
         # FPS hesaplama için değişkenler
         self.fps = 0
@@ -65,6 +105,17 @@ class SignDetector:
         
         logger.info(f"Şekil tabanlı tabela algılama sistemi başlatıldı - Min Alan: {self.min_alan}, Max Alan: {self.max_alan}")
     
+    def cozunurluk_ayarla(self, kamera_cozunurluk):
+        """Çalışma çözünürlüğünü değiştirir ve alan sınırlarını yeni görüntü alanına göre hesaplar.
+        
+        Args:
+            kamera_cozunurluk (tuple): Görüntü çözünürlüğü (genişlik, yükseklik)
+        """
+        self.genislik, self.yukseklik = kamera_cozunurluk
+        goruntu_alani = self.genislik * self.yukseklik
+        self.min_alan = int(goruntu_alani * self.min_alan_oran)
+        self.max_alan = int(goruntu_alani * self.max_alan_oran)
+    
     def parametreleri_ayarla(self, blur_kernel=(5,5), canny_alt=50, canny_ust=150,
                             epsilon_oran=0.04, dairesellik_esik=0.8):
         """Görüntü işleme parametrelerini ayarlar."""
@@ -98,11 +149,12 @@ class SignDetector:
             self.fps_sayac = 0
             self.son_fps_guncelleme = time.time()
     
-    def _sekil_tespit(self, kontur):
+    def _sekil_tespit(self, kontur, alan=None):
         """Konturun şeklini tespit eder.
         
         Args:
             kontur: Şekil konturu
+            alan (float): Önceden hesaplanmış kontur alanı (None ise hesaplanır)
             
         Returns:
             str: Şekil tipi ('dortgen', 'ucgen', 'daire' veya None)
@@ -120,7 +172,8 @@ class SignDetector:
             koseler = len(approx)
             
             # Dairesellik oranı
-            alan = cv2.contourArea(kontur)
+            if alan is None:
+                alan = cv2.contourArea(kontur)
             dairesellik = 4 * np.pi * alan / (cevre * cevre)
             
             if koseler == 3:
@@ -143,31 +196,265 @@ class SignDetector:
             logger.error(f"Şekil tespit hatası: {str(e)}")
             return None
     
-    def _goruntu_on_isle(self, frame):
+    def _toplu_olcumler(self, konturlar):
+        """Tüm konturların ucuz ölçümlerini tek seferde hesaplar.
+        
+        Noktalar tek dizide birleştirilir; sınırlayıcı kutular ve alanlar
+        (shoelace formülü, `contourArea` ile aynı sonuç) kontur sınırlarında
+        `reduceat` ile toplanır.
+        
+        Args:
+            konturlar: `findContours` çıktısı
+            
+        Returns:
+            tuple: (nokta_sayilari, x, y, w, h, alanlar) dizileri
+        """
+        nokta_sayilari = np.fromiter((len(k) for k in konturlar), dtype=np.intp,
+                                     count=len(konturlar))
+        noktalar = np.concatenate(konturlar).reshape(-1, 2)
+        baslangiclar = np.zeros(len(konturlar), dtype=np.intp)
+        np.cumsum(nokta_sayilari[:-1], out=baslangiclar[1:])
+        
+        # Sınırlayıcı kutular (boundingRect ile aynı: genişlik = max - min + 1)
+        min_xy = np.minimum.reduceat(noktalar, baslangiclar, axis=0)
+        max_xy = np.maximum.reduceat(noktalar, baslangiclar, axis=0)
+        boyut = max_xy - min_xy + 1
+        
+        # Her noktanın kendi konturundaki bir sonraki noktası
+        sonraki = np.arange(1, len(noktalar) + 1)
+        sonraki[baslangiclar + nokta_sayilari - 1] = baslangiclar
+        x = noktalar[:, 0].astype(np.float64)
+        y = noktalar[:, 1].astype(np.float64)
+        capraz = x * y[sonraki] - x[sonraki] * y
+        alanlar = np.abs(np.add.reduceat(capraz, baslangiclar)) / 2
+        
+        return nokta_sayilari, min_xy[:, 0], min_xy[:, 1], boyut[:, 0], boyut[:, 1], alanlar
+    
+    def _on_eleme(self, konturlar):
+        """Şekil analizine girecek konturları ucuz ölçümlerle seçer.
+        
+        Args:
+            konturlar: `findContours` çıktısı
+            
+        Returns:
+            list: [(kontur, alan, bbox), ...] - Elemeden geçen konturlar
+        """
+        if len(konturlar) == 0:
+            return []
+        
+        nokta_sayilari, x, y, w, h, alanlar = self._toplu_olcumler(konturlar)
+        
+        # Kontur alanı kutu alanını aşamaz; küçük kutular alan kontrolüne girmeden elenir
+        oran = w / h
+        gecerli = (nokta_sayilari >= self.min_nokta_sayisi) \
+            & (w * h >= self.min_alan) \
+            & (oran >= self.bbox_oran_alt) & (oran <= self.bbox_oran_ust) \
+            & (alanlar >= self.min_alan) & (alanlar <= self.max_alan)
+        
+        return [(konturlar[i], float(alanlar[i]),
+                 (int(x[i]), int(y[i]), int(w[i]), int(h[i])))
+                for i in np.flatnonzero(gecerli)]
+    
+    def _renk_maskesi(self, hsv, maske, gecici):
+        """Tüm tabela renk aralıklarının birleşim maskesini `maske` içine yazar."""
+        for i, (alt, ust) in enumerate(self.renk_araliklari):
+            if i == 0:
+                cv2.inRange(hsv, alt, ust, dst=maske)
+            else:
+                cv2.bitwise_or(maske, cv2.inRange(hsv, alt, ust, dst=gecici), dst=maske)
+        return maske
+    
+    def _renk_onerileri(self, frame):
+        """Tabela renklerindeki bölgelerden aday kutular üretir.
+        
+        Renk maskesi küçültülmüş karede hesaplanır; bağlı bileşenlerin
+        kutuları boyut, oran ve doluluk ile elenir, kenar analizi için pay
+        eklenerek tam çözünürlüğe taşınır ve çakışanlar birleştirilir.
+        
+        Args:
+            frame (numpy.ndarray): BGR görüntü
+            
+        Returns:
+            list: [(x0, y0, x1, y1), ...] aday bölgeler
+        """
+        yukseklik, genislik = frame.shape[:2]
+        olcek = self.oneri_olcek
+        kucuk_boyut = (max(1, int(genislik * olcek)), max(1, int(yukseklik * olcek)))
+        kanal = (kucuk_boyut[1], kucuk_boyut[0])
+        
+        renk = self._oneri_renk_goruntusu(frame, kucuk_boyut)
+        maske = self._renk_maskesi(renk, self.tamponlar.al('tabela_renk', kanal),
+                                   self.tamponlar.al('tabela_renk_gecici', kanal))
+        maske = cv2.morphologyEx(maske, cv2.MORPH_CLOSE, self.oneri_kernel,
+                                 dst=self.tamponlar.al('tabela_renk_kapali', kanal))
+        
+        _, _, istatistikler, _ = cv2.connectedComponentsWithStats(
+            maske, labels=self.tamponlar.al('tabela_etiket', kanal, np.int32),
+            connectivity=8)
+        
+        # Arka plan (0) hariç bileşenler, tam çözünürlük biriminde
+        istatistikler = istatistikler[1:].astype(np.float64)
+        x, y, w, h = (istatistikler[:, :4] / olcek).T
+        piksel = istatistikler[:, 4] / (olcek * olcek)
+        kutu_alani = w * h
+        oran = w / np.maximum(h, 1e-6)
+        gecerli = (kutu_alani >= self.min_alan * 0.5) \
+            & (kutu_alani <= self.max_alan * 4) \
+            & (oran >= self.bbox_oran_alt) & (oran <= self.bbox_oran_ust) \
+            & (piksel >= kutu_alani * self.oneri_doluluk)
+        
+        bolgeler = []
+        for i in np.flatnonzero(gecerli):
+            pay_x, pay_y = w[i] * self.oneri_pay + 4, h[i] * self.oneri_pay + 4
+            bolgeler.append([max(0, int(x[i] - pay_x)), max(0, int(y[i] - pay_y)),
+                             min(genislik, int(x[i] + w[i] + pay_x)),
+                             min(yukseklik, int(y[i] + h[i] + pay_y))])
+        
+        return self._bolgeleri_birlestir(bolgeler)
+    
+    def _oneri_renk_goruntusu(self, frame, kucuk_boyut):
+        """Renk önerisi maskesinin hesaplanacağı küçültülmüş HSV görüntü.
+        
+        Args:
+            frame (numpy.ndarray): BGR görüntü
+            kucuk_boyut (tuple): (genişlik, yükseklik) hedef boyut
+            
+        Returns:
+            numpy.ndarray: HSV görüntü (havuz tamponu)
+        """
+        kanal = (kucuk_boyut[1], kucuk_boyut[0])
+        kucuk = cv2.resize(frame, kucuk_boyut, interpolation=cv2.INTER_NEAREST,
+                           dst=self.tamponlar.al('tabela_kucuk', kanal + (3,)))
+        return cv2.cvtColor(kucuk, cv2.COLOR_BGR2HSV,
+                            dst=self.tamponlar.al('tabela_hsv', kanal + (3,)))
+    
+    def _bolge_renk_goruntusu(self, frame, bolge):
+        """Bir bölgenin tam çözünürlüklü HSV görüntüsü.
+        
+        Args:
+            frame (numpy.ndarray): BGR görüntü
+            bolge (tuple): (x0, y0, x1, y1) bölgesi
+            
+        Returns:
+            numpy.ndarray: Bölgenin HSV görüntüsü (tam kare tamponunun aynı konumu)
+        """
+        x0, y0, x1, y1 = bolge
+        return cv2.cvtColor(frame[y0:y1, x0:x1], cv2.COLOR_BGR2HSV,
+                            dst=self.tamponlar.al('tabela_hsv_tam', frame.shape)[y0:y1, x0:x1])
+    
+    def _gri_goruntu(self, frame, bolge):
+        """Bir bölgenin gri tonlu görüntüsü.
+        
+        Args:
+            frame (numpy.ndarray): BGR görüntü
+            bolge (tuple): (x0, y0, x1, y1) bölgesi
+            
+        Returns:
+            numpy.ndarray: Bölgenin gri görüntüsü (tam kare tamponunun aynı konumu)
+        """
+        x0, y0, x1, y1 = bolge
+        return cv2.cvtColor(frame[y0:y1, x0:x1], cv2.COLOR_BGR2GRAY,
+                            dst=self.tamponlar.al('tabela_gri', frame.shape[:2])[y0:y1, x0:x1])
+    
+    @staticmethod
+    def _bolgeleri_birlestir(bolgeler):
+        """Çakışan kutuları, çakışma kalmayana kadar birleştirir."""
+        birlesti = True
+        while birlesti:
+            birlesti = False
+            sonuc = []
+            for kutu in bolgeler:
+                for diger in sonuc:
+                    if kutu[0] < diger[2] and diger[0] < kutu[2] \
+                            and kutu[1] < diger[3] and diger[1] < kutu[3]:
+                        diger[0], diger[1] = min(diger[0], kutu[0]), min(diger[1], kutu[1])
+                        diger[2], diger[3] = max(diger[2], kutu[2]), max(diger[3], kutu[3])
+                        birlesti = True
+                        break
+                else:
+                    sonuc.append(kutu)
+            bolgeler = sonuc
+        return [tuple(kutu) for kutu in bolgeler]
+    
+    def _oneri_konturlari(self, frame):
+        """Konturları yalnızca renk önerisi bölgelerinde arar.
+        
+        Args:
+            frame (numpy.ndarray): BGR görüntü
+            
+        Returns:
+            list: Tam kare koordinatlarında konturlar
+        """
+        konturlar = []
+        for bolge in self._renk_onerileri(frame):
+            konturlar.extend(self._bolge_konturlari(frame, bolge))
+        return konturlar
+    
+    def _bolge_konturlari(self, frame, bolge):
+        """Bir bölgedeki kenar konturlarını (istenirse renk maskesiyle birlikte) bulur.
+        
+        Args:
+            frame (numpy.ndarray): BGR görüntü
+            bolge (tuple): (x0, y0, x1, y1) bölgesi
+            
+        Returns:
+            list: Tam kare koordinatlarında konturlar
+        """
+        x0, y0, x1, y1 = bolge
+        kenarlar = self._goruntu_on_isle(frame, bolge)
+        if kenarlar is None:
+            return []
+        
+        if self.oneri_renk_kenari:
+            # Plaka ile zemin arasında gri ton farkı düşükse kenarlar kapanmaz;
+            # bölgedeki tam çözünürlüklü renk maskesi kenarlarla birleştirilir.
+            # Konturları değiştirdiğinden tam kare analiziyle birebir sonuç vermez.
+            kanal = frame.shape[:2]
+            def tampon(ad):
+                return self.tamponlar.al(ad, kanal)[y0:y1, x0:x1]
+            renk = self._renk_maskesi(self._bolge_renk_goruntusu(frame, bolge),
+                                      tampon('tabela_renk_tam'), tampon('tabela_renk_tam_gecici'))
+            cv2.bitwise_or(kenarlar, renk, dst=kenarlar)
+        
+        konturlar, _ = cv2.findContours(kenarlar, cv2.RETR_EXTERNAL,
+                                        cv2.CHAIN_APPROX_SIMPLE,
+                                        offset=(x0, y0))
+        return konturlar
+    
+    def _goruntu_on_isle(self, frame, bolge=None):
         """Görüntüyü işlemeye hazırlar.
         
         Args:
             frame (numpy.ndarray): İşlenecek görüntü
+            bolge (tuple): Yalnızca işlenecek (x0, y0, x1, y1) bölgesi; sonuç
+                tam kare tamponlarının aynı konumuna yazılır (None ise tüm kare)
             
         Returns:
-            numpy.ndarray: İşlenmiş görüntü
+            numpy.ndarray: İşlenmiş görüntü (bölge verildiyse bölgenin kendisi)
         """
         if frame is None or frame.size == 0:
             raise ValueError("Geçersiz görüntü")
             
         try:
+            kanal = frame.shape[:2]
+            x0, y0, x1, y1 = bolge if bolge is not None else (0, 0, kanal[1], kanal[0])
+            
+            def tampon(ad):
+                return self.tamponlar.al(ad, kanal)[y0:y1, x0:x1]
+            
             # Gri tonlamaya çevir
-            gri = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            gri = self._gri_goruntu(frame, (x0, y0, x1, y1))
             
             # Gürültü azaltma
-            blur = cv2.GaussianBlur(gri, self.blur_kernel, 0)
+            blur = cv2.GaussianBlur(gri, self.blur_kernel, 0, dst=tampon('tabela_blur'))
             
             # Kenar tespiti
-            kenarlar = cv2.Canny(blur, self.canny_alt, self.canny_ust)
+            kenarlar = cv2.Canny(blur, self.canny_alt, self.canny_ust,
+                                 edges=tampon('tabela_kenar'))
             
             # Morfolojik işlemler
-            kenarlar = cv2.dilate(kenarlar, self.dilate_kernel, 
-                                iterations=self.dilate_iter)
+            kenarlar = cv2.dilate(kenarlar, self.dilate_kernel, dst=tampon('tabela_genis'),
+                                  iterations=self.dilate_iter)
             
             return kenarlar
             
@@ -193,37 +480,93 @@ class SignDetector:
             # FPS güncelle
             self._fps_guncelle()
             
-            # Görüntüyü ön işle
-            islenmiş = self._goruntu_on_isle(frame)
-            if islenmiş is None:
-                return []
-            
-            # Konturları bul
-            konturlar, _ = cv2.findContours(islenmiş, cv2.RETR_EXTERNAL, 
-                                          cv2.CHAIN_APPROX_SIMPLE)
+            if self.renk_onerisi:
+                # Kenar ve kontur analizi yalnızca tabela renkli bölgelerde
+                konturlar = self._oneri_konturlari(frame)
+            else:
+                # Görüntüyü ön işle
+                islenmiş = self._goruntu_on_isle(frame)
+                if islenmiş is None:
+                    return []
+                
+                # Konturları bul
+                konturlar, _ = cv2.findContours(islenmiş, cv2.RETR_EXTERNAL, 
+                                              cv2.CHAIN_APPROX_SIMPLE)
             
-            tespitler = []
-            for kontur in konturlar:
-                # Alan kontrolü
-                alan = cv2.contourArea(kontur)
-                if self.min_alan <= alan <= self.max_alan:
-                    # Şekil tespiti
-                    sekil = self._sekil_tespit(kontur)
-                    if sekil:
-                        # Sınırlayıcı kutu
-                        x, y, w, h = cv2.boundingRect(kontur)
-                        
-                        # Tabela tipini belirle
-                        tabela_tipi = self.TABELA_TIPI.get(sekil)
-                        if tabela_tipi:
-                            tespitler.append((tabela_tipi, alan, (x, y, w, h)))
-            
-            return tespitler
+            return self._tespitleri_sec(konturlar)
             
         except Exception as e:
             logger.error(f"Tabela tespit hatası: {str(e)}")
             return []
     
+    def _tespitleri_sec(self, konturlar):
+        """Konturlardan tabela şekillerini seçer.
+        
+        Nokta sayısı, kutu boyutu/oranı ve alan ile toplu ön eleme yapılır;
+        çokgen yaklaşımı yalnızca kalan konturlar için yapılır.
+        
+        Returns:
+            list: [(tabela_tipi, alan, bbox), ...] formatında tespit listesi
+        """
+        tespitler = []
+        for kontur, alan, bbox in self._on_eleme(konturlar):
+            sekil = self._sekil_tespit(kontur, alan)
+            if sekil:
+                # Tabela tipini belirle
+                tabela_tipi = self.TABELA_TIPI.get(sekil)
+                if tabela_tipi:
+                    tespitler.append((tabela_tipi, alan, bbox))
+        return tespitler
+    
+    def bolgede_tespit_et(self, frame, bolge):
+        """Tabelaları yalnızca verilen küçük bölgede arar.
+        
+        Renk önerisi adımı atlanır; takip edilen bir tabelanın tahmini kutusu
+        çevresini doğrulamak için kullanılır.
+        
+        Args:
+            frame (numpy.ndarray): İşlenecek görüntü
+            bolge (tuple): (x0, y0, x1, y1) bölgesi (tam kare koordinatları)
+            
+        Returns:
+            list: [(tabela_tipi, alan, bbox), ...] formatında tespit listesi
+        """
+        try:
+            x0, y0, x1, y1 = bolge
+            if x1 - x0 < 2 or y1 - y0 < 2:
+                return []
+            return self._tespitleri_sec(self._bolge_konturlari(frame, bolge))
+        except Exception as e:
+            logger.error(f"Bölgede tabela tespit hatası: {str(e)}")
+            return []
+    
+    def tabela_mesafeleri(self, tespitler, cozunurluk=None):
+        """Tespit edilen tabelaların ileri mesafelerini toplu olarak tahmin eder.
+        
+        Kutunun alt kısmı direği içerebileceğinden plaka merkezi kutunun
+        üstünden genişliğin yarısı kadar aşağıda varsayılır; plaka kare
+        boyutlu olduğundan genişlik boyut tahmininde de kullanılır.
+        
+        Args:
+            tespitler (list): `tabelalari_tespit_et` çıktısı
+            cozunurluk (tuple): Tespitlerin yapıldığı görüntü çözünürlüğü
+                (None ise kamera çözünürlüğü)
+            
+        Returns:
+            numpy.ndarray: Her tespit için ileri mesafe (cm)
+        """
+        if not tespitler:
+            return np.empty(0)
+        if cozunurluk is None:
+            cozunurluk = (self.genislik, self.yukseklik)
+        
+        kutular = np.array([bbox for _, _, bbox in tespitler], dtype=np.float64)
+        x, y, w = kutular[:, 0], kutular[:, 1], kutular[:, 2]
+        return self.mesafe_tablosu.mesafe_tahmini(
+            x + w / 2, y + w / 2, cozunurluk,
+            yukseklik=self.direk_yukseklik + self.tabela_yukseklik / 2,
+            piksel_boyutu=w, gercek_boyut=self.tabela_yukseklik)
+    
     def goruntu_isle(self, frame, tespitleri_ciz=True):
         """
         Görüntüyü işler ve opsiyonel olarak tespitleri çizer.
@@ -276,4 +619,82 @@ class SignDetector:
             
         except Exception as e:
             logger.error(f"Görüntü işleme hatası: {str(e)}")
-            return frame, [] 
\ No newline at end of file
+            return frame, [] 
+
+
+class YuvSignDetector(SignDetector):
+    """`YuvImage` düzlemleri üzerinde, BGR/HSV dönüşümü yapmadan çalışan tabela dedektörü.
+    
+    Kenar analizi Y düzlemini doğrudan gri görüntü olarak kullanır; renk
+    önerisi yarım çözünürlüklü U/V düzlemlerinde, bölge renk maskesi ise
+    U/V'nin bölge içinde tam çözünürlüğe büyütülmesiyle hesaplanır.
+    """
+    
+    def __init__(self, kamera_cozunurluk=(640, 480), min_alan_oran=0.01, max_alan_oran=0.1,
+                 buffer_havuzu=None, renk_onerisi=TABELA_RENK_ONERISI, mesafe_tablosu=None,
+                 renk_araliklari=TABELA_YUV_ARALIKLARI):
+        """
+        Args:
+            renk_araliklari (dict): Renk başına YUV (alt, üst) sınır listeleri;
+                diğer argümanlar `SignDetector` ile aynıdır
+        """
+        super().__init__(kamera_cozunurluk, min_alan_oran, max_alan_oran, buffer_havuzu,
+                         renk_onerisi, mesafe_tablosu)
+        self.renk_araliklari = [(np.array(alt), np.array(ust))
+                                for araliklar in renk_araliklari.values()
+                                for alt, ust in araliklar]
+    
+    def _oneri_renk_goruntusu(self, frame, kucuk_boyut):
+        """Renk önerisi için küçültülmüş üç kanallı YUV görüntü.
+        
+        Args:
+            frame (YuvImage): İşlenecek görüntü
+            kucuk_boyut (tuple): (genişlik, yükseklik) hedef boyut
+            
+        Returns:
+            numpy.ndarray: YUV görüntü (havuz tamponu)
+        """
+        kanal = (kucuk_boyut[1], kucuk_boyut[0])
+        yarim = frame.u.shape
+        if kanal == yarim:
+            # Varsayılan öneri ölçeği (0.5) renk düzlemlerinin kendi çözünürlüğüdür
+            return frame.yarim_birlesik(self.tamponlar.al('tabela_y_yarim', yarim),
+                                        self.tamponlar.al('tabela_yuv', kanal + (3,)))
+        birlesik = frame.yarim_birlesik(self.tamponlar.al('tabela_y_yarim', yarim),
+                                        self.tamponlar.al('tabela_yuv_yarim', yarim + (3,)))
+        return cv2.resize(birlesik, kucuk_boyut, interpolation=cv2.INTER_NEAREST,
+                          dst=self.tamponlar.al('tabela_yuv', kanal + (3,)))
+    
+    def _bolge_renk_goruntusu(self, frame, bolge):
+        """Bir bölgenin tam çözünürlüklü üç kanallı YUV görüntüsü.
+        
+        U/V düzlemlerinin bölgeyi kapsayan kısmı (çift sınırlara genişletilerek)
+        iki katına büyütülür ve Y ile birleştirilir.
+        
+        Args:
+            frame (YuvImage): İşlenecek görüntü
+            bolge (tuple): (x0, y0, x1, y1) bölgesi
+            
+        Returns:
+            numpy.ndarray: Bölgenin YUV görüntüsü (tam kare tamponunun aynı konumu)
+        """
+        x0, y0, x1, y1 = bolge
+        rx0, ry0, rx1, ry1 = x0 // 2, y0 // 2, (x1 + 1) // 2, (y1 + 1) // 2
+        ex0, ey0, ex1, ey1 = 2 * rx0, 2 * ry0, 2 * rx1, 2 * ry1
+        kanal = frame.shape[:2]
+        def tampon(ad, boyut=kanal):
+            return self.tamponlar.al(ad, boyut)[ey0:ey1, ex0:ex1]
+        
+        boyut = (ex1 - ex0, ey1 - ey0)
+        u = cv2.resize(frame.u[ry0:ry1, rx0:rx1], boyut, interpolation=cv2.INTER_NEAREST,
+                       dst=tampon('tabela_u_tam'))
+        v = cv2.resize(frame.v[ry0:ry1, rx0:rx1], boyut, interpolation=cv2.INTER_NEAREST,
+                       dst=tampon('tabela_v_tam'))
+        yuv = cv2.merge((frame.y[ey0:ey1, ex0:ex1], u, v),
+                        dst=tampon('tabela_yuv_tam', frame.shape))
+        return yuv[y0 - ey0:y1 - ey0, x0 - ex0:x1 - ex0]
+    
+    def _gri_goruntu(self, frame, bolge):
+        """Bölgenin Y düzlemi (kopyalanmadan gri görüntü olarak kullanılır)."""
+        x0, y0, x1, y1 = bolge
+        return frame.y[y0:y1, x0:x1]
@@ -0,0 +1,264 @@
+"""
+Tabela Takip Modülü
+-------------------
+`SignDetector` tespitlerini kareler arasında eşleştirir. Tam tespit
+(renk önerisi + kenar analizi tüm karede) yalnızca `TABELA_TAM_TESPIT_ARALIGI`
+karede bir çalışır; aradaki karelerde her izin kutusu sabit hız modeliyle
+tahmin edilir ve yalnızca tahmini kutunun çevresindeki küçük pencerede
+doğrulanır.
+
+Bir iz `TABELA_ONAY_SAYISI` isabetten sonra onaylanır ve dinleyicilere
+bildirilir; `TABELA_KAYIP_SINIRI` ardışık karede bulunamayan iz silinir.
+Eşleştirme aynı tipteki tespitler arasında IoU ile, IoU düşükse kutu
+boyutuna göre merkez uzaklığıyla yapılır.
+"""
+from loguru import logger
+from config.config import (
+    TABELA_TAM_TESPIT_ARALIGI,
+    TABELA_ONAY_SAYISI,
+    TABELA_KAYIP_SINIRI,
+    TABELA_IOU_ESIGI,
+    TABELA_PENCERE_PAYI
+)
+
+# Hız tahmininde yeni ölçümün ağırlığı
+_HIZ_AGIRLIGI = 0.5
+
+# IoU eşiği tutmazsa merkezler arası uzaklığın kutu boyutuna oranı bu sınırdan küçük olmalı
+_MERKEZ_ORANI = 0.5
+
+
+def _iou(a, b):
+    """İki (x, y, w, h) kutusunun kesişim/birleşim oranı."""
+    x0, y0 = max(a[0], b[0]), max(a[1], b[1])
+    x1, y1 = min(a[0] + a[2], b[0] + b[2]), min(a[1] + a[3], b[1] + b[3])
+    kesisim = max(0.0, x1 - x0) * max(0.0, y1 - y0)
+    birlesim = a[2] * a[3] + b[2] * b[3] - kesisim
+    return kesisim / birlesim if birlesim > 0 else 0.0
+
+
+def _merkez_yakinligi(a, b):
+    """Merkezler arası uzaklığın ortalama kutu boyutuna oranı."""
+    dx = (a[0] + a[2] / 2) - (b[0] + b[2] / 2)
+    dy = (a[1] + a[3] / 2) - (b[1] + b[3] / 2)
+    boyut = max((a[2] + a[3] + b[2] + b[3]) / 4, 1.0)
+    return (dx * dx + dy * dy) ** 0.5 / boyut
+
+
+class SignTrack:
+    """Tek bir tabelanın kareler arasındaki izi."""
+
+    def __init__(self, iz_no, tabela_tipi, alan, kutu):
+        """
+        Args:
+            iz_no (int): İz kimliği
+            tabela_tipi (str): `SignDetector.TABELA_TIPI` değerlerinden biri
+            alan (float): Kontur alanı (piksel)
+            kutu (tuple): (x, y, w, h) kutusu
+        """
+        self.iz_no = iz_no
+        self.tabela_tipi = tabela_tipi
+        self.alan = alan
+        self.kutu = tuple(float(k) for k in kutu)
+        self.hiz = (0.0, 0.0, 0.0, 0.0)  # Kare başına kutu değişimi
+        self.isabet = 1
+        self.kayip = 0
+        self.onayli = False
+
+    def tahmin(self):
+        """Bir sonraki karedeki kutuyu sabit hız modeliyle tahmin eder."""
+        x, y, w, h = (k + d for k, d in zip(self.kutu, self.hiz))
+        return x, y, max(w, 1.0), max(h, 1.0)
+
+    def isabet_ekle(self, alan, kutu):
+        """Eşleşen ölçümle kutuyu ve hızı günceller."""
+        kutu = tuple(float(k) for k in kutu)
+        self.hiz = tuple(_HIZ_AGIRLIGI * (yeni - eski) + (1 - _HIZ_AGIRLIGI) * hiz
+                         for yeni, eski, hiz in zip(kutu, self.kutu, self.hiz))
+        self.kutu = kutu
+        self.alan = alan
+        self.isabet += 1
+        self.kayip = 0
+
+    def kayip_ekle(self):
+        """Ölçüm yoksa kutuyu tahminle ilerletir."""
+        self.kutu = self.tahmin()
+        self.kayip += 1
+
+    def olcekle(self, x_olcek, y_olcek):
+        """Kutuyu, hızı ve alanı yeni çözünürlüğe taşır."""
+        olcekler = (x_olcek, y_olcek, x_olcek, y_olcek)
+        self.kutu = tuple(k * o for k, o in zip(self.kutu, olcekler))
+        self.hiz = tuple(d * o for d, o in zip(self.hiz, olcekler))
+        self.alan *= x_olcek * y_olcek
+
+    def bbox(self):
+        """Tamsayı (x, y, w, h) kutusu."""
+        return tuple(int(round(k)) for k in self.kutu)
+
+
+class SignTracker:
+    """Tabela tespitlerini takip eden ve tam tespit sıklığını düşüren sınıf."""
+
+    def __init__(self, dedektor, tam_tespit_araligi=TABELA_TAM_TESPIT_ARALIGI,
+                 onay_sayisi=TABELA_ONAY_SAYISI, kayip_siniri=TABELA_KAYIP_SINIRI,
+                 iou_esigi=TABELA_IOU_ESIGI, pencere_payi=TABELA_PENCERE_PAYI):
+        """
+        Args:
+            dedektor (SignDetector): Tespitleri üreten dedektör
+            tam_tespit_araligi (int): Tam tespitin kaç karede bir çalışacağı
+            onay_sayisi (int): İzin onaylanması için gereken isabet
+            kayip_siniri (int): İzin silinmesi için ardışık kayıp kare sayısı
+            iou_esigi (float): Eşleşme için en düşük IoU
+            pencere_payi (float): Doğrulama penceresinin kutu boyutuna göre payı
+        """
+        self.dedektor = dedektor
+        self.tam_tespit_araligi = max(1, tam_tespit_araligi)
+        self.onay_sayisi = onay_sayisi
+        self.kayip_siniri = kayip_siniri
+        self.iou_esigi = iou_esigi
+        self.pencere_payi = pencere_payi
+
+        self.izler = []
+        self._sonraki_iz = 1
+        self._kare_no = 0
+
+        # İstatistik: tam tespit ve pencere doğrulama sayıları
+        self.tam_tespit_sayisi = 0
+        self.pencere_sayisi = 0
+
+        # Yeni onaylanan izle (SignTrack) çağrılır
+        self.dinleyiciler = []
+
+    def _eslestir(self, iz, tespitler, kullanilan):
+        """İzin tahmini kutusuna en uygun, kullanılmamış aynı tipteki tespiti seçer.
+
+        Returns:
+            int: Tespitin indeksi (uygun yoksa None)
+        """
+        tahmin = iz.tahmin()
+        en_iyi, en_iyi_puan = None, None
+        for i, (tabela_tipi, _, kutu) in enumerate(tespitler):
+            if i in kullanilan or tabela_tipi != iz.tabela_tipi:
+                continue
+            iou = _iou(tahmin, kutu)
+            if iou >= self.iou_esigi:
+                puan = 1.0 + iou
+            else:
+                yakinlik = _merkez_yakinligi(tahmin, kutu)
+                if yakinlik >= _MERKEZ_ORANI:
+                    continue
+                puan = 1.0 - yakinlik
+            if en_iyi_puan is None or puan > en_iyi_puan:
+                en_iyi, en_iyi_puan = i, puan
+        return en_iyi
+
+    def _pencere(self, iz, cozunurluk):
+        """Tahmini kutunun çevresindeki doğrulama penceresi (x0, y0, x1, y1)."""
+        genislik, yukseklik = cozunurluk
+        x, y, w, h = iz.tahmin()
+        pay_x = w * self.pencere_payi + 4
+        pay_y = h * self.pencere_payi + 4
+        return (max(0, int(x - pay_x)), max(0, int(y - pay_y)),
+                min(genislik, int(x + w + pay_x)), min(yukseklik, int(y + h + pay_y)))
+
+    def _tam_tespit(self, frame):
+        """Tüm karede tespit yapar ve izlerle eşleştirir."""
+        self.tam_tespit_sayisi += 1
+        tespitler = self.dedektor.tabelalari_tespit_et(frame)
+
+        # Onaylı ve uzun süredir izlenen izler önce eşleşir
+        kullanilan = set()
+        for iz in sorted(self.izler, key=lambda iz: -iz.isabet):
+            i = self._eslestir(iz, tespitler, kullanilan)
+            if i is None:
+                iz.kayip_ekle()
+            else:
+                kullanilan.add(i)
+                iz.isabet_ekle(tespitler[i][1], tespitler[i][2])
+
+        for i, (tabela_tipi, alan, kutu) in enumerate(tespitler):
+            if i not in kullanilan:
+                self.izler.append(SignTrack(self._sonraki_iz, tabela_tipi, alan, kutu))
+                self._sonraki_iz += 1
+
+    def _pencerede_dogrula(self, frame):
+        """Her izi yalnızca tahmini kutusunun çevresinde doğrular."""
+        cozunurluk = (frame.shape[1], frame.shape[0])
+        for iz in self.izler:
+            self.pencere_sayisi += 1
+            tespitler = self.dedektor.bolgede_tespit_et(frame, self._pencere(iz, cozunurluk))
+            i = self._eslestir(iz, tespitler, set())
+            if i is None:
+                iz.kayip_ekle()
+            else:
+                iz.isabet_ekle(tespitler[i][1], tespitler[i][2])
+
+    def guncelle(self, frame):
+        """Kareyi işler ve onaylı izleri döndürür.
+
+        Args:
+            frame (numpy.ndarray): BGR görüntü (dedektörün çözünürlüğünde)
+
+        Returns:
+            list: Onaylı izler [SignTrack, ...]
+        """
+        if frame is None or frame.size == 0:
+            return []
+
+        try:
+            if self._kare_no % self.tam_tespit_araligi == 0:
+                self._tam_tespit(frame)
+            elif self.izler:
+                self._pencerede_dogrula(frame)
+            self._kare_no += 1
+
+            self.izler = [iz for iz in self.izler if iz.kayip < self.kayip_siniri]
+            for iz in self.izler:
+                if not iz.onayli and iz.isabet >= self.onay_sayisi:
+                    iz.onayli = True
+                    logger.debug("Tabela onaylandı: {} (iz {}, kutu {})",
+                                 iz.tabela_tipi, iz.iz_no, iz.bbox())
+                    for dinleyici in self.dinleyiciler:
+                        dinleyici(iz)
+
+            return self.onaylilar()
+
+        except Exception as e:
+            logger.error(f"Tabela takip hatası: {str(e)}")
+            return []
+
+    def onaylilar(self):
+        """Onaylı izleri döndürür."""
+        return [iz for iz in self.izler if iz.onayli]
+
+    def tespitler(self):
+        """Onaylı izleri `tabelalari_tespit_et` biçiminde döndürür.
+
+        Returns:
+            list: [(tabela_tipi, alan, bbox), ...]
+        """
+        return [(iz.tabela_tipi, iz.alan, iz.bbox()) for iz in self.onaylilar()]
+
+    def cozunurluk_ayarla(self, cozunurluk):
+        """Çalışma çözünürlüğü değiştiğinde dedektörün sınırlarını ve izleri ölçekler.
+
+        Dedektör yeniden oluşturulmaz; onaylı izler yeni çözünürlükte sürer.
+
+        Args:
+            cozunurluk (tuple): Yeni görüntü çözünürlüğü (genişlik, yükseklik)
+        """
+        eski = (self.dedektor.genislik, self.dedektor.yukseklik)
+        if tuple(cozunurluk) == eski:
+            return
+        x_olcek, y_olcek = cozunurluk[0] / eski[0], cozunurluk[1] / eski[1]
+        self.dedektor.cozunurluk_ayarla(cozunurluk)
+        for iz in self.izler:
+            iz.olcekle(x_olcek, y_olcek)
+        logger.debug("Tabela takibi çözünürlüğü: {} -> {} ({} iz ölçeklendi)",
+                     eski, tuple(cozunurluk), len(self.izler))
+
+    def sifirla(self):
+        """Tüm izleri siler."""
+        self.izler = []
+        self._kare_no = 0
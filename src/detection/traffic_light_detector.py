@@ -1,59 +1,101 @@
 """
 Trafik Işığı Algılama Modülü
 """
-import cv2
 import numpy as np
 from loguru import logger
+from src.utils.lazy_import import LazyModule
+from src.utils.buffer_pool import BufferPool
+from src.camera.ground_distance import GroundDistanceTable
 from config.config import (
+    KAMERA_COZUNURLUK,
     TRAFIK_ISIGI_MIN_BOYUT,
-    TRAFIK_ISIGI_MAX_BOYUT
+    TRAFIK_ISIGI_MAX_BOYUT,
+    ISIK_LAMBA_CAPI,
+    ISIK_LAMBA_YUKSEKLIKLERI,
+    ISIK_YUV_ARALIKLARI
 )
 
+# OpenCV ilk kullanımda yüklenir
+cv2 = LazyModule("cv2")
+
 class TrafficLightDetector:
     """Trafik ışığı algılama ve renk tespiti için sınıf."""
     
-    def __init__(self):
-        """Trafik ışığı algılama parametrelerini başlatır."""
-        # Renk aralıkları (HSV)
-        self.kirmizi_alt = np.array([0, 100, 100])
-        self.kirmizi_ust = np.array([10, 255, 255])
-        self.kirmizi_alt2 = np.array([170, 100, 100])
-        self.kirmizi_ust2 = np.array([180, 255, 255])
-        
-        self.sari_alt = np.array([20, 100, 100])
-        self.sari_ust = np.array([30, 255, 255])
+    def __init__(self, buffer_havuzu=None, mesafe_tablosu=None):
+        """Trafik ışığı algılama parametrelerini başlatır.
         
-        self.yesil_alt = np.array([40, 100, 100])
-        self.yesil_ust = np.array([80, 255, 255])
+        Args:
+            buffer_havuzu (BufferPool): Ara görüntüler için ortak tampon havuzu
+            mesafe_tablosu (GroundDistanceTable): Ortak mesafe tablosu (None ise
+                config montaj geometrisiyle oluşturulur)
+        """
+        # Renk aralıkları (HSV); durumlar bu sırayla denenir, bir durumun
+        # birden fazla aralığı varsa maskeleri birleştirilir
+        self.renk_araliklari = [
+            ("kirmizi", [(np.array([0, 100, 100]), np.array([10, 255, 255])),
+                         (np.array([170, 100, 100]), np.array([180, 255, 255]))]),
+            ("sari", [(np.array([20, 100, 100]), np.array([30, 255, 255]))]),
+            ("yesil", [(np.array([40, 100, 100]), np.array([80, 255, 255]))])
+        ]
         
         # Boyut sınırları
         self.min_boyut = TRAFIK_ISIGI_MIN_BOYUT
         self.max_boyut = TRAFIK_ISIGI_MAX_BOYUT
         
+        # Ara görüntü tamponları ve morfoloji çekirdeği (bir kez oluşturulur)
+        self.tamponlar = buffer_havuzu if buffer_havuzu is not None else BufferPool()
+        self.tamponlar.onceden_ayir({'isik_hsv': self.tamponlar.kare_boyutu})
+        self.tamponlar.onceden_ayir({ad: self.tamponlar.maske_boyutu for ad in (
+            'isik_ham', 'isik_acik', 'isik_kirmizi1', 'isik_kirmizi2',
+            'isik_kirmizi', 'isik_sari', 'isik_yesil'
+        )})
+        self.kernel = np.ones((3,3), np.uint8)
+        
+        # Mesafe tahmini: lamba yüksekliği ve boyutu (cm)
+        self.mesafe_tablosu = mesafe_tablosu if mesafe_tablosu is not None \
+            else GroundDistanceTable()
+        self.lamba_capi = ISIK_LAMBA_CAPI
+        self.lamba_yukseklikleri = ISIK_LAMBA_YUKSEKLIKLERI
+        self.son_yaricap = None  # Son tespit edilen lambanın yarıçapı (piksel)
+        
         logger.info("Trafik ışığı algılama sistemi başlatıldı")
     
-    def _renk_maskesi_olustur(self, frame, alt_sinir, ust_sinir):
+    def _renk_goruntusu(self, frame):
+        """Kareyi bir kez maskelerin renk uzayına (HSV) dönüştürür; tüm renk maskeleri bunu kullanır.
+        
+        Args:
+            frame (numpy.ndarray): BGR görüntü
+            
+        Returns:
+            numpy.ndarray: HSV görüntü (havuz tamponu)
+        """
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2HSV,
+                            dst=self.tamponlar.al('isik_hsv', frame.shape))
+    
+    def _renk_maskesi_olustur(self, hsv, alt_sinir, ust_sinir, ad):
         """Belirli bir renk aralığı için maske oluşturur.
         
         Args:
-            frame (numpy.ndarray): İşlenecek görüntü
+            hsv (numpy.ndarray): HSV formatında görüntü
             alt_sinir (numpy.ndarray): HSV alt sınır değerleri
             ust_sinir (numpy.ndarray): HSV üst sınır değerleri
+            ad (str): Sonucun yazılacağı tamponun adı
             
         Returns:
-            numpy.ndarray: İkili maske görüntüsü
+            numpy.ndarray: İkili maske görüntüsü (havuz tamponu)
         """
         try:
-            # BGR'den HSV'ye dönüşüm
-            hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+            kanal = hsv.shape[:2]
             
             # Renk maskesi
-            mask = cv2.inRange(hsv, alt_sinir, ust_sinir)
+            ham = cv2.inRange(hsv, alt_sinir, ust_sinir,
+                              dst=self.tamponlar.al('isik_ham', kanal))
             
             # Gürültü temizleme
-            kernel = np.ones((3,3), np.uint8)
-            mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel)
-            mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
+            acik = cv2.morphologyEx(ham, cv2.MORPH_OPEN, self.kernel,
+                                    dst=self.tamponlar.al('isik_acik', kanal))
+            mask = cv2.morphologyEx(acik, cv2.MORPH_CLOSE, self.kernel,
+                                    dst=self.tamponlar.al(ad, kanal))
             
             return mask
             
@@ -74,16 +116,21 @@ class TrafficLightDetector:
             # Konturları bul
             konturlar, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
             
+            # Boyut sınırları tam çözünürlük (KAMERA_COZUNURLUK) pikselidir
+            olcek = mask.shape[1] / KAMERA_COZUNURLUK[0]
+            min_alan = self.min_boyut[0] * self.min_boyut[1] * olcek * olcek
+            max_w, max_h = self.max_boyut[0] * olcek, self.max_boyut[1] * olcek
+            
             daireler = []
             for kontur in konturlar:
                 # Kontur alanını kontrol et
                 alan = cv2.contourArea(kontur)
-                if alan < self.min_boyut[0] * self.min_boyut[1]:
+                if alan < min_alan:
                     continue
                 
                 # Çevrel dikdörtgen boyutlarını kontrol et
                 x, y, w, h = cv2.boundingRect(kontur)
-                if w > self.max_boyut[0] or h > self.max_boyut[1]:
+                if w > max_w or h > max_h:
                     continue
                 
                 # Dairesellik oranını kontrol et
@@ -116,28 +163,29 @@ class TrafficLightDetector:
             return None, None
             
         try:
-            # Kırmızı ışık kontrolü
-            kirmizi_mask1 = self._renk_maskesi_olustur(frame, self.kirmizi_alt, self.kirmizi_ust)
-            kirmizi_mask2 = self._renk_maskesi_olustur(frame, self.kirmizi_alt2, self.kirmizi_ust2)
-            if kirmizi_mask1 is not None and kirmizi_mask2 is not None:
-                kirmizi_mask = cv2.bitwise_or(kirmizi_mask1, kirmizi_mask2)
-                kirmizi_daireler = self._dairesel_nesne_bul(kirmizi_mask)
-                if kirmizi_daireler:
-                    return "kirmizi", kirmizi_daireler[0][0]
-            
-            # Sarı ışık kontrolü
-            sari_mask = self._renk_maskesi_olustur(frame, self.sari_alt, self.sari_ust)
-            if sari_mask is not None:
-                sari_daireler = self._dairesel_nesne_bul(sari_mask)
-                if sari_daireler:
-                    return "sari", sari_daireler[0][0]
-            
-            # Yeşil ışık kontrolü
-            yesil_mask = self._renk_maskesi_olustur(frame, self.yesil_alt, self.yesil_ust)
-            if yesil_mask is not None:
-                yesil_daireler = self._dairesel_nesne_bul(yesil_mask)
-                if yesil_daireler:
-                    return "yesil", yesil_daireler[0][0]
+            renk = self._renk_goruntusu(frame)
+            
+            # Maske renk görüntüsünün çözünürlüğündedir; sonuç kare koordinatına taşınır
+            olcek = frame.shape[1] / renk.shape[1]
+            for durum, araliklar in self.renk_araliklari:
+                mask = None
+                for i, (alt, ust) in enumerate(araliklar):
+                    ad = f'isik_{durum}{i + 1}' if len(araliklar) > 1 else f'isik_{durum}'
+                    aralik_maskesi = self._renk_maskesi_olustur(renk, alt, ust, ad)
+                    if aralik_maskesi is None:
+                        mask = None
+                        break
+                    mask = aralik_maskesi if mask is None else cv2.bitwise_or(
+                        mask, aralik_maskesi,
+                        dst=self.tamponlar.al(f'isik_{durum}', aralik_maskesi.shape))
+                if mask is None:
+                    continue
+                
+                daireler = self._dairesel_nesne_bul(mask)
+                if daireler:
+                    (x, y), yaricap = daireler[0]
+                    self.son_yaricap = int(yaricap * olcek)
+                    return durum, (int(x * olcek), int(y * olcek))
             
             return None, None
             
@@ -145,12 +193,18 @@ class TrafficLightDetector:
             logger.error(f"Işık durumu tespit hatası: {str(e)}")
             return None, None
     
-    def mesafe_tahmin_et(self, frame, koordinatlar):
-        """Trafik ışığına olan mesafeyi piksel boyutuna göre tahmin eder.
+    def mesafe_tahmin_et(self, frame, koordinatlar, durum=None, yaricap=None):
+        """Trafik ışığına olan ileri mesafeyi zemin mesafe tablosuyla tahmin eder.
+        
+        Lamba merkezinin satırı, lambanın bulunduğu yükseklikteki yatay düzlemle
+        kesiştirilir; lamba yarıçapı biliniyorsa boyuttan tahminle birleştirilir.
         
         Args:
             frame (numpy.ndarray): İşlenecek görüntü
             koordinatlar (tuple): Trafik ışığının merkez koordinatları
+            durum (str): Yanan lamba ("kirmizi", "sari", "yesil"); None ise
+                sarı lamba yüksekliği kullanılır
+            yaricap (float): Lamba yarıçapı (piksel); None ise son tespitinki
             
         Returns:
             float: Tahmini mesafe (cm)
@@ -159,18 +213,53 @@ class TrafficLightDetector:
             return float('inf')
             
         try:
-            # Görüntü boyutları
             height, width = frame.shape[:2]
+            if yaricap is None:
+                yaricap = self.son_yaricap
             
-            # Trafik ışığının y koordinatı
-            y = koordinatlar[1]
-            
-            # Basit bir mesafe tahmini (kalibre edilmeli)
-            # Görüntünün üst kısmındaki ışıklar daha uzakta
-            mesafe = 200 * (1 - y/height)  # 200cm maksimum mesafe varsayımı
+            yukseklik = self.lamba_yukseklikleri.get(durum, self.lamba_yukseklikleri['sari'])
+            mesafe = self.mesafe_tablosu.mesafe_tahmini(
+                koordinatlar[0], koordinatlar[1], (width, height), yukseklik,
+                piksel_boyutu=2 * yaricap if yaricap else None,
+                gercek_boyut=self.lamba_capi)
             
-            return max(0, mesafe)
+            mesafe = float(mesafe)
+            return max(0.0, mesafe) if np.isfinite(mesafe) else float('inf')
             
         except Exception as e:
             logger.error(f"Mesafe tahmin hatası: {str(e)}")
-            return float('inf') 
\ No newline at end of file
+            return float('inf')
+
+
+class YuvTrafficLightDetector(TrafficLightDetector):
+    """`YuvImage` düzlemleri üzerinde, HSV dönüşümü yapmadan çalışan trafik ışığı dedektörü.
+    
+    Renk maskeleri U/V düzlemlerinin yarım çözünürlüğünde, Y düzlemi bu
+    çözünürlüğe indirilerek hesaplanır; bulunan lamba kare koordinatına taşınır.
+    """
+    
+    def __init__(self, buffer_havuzu=None, mesafe_tablosu=None, renk_araliklari=ISIK_YUV_ARALIKLARI):
+        """
+        Args:
+            buffer_havuzu (BufferPool): Ara görüntüler için ortak tampon havuzu
+            mesafe_tablosu (GroundDistanceTable): Ortak mesafe tablosu
+            renk_araliklari (dict): Durum başına YUV (alt, üst) sınır listeleri
+        """
+        super().__init__(buffer_havuzu, mesafe_tablosu)
+        self.renk_araliklari = [
+            (durum, [(np.array(alt), np.array(ust)) for alt, ust in renk_araliklari[durum]])
+            for durum, _ in self.renk_araliklari
+        ]
+    
+    def _renk_goruntusu(self, frame):
+        """Y, U ve V düzlemlerini yarım çözünürlükte üç kanallı görüntüde birleştirir.
+        
+        Args:
+            frame (YuvImage): İşlenecek görüntü
+            
+        Returns:
+            numpy.ndarray: (yükseklik / 2, genişlik / 2, 3) YUV görüntü (havuz tamponu)
+        """
+        kanal = frame.u.shape
+        return frame.yarim_birlesik(self.tamponlar.al('isik_y_yarim', kanal),
+                                    self.tamponlar.al('isik_yuv', kanal + (3,)))
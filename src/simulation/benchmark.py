@@ -0,0 +1,114 @@
+"""
+Kapalı Döngü Simülasyon Kıyaslaması
+-----------------------------------
+Tüm kontrol döngüsünü (`VehicleController`) araç olmadan, simüle kamera ve
+simüle motorlarla belirli bir süre çalıştırır ve tur süresi, döngü hızı,
+şerit takip hatası ve kamera-teker gecikmesini raporlar. Araç ışık
+beklemeden sürüş durumunda başlar; hiç tur tamamlanmazsa 1 ile çıkılır.
+
+Kullanım:
+    python -m src.simulation.benchmark --sure 120 --json logs/sim_sonuc.json
+"""
+import sys
+import json
+import time
+import argparse
+import threading
+from loguru import logger
+from src.control.motor_controller import MotorController
+from src.control.vehicle_controller import VehicleController
+from src.simulation.world import SimWorld
+from src.simulation.sim_camera import SimCameraController
+from src.simulation.sim_motor import SimMotorBackend
+from src.utils.logging_setup import log_ayarla, log_kapat
+
+
+def simulasyon_kur(serit='dis', kara_kutu=False):
+    """Simüle kamera ve motorlarla bir araç kontrolcüsü oluşturur.
+
+    Args:
+        serit (str): Takip edilecek şerit ('ic' veya 'dis')
+        kara_kutu (bool): Kara kutu kaydedicisi çalışsın mı
+
+    Returns:
+        tuple: (dunya, kontrolcu)
+    """
+    dunya = SimWorld(serit=serit)
+    kamera = SimCameraController(dunya)
+    motorlar = MotorController(backend=SimMotorBackend(dunya))
+    return dunya, VehicleController(camera=kamera, motors=motorlar, kayit_aktif=kara_kutu)
+
+
+def kiyasla(sure, serit='dis', kara_kutu=False):
+    """Simülasyonu verilen süre boyunca çalıştırır ve sonuçları döndürür.
+
+    Args:
+        sure (float): Çalışma süresi (saniye)
+        serit (str): Takip edilecek şerit
+        kara_kutu (bool): Kara kutu kaydedicisi çalışsın mı
+
+    Returns:
+        dict: Kıyaslama sonuçları
+    """
+    dunya, kontrolcu = simulasyon_kur(serit, kara_kutu)
+    kamera = kontrolcu.camera
+    # Başlangıçta ışık görüş alanında olmayabilir; araç yeşil ışık beklemeden sürer
+    kontrolcu.durum = "hareket"
+
+    zamanlayici = threading.Timer(sure, kontrolcu.durdur)
+    zamanlayici.daemon = True
+
+    baslangic = time.perf_counter()
+    zamanlayici.start()
+    kontrolcu.calistir()
+    gecen = time.perf_counter() - baslangic
+    zamanlayici.cancel()
+
+    sonuc = {
+        'sure_s': round(gecen, 2),
+        'dongu_sayisi': kontrolcu.dongu_sayisi,
+        'dongu_hizi_hz': round(kontrolcu.dongu_sayisi / gecen, 2) if gecen > 0 else 0.0,
+        'ortalama_render_ms': round(kamera.render_suresi / kamera.kare_sayisi * 1000, 2)
+        if kamera.kare_sayisi else None,
+        'gecikme': kontrolcu.gecikme.ozet()
+    }
+    sonuc.update(dunya.durum_ozeti())
+    return sonuc
+
+
+def main():
+    """Komut satırı giriş noktası."""
+    parser = argparse.ArgumentParser(description="Kapalı döngü simülasyon kıyaslaması")
+    parser.add_argument("--sure", type=float, default=60.0,
+                        help="Çalışma süresi (saniye; bir tur yaklaşık 25 saniye)")
+    parser.add_argument("--serit", choices=("ic", "dis"), default="dis",
+                        help="Takip edilecek şerit")
+    parser.add_argument("--kara-kutu", action="store_true",
+                        help="Kara kutu kaydını aç (logs/kayitlar altına arşiv yazar)")
+    parser.add_argument("--json", help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--log-seviyesi", default="WARNING", help="Konsol/dosya log seviyesi")
+    args = parser.parse_args()
+
+    log_ayarla("logs/simulasyon.log", seviye=args.log_seviyesi)
+    try:
+        sonuc = kiyasla(args.sure, args.serit, args.kara_kutu)
+        logger.info(f"Simülasyon sonucu: {sonuc}")
+
+        metin = json.dumps(sonuc, ensure_ascii=False, indent=2)
+        print(metin)
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                f.write(metin + "\n")
+        if sonuc['tur_sayisi'] == 0:
+            logger.error(f"Simülasyonda hiç tur tamamlanmadı: {sonuc['kat_edilen_yol_cm']} cm yol, "
+                         f"şerit hatası RMS {sonuc['serit_hatasi_rms_cm']} cm")
+            sys.exit(1)
+    except Exception as e:
+        logger.error(f"Simülasyon hatası: {str(e)}")
+        sys.exit(1)
+    finally:
+        log_kapat()
+
+
+if __name__ == "__main__":
+    main()
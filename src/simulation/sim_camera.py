@@ -0,0 +1,262 @@
+"""
+Simüle Kamera
+-------------
+Araç pozundan pist, trafik ışığı ve tabelaları render eden kamera.
+`CameraController` ile aynı arayüzü sağlar; ön işleme ve ROI fonksiyonları
+doğrudan ondan devralınır.
+"""
+import math
+import time
+import numpy as np
+from loguru import logger
+from src.camera.camera_controller import CameraController, cv2
+from src.camera.camera_geometry import CameraGeometry
+from src.camera.frame import Frame
+from config.config import KAMERA_FPS
+
+# Render renkleri (BGR)
+_ZEMIN_RENK = (95, 110, 100)
+_ASFALT_RENK = (55, 55, 55)
+_CIZGI_RENK = (235, 235, 235)
+_DUVAR_RENK = (95, 110, 100)
+_DIREK_RENK = (90, 90, 90)
+_GOVDE_RENK = (20, 20, 20)
+_SONUK_LAMBA_RENK = (45, 45, 45)
+
+_LAMBA_RENKLERI = {
+    'kirmizi': (0, 0, 255),
+    'sari': (0, 220, 255),
+    'yesil': (0, 255, 0)
+}
+_LAMBA_SIRASI = ('kirmizi', 'sari', 'yesil')
+
+_TABELA_RENKLERI = {
+    'dortgen': (200, 90, 0),
+    'ucgen': (30, 30, 220),
+    'daire': (200, 60, 20)
+}
+
+# Render edilen maksimum zemin mesafesi (cm)
+_MAX_MENZIL = 600.0
+
+
+class TrackRenderer:
+    """Zemin düzlemi izdüşümü ile pist görüntüsü üreten render sınıfı."""
+
+    def __init__(self, dunya, geometri):
+        """
+        Args:
+            dunya (SimWorld): Simülasyon dünyası
+            geometri (CameraGeometry): Kamera modeli
+        """
+        self.dunya = dunya
+        self.geometri = geometri
+        h, w = geometri.yukseklik, geometri.genislik
+
+        # Zemin piksellerinin araç koordinatları sabittir; bir kez hesaplanır
+        v, u = np.mgrid[0:h, 0:w]
+        ileri, sol = geometri.zemin_koordinatlari(u.ravel(), v.ravel())
+        zemin = np.isfinite(ileri) & (ileri <= _MAX_MENZIL)
+        self._zemin_indeks = np.flatnonzero(zemin)
+        self._ileri = ileri[zemin]
+        self._sol = sol[zemin]
+
+        # Ufkun üstü ve menzil dışı sabit arka plan
+        self._arka_plan = np.empty((h, w, 3), np.uint8)
+        self._arka_plan[:] = _DUVAR_RENK
+        self._palet = np.array([_ZEMIN_RENK, _ASFALT_RENK, _CIZGI_RENK], np.uint8)
+
+    def render(self, hedef):
+        """Güncel pozdan görüntüyü hedef diziye render eder.
+
+        Args:
+            hedef (numpy.ndarray): (yükseklik, genişlik, 3) BGR hedef dizi
+        """
+        x, y, teta = self.dunya.poz()
+        c, s = math.cos(teta), math.sin(teta)
+
+        # Zemin piksellerini dünya koordinatlarına taşı
+        wx = x + self._ileri * c - self._sol * s
+        wy = y + self._ileri * s + self._sol * c
+
+        pist, cizgi = self.dunya.pist.cizgi_uzerinde(wx, wy)
+        sinif = pist.astype(np.uint8) + cizgi.astype(np.uint8)
+
+        np.copyto(hedef, self._arka_plan)
+        hedef.reshape(-1, 3)[self._zemin_indeks] = self._palet[sinif]
+
+        self._nesneleri_ciz(hedef, x, y, teta)
+
+    def _arac_koordinati(self, x, y, teta, wx, wy):
+        """Dünya noktasını araç koordinatlarına (ileri, sol) çevirir."""
+        dx, dy = wx - x, wy - y
+        c, s = math.cos(teta), math.sin(teta)
+        return dx * c + dy * s, -dx * s + dy * c
+
+    def _plaka_noktalari(self, s, n, merkez_yukseklik, yerel):
+        """Pist kenarındaki dikey bir plakanın dünya noktalarını hesaplar.
+
+        Args:
+            s (float): Plakanın pist üzerindeki yay uzunluğu (cm)
+            n (float): Plakanın yanal konumu (cm)
+            merkez_yukseklik (float): Plaka merkezinin yüksekliği (cm)
+            yerel (list): Plaka düzleminde (yatay, dikey) noktalar (cm)
+
+        Returns:
+            tuple: (wx, wy, wz) dizileri
+        """
+        px, py, yon = self.dunya.pist.nokta(s, n)
+        # Plaka gelen araca dönüktür; yatay ekseni pist normali boyuncadır
+        nx, ny = math.sin(yon), -math.cos(yon)
+        yerel = np.asarray(yerel, dtype=np.float64)
+        wx = px + yerel[:, 0] * nx
+        wy = py + yerel[:, 0] * ny
+        wz = merkez_yukseklik + yerel[:, 1]
+        return wx, wy, wz
+
+    def _izdusur(self, poz, wx, wy, wz):
+        """Dünya noktalarını piksele izdüşürür; kameranın arkasındaysa None döner."""
+        x, y, teta = poz
+        ileri, sol = self._arac_koordinati(x, y, teta, wx, wy)
+        u, v, derinlik = self.geometri.projekte_et(ileri, sol, wz)
+        if np.any(derinlik <= 1.0):
+            return None, None
+        return np.stack([u, v], axis=1), float(np.mean(derinlik))
+
+    def _nesneleri_ciz(self, hedef, x, y, teta):
+        """Trafik ışıkları ve tabelaları uzaktan yakına doğru çizer."""
+        poz = (x, y, teta)
+        cizimler = []
+
+        isik = self.dunya.isik_durumu()
+        for nesne in self.dunya.isiklar:
+            cizimler.extend(self._isik_cizimleri(poz, nesne, isik))
+        for nesne in self.dunya.tabelalar:
+            cizimler.extend(self._tabela_cizimleri(poz, nesne))
+
+        for _, ciz in sorted(cizimler, key=lambda c: -c[0]):
+            ciz(hedef)
+
+    def _direk_cizimi(self, poz, s, n, ust):
+        """Zeminden verilen yüksekliğe kadar direk çizimi üretir."""
+        noktalar, derinlik = self._izdusur(poz, *self._plaka_noktalari(
+            s, n, 0.0, [(0.0, 0.0), (0.0, ust)]))
+        if noktalar is None:
+            return []
+        p1, p2 = noktalar.astype(np.int32)
+        kalinlik = max(1, int(self.geometri.odak * 1.5 / derinlik))
+        return [(derinlik + 1.0,
+                 lambda img: cv2.line(img, tuple(map(int, p1)), tuple(map(int, p2)),
+                                      _DIREK_RENK, kalinlik))]
+
+    def _isik_cizimleri(self, poz, nesne, durum):
+        """Trafik ışığı gövdesi ve lambaları için çizimler üretir."""
+        lamba_yaricap = 4.0
+        merkez_z = nesne['lamba_yukseklik']
+        cizimler = self._direk_cizimi(poz, nesne['s'], nesne['n'], merkez_z - 14.0)
+
+        govde, derinlik = self._izdusur(poz, *self._plaka_noktalari(
+            nesne['s'], nesne['n'], merkez_z,
+            [(-6.0, -14.0), (6.0, -14.0), (6.0, 14.0), (-6.0, 14.0)]))
+        if govde is None:
+            return cizimler
+
+        govde = govde.astype(np.int32)
+        cizimler.append((derinlik, lambda img: cv2.fillPoly(img, [govde], _GOVDE_RENK)))
+
+        # Lambalar yukarıdan aşağıya kırmızı, sarı, yeşil
+        for i, renk_adi in enumerate(_LAMBA_SIRASI):
+            lamba, lamba_derinlik = self._izdusur(poz, *self._plaka_noktalari(
+                nesne['s'], nesne['n'], merkez_z + (1 - i) * 9.0, [(0.0, 0.0)]))
+            if lamba is None:
+                continue
+            merkez = tuple(int(round(k)) for k in lamba[0])
+            yaricap = max(1, int(round(self.geometri.odak * lamba_yaricap / lamba_derinlik)))
+            renk = _LAMBA_RENKLERI[renk_adi] if renk_adi == durum else _SONUK_LAMBA_RENK
+            # Lambalar her zaman kendi gövdelerinin üzerine çizilir
+            cizimler.append((derinlik - 0.1,
+                             lambda img, m=merkez, r=yaricap, k=renk: cv2.circle(img, m, r, k, -1)))
+        return cizimler
+
+    def _tabela_cizimleri(self, poz, nesne):
+        """Tabela plakası ve direği için çizimler üretir."""
+        yari = 6.5  # 13 cm tabela
+        merkez_z = 20.0 + yari  # 20 cm direk
+        if nesne['sekil'] == 'dortgen':
+            yerel = [(-yari, -yari), (yari, -yari), (yari, yari), (-yari, yari)]
+        elif nesne['sekil'] == 'ucgen':
+            yerel = [(-yari, -yari), (yari, -yari), (0.0, yari)]
+        else:
+            yerel = [(yari * math.cos(a), yari * math.sin(a))
+                     for a in np.linspace(0, 2 * math.pi, 32, endpoint=False)]
+
+        cizimler = self._direk_cizimi(poz, nesne['s'], nesne['n'], 20.0)
+        plaka, derinlik = self._izdusur(poz, *self._plaka_noktalari(
+            nesne['s'], nesne['n'], merkez_z, yerel))
+        if plaka is None:
+            return cizimler
+
+        plaka = plaka.astype(np.int32)
+        renk = _TABELA_RENKLERI[nesne['sekil']]
+        cizimler.append((derinlik, lambda img: cv2.fillPoly(img, [plaka], renk)))
+        return cizimler
+
+
+class SimCameraController(CameraController):
+    """Simülasyon dünyasından kare üreten kamera.
+
+    Gerçek sensör gibi kare hızına bağlıdır: `kare_yakala` bir sonraki
+    kare zamanına kadar bekler.
+    """
+
+    def __init__(self, dunya, buffer_havuzu=None, fps=KAMERA_FPS):
+        """
+        Args:
+            dunya (SimWorld): Simülasyon dünyası
+            buffer_havuzu (BufferPool): Ara görüntüler için ortak tampon havuzu
+            fps (float): Simüle sensör kare hızı
+        """
+        self._tampon_ayarla(buffer_havuzu)
+        self.dunya = dunya
+        self.renderer = TrackRenderer(dunya, CameraGeometry(
+            (self.tamponlar.genislik, self.tamponlar.yukseklik)))
+
+        self.kare_araligi = 1.0 / fps
+        self._sonraki_kare = time.monotonic()
+        self.kare_sayisi = 0
+        self.render_suresi = 0.0
+
+        logger.info("Simüle kamera başlatıldı")
+
+    def kare_yakala(self):
+        """Güncel pozdan bir kare render eder.
+
+        Sensör zamanı render başlangıcıdır (görüntü o anki pozu gösterir).
+        Düşük çözünürlüklü algılama akışı açıksa ISP ölçeklemesi render
+        edilen kareden benzetilir.
+
+        Returns:
+            Frame: BGR görüntü (havuz tamponu) ve zaman bilgileri
+        """
+        try:
+            # Sensör kare hızını taklit et
+            bekleme = self._sonraki_kare - time.monotonic()
+            if bekleme > 0:
+                time.sleep(bekleme)
+            self._sonraki_kare = max(time.monotonic(), self._sonraki_kare) + self.kare_araligi
+
+            sensor_zamani = time.monotonic()
+            baslangic = time.perf_counter()
+            kare = self.tamponlar.al('kamera_bgr', self.tamponlar.kare_boyutu)
+            self.renderer.render(kare)
+            self.render_suresi += time.perf_counter() - baslangic
+            self.kare_sayisi += 1
+            return Frame(kare, sensor_zamani, kare_no=self.kare_sayisi,
+                         yuv=self._isp_benzet(kare))
+        except Exception as e:
+            logger.error(f"Simüle kare üretilemedi: {str(e)}")
+            return None
+
+    def close(self):
+        """Simüle kamerayı kapatır."""
+        logger.info("Simüle kamera kapatıldı")
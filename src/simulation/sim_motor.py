@@ -0,0 +1,38 @@
+"""
+Simüle Motor Arka Ucu
+---------------------
+`MotorController` görev oranlarını simülasyon dünyasındaki teker hız
+komutlarına çevirir. Araç dinamiği `SimWorld` içinde diferansiyel
+sürüş kinematiği ile işlenir.
+"""
+from loguru import logger
+from src.control.odometry import MAX_TEKER_HIZI
+
+
+class SimMotorBackend:
+    """Simülasyon dünyasına yazan motor arka ucu."""
+
+    def __init__(self, dunya):
+        """
+        Args:
+            dunya (SimWorld): Simülasyon dünyası
+        """
+        self.dunya = dunya
+        logger.info(f"Simüle motor arka ucu başlatıldı - Maksimum teker hızı: {MAX_TEKER_HIZI:.1f} cm/s")
+
+    def uygula(self, sol_oran, sag_oran):
+        """İşaretli görev oranlarını teker hızı komutuna çevirir.
+
+        Args:
+            sol_oran (float): Sol motor görev oranı (-1.0 ile 1.0 arası)
+            sag_oran (float): Sağ motor görev oranı (-1.0 ile 1.0 arası)
+        """
+        self.dunya.tekerlek_komutu(sol_oran * MAX_TEKER_HIZI, sag_oran * MAX_TEKER_HIZI)
+
+    def dur(self):
+        """Teker hız komutlarını sıfırlar."""
+        self.dunya.tekerlek_komutu(0.0, 0.0)
+
+    def kapat(self):
+        """Serbest bırakılacak kaynak yoktur."""
+        pass
@@ -0,0 +1,144 @@
+"""
+Simülasyon Pist Modeli
+----------------------
+İki düz ve iki yarım daire virajdan oluşan oval (stadyum) pist. Pist
+ölçüleri `config.py` içindeki gerçek pist ölçüleriyle aynıdır: 100 cm
+genişlik, 40 cm'lik iki şerit ve aralarında/kenarlarında beyaz çizgiler.
+
+Dünya koordinat sistemi (cm): x sağa, y yukarı; açılar x ekseninden saat
+yönünün tersine. Araç pist üzerinde saat yönünün tersine ilerler; `s`
+alt düzlüğün sol ucundan başlayan yay uzunluğu, `n` pist orta çizgisine
+göre dışa doğru yanal mesafedir.
+"""
+import math
+import numpy as np
+from config.config import (
+    PIST_GENISLIK,
+    SERIT_GENISLIK,
+    SIM_DUZ_UZUNLUK,
+    SIM_VIRAJ_YARICAPI,
+    SIM_KESIKLI_CIZGI
+)
+
+
+class TrackModel:
+    """Oval pist geometrisi."""
+
+    def __init__(self, duz_uzunluk=SIM_DUZ_UZUNLUK, viraj_yaricapi=SIM_VIRAJ_YARICAPI,
+                 pist_genislik=PIST_GENISLIK, serit_genislik=SERIT_GENISLIK,
+                 kesikli_cizgi=SIM_KESIKLI_CIZGI):
+        """
+        Args:
+            duz_uzunluk (float): Düz kısımların uzunluğu (cm)
+            viraj_yaricapi (float): Pist orta çizgisinin viraj yarıçapı (cm)
+            pist_genislik (float): Pist genişliği (cm)
+            serit_genislik (float): Tek şerit genişliği (cm)
+            kesikli_cizgi (tuple): Orta çizgi (periyot, dolu uzunluk) (cm)
+        """
+        self.duz_uzunluk = float(duz_uzunluk)
+        self.viraj_yaricapi = float(viraj_yaricapi)
+        self.pist_genislik = float(pist_genislik)
+        self.serit_genislik = float(serit_genislik)
+        self.kesikli_periyot, self.kesikli_dolu = kesikli_cizgi
+
+        # Üç çizgi (iç kenar, orta, dış kenar) şeritler arasında eşit paylaşılır
+        self.cizgi_genislik = (self.pist_genislik - 2 * self.serit_genislik) / 3
+        yari = self.pist_genislik / 2 - self.cizgi_genislik / 2
+        self.cizgi_konumlari = (-yari, 0.0, yari)
+
+        # Şerit merkezleri (n); sağdan gidiş için dış şerit kullanılır
+        ofset = self.cizgi_genislik / 2 + self.serit_genislik / 2
+        self.serit_merkezleri = {'ic': -ofset, 'dis': ofset}
+
+        L, R = self.duz_uzunluk, self.viraj_yaricapi
+        self.cevre = 2 * L + 2 * math.pi * R
+        self._sinirlar = (L, L + math.pi * R, 2 * L + math.pi * R)
+
+    def yanal_konum(self, x, y):
+        """Noktaların pist orta çizgisine göre yanal konumunu hesaplar.
+
+        Args:
+            x (numpy.ndarray): Dünya x koordinatları (cm)
+            y (numpy.ndarray): Dünya y koordinatları (cm)
+
+        Returns:
+            numpy.ndarray: Dışa doğru pozitif yanal mesafe (cm)
+        """
+        yari_L = self.duz_uzunluk / 2
+        dx = x - np.clip(x, -yari_L, yari_L)
+        return np.sqrt(dx * dx + y * y) - self.viraj_yaricapi
+
+    def ilerleme(self, x, y):
+        """Noktaların pist boyunca yay uzunluğu konumunu hesaplar.
+
+        Args:
+            x (numpy.ndarray): Dünya x koordinatları (cm)
+            y (numpy.ndarray): Dünya y koordinatları (cm)
+
+        Returns:
+            numpy.ndarray: Yay uzunluğu (0 ile çevre arası, cm)
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        L, R = self.duz_uzunluk, self.viraj_yaricapi
+        yari_L = L / 2
+
+        sag_aci = np.arctan2(y, x - yari_L)
+        sol_aci = np.mod(np.arctan2(y, x + yari_L), 2 * np.pi)
+
+        return np.select(
+            [x > yari_L, x < -yari_L, y < 0],
+            [L + R * (sag_aci + np.pi / 2),
+             2 * L + np.pi * R + R * (sol_aci - np.pi / 2),
+             x + yari_L],
+            default=L + np.pi * R + (yari_L - x)
+        )
+
+    def nokta(self, s, n=0.0):
+        """Yay uzunluğu ve yanal konumdan dünya noktasını hesaplar.
+
+        Args:
+            s (float): Yay uzunluğu (cm)
+            n (float): Dışa doğru yanal konum (cm)
+
+        Returns:
+            tuple: (x, y, yon) - Dünya koordinatları ve pist ilerleme yönü (radyan)
+        """
+        L, R = self.duz_uzunluk, self.viraj_yaricapi
+        yari_L = L / 2
+        s = s % self.cevre
+        r = R + n
+
+        if s < self._sinirlar[0]:
+            return -yari_L + s, -r, 0.0
+        if s < self._sinirlar[1]:
+            aci = (s - L) / R - math.pi / 2
+            return yari_L + r * math.cos(aci), r * math.sin(aci), aci + math.pi / 2
+        if s < self._sinirlar[2]:
+            return yari_L - (s - self._sinirlar[1]), r, math.pi
+        aci = (s - self._sinirlar[2]) / R + math.pi / 2
+        return -yari_L + r * math.cos(aci), r * math.sin(aci), aci + math.pi / 2
+
+    def cizgi_uzerinde(self, x, y):
+        """Noktaların beyaz çizgi üzerinde olup olmadığını belirler.
+
+        Args:
+            x (numpy.ndarray): Dünya x koordinatları (cm)
+            y (numpy.ndarray): Dünya y koordinatları (cm)
+
+        Returns:
+            tuple: (pist_uzerinde, cizgi_uzerinde) - Boolean diziler
+        """
+        n = self.yanal_konum(x, y)
+        yari_cizgi = self.cizgi_genislik / 2
+
+        pist = np.abs(n) <= self.pist_genislik / 2
+        kenar = np.abs(np.abs(n) - self.cizgi_konumlari[2]) <= yari_cizgi
+        orta = np.abs(n) <= yari_cizgi
+
+        # Orta çizgi kesiklidir; yay uzunluğu yalnızca aday noktalar için hesaplanır
+        if np.any(orta):
+            s = self.ilerleme(x[orta], y[orta])
+            orta[orta] = np.mod(s, self.kesikli_periyot) < self.kesikli_dolu
+
+        return pist, kenar | orta
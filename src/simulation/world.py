@@ -0,0 +1,178 @@
+"""
+Simülasyon Dünyası
+------------------
+Aracın pist üzerindeki konumunu diferansiyel sürüş kinematiği ile
+ilerletir, trafik ışığı döngüsünü ve tabela yerleşimini tutar ve şerit
+takibi/tur istatistiklerini toplar. Simüle kamera ve simüle motor arka
+ucu aynı dünya nesnesini paylaşır.
+"""
+import math
+import time
+import threading
+from src.simulation.track import TrackModel
+from config.config import (
+    ARAC_GENISLIK,
+    SIM_MOTOR_ZAMAN_SABITI,
+    SIM_ISIK_DONGUSU
+)
+
+# Kinematik integrasyonun maksimum adımı (saniye)
+_MAX_ADIM = 0.005
+
+
+class SimWorld:
+    """Araç pozu, pist nesneleri ve sürüş istatistikleri."""
+
+    def __init__(self, pist=None, serit='dis', baslangic_s=0.0, saat=time.monotonic):
+        """
+        Args:
+            pist (TrackModel): Pist modeli (None ise varsayılan oval pist)
+            serit (str): Takip edilecek şerit ('ic' veya 'dis')
+            baslangic_s (float): Başlangıç yay uzunluğu (cm)
+            saat (callable): Saniye cinsinden monoton zaman kaynağı
+        """
+        self.pist = pist if pist is not None else TrackModel()
+        self.serit = serit
+        self.serit_n = self.pist.serit_merkezleri[serit]
+        self.saat = saat
+        self._kilit = threading.Lock()
+
+        # Araç pozu ve teker hızları (cm/s)
+        self.x, self.y, self.teta = self.pist.nokta(baslangic_s, self.serit_n)
+        self.teker_yolu = ARAC_GENISLIK
+        self.sol_komut = self.sag_komut = 0.0
+        self.sol_teker = self.sag_teker = 0.0
+
+        # Pist nesneleri: (tip, s, n, yükseklik) - n dış kenarın dışında
+        kenar = self.pist.pist_genislik / 2
+        self.isiklar = [
+            {'s': 130.0, 'n': kenar + 8.0, 'lamba_yukseklik': 30.0}
+        ]
+        self.tabelalar = [
+            {'sekil': 'dortgen', 's': 0.30 * self.pist.cevre, 'n': kenar + 10.0},
+            {'sekil': 'ucgen', 's': 0.55 * self.pist.cevre, 'n': kenar + 10.0},
+            {'sekil': 'daire', 's': 0.80 * self.pist.cevre, 'n': kenar + 10.0}
+        ]
+        self._isik_dongusu = SIM_ISIK_DONGUSU
+        self._isik_periyodu = sum(sure for _, sure in SIM_ISIK_DONGUSU)
+
+        # İstatistikler
+        self.baslangic_zamani = self.saat()
+        self._son_zaman = self.baslangic_zamani
+        self._son_s = baslangic_s
+        self.kat_edilen_yol = 0.0
+        self.tur_baslangici = None
+        self.tur_sureleri = []
+        self._hata_kare_toplami = 0.0
+        self._hata_suresi = 0.0
+        self.max_serit_hatasi = 0.0
+        self.pistten_cikis = 0
+        self._pist_disinda = False
+
+    def _ilerlet(self, simdi):
+        """Pozu verilen zamana kadar integre eder (kilit tutulurken çağrılır)."""
+        kalan = simdi - self._son_zaman
+        self._son_zaman = simdi
+        if kalan <= 0:
+            return
+
+        while kalan > 0:
+            dt = min(kalan, _MAX_ADIM)
+            kalan -= dt
+
+            # Motor tepkisi birinci dereceden gecikme ile modellenir
+            alfa = 1.0 - math.exp(-dt / SIM_MOTOR_ZAMAN_SABITI)
+            self.sol_teker += (self.sol_komut - self.sol_teker) * alfa
+            self.sag_teker += (self.sag_komut - self.sag_teker) * alfa
+
+            # Diferansiyel sürüş kinematiği
+            v = (self.sol_teker + self.sag_teker) / 2
+            w = (self.sag_teker - self.sol_teker) / self.teker_yolu
+            self.x += v * math.cos(self.teta) * dt
+            self.y += v * math.sin(self.teta) * dt
+            self.teta += w * dt
+
+            self._istatistik_guncelle(dt)
+
+    def _istatistik_guncelle(self, dt):
+        """Şerit hatası, yol ve tur istatistiklerini günceller."""
+        pist = self.pist
+        n = float(pist.yanal_konum(self.x, self.y))
+        hata = n - self.serit_n
+        self._hata_kare_toplami += hata * hata * dt
+        self._hata_suresi += dt
+        self.max_serit_hatasi = max(self.max_serit_hatasi, abs(hata))
+
+        disarida = abs(n) > pist.pist_genislik / 2
+        if disarida and not self._pist_disinda:
+            self.pistten_cikis += 1
+        self._pist_disinda = disarida
+
+        s = float(pist.ilerleme(self.x, self.y))
+        ds = (s - self._son_s + pist.cevre / 2) % pist.cevre - pist.cevre / 2
+        self._son_s = s
+
+        self.kat_edilen_yol += ds
+        if self.tur_baslangici is None and self.kat_edilen_yol > 0:
+            # Tur süresi aracın ilk ileri hareketinden itibaren ölçülür
+            self.tur_baslangici = self._son_zaman
+        if self.kat_edilen_yol >= (len(self.tur_sureleri) + 1) * pist.cevre:
+            self.tur_sureleri.append(self._son_zaman - self.tur_baslangici)
+            self.tur_baslangici = self._son_zaman
+
+    def tekerlek_komutu(self, sol, sag):
+        """Teker hız komutlarını ayarlar.
+
+        Args:
+            sol (float): Sol teker hız komutu (cm/s)
+            sag (float): Sağ teker hız komutu (cm/s)
+        """
+        with self._kilit:
+            self._ilerlet(self.saat())
+            self.sol_komut = sol
+            self.sag_komut = sag
+
+    def poz(self):
+        """Güncel araç pozunu döndürür.
+
+        Returns:
+            tuple: (x, y, teta) - Dünya koordinatları (cm) ve yön (radyan)
+        """
+        with self._kilit:
+            self._ilerlet(self.saat())
+            return self.x, self.y, self.teta
+
+    def isik_durumu(self, simdi=None):
+        """Trafik ışıklarının güncel durumunu döndürür.
+
+        Returns:
+            str: 'kirmizi', 'sari' veya 'yesil'
+        """
+        if simdi is None:
+            simdi = self.saat()
+        t = (simdi - self.baslangic_zamani) % self._isik_periyodu
+        for durum, sure in self._isik_dongusu:
+            if t < sure:
+                return durum
+            t -= sure
+        return self._isik_dongusu[-1][0]
+
+    def durum_ozeti(self):
+        """Sürüş istatistiklerinin özetini döndürür.
+
+        Returns:
+            dict: Tur süreleri, şerit hatası ve yol bilgileri
+        """
+        with self._kilit:
+            self._ilerlet(self.saat())
+            rms = math.sqrt(self._hata_kare_toplami / self._hata_suresi) \
+                if self._hata_suresi > 0 else 0.0
+            return {
+                'tur_sayisi': len(self.tur_sureleri),
+                'tur_sureleri_s': [round(t, 2) for t in self.tur_sureleri],
+                'en_iyi_tur_s': round(min(self.tur_sureleri), 2) if self.tur_sureleri else None,
+                'kat_edilen_yol_cm': round(self.kat_edilen_yol, 1),
+                'serit_hatasi_rms_cm': round(rms, 2),
+                'serit_hatasi_max_cm': round(self.max_serit_hatasi, 2),
+                'pistten_cikis': self.pistten_cikis
+            }
@@ -0,0 +1,77 @@
+"""
+Görüntü Tampon Havuzu Modülü
+----------------------------
+Kare başına ara görüntü ayırmayı önlemek için önceden ayrılmış, isimli
+numpy tamponları sağlar. OpenCV fonksiyonları sonuçlarını `dst`
+argümanı ile bu tamponlara yazar.
+"""
+import numpy as np
+from loguru import logger
+from config.config import KAMERA_COZUNURLUK
+
+
+class BufferPool:
+    """İsimli ve yeniden kullanılabilir görüntü tamponları havuzu.
+
+    Bir tampon ilk istendiğinde (veya `onceden_ayir` ile) ayrılır ve aynı isim,
+    boyut ve veri tipiyle yapılan sonraki isteklerde aynı dizi döndürülür.
+    Döndürülen diziler bir sonraki karede üzerine yazılır; kareden daha uzun
+    yaşaması gereken veriler kopyalanmalıdır.
+    """
+
+    def __init__(self, cozunurluk=KAMERA_COZUNURLUK):
+        """
+        Args:
+            cozunurluk (tuple): Tam kare çözünürlüğü (genişlik, yükseklik)
+        """
+        self.genislik, self.yukseklik = cozunurluk
+        self._tamponlar = {}
+        self.yeniden_ayirma_sayisi = 0
+
+    @property
+    def kare_boyutu(self):
+        """Renkli tam kare tampon boyutu (yükseklik, genişlik, 3)."""
+        return (self.yukseklik, self.genislik, 3)
+
+    @property
+    def maske_boyutu(self):
+        """Tek kanallı tam kare tampon boyutu (yükseklik, genişlik)."""
+        return (self.yukseklik, self.genislik)
+
+    def onceden_ayir(self, tanimlar, dtype=np.uint8):
+        """Verilen tamponları döngü başlamadan ayırır.
+
+        Args:
+            tanimlar (dict): {isim: boyut} eşlemesi
+            dtype: Tampon veri tipi
+        """
+        for ad, boyut in tanimlar.items():
+            self.al(ad, boyut, dtype)
+
+    def al(self, ad, boyut, dtype=np.uint8):
+        """İsimli tamponu döndürür, gerekirse ayırır.
+
+        Args:
+            ad (str): Tampon adı (kullanan modül önekiyle, ör. 'serit_hsv')
+            boyut (tuple): Dizi boyutu
+            dtype: Dizi veri tipi
+
+        Returns:
+            numpy.ndarray: Tampon dizisi
+        """
+        tampon = self._tamponlar.get(ad)
+        if tampon is not None and tampon.shape == tuple(boyut) and tampon.dtype == dtype:
+            return tampon
+
+        if tampon is not None:
+            # Çözünürlük değişimi gibi durumlarda tek seferlik yeniden ayırma
+            self.yeniden_ayirma_sayisi += 1
+            logger.debug(f"Tampon yeniden ayrıldı: {ad} {tampon.shape} -> {tuple(boyut)}")
+
+        tampon = np.empty(boyut, dtype=dtype)
+        self._tamponlar[ad] = tampon
+        return tampon
+
+    def toplam_bayt(self):
+        """Havuzdaki tüm tamponların toplam boyutunu döndürür."""
+        return sum(t.nbytes for t in self._tamponlar.values())
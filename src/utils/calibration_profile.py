@@ -0,0 +1,72 @@
+"""
+Kalibrasyon Profili Modülü
+--------------------------
+Kalibrasyon aracında canlı ayarlanan şerit HSV eşikleri, perspektif
+kaynak noktaları ve Canny eşiklerini JSON dosyasında saklar. Dosya yoksa
+veya bir alan eksikse `config.py` varsayılanları kullanılır.
+"""
+import os
+import json
+import copy
+from loguru import logger
+from config.config import (
+    KALIBRASYON_PROFILI,
+    SERIT_HSV_ALT,
+    SERIT_HSV_UST
+)
+
+# Perspektif kaynak noktaları ROI genişlik/yüksekliğine oranla verilir
+# (sol alt, sol üst, sağ üst, sağ alt)
+VARSAYILAN_PROFIL = {
+    'serit_hsv_alt': list(SERIT_HSV_ALT),
+    'serit_hsv_ust': list(SERIT_HSV_UST),
+    'perspektif_noktalari': [[0.1, 0.8], [0.4, 0.5], [0.6, 0.5], [0.9, 0.8]],
+    'canny_alt': 50,
+    'canny_ust': 150
+}
+
+
+def profil_yukle(dosya_yolu=KALIBRASYON_PROFILI):
+    """Kalibrasyon profilini yükler.
+
+    Args:
+        dosya_yolu (str): Profil dosyası
+
+    Returns:
+        dict: Varsayılanlarla tamamlanmış profil
+    """
+    profil = copy.deepcopy(VARSAYILAN_PROFIL)
+    if not os.path.exists(dosya_yolu):
+        return profil
+
+    try:
+        with open(dosya_yolu, encoding="utf-8") as f:
+            kayitli = json.load(f)
+        profil.update({ad: deger for ad, deger in kayitli.items() if ad in profil})
+        logger.info(f"Kalibrasyon profili yüklendi: {dosya_yolu}")
+    except Exception as e:
+        logger.error(f"Kalibrasyon profili okunamadı, varsayılanlar kullanılıyor: {str(e)}")
+
+    return profil
+
+
+def profil_kaydet(profil, dosya_yolu=KALIBRASYON_PROFILI):
+    """Kalibrasyon profilini kaydeder.
+
+    Dosya önce geçici olarak yazılıp yerine taşınır; yazım yarıda kalırsa
+    eski profil bozulmaz.
+
+    Args:
+        profil (dict): Kaydedilecek profil
+        dosya_yolu (str): Profil dosyası
+    """
+    dizin = os.path.dirname(dosya_yolu)
+    if dizin:
+        os.makedirs(dizin, exist_ok=True)
+
+    gecici = dosya_yolu + ".tmp"
+    with open(gecici, "w", encoding="utf-8") as f:
+        json.dump(profil, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    os.replace(gecici, dosya_yolu)
+    logger.info(f"Kalibrasyon profili kaydedildi: {dosya_yolu}")
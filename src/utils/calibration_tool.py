@@ -1,106 +1,253 @@
 """
 Kamera Kalibrasyon Aracı
+------------------------
+Kare yakalama ayrı bir iş parçacığında kamera hızında çalışır. Önizleme
+pencereleri (OpenCV pencereleri tek iş parçacığından yönetilmelidir) ana
+iş parçacığında `KALIBRASYON_ONIZLEME_FPS` hızında ve küçültülmüş karelerle
+güncellenir. 'Ayarlar' penceresindeki kaydırıcılar şerit HSV eşiklerini,
+perspektif noktalarını ve Canny eşiklerini canlı değiştirir; değerler
+kalibrasyon profiline yazılır.
+
+Tuşlar:
+    q: Çıkış (değişiklikler profile kaydedilir)
+    w: Profili kaydet
+    r: Profili varsayılanlara döndür
+    s: Önizleme görüntülerini kaydet
 """
+import copy
+import threading
 import cv2
 import numpy as np
 from loguru import logger
 import time
 from src.camera.camera_controller import CameraController
 from src.detection.lane_detector import LaneDetector
+from src.utils.calibration_profile import profil_yukle, profil_kaydet, VARSAYILAN_PROFIL
+from src.utils.logging_setup import log_ayarla, log_kapat
+from config.config import (
+    KALIBRASYON_ONIZLEME_FPS,
+    KALIBRASYON_ONIZLEME_OLCEK
+)
+
+AYARLAR_PENCERESI = 'Ayarlar'
+
+# Kaydırıcılar: (ad, profil alanı, alan içindeki indeks, maksimum, ölçek)
+# Perspektif noktaları profilde ROI oranı, kaydırıcıda yüzde olarak tutulur
+_KAYDIRICILAR = [
+    ('H alt', 'serit_hsv_alt', 0, 180, 1),
+    ('S alt', 'serit_hsv_alt', 1, 255, 1),
+    ('V alt', 'serit_hsv_alt', 2, 255, 1),
+    ('H ust', 'serit_hsv_ust', 0, 180, 1),
+    ('S ust', 'serit_hsv_ust', 1, 255, 1),
+    ('V ust', 'serit_hsv_ust', 2, 255, 1),
+    ('Canny alt', 'canny_alt', None, 255, 1),
+    ('Canny ust', 'canny_ust', None, 255, 1),
+] + [
+    (f'{nokta} {eksen} %', 'perspektif_noktalari', (i, j), 100, 100)
+    for i, nokta in enumerate(('Sol alt', 'Sol ust', 'Sag ust', 'Sag alt'))
+    for j, eksen in enumerate(('x', 'y'))
+]
+
+
+class FrameGrabber:
+    """Kameradan sürekli kare alıp en son ön işlenmiş kareyi saklayan iş parçacığı."""
+
+    def __init__(self, camera):
+        """
+        Args:
+            camera (CameraController): Kare alınacak kamera
+        """
+        self.camera = camera
+        self._kilit = threading.Lock()
+        self._kare = None
+        self._kare_no = 0
+        self._dur = threading.Event()
+        self._thread = threading.Thread(target=self._calis, name="kalibrasyon-yakalama",
+                                        daemon=True)
+
+    def baslat(self):
+        """Yakalama iş parçacığını başlatır."""
+        self._thread.start()
+
+    def _calis(self):
+        """Kamera kare hızında yakalar; capture_frame kare gelene kadar bekler."""
+        while not self._dur.is_set():
+            frame = self.camera.capture_frame()
+            if frame is None:
+                self._dur.wait(0.1)  # Kamera hazır değilse biraz bekle
+                continue
+
+            # Havuz tamponları bir sonraki karede üzerine yazılır
+            kare = self.camera.preprocess_frame(frame).copy()
+            with self._kilit:
+                self._kare = kare
+                self._kare_no += 1
+
+    def son_kare(self):
+        """En son kareyi döndürür.
+
+        Returns:
+            tuple: (kare, kare_no) - Kare henüz yoksa (None, 0)
+        """
+        with self._kilit:
+            return self._kare, self._kare_no
+
+    def durdur(self):
+        """Yakalama iş parçacığını durdurur."""
+        self._dur.set()
+        self._thread.join(timeout=1.0)
+
+
+def _kaydiricilari_olustur(profil):
+    """Ayarlar penceresini ve kaydırıcıları profil değerleriyle oluşturur."""
+    cv2.namedWindow(AYARLAR_PENCERESI, cv2.WINDOW_NORMAL)
+    for ad, _, _, maksimum, _ in _KAYDIRICILAR:
+        cv2.createTrackbar(ad, AYARLAR_PENCERESI, 0, maksimum, lambda _: None)
+    _kaydiricilari_ayarla(profil)
+
+
+def _kaydiricilari_ayarla(profil):
+    """Kaydırıcı konumlarını profile göre ayarlar."""
+    for ad, alan, indeks, _, olcek in _KAYDIRICILAR:
+        deger = profil[alan]
+        if isinstance(indeks, tuple):
+            deger = deger[indeks[0]][indeks[1]]
+        elif indeks is not None:
+            deger = deger[indeks]
+        cv2.setTrackbarPos(ad, AYARLAR_PENCERESI, int(round(deger * olcek)))
+
+
+def _kaydiricilari_oku(profil):
+    """Kaydırıcı konumlarından yeni bir profil oluşturur."""
+    yeni = copy.deepcopy(profil)
+    for ad, alan, indeks, _, olcek in _KAYDIRICILAR:
+        deger = cv2.getTrackbarPos(ad, AYARLAR_PENCERESI)
+        deger = deger / olcek if olcek != 1 else deger
+        if isinstance(indeks, tuple):
+            yeni[alan][indeks[0]][indeks[1]] = deger
+        elif indeks is not None:
+            yeni[alan][indeks] = deger
+        else:
+            yeni[alan] = deger
+    return yeni
+
+
+def _onizlemeleri_olustur(camera, lane_detector, kare, profil, olcek):
+    """Küçültülmüş kare üzerinden önizleme görüntülerini üretir.
+
+    Returns:
+        dict: {pencere adı: görüntü}
+    """
+    kucuk = cv2.resize(kare, None, fx=olcek, fy=olcek, interpolation=cv2.INTER_AREA)
+    roi_frame, _ = camera.apply_roi(kucuk)
+
+    # Referans dörtgeni küçük kopya üzerine çizilir
+    kalibrasyon_goruntusu = lane_detector.kalibrasyon_goruntusunu_goster(roi_frame)
+
+    if not lane_detector.kalibre_edildi:
+        lane_detector.perspektif_kalibrasyonu(roi_frame)
+    kus_bakisi = lane_detector.perspektif_donusumu_uygula(roi_frame)
+
+    maske = lane_detector._serit_maske_olustur(roi_frame)
+    gri = cv2.cvtColor(roi_frame, cv2.COLOR_BGR2GRAY)
+    kenarlar = cv2.Canny(gri, profil['canny_alt'], profil['canny_ust'])
+
+    return {
+        'Kalibrasyon': kalibrasyon_goruntusu,
+        'Kuş Bakışı Görünüm': kus_bakisi,
+        'Şerit Maskesi': maske,
+        'Kenarlar': kenarlar
+    }
+
 
 def main():
     """Kalibrasyon aracı ana fonksiyonu."""
+    camera = None
+    yakalayici = None
     try:
-        # Kamera ve şerit detektörünü başlat
+        # Kamera, şerit detektörü ve profil
         camera = CameraController()
-        lane_detector = LaneDetector()
-        
-        # Pencere oluştur ve boyutlandır
-        cv2.namedWindow('Kalibrasyon', cv2.WINDOW_NORMAL)
-        cv2.resizeWindow('Kalibrasyon', 640, 480)
-        cv2.namedWindow('Kuş Bakışı Görünüm', cv2.WINDOW_NORMAL)
-        cv2.resizeWindow('Kuş Bakışı Görünüm', 640, 480)
-        
-        # FPS kontrolü için değişkenler
-        fps_limit = 30  # Maksimum FPS
-        frame_delay = 1.0 / fps_limit
-        last_frame_time = time.time()
-        
+        profil = profil_yukle()
+        kayitli_profil = copy.deepcopy(profil)
+        lane_detector = LaneDetector(profil=profil)
+
+        _kaydiricilari_olustur(profil)
+
+        yakalayici = FrameGrabber(camera)
+        yakalayici.baslat()
+
+        olcek = KALIBRASYON_ONIZLEME_OLCEK
+        aralik = 1.0 / KALIBRASYON_ONIZLEME_FPS
+        son_kare_no = 0
+        goruntuler = {}
+
         while True:
-            # FPS kontrolü
-            current_time = time.time()
-            elapsed = current_time - last_frame_time
-            if elapsed < frame_delay:
-                continue
-            
-            last_frame_time = current_time
-            
-            # Görüntü al
-            frame = camera.capture_frame()
-            if frame is None:
-                time.sleep(0.1)  # Kamera hazır değilse biraz bekle
-                continue
-            
-            try:
-                # Görüntüyü yeniden boyutlandır (performans için)
-                frame = cv2.resize(frame, (640, 480))
-                
-                # Görüntüyü ön işle
-                frame = camera.preprocess_frame(frame)
-                
-                # ROI uygula
-                roi_frame, _ = camera.apply_roi(frame)
-                
-                # Kalibrasyon görüntüsünü göster
-                kalibrasyon_goruntusu = lane_detector.kalibrasyon_goruntusunu_goster(roi_frame)
-                cv2.imshow('Kalibrasyon', kalibrasyon_goruntusu)
-                
-                # Perspektif dönüşümü uygula
-                if not lane_detector.kalibre_edildi:
-                    lane_detector.perspektif_kalibrasyonu(roi_frame)
-                
-                kus_bakisi = lane_detector.perspektif_donusumu_uygula(roi_frame)
-                cv2.imshow('Kuş Bakışı Görünüm', kus_bakisi)
-                
-            except Exception as e:
-                logger.error(f"Görüntü işleme hatası: {str(e)}")
-                continue
-            
-            # Tuş kontrolü - Non-blocking wait
-            key = cv2.waitKey(1) & 0xFF
-            
+            baslangic = time.monotonic()
+
+            # Kaydırıcı değişikliklerini uygula (perspektif matrisi yalnızca
+            # noktalar değiştiğinde yeniden hesaplanır)
+            yeni_profil = _kaydiricilari_oku(profil)
+            degisti = yeni_profil != profil
+            if degisti:
+                profil = yeni_profil
+                lane_detector.profil_uygula(profil)
+
+            # Önizlemeler yalnızca yeni kare veya ayar değişikliğinde güncellenir
+            kare, kare_no = yakalayici.son_kare()
+            if kare is not None and (kare_no != son_kare_no or degisti):
+                son_kare_no = kare_no
+                try:
+                    goruntuler = _onizlemeleri_olustur(camera, lane_detector, kare, profil, olcek)
+                    for pencere, goruntu in goruntuler.items():
+                        cv2.imshow(pencere, goruntu)
+                except Exception as e:
+                    logger.error(f"Görüntü işleme hatası: {str(e)}")
+
+            # Önizleme hızına kadar tuş beklenir (meşgul bekleme yok)
+            bekleme = max(1, int((aralik - (time.monotonic() - baslangic)) * 1000))
+            key = cv2.waitKey(bekleme) & 0xFF
+
             # 'q' tuşu ile çık
             if key == ord('q'):
                 break
-            # 'c' tuşu ile yeniden kalibre et
-            elif key == ord('c'):
-                lane_detector.kalibre_edildi = False
-            # 's' tuşu ile kaydet
+            # 'w' tuşu ile profili kaydet
+            elif key == ord('w'):
+                profil_kaydet(profil)
+                kayitli_profil = copy.deepcopy(profil)
+            # 'r' tuşu ile varsayılanlara dön
+            elif key == ord('r'):
+                profil = copy.deepcopy(VARSAYILAN_PROFIL)
+                _kaydiricilari_ayarla(profil)
+                lane_detector.profil_uygula(profil)
+            # 's' tuşu ile görüntüleri kaydet
             elif key == ord('s'):
                 try:
                     timestamp = time.strftime("%Y%m%d-%H%M%S")
-                    cv2.imwrite(f'kalibrasyon_{timestamp}.jpg', kalibrasyon_goruntusu)
-                    cv2.imwrite(f'kus_bakisi_{timestamp}.jpg', kus_bakisi)
+                    cv2.imwrite(f'kalibrasyon_{timestamp}.jpg', goruntuler['Kalibrasyon'])
+                    cv2.imwrite(f'kus_bakisi_{timestamp}.jpg', goruntuler['Kuş Bakışı Görünüm'])
                     logger.info("Görüntüler kaydedildi")
                 except Exception as e:
                     logger.error(f"Görüntü kaydetme hatası: {str(e)}")
-            
-            # CPU kullanımını azaltmak için kısa bekleme
-            time.sleep(0.01)
-        
+
+        if profil != kayitli_profil:
+            profil_kaydet(profil)
+
     except Exception as e:
         logger.error(f"Kalibrasyon aracı hatası: {str(e)}")
     finally:
         # Temizlik işlemleri
+        if yakalayici is not None:
+            yakalayici.durdur()
         cv2.destroyAllWindows()
-        camera.close()
+        if camera is not None:
+            camera.close()
         logger.info("Kalibrasyon aracı kapatıldı")
 
 if __name__ == "__main__":
-    # Log ayarlarını yapılandır
-    logger.add("logs/kalibrasyon.log",
-               rotation="1 day",
-               format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}",
-               enqueue=True)  # Thread-safe logging
-    
-    main() 
\ No newline at end of file
+    # Log ayarlarını yapılandır (kuyruklu, thread-safe)
+    log_ayarla("logs/kalibrasyon.log")
+
+    try:
+        main()
+    finally:
+        log_kapat()
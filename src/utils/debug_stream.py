@@ -0,0 +1,318 @@
+"""
+Hata Ayıklama Video Yayını
+--------------------------
+Sürüş döngüsünün gördüğü kareleri ayrı bir kodlayıcı sürecine paylaşımlı
+bellek üzerinden aktarır. Kodlayıcı süreci şerit eğrilerini, trafik ışığı
+durumunu ve `SignDetector.goruntu_isle` tabela kutularını çizer, JPEG'e
+kodlar ve MJPEG olarak HTTP üzerinden yayınlar.
+
+Kontrol döngüsünde yalnızca hız sınırı kontrolü, kare kopyası ve birkaç
+sayının yazılması yapılır; çizim ve kodlama hiçbir zaman döngünün iş
+parçacığında çalışmaz.
+
+Paylaşımlı bellek düzeni: float64 denetim alanı (sıra numarası, durdurma
+bayrağı) + her biri kendi başlığına sahip iki kare yuvası. Yazıcı kareyi ve
+algılama sonuçlarını sıradaki yuvaya yazar ve sıra numarasını en son artırır;
+okuyucu yuvayı başlığıyla birlikte kopyaladıktan sonra sıra numarasının
+değişmediğini doğrular, böylece bir kare başka bir karenin sonuçlarıyla
+eşleşmez.
+
+İzleme: http://<adres>:<port>/ (MJPEG), /kare.jpg (tek kare)
+"""
+import os
+import time
+import threading
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import numpy as np
+from loguru import logger
+from config.config import (
+    KAMERA_COZUNURLUK,
+    DEBUG_YAYIN_ADRESI,
+    DEBUG_YAYIN_PORTU,
+    DEBUG_YAYIN_FPS,
+    DEBUG_YAYIN_JPEG_KALITESI
+)
+
+# Denetim alanları (float64 indeksleri)
+_SIRA = 0
+_DUR = 1
+_DENETIM_BOYUTU = 2
+
+# Yuva başlığı alanları (float64 indeksleri)
+_YUKSEKLIK = 0
+_GENISLIK = 1
+_ROI_BAS = 2
+_ROI_SON = 3
+_SOL_VAR = 4
+_SOL = slice(5, 8)
+_SAG_VAR = 8
+_SAG = slice(9, 12)
+_ISIK = 12
+_ISIK_X = 13
+_ISIK_Y = 14
+_SAPMA = 15
+_BASLIK_BOYUTU = 32
+
+_ISIK_KODLARI = {None: 0, 'kirmizi': 1, 'sari': 2, 'yesil': 3}
+_ISIK_ADLARI = {kod: ad for ad, kod in _ISIK_KODLARI.items()}
+_ISIK_RENKLERI = {'kirmizi': (0, 0, 255), 'sari': (0, 220, 255), 'yesil': (0, 255, 0)}
+
+
+def _bellek_duzeni(shm, genislik, yukseklik):
+    """Paylaşımlı bellek üzerinde denetim, yuva başlığı ve kare yuvası görünümlerini oluşturur."""
+    denetim = np.ndarray((_DENETIM_BOYUTU,), dtype=np.float64, buffer=shm.buf)
+    basliklar = np.ndarray((2, _BASLIK_BOYUTU), dtype=np.float64, buffer=shm.buf,
+                           offset=denetim.nbytes)
+    yuvalar = np.ndarray((2, yukseklik, genislik, 3), dtype=np.uint8, buffer=shm.buf,
+                         offset=denetim.nbytes + basliklar.nbytes)
+    return denetim, basliklar, yuvalar
+
+
+class DebugStream:
+    """Sürüş döngüsü tarafı: kareleri kodlayıcı sürecine aktarır."""
+
+    def __init__(self, cozunurluk=KAMERA_COZUNURLUK, adres=DEBUG_YAYIN_ADRESI,
+                 port=DEBUG_YAYIN_PORTU, fps=DEBUG_YAYIN_FPS):
+        """
+        Args:
+            cozunurluk (tuple): Yayınlanabilecek en büyük kare (genişlik, yükseklik)
+            adres (str): HTTP sunucusunun dinleyeceği adres
+            port (int): HTTP sunucusunun portu
+            fps (float): Yayına aktarılan en yüksek kare hızı
+        """
+        self.genislik, self.yukseklik = cozunurluk
+        self.aralik = 1.0 / fps
+        self._son_yayin = 0.0
+        self.aktarilan_kare = 0
+
+        boyut = (_DENETIM_BOYUTU + 2 * _BASLIK_BOYUTU) * 8 + 2 * self.yukseklik * self.genislik * 3
+        self._shm = shared_memory.SharedMemory(create=True, size=boyut)
+        self._denetim, self._basliklar, self._yuvalar = _bellek_duzeni(
+            self._shm, self.genislik, self.yukseklik)
+        self._denetim[:] = 0
+        self._basliklar[:] = 0
+
+        # Süreç, kamera ve motor iş parçacıkları kopyalanmasın diye 'spawn' ile başlatılır
+        baglam = mp.get_context("spawn")
+        self._yeni_kare = baglam.Event()
+        self._surec = baglam.Process(
+            target=_kodlayici_sureci, name="debug-yayin",
+            args=(self._shm.name, self.genislik, self.yukseklik, adres, port,
+                  self._yeni_kare),
+            daemon=True)
+        self._surec.start()
+        logger.info(f"Hata ayıklama yayını: http://{adres}:{port}/ (en fazla {fps} FPS)")
+
+    def yayinla(self, frame, sol_serit=None, sag_serit=None, roi_koordinatlari=(0, 0),
+                isik=(None, None), merkez_sapma=0.0, olcek=1.0):
+        """Kareyi ve algılama sonuçlarını yayına aktarır (hız sınırlı).
+
+        Args:
+            frame (numpy.ndarray): BGR kare
+            sol_serit, sag_serit: Şerit eğrisi katsayıları (ROI koordinatlarında)
+            roi_koordinatlari (tuple): ROI'nin (y_start, y_end) koordinatları
+            isik (tuple): (durum, merkez) trafik ışığı tespiti
+            merkez_sapma (float): Şerit merkezinden sapma (piksel)
+            olcek (float): Algılama sonuçlarının çözünürlüğünün kareye oranı
+                (sonuçlar kare koordinatlarına çevrilir)
+
+        Returns:
+            bool: Kare aktarıldı mı
+        """
+        simdi = time.monotonic()
+        if frame is None or simdi - self._son_yayin < self.aralik or not self._surec.is_alive():
+            return False
+        self._son_yayin = simdi
+
+        h, w = frame.shape[:2]
+        if h > self.yukseklik or w > self.genislik or frame.ndim != 3:
+            return False
+
+        # Okuyucu en son yayınlanan yuvayı kopyalıyor olabilir; yazım diğer
+        # yuvaya ve o yuvanın kendi başlığına yapılır
+        sira = int(self._denetim[_SIRA]) + 1
+        baslik = self._basliklar[sira % 2]
+        np.copyto(self._yuvalar[sira % 2, :h, :w], frame)
+
+        # x = a*y^2 + b*y + c eğrisi k kat büyütülünce (a/k, b, c*k) olur
+        k = 1.0 / olcek
+        egri_olcegi = np.array([1.0 / k, 1.0, k])
+        baslik[_YUKSEKLIK], baslik[_GENISLIK] = h, w
+        baslik[_ROI_BAS], baslik[_ROI_SON] = (r * k for r in roi_koordinatlari)
+        baslik[_SOL_VAR] = sol_serit is not None
+        if sol_serit is not None:
+            baslik[_SOL] = np.multiply(sol_serit, egri_olcegi)
+        baslik[_SAG_VAR] = sag_serit is not None
+        if sag_serit is not None:
+            baslik[_SAG] = np.multiply(sag_serit, egri_olcegi)
+        durum, merkez = isik
+        baslik[_ISIK] = _ISIK_KODLARI.get(durum, 0)
+        if merkez is not None:
+            baslik[_ISIK_X], baslik[_ISIK_Y] = merkez[0] * k, merkez[1] * k
+        baslik[_SAPMA] = merkez_sapma * k
+
+        # Sıra numarası en son yazılır
+        self._denetim[_SIRA] = sira
+        self._yeni_kare.set()
+        self.aktarilan_kare += 1
+        return True
+
+    def kapat(self):
+        """Kodlayıcı sürecini durdurur ve paylaşımlı belleği serbest bırakır."""
+        try:
+            self._denetim[_DUR] = 1
+            self._yeni_kare.set()
+            self._surec.join(timeout=2.0)
+            if self._surec.is_alive():
+                self._surec.terminate()
+            del self._denetim, self._basliklar, self._yuvalar
+            self._shm.close()
+            self._shm.unlink()
+            logger.info(f"Hata ayıklama yayını kapatıldı ({self.aktarilan_kare} kare aktarıldı)")
+        except Exception as e:
+            logger.error(f"Hata ayıklama yayını kapatılamadı: {str(e)}")
+
+
+class _KareKutusu:
+    """Kodlayıcı sürecinde en son JPEG'i HTTP istemcileriyle paylaşır."""
+
+    def __init__(self):
+        self.kosul = threading.Condition()
+        self.jpeg = None
+        self.sira = 0
+
+    def koy(self, jpeg):
+        with self.kosul:
+            self.jpeg = jpeg
+            self.sira += 1
+            self.kosul.notify_all()
+
+    def bekle(self, son_sira, zaman_asimi=5.0):
+        with self.kosul:
+            self.kosul.wait_for(lambda: self.sira != son_sira, timeout=zaman_asimi)
+            return self.jpeg, self.sira
+
+
+def _http_sunucusu(adres, port, kutu):
+    """MJPEG yayını yapan HTTP sunucusunu arka planda başlatır."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Isleyici(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.startswith("/kare.jpg"):
+                jpeg, _ = kutu.bekle(-1, 0)
+                if jpeg is None:
+                    self.send_error(503)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "image/jpeg")
+                self.send_header("Content-Length", str(len(jpeg)))
+                self.end_headers()
+                self.wfile.write(jpeg)
+                return
+
+            self.send_response(200)
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Content-Type", "multipart/x-mixed-replace; boundary=kare")
+            self.end_headers()
+            sira = 0
+            try:
+                while True:
+                    jpeg, yeni_sira = kutu.bekle(sira)
+                    if jpeg is None or yeni_sira == sira:
+                        continue
+                    sira = yeni_sira
+                    self.wfile.write(b"--kare\r\nContent-Type: image/jpeg\r\n")
+                    self.wfile.write(f"Content-Length: {len(jpeg)}\r\n\r\n".encode())
+                    self.wfile.write(jpeg)
+                    self.wfile.write(b"\r\n")
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+        def log_message(self, format, *args):
+            pass
+
+    sunucu = ThreadingHTTPServer((adres, port), Isleyici)
+    sunucu.daemon_threads = True
+    threading.Thread(target=sunucu.serve_forever, name="debug-http", daemon=True).start()
+    return sunucu
+
+
+def _ciz(kare, baslik):
+    """Şerit eğrilerini, ışık durumunu ve sapmayı kare üzerine çizer."""
+    import cv2
+
+    y0, y1 = int(baslik[_ROI_BAS]), int(baslik[_ROI_SON])
+    if y1 > y0:
+        cv2.line(kare, (0, y0), (kare.shape[1] - 1, y0), (255, 255, 0), 1)
+        satirlar = np.arange(0, y1 - y0, 4, dtype=np.float64)
+        for var, katsayilar in ((_SOL_VAR, _SOL), (_SAG_VAR, _SAG)):
+            if baslik[var]:
+                x = np.polyval(baslik[katsayilar], satirlar)
+                noktalar = np.stack([x, satirlar + y0], axis=1).astype(np.int32)
+                cv2.polylines(kare, [noktalar], False, (255, 0, 255), 2)
+
+    durum = _ISIK_ADLARI.get(int(baslik[_ISIK]))
+    if durum is not None:
+        merkez = (int(baslik[_ISIK_X]), int(baslik[_ISIK_Y]))
+        cv2.circle(kare, merkez, 12, _ISIK_RENKLERI[durum], 2)
+        cv2.putText(kare, durum, (merkez[0] + 15, merkez[1]),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, _ISIK_RENKLERI[durum], 1)
+
+    cv2.putText(kare, f"sapma: {baslik[_SAPMA]:.1f}px", (10, kare.shape[0] - 10),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+
+
+def _kodlayici_sureci(shm_adi, genislik, yukseklik, adres, port, yeni_kare):
+    """Kodlayıcı süreci: kareyi okur, çizer, kodlar ve yayınlar."""
+    import cv2
+    from src.detection.sign_detector import SignDetector
+
+    # Sürüş döngüsüyle CPU yarışında geri planda kalır
+    try:
+        os.nice(10)
+    except OSError:
+        pass
+
+    shm = shared_memory.SharedMemory(name=shm_adi)
+    try:
+        denetim, basliklar, yuvalar = _bellek_duzeni(shm, genislik, yukseklik)
+        kutu = _KareKutusu()
+        sunucu = _http_sunucusu(adres, port, kutu)
+        tabela_dedektoru = None
+        kodlama = [int(cv2.IMWRITE_JPEG_QUALITY), DEBUG_YAYIN_JPEG_KALITESI]
+        son_sira = 0
+
+        while not denetim[_DUR]:
+            if not yeni_kare.wait(1.0):
+                continue
+            yeni_kare.clear()
+
+            sira = int(denetim[_SIRA])
+            if sira == son_sira:
+                continue
+            bilgi = basliklar[sira % 2].copy()
+            h, w = int(bilgi[_YUKSEKLIK]), int(bilgi[_GENISLIK])
+            kare = yuvalar[sira % 2, :h, :w].copy()
+            if int(denetim[_SIRA]) != sira:
+                # Kopyalama sırasında yeni kare yayınlandı; yazıcı bu yuvaya
+                # geçmiş olabileceğinden kopya atılır, sonraki kare beklenir
+                continue
+            son_sira = sira
+
+            # Tabela kutuları tabela dedektörünün kendi çizimiyle eklenir; dedektör
+            # kareyi yeniden boyutlandırmasın diye çalışma çözünürlüğüne göre kurulur
+            if tabela_dedektoru is None \
+                    or (tabela_dedektoru.genislik, tabela_dedektoru.yukseklik) != (w, h):
+                tabela_dedektoru = SignDetector(kamera_cozunurluk=(w, h))
+            kare, _ = tabela_dedektoru.goruntu_isle(kare)
+            _ciz(kare, bilgi)
+
+            basarili, jpeg = cv2.imencode(".jpg", kare, kodlama)
+            if basarili:
+                kutu.koy(jpeg.tobytes())
+
+        sunucu.shutdown()
+    finally:
+        shm.close()
@@ -0,0 +1,574 @@
+"""
+Dedektör Fark Testi
+-------------------
+`LaneDetector`, `TrafficLightDetector` ve `SignDetector` üzerinde yapılan
+performans değişikliklerinin davranışı bozmadığını doğrular. Dedektör
+modüllerinin bir git revizyonundaki hali (varsayılan
+`FARK_REFERANS_REVIZYONU`, optimizasyonlardan önceki commit; veya
+`--referans` ile verilen revizyon) ayrı bir modül adıyla yüklenir ve çalışma ağacındaki (aday) sınıflarla aynı kareler
+üzerinde yan yana çalıştırılır. Karşılaştırılanlar:
+
+    serit   ROI satırlarında şerit eğrileri arasındaki en büyük fark ve
+            ROI alt satırındaki şerit merkezi farkı (kontrolcünün sapmayı
+            ölçtüğü satır; katsayı farkları yalnızca raporlanır, ölçekleri
+            çok farklı olduğundan tolerans piksel üzerindendir)
+    isik    Işık durumu (birebir) ve ışık merkezi farkı
+    tabela  Aynı tipteki kutuların eşleşmesi ve kenar farkları
+
+Her dedektör için kare başına süreler ölçülür ve hızlanma (referans/aday)
+raporlanır. `--renk-uzayi yuv` ile aday olarak YUV dedektörleri
+(`YuvLaneDetector` vb.) aynı I420 karenin düzlemlerinde, referans ise bu
+karenin BGR dönüşümünde çalışır; farklar iki algılama yolu arasındadır.
+`--serit-motoru` ile aday şerit dedektörü verilen motorla
+(`SERIT_MOTORLARI`) çalışır; motorun referans motordan farkı ve maliyeti
+raporlanır.
+
+Referans dedektörün `src.detection` altından içe aktardığı algoritma
+modülleri (ör. `lane_engines`) de aynı revizyondan yüklenir; diğer
+yardımcılar (`BufferPool`, kalibrasyon profili, config) çalışma ağacından
+gelir. Referans sabit bir commit olduğundan commit edilen bir değişiklik
+kendiliğinden referans olmaz.
+
+Kullanım:
+    python -m src.utils.detector_diff
+    python -m src.utils.detector_diff --referans HEAD~3 --kayit logs/kayitlar --json logs/fark.json
+    python -m src.utils.detector_diff --renk-uzayi yuv
+    python -m src.utils.detector_diff --dedektorler serit --serit-motoru kayan_pencere
+"""
+import os
+import sys
+import json
+import time
+import types
+import builtins
+import inspect
+import argparse
+import subprocess
+import numpy as np
+from loguru import logger
+from src.camera.frame import Frame
+from src.detection.lane_detector import LaneDetector, YuvLaneDetector
+from src.detection.lane_engines import SERIT_MOTORLARI
+from src.detection.traffic_light_detector import TrafficLightDetector, YuvTrafficLightDetector
+from src.detection.sign_detector import SignDetector, YuvSignDetector
+from src.detection.sign_tracker import _iou
+from src.simulation.sim_camera import SimCameraController
+from src.simulation.world import SimWorld
+from src.utils.buffer_pool import BufferPool
+from src.utils.logging_setup import log_ayarla, log_kapat
+from src.utils.soak_test import RecordedCamera
+from config.config import (
+    SOAK_MAX_KAYIT_KARESI,
+    FARK_REFERANS_REVIZYONU,
+    FARK_KARE_SAYISI,
+    FARK_SERIT_TOLERANSI,
+    FARK_SAPMA_TOLERANSI,
+    FARK_ISIK_TOLERANSI,
+    FARK_TABELA_TOLERANSI
+)
+
+_KOK_DIZIN = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Bu paketlerden içe aktarılan modüller (algoritma kodu) referanstan yüklenir
+_REFERANS_PAKETLERI = ("src.detection.",)
+
+# Referans motorlara verilen, config'den bağımsız sabit seçenekler
+_REFERANS_SECENEKLERI = {'serit': {'motor': 'satir_ortalamasi'}}
+
+# Dedektör adı: (modül dosyası, sınıf adı, aday sınıf, YUV aday sınıfı)
+_DEDEKTORLER = {
+    'serit': ("src/detection/lane_detector.py", "LaneDetector", LaneDetector,
+              YuvLaneDetector),
+    'isik': ("src/detection/traffic_light_detector.py", "TrafficLightDetector",
+             TrafficLightDetector, YuvTrafficLightDetector),
+    'tabela': ("src/detection/sign_detector.py", "SignDetector", SignDetector,
+               YuvSignDetector)
+}
+
+# Süre ölçümüne katılmayan ilk kareler (tampon ayırma, önbellek ısınması)
+_ISINMA_KARESI = 5
+
+# Raporda dedektör başına listelenen uyumsuz kare sayısı
+_ORNEK_SAYISI = 10
+
+# Sentetik karelerde ardışık kareler arası sanal süre (ışık döngüsünün tüm
+# durumları taransın diye periyodun katı olmayan bir değer)
+_SENTETIK_ZAMAN_ADIMI = 0.7
+
+# Sentetik karelerde aracın şerit ortasından yanal salınımı (cm) ve periyodu (kare)
+_SENTETIK_SALINIM = 4.0
+_SENTETIK_SALINIM_PERIYODU = 40
+
+
+def _kaynak_oku(yol, revizyon):
+    """Modül kaynağını git revizyonundan veya dondurulmuş kopyanın kök dizininden okur.
+
+    Returns:
+        tuple: (kaynak, kaynak_adi)
+    """
+    if os.path.isdir(revizyon):
+        kaynak_adi = os.path.join(revizyon, yol)
+        with open(kaynak_adi, encoding="utf-8") as f:
+            return f.read(), kaynak_adi
+
+    kaynak_adi = f"{revizyon}:{yol}"
+    sonuc = subprocess.run(["git", "show", kaynak_adi], cwd=_KOK_DIZIN,
+                           capture_output=True, text=True)
+    if sonuc.returncode != 0:
+        raise ValueError(f"Referans okunamadı ({kaynak_adi}): {sonuc.stderr.strip()}")
+    return sonuc.stdout, kaynak_adi
+
+
+def referans_modulu_yukle(yol, revizyon=FARK_REFERANS_REVIZYONU, yuklenenler=None):
+    """Bir modülün git revizyonundaki halini çalışma ağacındakinden bağımsız yükler.
+
+    Modülün `_REFERANS_PAKETLERI` altından `from ... import` ile aldığı
+    modüller de aynı revizyondan yüklenir.
+
+    Args:
+        yol (str): Depo köküne göre modül dosyası (ör. src/detection/lane_detector.py)
+        revizyon (str): Git revizyonu veya dondurulmuş kopyanın kök dizini
+        yuklenenler (dict): {yol: modül} - Aynı revizyondan yüklenmiş modüller
+            (bağımlılıklar bir kez yüklenir; yüklenenler buraya eklenir)
+
+    Returns:
+        module: Referans modül (sys.modules'e eklenmez)
+    """
+    yuklenenler = {} if yuklenenler is None else yuklenenler
+    if yol in yuklenenler:
+        return yuklenenler[yol]
+    kaynak, kaynak_adi = _kaynak_oku(yol, revizyon)
+
+    def ice_aktar(isim, globals=None, locals=None, fromlist=(), level=0):
+        if level == 0 and fromlist and isim.startswith(_REFERANS_PAKETLERI):
+            return referans_modulu_yukle(isim.replace(".", "/") + ".py", revizyon, yuklenenler)
+        return builtins.__import__(isim, globals, locals, fromlist, level)
+
+    ad = "referans." + os.path.splitext(yol)[0].replace("/", ".")
+    modul = types.ModuleType(ad)
+    modul.__file__ = kaynak_adi
+    modul.__builtins__ = dict(vars(builtins), __import__=ice_aktar)
+    exec(compile(kaynak, kaynak_adi, "exec"), modul.__dict__)
+    yuklenenler[yol] = modul
+    return modul
+
+
+def _olustur(sinif, **secenekler):
+    """Sınıfı, yalnızca yapıcısının kabul ettiği seçeneklerle oluşturur.
+
+    Referans revizyondaki yapıcı imzası adaydan farklı olabilir.
+    """
+    parametreler = inspect.signature(sinif.__init__).parameters
+    return sinif(**{ad: deger for ad, deger in secenekler.items() if ad in parametreler})
+
+
+def _sure_ozeti(sureler):
+    """Ölçülen sürelerin ortalamasını ve p95 değerini ms olarak döndürür."""
+    if not sureler:
+        return None, None
+    dizi = np.array(sureler) * 1000
+    return round(float(dizi.mean()), 3), round(float(np.percentile(dizi, 95)), 3)
+
+
+def _alt_satir_merkezi(cikti, roi_yukseklik):
+    """`seritleri_bul` çıktısında şerit merkezinin ROI alt satırındaki konumu (şerit eksikse 0)."""
+    sol, sag = cikti[:2]
+    if sol is None or sag is None:
+        return 0.0
+    y = roi_yukseklik - 1
+    return float(np.polyval(sol, y) + np.polyval(sag, y)) / 2
+
+
+def _serit_farki(referans, aday, roi_yukseklik):
+    """İki `seritleri_bul` çıktısını karşılaştırır.
+
+    Sapma, dedektörün `merkez_sapma` değeri yerine kontrolcünün kullandığı
+    ROI alt satırındaki şerit merkezinden karşılaştırılır; `merkez_sapma`
+    eğrileri ROI'nin çok altındaki bir satırda değerlendirdiğinden eğrideki
+    piksel altı farkları onlarca piksele büyütür.
+
+    Returns:
+        tuple: (egri_farki, katsayi_farki, sapma_farki, aciklama) - Eğriler
+            arasındaki en büyük fark (piksel; yalnızca biri varsa inf),
+            katsayı başına mutlak farklar, sapma farkı ve uyumsuzluk
+            açıklaması (uyumluysa None)
+    """
+    y = np.arange(roi_yukseklik, dtype=np.float64)
+    egri_farki = 0.0
+    katsayi_farki = None
+    for ref_egri, aday_egri in zip(referans[:2], aday[:2]):
+        if ref_egri is None and aday_egri is None:
+            continue
+        if ref_egri is None or aday_egri is None:
+            egri_farki = float('inf')
+            continue
+        egri_farki = max(egri_farki, float(np.max(np.abs(
+            np.polyval(ref_egri, y) - np.polyval(aday_egri, y)))))
+        fark = np.abs(np.asarray(ref_egri, np.float64) - np.asarray(aday_egri, np.float64))
+        katsayi_farki = fark if katsayi_farki is None else np.maximum(katsayi_farki, fark)
+    ref_merkez = _alt_satir_merkezi(referans, roi_yukseklik)
+    aday_merkez = _alt_satir_merkezi(aday, roi_yukseklik)
+    sapma_farki = abs(ref_merkez - aday_merkez)
+
+    aciklama = None
+    if egri_farki > FARK_SERIT_TOLERANSI:
+        aciklama = f"eğri farkı {egri_farki:.2f} px"
+    elif sapma_farki > FARK_SAPMA_TOLERANSI:
+        aciklama = f"alt satır merkezi {ref_merkez:.2f} -> {aday_merkez:.2f} px"
+    return egri_farki, katsayi_farki, sapma_farki, aciklama
+
+
+def _isik_farki(referans, aday):
+    """İki `isik_durumunu_tespit_et` çıktısını karşılaştırır.
+
+    Returns:
+        tuple: (konum_farki, aciklama) - Işık merkezleri arası uzaklık
+            (piksel; ışık yoksa 0) ve uyumsuzluk açıklaması
+    """
+    if referans[0] != aday[0]:
+        return 0.0, f"durum {referans[0]} -> {aday[0]}"
+    if referans[1] is None or aday[1] is None:
+        konum_farki = 0.0 if referans[1] is None and aday[1] is None else float('inf')
+    else:
+        konum_farki = float(np.hypot(referans[1][0] - aday[1][0], referans[1][1] - aday[1][1]))
+    if konum_farki > FARK_ISIK_TOLERANSI:
+        return konum_farki, f"{referans[0]} ışık konumu {referans[1]} -> {aday[1]}"
+    return konum_farki, None
+
+
+def _tabela_farki(referans, aday):
+    """İki `tabelalari_tespit_et` çıktısını aynı tipteki kutuları eşleştirerek karşılaştırır.
+
+    Returns:
+        tuple: (kutu_farki, eksik, fazla, aciklama) - Eşleşen kutuların en
+            büyük kenar farkı, adayda bulunmayan ve adayda fazladan olan
+            tespit sayıları ve uyumsuzluk açıklaması
+    """
+    kutu_farki = 0.0
+    eksik = []
+    kullanilan = set()
+    for tabela_tipi, _, kutu in referans:
+        en_iyi, en_iyi_iou = None, 0.0
+        for i, (aday_tipi, _, aday_kutu) in enumerate(aday):
+            if i in kullanilan or aday_tipi != tabela_tipi:
+                continue
+            iou = _iou(kutu, aday_kutu)
+            if iou > en_iyi_iou:
+                en_iyi, en_iyi_iou = i, iou
+        if en_iyi is None:
+            eksik.append(tabela_tipi)
+            continue
+        kullanilan.add(en_iyi)
+        aday_kutu = aday[en_iyi][2]
+        # (x, y, w, h) -> kenarlar (x0, y0, x1, y1)
+        kutu_farki = max(kutu_farki, float(max(
+            abs(kutu[0] - aday_kutu[0]), abs(kutu[1] - aday_kutu[1]),
+            abs(kutu[0] + kutu[2] - aday_kutu[0] - aday_kutu[2]),
+            abs(kutu[1] + kutu[3] - aday_kutu[1] - aday_kutu[3]))))
+    fazla = [aday[i][0] for i in range(len(aday)) if i not in kullanilan]
+
+    aciklama = None
+    if eksik or fazla:
+        aciklama = f"eksik {eksik}, fazla {fazla}"
+    elif kutu_farki > FARK_TABELA_TOLERANSI:
+        aciklama = f"kutu farkı {kutu_farki:.1f} px"
+    return kutu_farki, len(eksik), len(fazla), aciklama
+
+
+class DetectorComparison:
+    """Bir dedektörün referans ve aday motorlarını aynı karelerde çalıştırıp karşılaştıran sınıf."""
+
+    def __init__(self, ad, referans, aday):
+        """
+        Args:
+            ad (str): 'serit', 'isik' veya 'tabela'
+            referans: Referans dedektör nesnesi
+            aday: Aday (çalışma ağacı) dedektör nesnesi
+        """
+        self.ad = ad
+        self.motorlar = (referans, aday)
+        self.sureler = ([], [])
+        self.kare_sayisi = 0
+        self.uyumsuz_kare = 0
+        self.ornekler = []
+
+        # Dedektöre özgü en büyük farklar ve sayaçlar
+        self.farklar = {}
+        self._katsayi_farki = None
+
+    def _calistir(self, motor, girdi):
+        """Dedektörün kare çağrısını yapar."""
+        if self.ad == 'serit':
+            return motor.seritleri_bul(girdi)
+        if self.ad == 'isik':
+            return motor.isik_durumunu_tespit_et(girdi)
+        return motor.tabelalari_tespit_et(girdi)
+
+    def _en_buyuk(self, anahtar, deger):
+        """Farkı rapordaki en büyük değerle birleştirir."""
+        self.farklar[anahtar] = max(self.farklar.get(anahtar, 0.0), deger)
+
+    def kare_isle(self, girdi, tampon, aday_girdisi=None):
+        """İki motoru aynı girdiyle çalıştırır ve çıktıları karşılaştırır.
+
+        Her motor girdinin kendi kopyasını alır (bir motorun girdiyi
+        değiştirmesi diğerini etkilemez); çalışma sırası her karede değişir.
+
+        Args:
+            girdi (numpy.ndarray): Dedektör girdisi (şerit için ROI)
+            tampon (numpy.ndarray): Girdi boyutunda kopyalama tamponu
+            aday_girdisi (YuvImage): Verilirse aday bu girdiyle çalışır
+                (aynı karenin YUV düzlemleri; kopyalanmaz)
+        """
+        ciktilar = [None, None]
+        sira = (0, 1) if self.kare_sayisi % 2 == 0 else (1, 0)
+        for i in sira:
+            if i == 1 and aday_girdisi is not None:
+                motor_girdisi = aday_girdisi
+            else:
+                np.copyto(tampon, girdi)
+                motor_girdisi = tampon
+            baslangic = time.perf_counter()
+            cikti = self._calistir(self.motorlar[i], motor_girdisi)
+            sure = time.perf_counter() - baslangic
+            if self.kare_sayisi >= _ISINMA_KARESI:
+                self.sureler[i].append(sure)
+            # Çıktılar havuz tamponuna bağlı olabilir; diğer motor çalışmadan kopyalanır
+            ciktilar[i] = self._kopyala(cikti)
+
+        aciklama = self._karsilastir(ciktilar[0], ciktilar[1], girdi.shape[0])
+        if aciklama is not None:
+            self.uyumsuz_kare += 1
+            if len(self.ornekler) < _ORNEK_SAYISI:
+                self.ornekler.append({'kare': self.kare_sayisi, 'fark': aciklama})
+        self.kare_sayisi += 1
+
+    def _kopyala(self, cikti):
+        """Dedektör çıktısının bağımsız kopyasını döndürür."""
+        if self.ad == 'serit':
+            sol, sag, sapma = cikti
+            return (None if sol is None else np.array(sol, np.float64),
+                    None if sag is None else np.array(sag, np.float64), float(sapma))
+        if self.ad == 'isik':
+            durum, koordinatlar = cikti
+            return durum, None if koordinatlar is None else tuple(koordinatlar)
+        return [(tip, alan, tuple(kutu)) for tip, alan, kutu in cikti]
+
+    def _karsilastir(self, referans, aday, yukseklik):
+        """Çıktıları karşılaştırır ve farkları biriktirir.
+
+        Returns:
+            str: Uyumsuzluk açıklaması (uyumluysa None)
+        """
+        if self.ad == 'serit':
+            egri_farki, katsayi_farki, sapma_farki, aciklama = _serit_farki(
+                referans, aday, yukseklik)
+            self._en_buyuk('max_egri_farki_px', egri_farki)
+            self._en_buyuk('max_sapma_farki_px', sapma_farki)
+            if katsayi_farki is not None:
+                self._katsayi_farki = katsayi_farki if self._katsayi_farki is None \
+                    else np.maximum(self._katsayi_farki, katsayi_farki)
+            return aciklama
+
+        if self.ad == 'isik':
+            konum_farki, aciklama = _isik_farki(referans, aday)
+            if referans[0] != aday[0]:
+                self.farklar['durum_farki'] = self.farklar.get('durum_farki', 0) + 1
+            else:
+                self._en_buyuk('max_konum_farki_px', konum_farki)
+            if referans[0] is not None:
+                self.farklar['isikli_kare'] = self.farklar.get('isikli_kare', 0) + 1
+            return aciklama
+
+        kutu_farki, eksik, fazla, aciklama = _tabela_farki(referans, aday)
+        self._en_buyuk('max_kutu_farki_px', kutu_farki)
+        self.farklar['referans_tespit'] = self.farklar.get('referans_tespit', 0) + len(referans)
+        self.farklar['eksik'] = self.farklar.get('eksik', 0) + eksik
+        self.farklar['fazla'] = self.farklar.get('fazla', 0) + fazla
+        return aciklama
+
+    def rapor(self):
+        """Dedektör raporunu döndürür.
+
+        Returns:
+            dict: Kare sayıları, en büyük farklar, süreler ve hızlanma
+        """
+        referans_ms, referans_p95 = _sure_ozeti(self.sureler[0])
+        aday_ms, aday_p95 = _sure_ozeti(self.sureler[1])
+        rapor = {
+            'kare_sayisi': self.kare_sayisi,
+            'uyumsuz_kare': self.uyumsuz_kare,
+            'referans_ms': referans_ms,
+            'referans_p95_ms': referans_p95,
+            'aday_ms': aday_ms,
+            'aday_p95_ms': aday_p95,
+            'hizlanma': round(sum(self.sureler[0]) / sum(self.sureler[1]), 3)
+            if self.sureler[1] and sum(self.sureler[1]) > 0 else None
+        }
+        for anahtar, deger in self.farklar.items():
+            rapor[anahtar] = None if deger == float('inf') else \
+                (round(deger, 4) if isinstance(deger, float) else deger)
+        if self._katsayi_farki is not None:
+            rapor['max_katsayi_farki'] = [float(f"{f:.4g}") for f in self._katsayi_farki]
+        rapor['ornekler'] = self.ornekler
+        return rapor
+
+
+def sentetik_kareler(kamera, sayi=FARK_KARE_SAYISI):
+    """Pisti bir tur tarayan belirlenimci simülasyon kareleri üretir.
+
+    Araç pist boyunca eşit aralıklarla, şerit ortasından küçük yanal
+    salınımla konumlanır; ışık durumu sanal saatle ilerletilir. Aynı sayı
+    için kareler her çalıştırmada aynıdır.
+
+    Args:
+        kamera (SimCameraController): Simülasyon kamerası (dünyasının saati değiştirilir)
+        sayi (int): Kare sayısı
+
+    Yields:
+        numpy.ndarray: BGR görüntü (havuz tamponu; bir sonraki karede üzerine yazılır)
+    """
+    dunya = kamera.dunya
+    # Sanal saat yalnızca render edilen ışık durumunu belirler
+    sanal_zaman = [0.0]
+    dunya.saat = lambda: sanal_zaman[0]
+    dunya.baslangic_zamani = 0.0
+    hedef = kamera.tamponlar.al('kamera_bgr', kamera.tamponlar.kare_boyutu)
+    for i in range(sayi):
+        s = i * dunya.pist.cevre / sayi
+        n = dunya.serit_n + _SENTETIK_SALINIM * np.sin(2 * np.pi * i / _SENTETIK_SALINIM_PERIYODU)
+        with dunya._kilit:
+            dunya.x, dunya.y, dunya.teta = dunya.pist.nokta(s, n)
+        sanal_zaman[0] = i * _SENTETIK_ZAMAN_ADIMI
+        kamera.renderer.render(hedef)
+        yield hedef
+
+
+def fark_testi(revizyon=FARK_REFERANS_REVIZYONU, kayit=None, sayi=FARK_KARE_SAYISI,
+               dedektorler=tuple(_DEDEKTORLER), on_isleme='tam', renk_uzayi='bgr',
+               serit_motoru=None):
+    """Referans ve aday dedektörleri aynı karelerde çalıştırıp raporu döndürür.
+
+    Args:
+        revizyon (str): Referans git revizyonu veya dondurulmuş kopyanın kök dizini
+        kayit (str): Kayıt arşivi/dizini (None ise sentetik kareler)
+        sayi (int): Sentetik kare sayısı veya kayıttan yüklenecek en fazla kare
+        dedektorler (tuple): Karşılaştırılacak dedektörler
+        on_isleme (str): Karelere uygulanan ön işleme ('tam', 'hafif', 'yok')
+        renk_uzayi (str): 'bgr' (aday çalışma ağacındaki BGR dedektörleri) veya
+            'yuv' (aday YUV dedektörleri; kareler algılama çözünürlüğüne indirilir)
+        serit_motoru (str): Aday şerit dedektörünün motoru (None ise config varsayılanı)
+
+    Returns:
+        dict: Dedektör başına raporlar ve genel sonuç
+    """
+    if kayit:
+        kamera = RecordedCamera(kayit, max_kare=sayi)
+        kareler = kamera.kareler
+        kaynak = kayit
+    else:
+        kamera = SimCameraController(SimWorld())
+        kareler = sentetik_kareler(kamera, sayi)
+        kaynak = "sentetik"
+
+    cozunurluk = (kamera.tamponlar.genislik, kamera.tamponlar.yukseklik)
+    if renk_uzayi == 'yuv' and kamera.dusuk_cozunurluk is not None:
+        cozunurluk = kamera.dusuk_cozunurluk
+    karsilastirmalar = []
+    for ad in dedektorler:
+        yol, sinif_adi, aday_sinifi, yuv_sinifi = _DEDEKTORLER[ad]
+        if renk_uzayi == 'yuv':
+            aday_sinifi = yuv_sinifi
+        referans_sinifi = getattr(referans_modulu_yukle(yol, revizyon), sinif_adi)
+        # Her motorun kendi tampon havuzu olur; çıktılar birbirinin tamponunu ezmez
+        motorlar = [_olustur(sinif, buffer_havuzu=BufferPool(cozunurluk),
+                             kamera_cozunurluk=cozunurluk, **secenekler)
+                    for sinif, secenekler in ((referans_sinifi, _REFERANS_SECENEKLERI.get(ad, {})),
+                                              (aday_sinifi, {}))]
+        if ad == 'serit' and serit_motoru is not None:
+            motorlar[1].motor_sec(serit_motoru)
+        karsilastirmalar.append(DetectorComparison(ad, *motorlar))
+    logger.info(f"Fark testi: referans {revizyon}, kaynak {kaynak}, renk uzayı {renk_uzayi}, "
+                f"dedektörler {', '.join(dedektorler)}"
+                + (f", şerit motoru {serit_motoru}" if serit_motoru else ""))
+
+    tamponlar = {}
+    for kare in kareler:
+        if renk_uzayi == 'yuv':
+            # Referans, aday ile aynı I420 karenin BGR dönüşümünü görür
+            kamera_karesi = Frame(kare, 0.0, 0.0, yuv=kamera._isp_benzet(kare))
+            girdiler = [kamera.preprocess_frame(
+                kamera.algilama_karesi(kamera_karesi, renk_uzayi=uzay)[0], on_isleme)
+                for uzay in ('bgr', 'yuv')]
+        else:
+            girdiler = [kamera.preprocess_frame(kare, on_isleme), None]
+        roiler = [None if girdi is None else kamera.apply_roi(girdi)[0] for girdi in girdiler]
+        for karsilastirma in karsilastirmalar:
+            girdi, aday_girdisi = roiler if karsilastirma.ad == 'serit' else girdiler
+            tampon = tamponlar.get(girdi.shape)
+            if tampon is None:
+                tampon = tamponlar[girdi.shape] = np.empty_like(girdi)
+            karsilastirma.kare_isle(girdi, tampon, aday_girdisi)
+
+    raporlar = {k.ad: k.rapor() for k in karsilastirmalar}
+    return {
+        'referans': revizyon,
+        'kaynak': kaynak,
+        'on_isleme': on_isleme,
+        'renk_uzayi': renk_uzayi,
+        'serit_motoru': serit_motoru,
+        'cozunurluk': list(cozunurluk),
+        'basarili': all(r['uyumsuz_kare'] == 0 for r in raporlar.values()),
+        'dedektorler': raporlar
+    }
+
+
+def main():
+    """Komut satırı giriş noktası; uyumsuz kare varsa 1 ile çıkar."""
+    parser = argparse.ArgumentParser(description="Referans ve aday dedektör fark testi")
+    parser.add_argument("--referans", default=FARK_REFERANS_REVIZYONU,
+                        help="Referans git revizyonu veya dondurulmuş kopyanın kök dizini")
+    parser.add_argument("--kayit", help="Kara kutu arşivi, arşiv dizini veya görüntü dizini "
+                                        "(verilmezse sentetik kareler)")
+    parser.add_argument("--kare", type=int, default=None,
+                        help=f"Kare sayısı (sentetik varsayılan {FARK_KARE_SAYISI}, "
+                             f"kayıt varsayılan {SOAK_MAX_KAYIT_KARESI})")
+    parser.add_argument("--dedektorler", nargs="+", choices=tuple(_DEDEKTORLER),
+                        default=list(_DEDEKTORLER), help="Karşılaştırılacak dedektörler")
+    parser.add_argument("--on-isleme", choices=("tam", "hafif", "yok"), default="tam",
+                        help="Karelere uygulanan ön işleme")
+    parser.add_argument("--renk-uzayi", choices=("bgr", "yuv"), default="bgr",
+                        help="Aday dedektörler: çalışma ağacındaki BGR sınıfları veya "
+                             "YUV düzlemlerinde çalışan sınıflar")
+    parser.add_argument("--serit-motoru", choices=tuple(SERIT_MOTORLARI),
+                        help="Aday şerit dedektörünün motoru (verilmezse config varsayılanı)")
+    parser.add_argument("--json", help="Raporun yazılacağı JSON dosyası")
+    parser.add_argument("--log-seviyesi", default="WARNING", help="Konsol/dosya log seviyesi")
+    args = parser.parse_args()
+
+    log_ayarla("logs/fark_testi.log", seviye=args.log_seviyesi)
+    basarili = False
+    try:
+        sayi = args.kare or (SOAK_MAX_KAYIT_KARESI if args.kayit else FARK_KARE_SAYISI)
+        rapor = fark_testi(args.referans, args.kayit, sayi, tuple(args.dedektorler),
+                           args.on_isleme, args.renk_uzayi, args.serit_motoru)
+        basarili = rapor['basarili']
+
+        metin = json.dumps(rapor, ensure_ascii=False, indent=2)
+        print(metin)
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                f.write(metin + "\n")
+        if not basarili:
+            logger.error("Fark testi başarısız: " + ", ".join(
+                f"{ad} {r['uyumsuz_kare']}/{r['kare_sayisi']} kare"
+                for ad, r in rapor['dedektorler'].items() if r['uyumsuz_kare']))
+    except Exception as e:
+        logger.error(f"Fark testi hatası: {str(e)}")
+    finally:
+        log_kapat()
+    sys.exit(0 if basarili else 1)
+
+
+if __name__ == "__main__":
+    main()
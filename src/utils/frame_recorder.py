@@ -0,0 +1,261 @@
+"""
+Kara Kutu Kare Kaydedici
+------------------------
+Sürüş sırasında kareleri ve telemetriyi kontrol döngüsünü bekletmeden
+kaydeder. Döngü yalnızca kareyi kopyalayıp sınırlı bir kuyruğa ekler;
+kuyruk doluysa en eski kare düşürülür. Kodlayıcı iş parçacığı kareleri
+JPEG'e çevirir ve son `KAYIT_PENCERE_SURESI` saniyeyi bellekte tutar. Bir
+olay bildirildiğinde (şeritten çıkma, hata, acil durma) pencere, olay
+sonrası birkaç saniye de eklenerek parçalı zip arşivine yazılır. Disk
+yazımı ayrı bir iş parçacığında yapılır; SD kart yavaşlasa bile kodlama
+ve döngü etkilenmez.
+
+Arşiv: <dizin>/<ad>_000.zip, _001.zip ... Her parça `kare_<no>.jpg`
+dosyalarını ve her kare için bir satır içeren `telemetri.jsonl` dosyasını
+içerir.
+"""
+import os
+import json
+import time
+import queue
+import zipfile
+import threading
+from collections import deque
+from datetime import datetime
+import numpy as np
+from loguru import logger
+from src.utils.lazy_import import LazyModule
+from config.config import (
+    KAYIT_DIZINI,
+    KAYIT_FPS,
+    KAYIT_PENCERE_SURESI,
+    KAYIT_OLAY_SONRASI_SURESI,
+    KAYIT_KUYRUK_BOYUTU,
+    KAYIT_PARCA_KARE_SAYISI,
+    KAYIT_JPEG_KALITESI,
+    KAYIT_SUREKLI,
+    KAYIT_MAX_BOYUT_MB
+)
+
+# OpenCV ilk kullanımda yüklenir
+cv2 = LazyModule("cv2")
+
+# Bekleyen disk işi sınırı (sürekli kayıtta disk yetişemezse parçalar atlanır)
+_MAX_DISK_ISI = 8
+
+
+def _json_uyumlu(deger):
+    """numpy değerlerini JSON'a yazılabilir hale getirir."""
+    if isinstance(deger, np.ndarray):
+        return deger.tolist()
+    if isinstance(deger, np.generic):
+        return deger.item()
+    if isinstance(deger, (list, tuple)):
+        return [_json_uyumlu(d) for d in deger]
+    if isinstance(deger, dict):
+        return {k: _json_uyumlu(d) for k, d in deger.items()}
+    return deger
+
+
+class FrameRecorder:
+    """Sınırlı kuyruklu, arka planda kodlayan ve yazan kare kaydedici."""
+
+    def __init__(self, dizin=KAYIT_DIZINI, fps=KAYIT_FPS, pencere_suresi=KAYIT_PENCERE_SURESI,
+                 olay_sonrasi=KAYIT_OLAY_SONRASI_SURESI, kuyruk_boyutu=KAYIT_KUYRUK_BOYUTU,
+                 surekli=KAYIT_SUREKLI):
+        """
+        Args:
+            dizin (str): Arşivlerin yazılacağı dizin
+            fps (float): Kaydedilen en yüksek kare hızı
+            pencere_suresi (float): Olay öncesi bellekte tutulan süre (saniye)
+            olay_sonrasi (float): Olaydan sonra pencereye eklenen süre (saniye)
+            kuyruk_boyutu (int): Kodlanmayı bekleyen en fazla kare
+            surekli (bool): Tüm kareler de parça parça arşivlensin mi
+        """
+        self.dizin = dizin
+        self.aralik = 1.0 / fps
+        self.pencere_suresi = pencere_suresi
+        self.olay_sonrasi = olay_sonrasi
+        self.surekli = surekli
+
+        # Döngü -> kodlayıcı: dolunca en eski kare düşer (deque maxlen)
+        self._kuyruk = deque(maxlen=kuyruk_boyutu)
+        self._yeni_kare = threading.Event()
+        self._son_kayit = 0.0
+        self._kare_no = 0
+
+        # Kodlayıcı durumu
+        self._pencere = deque()  # (zaman, kare_no, jpeg, telemetri)
+        self._surekli_parca = []
+        self._surekli_parca_no = 0
+        self._surekli_ad = f"surus_{datetime.now():%Y%m%d-%H%M%S}"
+        self._olaylar = deque()  # (bitis_zamani, ad)
+        self._olay_kilidi = threading.Lock()
+
+        # İstatistikler
+        self.dusurulen_kare = 0
+        self.kodlanan_kare = 0
+        self.atlanan_disk_isi = 0
+
+        self._calisiyor = True
+        self._disk_kuyrugu = queue.Queue()
+        self._kodlayici = threading.Thread(target=self._kodlayici_dongusu,
+                                           name="kayit-kodlayici", daemon=True)
+        self._disk = threading.Thread(target=self._disk_dongusu, name="kayit-disk", daemon=True)
+        self._kodlayici.start()
+        self._disk.start()
+
+        logger.info(f"Kare kaydedici başlatıldı - {fps} FPS, {pencere_suresi} sn pencere, "
+                    f"dizin: {dizin}")
+
+    def kaydet(self, frame, telemetri=None):
+        """Kareyi kayda ekler (hız sınırlı, bloklamaz).
+
+        Args:
+            frame (numpy.ndarray): BGR kare (havuz tamponu olabilir; kopyalanır)
+            telemetri (dict): Kareyle birlikte saklanacak bilgiler
+
+        Returns:
+            bool: Kare kuyruğa eklendi mi
+        """
+        simdi = time.monotonic()
+        if frame is None or simdi - self._son_kayit < self.aralik:
+            return False
+        self._son_kayit = simdi
+
+        if len(self._kuyruk) == self._kuyruk.maxlen:
+            self.dusurulen_kare += 1
+        self._kare_no += 1
+        self._kuyruk.append((simdi, time.time(), self._kare_no, frame.copy(), telemetri))
+        self._yeni_kare.set()
+        return True
+
+    def olay_bildir(self, neden):
+        """Son penceredeki karelerin (ve olay sonrası sürenin) arşivlenmesini ister.
+
+        Args:
+            neden (str): Arşiv adına eklenecek kısa açıklama
+        """
+        ad = f"olay_{datetime.now():%Y%m%d-%H%M%S}_{neden}"
+        with self._olay_kilidi:
+            self._olaylar.append((time.monotonic() + self.olay_sonrasi, ad))
+        self._yeni_kare.set()
+        logger.warning(f"Kayıt olayı: {neden}")
+
+    def _kodlayici_dongusu(self):
+        """Kareleri JPEG'e kodlar, pencereyi günceller ve olayları arşive verir."""
+        try:
+            # Kodlama kontrol döngüsüyle yarışmasın (Linux'ta iş parçacığı önceliği)
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 10)
+        except (AttributeError, OSError):
+            pass
+
+        kodlama = [int(cv2.IMWRITE_JPEG_QUALITY), KAYIT_JPEG_KALITESI]
+        while self._calisiyor or self._kuyruk:
+            self._yeni_kare.wait(0.5)
+            self._yeni_kare.clear()
+
+            while self._kuyruk:
+                try:
+                    zaman, duvar_zamani, kare_no, kare, telemetri = self._kuyruk.popleft()
+                except IndexError:
+                    break
+                basarili, jpeg = cv2.imencode(".jpg", kare, kodlama)
+                if not basarili:
+                    continue
+                self.kodlanan_kare += 1
+
+                kayit = (zaman, kare_no, jpeg.tobytes(),
+                         dict(_json_uyumlu(telemetri or {}), zaman=duvar_zamani, kare=kare_no))
+                self._pencere.append(kayit)
+                if self.surekli:
+                    self._surekli_parca.append(kayit)
+                    if len(self._surekli_parca) >= KAYIT_PARCA_KARE_SAYISI:
+                        self._disk_isi_ekle(
+                            f"{self._surekli_ad}_{self._surekli_parca_no:03d}",
+                            self._surekli_parca)
+                        self._surekli_parca = []
+                        self._surekli_parca_no += 1
+
+            # Olay sonrası süre de eklenene kadar pencere kısaltılmaz
+            simdi = time.monotonic()
+            sinir = simdi - self.pencere_suresi - self.olay_sonrasi
+            while self._pencere and self._pencere[0][0] < sinir:
+                self._pencere.popleft()
+
+            with self._olay_kilidi:
+                while self._olaylar and (self._olaylar[0][0] <= simdi or not self._calisiyor):
+                    _, ad = self._olaylar.popleft()
+                    self._arsivle(ad, list(self._pencere))
+
+        if self.surekli and self._surekli_parca:
+            self._disk_isi_ekle(f"{self._surekli_ad}_{self._surekli_parca_no:03d}",
+                                self._surekli_parca)
+        self._disk_kuyrugu.put(None)
+
+    def _arsivle(self, ad, kayitlar):
+        """Olay penceresini parçalara bölerek disk kuyruğuna verir."""
+        for i in range(0, len(kayitlar), KAYIT_PARCA_KARE_SAYISI):
+            self._disk_isi_ekle(f"{ad}_{i // KAYIT_PARCA_KARE_SAYISI:03d}",
+                                kayitlar[i:i + KAYIT_PARCA_KARE_SAYISI])
+
+    def _disk_isi_ekle(self, ad, kayitlar):
+        """Bir arşiv parçasını disk iş parçacığına verir."""
+        if self._disk_kuyrugu.qsize() >= _MAX_DISK_ISI and ad.startswith(self._surekli_ad):
+            # Olay arşivleri hiçbir zaman atlanmaz; disk yetişemezse sürekli kayıt parçaları atlanır
+            self.atlanan_disk_isi += 1
+            return
+        self._disk_kuyrugu.put((ad, kayitlar))
+
+    def _disk_dongusu(self):
+        """Arşiv parçalarını zip olarak yazar ve toplam boyutu sınırlar."""
+        while True:
+            is_ = self._disk_kuyrugu.get()
+            if is_ is None:
+                break
+            ad, kayitlar = is_
+            try:
+                os.makedirs(self.dizin, exist_ok=True)
+                yol = os.path.join(self.dizin, ad + ".zip")
+                gecici = yol + ".tmp"
+
+                # JPEG zaten sıkıştırılmıştır; yalnızca telemetri sıkıştırılır
+                with zipfile.ZipFile(gecici, "w", zipfile.ZIP_STORED) as arsiv:
+                    for _, kare_no, jpeg, _ in kayitlar:
+                        arsiv.writestr(f"kare_{kare_no:06d}.jpg", jpeg)
+                    arsiv.writestr(
+                        "telemetri.jsonl",
+                        "".join(json.dumps(t, ensure_ascii=False) + "\n"
+                                for _, _, _, t in kayitlar),
+                        compress_type=zipfile.ZIP_DEFLATED)
+                os.replace(gecici, yol)
+                logger.debug(f"Kayıt arşivi yazıldı: {yol} ({len(kayitlar)} kare)")
+
+                self._boyut_sinirla()
+            except Exception as e:
+                logger.error(f"Kayıt arşivi yazılamadı ({ad}): {str(e)}")
+
+    def _boyut_sinirla(self):
+        """Dizin `KAYIT_MAX_BOYUT_MB` sınırını aşarsa en eski arşivleri siler."""
+        arsivler = sorted(
+            (os.path.join(self.dizin, ad) for ad in os.listdir(self.dizin) if ad.endswith(".zip")),
+            key=os.path.getmtime)
+        toplam = sum(os.path.getsize(yol) for yol in arsivler)
+        while arsivler and toplam > KAYIT_MAX_BOYUT_MB * 1024 * 1024:
+            yol = arsivler.pop(0)
+            toplam -= os.path.getsize(yol)
+            os.remove(yol)
+            logger.debug(f"Eski kayıt arşivi silindi: {yol}")
+
+    def kapat(self, zaman_asimi=5.0):
+        """Bekleyen kareleri ve olayları yazar, iş parçacıklarını durdurur.
+
+        Args:
+            zaman_asimi (float): Her iş parçacığı için en fazla bekleme (saniye)
+        """
+        self._calisiyor = False
+        self._yeni_kare.set()
+        self._kodlayici.join(timeout=zaman_asimi)
+        self._disk.join(timeout=zaman_asimi)
+        logger.info(f"Kare kaydedici kapatıldı - kodlanan: {self.kodlanan_kare}, "
+                    f"düşürülen: {self.dusurulen_kare}, atlanan parça: {self.atlanan_disk_isi}")
@@ -0,0 +1,42 @@
+"""
+Gecikmeli Modül Yükleme
+-----------------------
+Ağır bağımlılıkların (cv2 gibi) modül içe aktarılırken değil, ilk
+kullanıldığında yüklenmesini sağlar.
+"""
+import importlib
+import threading
+
+
+class LazyModule:
+    """İlk öznitelik erişiminde gerçek modülü yükleyen vekil nesne.
+
+    Yükleme sonrasında modülün isim alanı vekile kopyalanır; böylece sonraki
+    erişimler doğrudan örnek sözlüğünden yapılır ve ek maliyet oluşmaz.
+    """
+
+    def __init__(self, modul_adi):
+        """
+        Args:
+            modul_adi (str): Yüklenecek modülün tam adı
+        """
+        self.__dict__['_modul_adi'] = modul_adi
+        self.__dict__['_kilit'] = threading.Lock()
+
+    def _yukle(self):
+        """Modülü yükler ve isim alanını vekile aktarır."""
+        with self._kilit:
+            modul = importlib.import_module(self._modul_adi)
+            self.__dict__.update(modul.__dict__)
+            self.__dict__['_modul'] = modul
+        return modul
+
+    def __getattr__(self, oznitelik):
+        """Yüklenmemiş bir öznitelik istendiğinde modülü yükler."""
+        if oznitelik.startswith('__') or '_modul' in self.__dict__:
+            raise AttributeError(oznitelik)
+        return getattr(self._yukle(), oznitelik)
+
+    def __repr__(self):
+        durum = "yüklü" if '_modul' in self.__dict__ else "yüklenmedi"
+        return f"<LazyModule {self._modul_adi} ({durum})>"
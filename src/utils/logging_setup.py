@@ -0,0 +1,227 @@
+"""
+Log Yapılandırma Modülü
+-----------------------
+Kontrol döngüsünü log yazımından ayırmak için kuyruklu, toplu yazan dosya
+hedefi ve mesaj anahtarı bazlı hız sınırlayıcı sağlar.
+"""
+import os
+import sys
+import time
+import queue
+import threading
+from datetime import date
+from loguru import logger
+from config.config import (
+    LOG_DOSYA,
+    LOG_SEVIYESI,
+    LOG_KUYRUK_BOYUTU,
+    LOG_TOPLU_YAZMA_BOYUTU,
+    LOG_YAZMA_ARALIGI,
+    LOG_TEKRAR_ARALIGI,
+    LOG_ANAHTAR_MIN_ARALIK
+)
+
+LOG_FORMATI = "{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}"
+
+# Hız sınırlamasının uygulanmayacağı en düşük seviye (WARNING ve üstü her zaman yazılır)
+_SINIRSIZ_SEVIYE_NO = 30
+
+
+class RateLimitFilter:
+    """Mesaj anahtarı bazlı hız sınırlama ve tekrar bastırma filtresi.
+
+    Anahtar, kayıt `logger.bind(anahtar=...)` ile verilmişse o değer, verilmemişse
+    mesajın üretildiği modül/fonksiyon/satır üçlüsüdür. Aynı metinli mesajlar
+    `tekrar_araligi` saniyeden sık yazılmaz. `min_aralik` yalnızca açıkça
+    bağlanmış anahtarlara (motor komutları, her karede gelen ışık mesajları)
+    uygulanır; aynı satırdan gelen farklı metinli mesajlar bastırılmaz.
+    Bastırılan mesaj sayısı bir sonraki kayda eklenir.
+    """
+
+    def __init__(self, tekrar_araligi=LOG_TEKRAR_ARALIGI, min_aralik=LOG_ANAHTAR_MIN_ARALIK):
+        """
+        Args:
+            tekrar_araligi (float): Aynı mesaj metninin tekrar yazılması için gereken süre (sn)
+            min_aralik (float): Aynı anahtarlı iki mesaj arasındaki minimum süre (sn)
+        """
+        self.tekrar_araligi = tekrar_araligi
+        self.min_aralik = min_aralik
+        self._durumlar = {}  # anahtar -> [son_zaman, son_mesaj, bastirilan]
+        self._kilit = threading.Lock()
+
+    def __call__(self, record):
+        """Kaydın yazılıp yazılmayacağına karar verir."""
+        if record["level"].no >= _SINIRSIZ_SEVIYE_NO:
+            return True
+
+        # Aynı kayıt birden fazla hedefe gider; karar yalnızca bir kez verilir
+        karar = record["extra"].get("_hiz_siniri")
+        if karar is not None:
+            return karar
+        record["extra"]["_hiz_siniri"] = karar = self._karar_ver(record)
+        return karar
+
+    def _karar_ver(self, record):
+        """Kaydın anahtarına göre hız sınırı kararını verir."""
+        anahtar = record["extra"].get("anahtar")
+        min_aralik = self.min_aralik
+        if anahtar is None:
+            anahtar = (record["name"], record["function"], record["line"])
+            min_aralik = 0.0
+
+        simdi = time.monotonic()
+        mesaj = record["message"]
+
+        with self._kilit:
+            durum = self._durumlar.get(anahtar)
+            if durum is None:
+                self._durumlar[anahtar] = [simdi, mesaj, 0]
+                return True
+
+            gecen = simdi - durum[0]
+            if gecen < min_aralik or (mesaj == durum[1] and gecen < self.tekrar_araligi):
+                durum[2] += 1
+                return False
+
+            bastirilan = durum[2]
+            durum[0], durum[1], durum[2] = simdi, mesaj, 0
+
+        if bastirilan:
+            record["message"] = f"{mesaj} (+{bastirilan} benzer mesaj bastırıldı)"
+        return True
+
+
+class QueuedFileSink:
+    """Arka plan iş parçacığında toplu yazan kuyruklu dosya hedefi.
+
+    `write` yalnızca sınırlı bir kuyruğa ekleme yapar; dosya erişimi, gün
+    değişiminde dosya döndürme ve flush işlemleri ayrı bir iş parçacığında
+    `toplu_boyut` mesajlık gruplar halinde veya `yazma_araligi` saniyede bir
+    yapılır. Kuyruk dolduğunda yeni mesajlar beklemeden düşürülür.
+    """
+
+    def __init__(self, dosya_yolu, kuyruk_boyutu=LOG_KUYRUK_BOYUTU,
+                 toplu_boyut=LOG_TOPLU_YAZMA_BOYUTU, yazma_araligi=LOG_YAZMA_ARALIGI):
+        """
+        Args:
+            dosya_yolu (str): Log dosyasının yolu
+            kuyruk_boyutu (int): Bekleyen maksimum mesaj sayısı
+            toplu_boyut (int): Tek seferde yazılacak maksimum mesaj sayısı
+            yazma_araligi (float): Kuyruk boş değilse en geç kaç saniyede bir yazılacağı
+        """
+        self.dosya_yolu = dosya_yolu
+        self.toplu_boyut = toplu_boyut
+        self.yazma_araligi = yazma_araligi
+        self.dusurulen = 0
+        self._dusurulen_kilit = threading.Lock()  # write() birden çok iş parçacığından çağrılır
+
+        self._kuyruk = queue.Queue(maxsize=kuyruk_boyutu)
+        self._durdur = threading.Event()
+
+        dizin = os.path.dirname(dosya_yolu)
+        if dizin:
+            os.makedirs(dizin, exist_ok=True)
+        self._dosya = open(dosya_yolu, "a", encoding="utf-8")
+        self._dosya_gunu = date.today()
+
+        self._thread = threading.Thread(target=self._yazici_dongusu,
+                                        name="log-yazici", daemon=True)
+        self._thread.start()
+
+    def write(self, mesaj):
+        """Mesajı bloklamadan kuyruğa ekler (loguru tarafından çağrılır)."""
+        try:
+            self._kuyruk.put_nowait(mesaj)
+        except queue.Full:
+            with self._dusurulen_kilit:
+                self.dusurulen += 1
+
+    def _gun_kontrolu(self):
+        """Gün değiştiyse mevcut dosyayı tarihli isimle döndürür."""
+        bugun = date.today()
+        if bugun == self._dosya_gunu:
+            return
+
+        self._dosya.close()
+        kok, uzanti = os.path.splitext(self.dosya_yolu)
+        arsiv = f"{kok}.{self._dosya_gunu.isoformat()}{uzanti}"
+        try:
+            os.replace(self.dosya_yolu, arsiv)
+        except OSError:
+            pass
+        self._dosya = open(self.dosya_yolu, "a", encoding="utf-8")
+        self._dosya_gunu = bugun
+
+    def _yazici_dongusu(self):
+        """Kuyruktaki mesajları gruplar halinde dosyaya yazar."""
+        while not (self._durdur.is_set() and self._kuyruk.empty()):
+            try:
+                grup = [self._kuyruk.get(timeout=self.yazma_araligi)]
+            except queue.Empty:
+                continue
+
+            # Kısa bir süre daha biriktir, böylece her mesaj ayrı bir yazma olmaz
+            son_tarih = time.monotonic() + self.yazma_araligi
+            while len(grup) < self.toplu_boyut:
+                kalan = son_tarih - time.monotonic()
+                if kalan <= 0 or self._durdur.is_set():
+                    break
+                try:
+                    grup.append(self._kuyruk.get(timeout=kalan))
+                except queue.Empty:
+                    break
+
+            # Kuyrukta hazır bekleyenleri de bloklamadan ekle
+            while len(grup) < self.toplu_boyut:
+                try:
+                    grup.append(self._kuyruk.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._gun_kontrolu()
+                with self._dusurulen_kilit:
+                    dusurulen, self.dusurulen = self.dusurulen, 0
+                if dusurulen:
+                    grup.append(f"{dusurulen} log mesajı kuyruk dolu olduğu için düşürüldü\n")
+                self._dosya.write("".join(grup))
+                self._dosya.flush()
+            except Exception as e:
+                print(f"Log yazma hatası: {str(e)}", file=sys.stderr)
+
+    def stop(self):
+        """Bekleyen mesajları yazar ve dosyayı kapatır (loguru tarafından çağrılır)."""
+        self._durdur.set()
+        self._thread.join(timeout=2.0)
+        try:
+            self._dosya.close()
+        except Exception:
+            pass
+
+
+def log_ayarla(dosya_yolu=LOG_DOSYA, seviye=LOG_SEVIYESI, konsol=True):
+    """Loguru'yu kuyruklu dosya hedefi ve hız sınırlayıcı ile yapılandırır.
+
+    Args:
+        dosya_yolu (str): Log dosyasının yolu
+        seviye (str): Minimum log seviyesi
+        konsol (bool): stderr'e de yazılsın mı
+
+    Returns:
+        QueuedFileSink: Oluşturulan dosya hedefi
+    """
+    logger.remove()
+    filtre = RateLimitFilter()
+
+    if konsol:
+        logger.add(sys.stderr, level=seviye, filter=filtre, format=LOG_FORMATI,
+                   enqueue=True)
+
+    hedef = QueuedFileSink(dosya_yolu)
+    logger.add(hedef, level=seviye, filter=filtre, format=LOG_FORMATI)
+    return hedef
+
+
+def log_kapat():
+    """Tüm log hedeflerini kapatır ve bekleyen mesajların yazılmasını sağlar."""
+    logger.remove()
@@ -0,0 +1,367 @@
+"""
+Çalışma Anında Profil Alma Modülü
+---------------------------------
+Pistte ortaya çıkan yavaşlamaları yakalamak için çalışan programa sinyal
+gönderilerek açılıp kapatılan profil araçları sağlar:
+
+    kill -USR1 <pid>  -> cProfile (deterministik) başlat / durdur
+    kill -USR2 <pid>  -> örnekleyici profil başlat / durdur
+
+Profil kapalıyken ek maliyet yoktur: cProfile etkin değildir ve örnekleyici
+iş parçacığı çalışmaz. Her başlatma ve durdurmada `StageTimer` aşama
+süreleri de `PROFIL_DIZINI` altına yazılır; başlangıçtaki anlık görüntü
+yavaşlama anındaki döngüyü, bitişteki profil süresince olanı gösterir.
+"""
+import io
+import os
+import sys
+import json
+import time
+import signal
+import pstats
+import cProfile
+import threading
+from collections import Counter, deque, defaultdict
+from datetime import datetime
+import numpy as np
+from loguru import logger
+from config.config import (
+    PROFIL_DIZINI,
+    PROFIL_ORNEKLEME_ARALIGI,
+    PROFIL_RAPOR_SATIRI,
+    ASAMA_ORNEK_SAYISI
+)
+
+
+class StageTimer:
+    """Kontrol döngüsünün aşama sürelerini ölçer.
+
+    Döngü başında `baslat`, her aşamanın sonunda `isaretle(ad)` çağrılır; aşama
+    süresi bir önceki işaretten bu yana geçen süredir. Aşama başına son
+    `ornek_sayisi` ölçüm tutulur.
+    """
+
+    def __init__(self, ornek_sayisi=ASAMA_ORNEK_SAYISI):
+        """
+        Args:
+            ornek_sayisi (int): Aşama başına tutulan son ölçüm sayısı
+        """
+        self.ornek_sayisi = ornek_sayisi
+        self._olcumler = defaultdict(lambda: deque(maxlen=self.ornek_sayisi))
+        self._son = time.perf_counter()
+
+    def baslat(self):
+        """Yeni döngü turunun başlangıcını işaretler."""
+        self._son = time.perf_counter()
+
+    def isaretle(self, ad):
+        """Son işaretten bu yana geçen süreyi aşamaya kaydeder.
+
+        Args:
+            ad (str): Aşama adı
+        """
+        simdi = time.perf_counter()
+        self._olcumler[ad].append(simdi - self._son)
+        self._son = simdi
+
+    def sifirla(self):
+        """Tüm ölçümleri siler."""
+        self._olcumler.clear()
+
+    def ozet(self):
+        """Aşama başına süre istatistiklerini döndürür.
+
+        Returns:
+            dict: {aşama: {'sayi', 'ortalama_ms', 'p50_ms', 'p95_ms', 'max_ms'}}
+        """
+        sonuc = {}
+        for ad, olcumler in list(self._olcumler.items()):
+            if not olcumler:
+                continue
+            sureler = np.array(olcumler) * 1000
+            sonuc[ad] = {
+                'sayi': len(sureler),
+                'ortalama_ms': round(float(sureler.mean()), 3),
+                'p50_ms': round(float(np.percentile(sureler, 50)), 3),
+                'p95_ms': round(float(np.percentile(sureler, 95)), 3),
+                'max_ms': round(float(sureler.max()), 3)
+            }
+        return sonuc
+
+
+class LatencyTracker:
+    """Kamera camından tekerleğe (sensör zamanından motor çıkışına) gecikmeyi ölçer.
+
+    Her motor komutu türetildiği kareyle damgalanır; motor kontrolcüsü çıkışı
+    yazdığında `etki_kaydet` çağrılır. Ölçülen aralıklar:
+
+        yakalama  sensör zamanı -> karenin programa ulaşması
+        ilk_etki  sensör zamanı -> komutun ilk motor çıkışı
+        hedef     sensör zamanı -> hedef hıza ulaşılması (yumuşak rampa sonu)
+    """
+
+    def __init__(self, ornek_sayisi=ASAMA_ORNEK_SAYISI):
+        """
+        Args:
+            ornek_sayisi (int): Aralık başına tutulan son ölçüm sayısı
+        """
+        self.ornek_sayisi = ornek_sayisi
+        self._olcumler = defaultdict(lambda: deque(maxlen=self.ornek_sayisi))
+
+    def kare_alindi(self, kare):
+        """Karenin sensörden programa ulaşma süresini kaydeder.
+
+        Args:
+            kare (Frame): Yakalanan kare
+        """
+        self._olcumler['yakalama'].append(kare.teslim_zamani - kare.sensor_zamani)
+
+    def etki_kaydet(self, kare, olay, zaman):
+        """Karenin motor çıkışına etkisini kaydeder (motor dinleyicisi).
+
+        Args:
+            kare (Frame): Komutun türetildiği kare
+            olay (str): 'ilk_etki' veya 'hedef'
+            zaman (float): Çıkışın yazıldığı an (time.monotonic)
+        """
+        self._olcumler[olay].append(zaman - kare.sensor_zamani)
+
+    def sifirla(self):
+        """Tüm ölçümleri siler."""
+        self._olcumler.clear()
+
+    def ozet(self):
+        """Aralık başına gecikme dağılımını döndürür.
+
+        Returns:
+            dict: {aralık: {'sayi', 'ortalama_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms'}}
+        """
+        sonuc = {}
+        for ad, olcumler in list(self._olcumler.items()):
+            if not olcumler:
+                continue
+            sureler = np.array(olcumler) * 1000
+            sonuc[ad] = {
+                'sayi': len(sureler),
+                'ortalama_ms': round(float(sureler.mean()), 3),
+                'p50_ms': round(float(np.percentile(sureler, 50)), 3),
+                'p95_ms': round(float(np.percentile(sureler, 95)), 3),
+                'p99_ms': round(float(np.percentile(sureler, 99)), 3),
+                'max_ms': round(float(sureler.max()), 3)
+            }
+        return sonuc
+
+
+class SamplingProfiler:
+    """Hedef iş parçacığının yığınını düzenli aralıklarla okuyan profil aracı.
+
+    Kodun kendisine dokunmaz; maliyeti örnekleme aralığıyla sınırlıdır. Her
+    örnekte en üstteki fonksiyon "kendi", yığındaki tüm fonksiyonlar
+    "toplam" sayılır.
+    """
+
+    def __init__(self, hedef_thread_id, aralik=PROFIL_ORNEKLEME_ARALIGI):
+        """
+        Args:
+            hedef_thread_id (int): Örneklenecek iş parçacığının kimliği
+            aralik (float): Örnekleme aralığı (saniye)
+        """
+        self.hedef_thread_id = hedef_thread_id
+        self.aralik = aralik
+        self.kendi = Counter()
+        self.toplam = Counter()
+        self.yigitlar = Counter()
+        self.ornek_sayisi = 0
+        self._dur = threading.Event()
+        self._thread = threading.Thread(target=self._calis, name="profil-ornekleyici",
+                                        daemon=True)
+
+    def baslat(self):
+        """Örneklemeyi başlatır."""
+        self.baslangic = time.monotonic()
+        self._thread.start()
+
+    def durdur(self):
+        """Örneklemeyi durdurur."""
+        self._dur.set()
+        self._thread.join(timeout=1.0)
+        self.sure = time.monotonic() - self.baslangic
+
+    def _calis(self):
+        """Hedef iş parçacığının yığınını okur ve sayaçları günceller."""
+        while not self._dur.wait(self.aralik):
+            cerceve = sys._current_frames().get(self.hedef_thread_id)
+            if cerceve is None:
+                continue
+
+            yigit = []
+            while cerceve is not None:
+                kod = cerceve.f_code
+                yigit.append(f"{kod.co_name} ({os.path.basename(kod.co_filename)}:"
+                             f"{kod.co_firstlineno})")
+                cerceve = cerceve.f_back
+
+            self.ornek_sayisi += 1
+            self.kendi[yigit[0]] += 1
+            self.toplam.update(set(yigit))
+            self.yigitlar[";".join(reversed(yigit))] += 1
+
+    def rapor(self, satir_sayisi=PROFIL_RAPOR_SATIRI):
+        """Kendi ve toplam örnek sayılarına göre metin raporu üretir.
+
+        Returns:
+            str: Rapor metni
+        """
+        n = max(self.ornek_sayisi, 1)
+        satirlar = [f"{self.ornek_sayisi} örnek, {self.sure:.1f} sn, "
+                    f"aralık {self.aralik * 1000:.1f} ms", "",
+                    "Kendi süresi (yığının en üstü):"]
+        satirlar += [f"{sayi / n * 100:6.1f}%  {sayi:6d}  {ad}"
+                     for ad, sayi in self.kendi.most_common(satir_sayisi)]
+        satirlar += ["", "Toplam süre (yığında bulunma):"]
+        satirlar += [f"{sayi / n * 100:6.1f}%  {sayi:6d}  {ad}"
+                     for ad, sayi in self.toplam.most_common(satir_sayisi)]
+        return "\n".join(satirlar) + "\n"
+
+
+class RuntimeProfiler:
+    """Sinyalle açılıp kapatılan cProfile ve örnekleyici profil yöneticisi."""
+
+    def __init__(self, zamanlayici=None, dizin=PROFIL_DIZINI, gecikme=None):
+        """
+        Args:
+            zamanlayici (StageTimer): Anlık görüntüsü alınacak aşama zamanlayıcısı
+            dizin (str): Raporların yazılacağı dizin
+            gecikme (LatencyTracker): Anlık görüntüsü alınacak gecikme ölçer
+        """
+        self.zamanlayici = zamanlayici
+        self.gecikme = gecikme
+        self.dizin = dizin
+        self._cprofile = None
+        self._ornekleyici = None
+        self._yazicilar = []
+        self._ana_thread_id = threading.main_thread().ident
+
+    def sinyalleri_kur(self):
+        """SIGUSR1/SIGUSR2 yakalayıcılarını kurar (ana iş parçacığından çağrılmalı)."""
+        if not hasattr(signal, "SIGUSR1"):
+            logger.warning("Bu platformda SIGUSR1/SIGUSR2 yok, profil sinyalleri kurulmadı")
+            return
+        signal.signal(signal.SIGUSR1, lambda signum, frame: self.cprofile_degistir())
+        signal.signal(signal.SIGUSR2, lambda signum, frame: self.ornekleme_degistir())
+        logger.info(f"Profil sinyalleri hazır: kill -USR1 {os.getpid()} (cProfile), "
+                    f"kill -USR2 {os.getpid()} (örnekleme)")
+
+    def cprofile_degistir(self):
+        """cProfile'ı başlatır, çalışıyorsa durdurup raporu yazar.
+
+        Sinyal yakalayıcısı ana iş parçacığında çalıştığından profil kontrol
+        döngüsünün iş parçacığını kapsar.
+        """
+        if self._cprofile is None:
+            self._asamalari_yaz("cprofile", "oncesi")
+            self._cprofile = cProfile.Profile()
+            self._cprofile_baslangic = time.monotonic()
+            self._cprofile.enable()
+            logger.warning("cProfile başlatıldı")
+            return
+
+        self._cprofile.disable()
+        profil, self._cprofile = self._cprofile, None
+        sure = time.monotonic() - self._cprofile_baslangic
+        zaman = self._asamalari_yaz("cprofile", "sirasinda")
+
+        # İstatistik dosyaları döngüyü bekletmeden yazılır
+        self._yazici_baslat(self._cprofile_yaz, profil, zaman, sure)
+
+    def _cprofile_yaz(self, profil, zaman, sure):
+        """cProfile istatistiklerini .prof ve metin özeti olarak yazar."""
+        try:
+            yol = os.path.join(self.dizin, f"cprofile_{zaman}")
+            profil.dump_stats(yol + ".prof")
+
+            metin = io.StringIO()
+            istatistik = pstats.Stats(profil, stream=metin)
+            metin.write(f"Profil süresi: {sure:.1f} sn\n")
+            istatistik.sort_stats("cumulative").print_stats(PROFIL_RAPOR_SATIRI)
+            istatistik.sort_stats("tottime").print_stats(PROFIL_RAPOR_SATIRI)
+            with open(yol + ".txt", "w", encoding="utf-8") as f:
+                f.write(metin.getvalue())
+            logger.warning(f"cProfile durduruldu ({sure:.1f} sn): {yol}.prof")
+        except Exception as e:
+            logger.error(f"cProfile raporu yazılamadı: {str(e)}")
+
+    def ornekleme_degistir(self):
+        """Örnekleyici profili başlatır, çalışıyorsa durdurup raporu yazar."""
+        if self._ornekleyici is None:
+            self._asamalari_yaz("ornekleme", "oncesi")
+            self._ornekleyici = SamplingProfiler(self._ana_thread_id)
+            self._ornekleyici.baslat()
+            logger.warning("Örnekleyici profil başlatıldı")
+            return
+
+        ornekleyici, self._ornekleyici = self._ornekleyici, None
+        zaman = self._asamalari_yaz("ornekleme", "sirasinda")
+        self._yazici_baslat(self._ornekleme_yaz, ornekleyici, zaman)
+
+    def _ornekleme_yaz(self, ornekleyici, zaman):
+        """Örnekleyiciyi durdurur; metin raporunu ve katlanmış yığınları yazar.
+
+        `.folded` dosyası flamegraph araçlarının okuduğu "yığın sayı" biçimindedir.
+        """
+        try:
+            ornekleyici.durdur()
+            yol = os.path.join(self.dizin, f"ornekleme_{zaman}")
+            with open(yol + ".txt", "w", encoding="utf-8") as f:
+                f.write(ornekleyici.rapor())
+            with open(yol + ".folded", "w", encoding="utf-8") as f:
+                for yigit, sayi in ornekleyici.yigitlar.items():
+                    f.write(f"{yigit} {sayi}\n")
+            logger.warning(f"Örnekleyici profil durduruldu ({ornekleyici.ornek_sayisi} örnek): "
+                           f"{yol}.txt")
+        except Exception as e:
+            logger.error(f"Örnekleme raporu yazılamadı: {str(e)}")
+
+    def _yazici_baslat(self, hedef, *args):
+        """Rapor yazımını arka plan iş parçacığında başlatır."""
+        self._yazicilar = [t for t in self._yazicilar if t.is_alive()]
+        yazici = threading.Thread(target=hedef, args=args, name="profil-yazici", daemon=True)
+        yazici.start()
+        self._yazicilar.append(yazici)
+
+    def _asamalari_yaz(self, tur, ek):
+        """Aşama zamanlayıcısının ve gecikme ölçerin anlık görüntüsünü yazar.
+
+        "oncesi" görüntüsünden sonra ölçümler sıfırlanır; böylece "sirasinda"
+        görüntüsü yalnızca profil süresini kapsar.
+
+        Returns:
+            str: Dosya adlarında kullanılan zaman damgası
+        """
+        zaman = f"{datetime.now():%Y%m%d-%H%M%S}"
+        try:
+            os.makedirs(self.dizin, exist_ok=True)
+            for ad, olcer in (("asamalar", self.zamanlayici), ("gecikme", self.gecikme)):
+                if olcer is None:
+                    continue
+                yol = os.path.join(self.dizin, f"{ad}_{tur}_{zaman}_{ek}.json")
+                with open(yol, "w", encoding="utf-8") as f:
+                    json.dump(olcer.ozet(), f, ensure_ascii=False, indent=2)
+                if ek == "oncesi":
+                    olcer.sifirla()
+        except Exception as e:
+            logger.error(f"Aşama süreleri yazılamadı: {str(e)}")
+        return zaman
+
+    def kapat(self, zaman_asimi=10.0):
+        """Açık kalan profilleri durdurur ve raporların yazılmasını bekler.
+
+        Args:
+            zaman_asimi (float): Her rapor için en fazla bekleme (saniye)
+        """
+        if self._cprofile is not None:
+            self.cprofile_degistir()
+        if self._ornekleyici is not None:
+            self.ornekleme_degistir()
+        for yazici in self._yazicilar:
+            yazici.join(timeout=zaman_asimi)
@@ -0,0 +1,195 @@
+"""
+Uyarlanabilir Kalite Yöneticisi
+-------------------------------
+Kontrol döngüsünün algılama süresini, CPU kullanımını ve işlemci
+sıcaklığını izler; hedef döngü hızı tutturulamadığında veya işlemci
+ısındığında `KALITE_SEVIYELERI` içinde bir alt seviyeye (daha küçük
+çalışma çözünürlüğü, daha hafif ön işleme, daha seyrek dedektör) iner,
+yeniden pay oluştuğunda bir üst seviyeye çıkar.
+
+Ölçüm kaynağı değiştirilebilir; masa başı denemelerinde
+`FakeMetricsSource` ile sıcaklık ve yük elle verilebilir.
+"""
+import time
+from collections import deque
+from loguru import logger
+from config.config import (
+    KALITE_SEVIYELERI,
+    HEDEF_DONGU_HIZI,
+    KALITE_DEGERLENDIRME_ARALIGI,
+    KALITE_YUKSELTME_BEKLEMESI,
+    KALITE_ASIM_ORANI,
+    KALITE_SICAKLIK_UYARI,
+    KALITE_SICAKLIK_KRITIK,
+    KALITE_CPU_SINIRI
+)
+
+# Yükseltme için gereken pay: sıcaklıkta (°C) ve süre/CPU oranında
+_SICAKLIK_HISTEREZISI = 5.0
+_YUKSELTME_PAYI = 0.6
+
+
+class SystemMetricsSource:
+    """İşlemci sıcaklığını /sys/class/thermal, CPU kullanımını /proc/stat üzerinden okur."""
+
+    def __init__(self, termal_bolge="/sys/class/thermal/thermal_zone0/temp",
+                 cpu_istatistik="/proc/stat"):
+        """
+        Args:
+            termal_bolge (str): Milidereceli sıcaklık dosyası
+            cpu_istatistik (str): Çekirdek zaman sayaçları dosyası
+        """
+        self.termal_bolge = termal_bolge
+        self.cpu_istatistik = cpu_istatistik
+        self._son_cpu = None
+
+    def sicaklik(self):
+        """İşlemci sıcaklığını döndürür.
+
+        Returns:
+            float: Sıcaklık (°C); okunamazsa None
+        """
+        try:
+            with open(self.termal_bolge) as f:
+                return int(f.read().strip()) / 1000.0
+        except (OSError, ValueError):
+            return None
+
+    def cpu_kullanimi(self):
+        """Son çağrıdan bu yana toplam CPU kullanım oranını döndürür.
+
+        Returns:
+            float: 0.0 ile 1.0 arası kullanım; ilk çağrıda veya okunamazsa None
+        """
+        try:
+            with open(self.cpu_istatistik) as f:
+                alanlar = [int(x) for x in f.readline().split()[1:]]
+        except (OSError, ValueError):
+            return None
+
+        # idle + iowait boşta geçen süredir
+        bosta, toplam = alanlar[3] + alanlar[4], sum(alanlar)
+        onceki, self._son_cpu = self._son_cpu, (bosta, toplam)
+        if onceki is None or toplam == onceki[1]:
+            return None
+        return 1.0 - (bosta - onceki[0]) / (toplam - onceki[1])
+
+
+class FakeMetricsSource:
+    """Değerleri dışarıdan atanan ölçüm kaynağı (deneme ve simülasyon için)."""
+
+    def __init__(self, sicaklik=50.0, cpu=0.3):
+        """
+        Args:
+            sicaklik (float): Döndürülecek sıcaklık (°C)
+            cpu (float): Döndürülecek CPU kullanım oranı
+        """
+        self.sicaklik_degeri = sicaklik
+        self.cpu_degeri = cpu
+
+    def sicaklik(self):
+        return self.sicaklik_degeri
+
+    def cpu_kullanimi(self):
+        return self.cpu_degeri
+
+
+class QualityGovernor:
+    """Döngü süresi ve termal duruma göre kalite seviyesi seçen sınıf.
+
+    Seviyeler en yüksek kaliteden en düşüğe sıralıdır. Her seviye
+    `olcek` (çalışma çözünürlüğü çarpanı), `on_isleme` ('tam', 'hafif',
+    'yok') ve `isik_araligi` (trafik ışığı dedektörünün kaç karede bir
+    çalışacağı) alanlarını içerir.
+    """
+
+    def __init__(self, seviyeler=KALITE_SEVIYELERI, hedef_hiz=HEDEF_DONGU_HIZI,
+                 kaynak=None, saat=time.monotonic):
+        """
+        Args:
+            seviyeler (tuple): Kalite seviyeleri (yüksekten düşüğe)
+            hedef_hiz (float): Hedef döngü hızı (Hz)
+            kaynak: `sicaklik()` ve `cpu_kullanimi()` sağlayan ölçüm kaynağı
+                (None ise `SystemMetricsSource`)
+            saat (callable): Saniye cinsinden monoton zaman kaynağı
+        """
+        self.seviyeler = list(seviyeler)
+        self.butce = 1.0 / hedef_hiz
+        self.kaynak = kaynak if kaynak is not None else SystemMetricsSource()
+        self.saat = saat
+
+        self.seviye_indeksi = 0
+        self._sureler = deque(maxlen=256)
+        self._son_degerlendirme = self.saat()
+        self._son_degisiklik = self._son_degerlendirme
+        self.son_olcum = {}
+
+        # İlk CPU okuması referans noktasıdır
+        self.kaynak.cpu_kullanimi()
+
+    @property
+    def seviye(self):
+        """Geçerli kalite seviyesi (dict)."""
+        return self.seviyeler[self.seviye_indeksi]
+
+    def dongu_bildir(self, sure):
+        """Bir karenin algılama süresini kaydeder ve gerekirse seviyeyi günceller.
+
+        Args:
+            sure (float): Karenin işlenme süresi (saniye)
+
+        Returns:
+            dict: Geçerli kalite seviyesi
+        """
+        self._sureler.append(sure)
+
+        simdi = self.saat()
+        if simdi - self._son_degerlendirme >= KALITE_DEGERLENDIRME_ARALIGI:
+            self._son_degerlendirme = simdi
+            self._degerlendir(simdi)
+
+        return self.seviye
+
+    def _degerlendir(self, simdi):
+        """Son penceredeki ölçümlere göre bir seviye iner veya çıkar."""
+        sureler = list(self._sureler)
+        self._sureler.clear()
+        if not sureler:
+            return
+
+        ortalama = sum(sureler) / len(sureler)
+        asim_orani = sum(1 for s in sureler if s > self.butce) / len(sureler)
+        sicaklik = self.kaynak.sicaklik()
+        cpu = self.kaynak.cpu_kullanimi()
+        self.son_olcum = {
+            'ortalama_ms': ortalama * 1000,
+            'asim_orani': asim_orani,
+            'sicaklik': sicaklik,
+            'cpu': round(cpu, 2) if cpu is not None else None
+        }
+
+        sicak = sicaklik is not None and sicaklik >= KALITE_SICAKLIK_UYARI
+        if sicaklik is not None and sicaklik >= KALITE_SICAKLIK_KRITIK:
+            self._seviye_degistir(len(self.seviyeler) - 1, "kritik sıcaklık", simdi)
+        elif asim_orani > KALITE_ASIM_ORANI or sicak \
+                or (cpu is not None and cpu >= KALITE_CPU_SINIRI):
+            self._seviye_degistir(self.seviye_indeksi + 1, "döngü/termal sınır", simdi)
+        elif ortalama < self.butce * _YUKSELTME_PAYI \
+                and (sicaklik is None or sicaklik < KALITE_SICAKLIK_UYARI - _SICAKLIK_HISTEREZISI) \
+                and (cpu is None or cpu < KALITE_CPU_SINIRI * _YUKSELTME_PAYI) \
+                and simdi - self._son_degisiklik >= KALITE_YUKSELTME_BEKLEMESI:
+            self._seviye_degistir(self.seviye_indeksi - 1, "yeterli pay", simdi)
+
+    def _seviye_degistir(self, indeks, neden, simdi):
+        """Seviyeyi sınırlar içinde değiştirir ve loglar."""
+        indeks = max(0, min(len(self.seviyeler) - 1, indeks))
+        if indeks == self.seviye_indeksi:
+            return
+
+        self.seviye_indeksi = indeks
+        self._son_degisiklik = simdi
+        olcum = self.son_olcum
+        logger.info(f"Kalite seviyesi: {self.seviye['ad']} ({neden}) - "
+                    f"ortalama {olcum['ortalama_ms']:.1f} ms, "
+                    f"aşım %{olcum['asim_orani'] * 100:.0f}, "
+                    f"sıcaklık {olcum['sicaklik']}, CPU {olcum['cpu']}")
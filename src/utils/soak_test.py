@@ -0,0 +1,468 @@
+"""
+Uzun Süreli Dayanıklılık (Soak) Testi
+-------------------------------------
+Tüm kontrol döngüsünü (`VehicleController`) kayıtlı veya sentetik karelerle,
+donanımsız (`NullMotorBackend`) belirtilen süre boyunca çalıştırır ve her
+`SOAK_ORNEK_ARALIGI` saniyede bir şunları ölçer:
+
+    rss_mb      Süreç bellek kullanımı (/proc/self/statm)
+    izlenen_mb  tracemalloc'un izlediği Python ayırmaları
+    dongu_hz    Penceredeki döngü hızı
+    islem_ms    Döngü başına ortalama işlem süresi (kare bekleme hariç)
+    gc_ms       Penceredeki çöp toplayıcı duraklamalarının toplamı
+
+Isınma süresinden sonraki örneklere doğru uydurulur; bellek veya işlem
+süresi artış, döngü hızı düşüş eğilimindeyse test başarısız sayılır. Rapor
+en çok büyüyen ayırma kaynaklarını ve GC duraklama dağılımını da içerir.
+
+Kullanım:
+    python -m src.utils.soak_test --sure 3600
+    python -m src.utils.soak_test --sure 3600 --kayit logs/kayitlar --json logs/soak.json
+"""
+import os
+import gc
+import sys
+import json
+import time
+import zipfile
+import argparse
+import threading
+import tracemalloc
+from collections import deque
+from datetime import datetime
+import numpy as np
+from loguru import logger
+from src.camera.camera_controller import CameraController, cv2
+from src.camera.frame import Frame
+from src.control.motor_backends import NullMotorBackend
+from src.control.motor_controller import MotorController
+from src.control.vehicle_controller import VehicleController
+from src.simulation.sim_camera import SimCameraController
+from src.simulation.world import SimWorld
+from src.utils.logging_setup import log_ayarla, log_kapat
+from config.config import (
+    KAMERA_FPS,
+    SOAK_ORNEK_ARALIGI,
+    SOAK_ISINMA_SURESI,
+    SOAK_MAX_RSS_ARTISI,
+    SOAK_MAX_SURE_ARTISI,
+    SOAK_MAX_HIZ_DUSUSU,
+    SOAK_TRACEMALLOC,
+    SOAK_TRACEMALLOC_DERINLIK,
+    SOAK_SENTETIK_HIZ,
+    SOAK_MAX_KAYIT_KARESI
+)
+
+# Raporda listelenen en çok büyüyen ayırma kaynağı sayısı
+_AYIRMA_SATIRI = 15
+
+# Eğilim hesabı için ısınma sonrası gereken en az örnek
+_MIN_ORNEK = 3
+
+_GORUNTU_UZANTILARI = (".jpg", ".jpeg", ".png")
+
+
+class RecordedCamera(CameraController):
+    """Kara kutu arşivlerinden veya görüntü dizininden kareleri döngüyle veren kamera.
+
+    Kareler açılışta bir kez çözülüp belleğe alınır; böylece ölçülen bellek
+    ve süre eğilimleri JPEG çözmeden değil kontrol döngüsünden gelir.
+    """
+
+    def __init__(self, kaynak, buffer_havuzu=None, fps=KAMERA_FPS,
+                 max_kare=SOAK_MAX_KAYIT_KARESI):
+        """
+        Args:
+            kaynak (str): Kayıt arşivi (.zip), arşiv dizini veya görüntü dizini
+            buffer_havuzu (BufferPool): Ara görüntüler için ortak tampon havuzu
+            fps (float): Karelerin verilme hızı
+            max_kare (int): Belleğe yüklenen en fazla kare
+        """
+        self._tampon_ayarla(buffer_havuzu)
+        self.kare_araligi = 1.0 / fps
+        self._sonraki_kare = time.monotonic()
+
+        self.kareler = self._kareleri_yukle(kaynak, max_kare)
+        if not self.kareler:
+            raise ValueError(f"Kayıtta kare bulunamadı: {kaynak}")
+        logger.info(f"Kayıtlı kamera başlatıldı: {len(self.kareler)} kare ({kaynak})")
+
+    def _kareleri_yukle(self, kaynak, max_kare):
+        """Kaynaktaki görüntüleri çözer ve kamera çözünürlüğüne getirir."""
+        veriler = []
+        if os.path.isdir(kaynak):
+            adlar = sorted(os.listdir(kaynak))
+            arsivler = [os.path.join(kaynak, ad) for ad in adlar if ad.endswith(".zip")]
+            for ad in adlar:
+                if ad.lower().endswith(_GORUNTU_UZANTILARI):
+                    with open(os.path.join(kaynak, ad), "rb") as f:
+                        veriler.append(f.read())
+        else:
+            arsivler = [kaynak]
+
+        for arsiv_yolu in arsivler:
+            with zipfile.ZipFile(arsiv_yolu) as arsiv:
+                for ad in sorted(arsiv.namelist()):
+                    if ad.lower().endswith(_GORUNTU_UZANTILARI):
+                        veriler.append(arsiv.read(ad))
+            if len(veriler) >= max_kare:
+                break
+
+        genislik, yukseklik = self.tamponlar.genislik, self.tamponlar.yukseklik
+        kareler = []
+        for veri in veriler[:max_kare]:
+            kare = cv2.imdecode(np.frombuffer(veri, np.uint8), cv2.IMREAD_COLOR)
+            if kare is None:
+                continue
+            if kare.shape[:2] != (yukseklik, genislik):
+                kare = cv2.resize(kare, (genislik, yukseklik), interpolation=cv2.INTER_AREA)
+            kareler.append(kare)
+        return kareler
+
+    def kare_yakala(self):
+        """Sıradaki kayıtlı kareyi kare hızında verir.
+
+        Returns:
+            Frame: BGR görüntü (havuz tamponu) ve zaman bilgileri
+        """
+        try:
+            bekleme = self._sonraki_kare - time.monotonic()
+            if bekleme > 0:
+                time.sleep(bekleme)
+            self._sonraki_kare = max(time.monotonic(), self._sonraki_kare) + self.kare_araligi
+
+            sensor_zamani = time.monotonic()
+            kaynak = self.kareler[self.kare_sayisi % len(self.kareler)]
+            kare = self.tamponlar.al('kamera_bgr', kaynak.shape)
+            np.copyto(kare, kaynak)
+            self.kare_sayisi += 1
+            return Frame(kare, sensor_zamani, kare_no=self.kare_sayisi,
+                         yuv=self._isp_benzet(kare))
+        except Exception as e:
+            logger.error(f"Kayıtlı kare verilemedi: {str(e)}")
+            return None
+
+    def close(self):
+        """Kayıtlı kamerayı kapatır."""
+        logger.info("Kayıtlı kamera kapatıldı")
+
+
+class SyntheticCamera(SimCameraController):
+    """Aracı şerit ortasında sabit hızla ilerletip simülasyon karesi render eden kamera.
+
+    Motorlar dünyaya bağlı değildir (null arka uç); poz komutlardan değil
+    zamandan hesaplanır, böylece ışık, tabela ve virajlar sürekli değişir.
+    """
+
+    def __init__(self, buffer_havuzu=None, fps=KAMERA_FPS, hiz=SOAK_SENTETIK_HIZ):
+        """
+        Args:
+            buffer_havuzu (BufferPool): Ara görüntüler için ortak tampon havuzu
+            fps (float): Simüle sensör kare hızı
+            hiz (float): Aracın pist üzerindeki hızı (cm/s)
+        """
+        super().__init__(SimWorld(), buffer_havuzu, fps)
+        self.hiz = hiz
+        self._baslangic = time.monotonic()
+
+    def kare_yakala(self):
+        """Pozu zamana göre ilerletir ve kareyi render eder."""
+        dunya = self.dunya
+        s = (time.monotonic() - self._baslangic) * self.hiz
+        with dunya._kilit:
+            dunya.x, dunya.y, dunya.teta = dunya.pist.nokta(s, dunya.serit_n)
+            dunya._son_zaman = dunya.saat()
+        return super().kare_yakala()
+
+
+def _rss_mb():
+    """Sürecin yerleşik bellek kullanımını döndürür (MB; okunamazsa None)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _egilim(zamanlar, degerler):
+    """Değerlere doğru uydurur.
+
+    Returns:
+        tuple: (baslangic, artis) - Uydurulan doğrunun ilk örnekteki değeri ve
+            ilk örnekten son örneğe toplam değişimi; yetersiz veri varsa (None, None)
+    """
+    cift = [(t, d) for t, d in zip(zamanlar, degerler) if d is not None]
+    if len(cift) < _MIN_ORNEK:
+        return None, None
+    t, d = np.array(cift, dtype=np.float64).T
+    egim, kesim = np.polyfit(t, d, 1)
+    return float(egim * t[0] + kesim), float(egim * (t[-1] - t[0]))
+
+
+class SoakMonitor:
+    """Çalışan kontrolcünün bellek, döngü hızı ve GC ölçümlerini pencere pencere toplar."""
+
+    def __init__(self, kontrolcu, aralik=SOAK_ORNEK_ARALIGI, isinma=SOAK_ISINMA_SURESI,
+                 tracemalloc_derinlik=SOAK_TRACEMALLOC_DERINLIK if SOAK_TRACEMALLOC else 0):
+        """
+        Args:
+            kontrolcu (VehicleController): İzlenen kontrolcü
+            aralik (float): Ölçüm penceresi (saniye)
+            isinma (float): Eğilime katılmayan başlangıç süresi (saniye)
+            tracemalloc_derinlik (int): Ayırma yığın derinliği (0 ise tracemalloc kapalı)
+        """
+        self.kontrolcu = kontrolcu
+        self.aralik = aralik
+        self.isinma = isinma
+        self.tracemalloc_derinlik = tracemalloc_derinlik
+
+        self.ornekler = []
+        self._gc_baslangic = {}
+        self._gc_duraklamalari = deque(maxlen=100000)  # (nesil, süre)
+        self._pencere_gc = 0.0
+        self._ilk_goruntu = None
+        self._son_goruntu = None
+
+        self._dur = threading.Event()
+        self._thread = threading.Thread(target=self._calis, name="soak-izleyici", daemon=True)
+
+    def baslat(self):
+        """GC geri çağrımını, tracemalloc'u ve ölçüm iş parçacığını başlatır."""
+        gc.callbacks.append(self._gc_geri_cagirim)
+        if self.tracemalloc_derinlik > 0:
+            tracemalloc.start(self.tracemalloc_derinlik)
+        self.baslangic = time.monotonic()
+        self._son_zaman = self.baslangic
+        self._son_dongu = self.kontrolcu.dongu_sayisi
+        self.kontrolcu.zamanlayici.sifirla()
+        self._thread.start()
+
+    def _gc_geri_cagirim(self, faz, bilgi):
+        """Her toplama turunun süresini nesliyle birlikte kaydeder."""
+        simdi = time.perf_counter()
+        thread_id = threading.get_ident()
+        if faz == "start":
+            self._gc_baslangic[thread_id] = simdi
+            return
+        baslangic = self._gc_baslangic.pop(thread_id, None)
+        if baslangic is not None:
+            sure = simdi - baslangic
+            self._gc_duraklamalari.append((bilgi.get("generation"), sure))
+            self._pencere_gc += sure
+
+    def _calis(self):
+        """`aralik` saniyede bir örnek alır."""
+        while not self._dur.wait(self.aralik):
+            try:
+                self._ornek_al()
+            except Exception as e:
+                logger.error(f"Soak ölçüm hatası: {str(e)}")
+
+    def _ornek_al(self):
+        """Son pencerenin ölçümlerini örnek listesine ekler."""
+        simdi = time.monotonic()
+        dongu = self.kontrolcu.dongu_sayisi
+        sure = simdi - self._son_zaman
+
+        # Kare bekleme (yakalama) hariç aşamaların ortalamaları döngü başına işlem süresidir
+        asamalar = self.kontrolcu.zamanlayici.ozet()
+        self.kontrolcu.zamanlayici.sifirla()
+        islem = sum(o['ortalama_ms'] for ad, o in asamalar.items() if ad != "yakalama") \
+            if asamalar else None
+
+        gc_ms, self._pencere_gc = self._pencere_gc * 1000, 0.0
+        izlenen = tracemalloc.get_traced_memory()[0] / 2 ** 20 \
+            if tracemalloc.is_tracing() else None
+
+        ornek = {
+            't': round(simdi - self.baslangic, 1),
+            'rss_mb': _rss_mb(),
+            'izlenen_mb': izlenen,
+            'dongu_hz': (dongu - self._son_dongu) / sure if sure > 0 else None,
+            'islem_ms': islem,
+            'gc_ms': gc_ms
+        }
+        self.ornekler.append(ornek)
+        self._son_zaman, self._son_dongu = simdi, dongu
+
+        # Ayırma karşılaştırmasının tabanı ısınma bittiğinde alınır
+        if tracemalloc.is_tracing() and self._ilk_goruntu is None and ornek['t'] >= self.isinma:
+            self._ilk_goruntu = self._goruntu_al()
+
+        logger.info("Soak t={t:.0f} s: rss={rss} MB, döngü={hz} Hz, işlem={islem} ms, "
+                    "gc={gc:.1f} ms", t=ornek['t'],
+                    rss=f"{ornek['rss_mb']:.1f}" if ornek['rss_mb'] is not None else "-",
+                    hz=f"{ornek['dongu_hz']:.2f}" if ornek['dongu_hz'] is not None else "-",
+                    islem=f"{islem:.2f}" if islem is not None else "-", gc=gc_ms)
+
+    def _goruntu_al(self):
+        """tracemalloc anlık görüntüsünü kendi ayırmaları filtrelenmiş olarak alır."""
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<unknown>")
+        ))
+
+    def durdur(self):
+        """Ölçümü durdurur, son ayırma görüntüsünü alır ve izlemeyi kapatır."""
+        self._dur.set()
+        self._thread.join(timeout=self.aralik + 5.0)
+        if tracemalloc.is_tracing():
+            if self._ilk_goruntu is not None:
+                self._son_goruntu = self._goruntu_al()
+            tracemalloc.stop()
+        if self._gc_geri_cagirim in gc.callbacks:
+            gc.callbacks.remove(self._gc_geri_cagirim)
+
+    def _ayirma_artislari(self):
+        """Isınma sonundan test sonuna en çok büyüyen ayırma kaynakları."""
+        if self._ilk_goruntu is None or self._son_goruntu is None:
+            return []
+        farklar = self._son_goruntu.compare_to(self._ilk_goruntu, "lineno")
+        return [{
+            'konum': str(fark.traceback[0]),
+            'artis_kb': round(fark.size_diff / 1024, 1),
+            'toplam_kb': round(fark.size / 1024, 1),
+            'sayi_artisi': fark.count_diff
+        } for fark in farklar[:_AYIRMA_SATIRI] if fark.size_diff > 0]
+
+    def _gc_ozeti(self):
+        """Nesil başına GC duraklama dağılımı."""
+        ozet = {}
+        for nesil in sorted({n for n, _ in self._gc_duraklamalari}):
+            sureler = np.array([s for n, s in self._gc_duraklamalari if n == nesil]) * 1000
+            ozet[f"nesil_{nesil}"] = {
+                'sayi': len(sureler),
+                'toplam_ms': round(float(sureler.sum()), 2),
+                'p50_ms': round(float(np.percentile(sureler, 50)), 3),
+                'p99_ms': round(float(np.percentile(sureler, 99)), 3),
+                'max_ms': round(float(sureler.max()), 3)
+            }
+        return ozet
+
+    def rapor(self):
+        """Eğilimleri hesaplar ve eşiklerle karşılaştırır.
+
+        Returns:
+            dict: Örnekler, eğilimler, GC ve ayırma özetleri, 'basarili' ve 'hatalar'
+        """
+        gecerli = [o for o in self.ornekler if o['t'] >= self.isinma]
+        zamanlar = [o['t'] for o in gecerli]
+        egilimler = {}
+        for ad in ('rss_mb', 'izlenen_mb', 'dongu_hz', 'islem_ms', 'gc_ms'):
+            baslangic, artis = _egilim(zamanlar, [o[ad] for o in gecerli])
+            if baslangic is not None:
+                egilimler[ad] = {'baslangic': round(baslangic, 3), 'artis': round(artis, 3)}
+
+        hatalar = []
+        if len(gecerli) < _MIN_ORNEK:
+            hatalar.append(f"Isınma sonrası yetersiz örnek ({len(gecerli)}); "
+                           f"süre en az {self.isinma + _MIN_ORNEK * self.aralik:.0f} sn olmalı")
+        rss = egilimler.get('rss_mb')
+        if rss is not None and rss['artis'] > SOAK_MAX_RSS_ARTISI:
+            hatalar.append(f"Bellek artıyor: RSS {rss['artis']:.1f} MB "
+                           f"(sınır {SOAK_MAX_RSS_ARTISI} MB)")
+        islem = egilimler.get('islem_ms')
+        if islem is not None and islem['baslangic'] > 0 \
+                and islem['artis'] / islem['baslangic'] > SOAK_MAX_SURE_ARTISI:
+            hatalar.append(f"İşlem süresi artıyor: {islem['baslangic']:.2f} ms -> "
+                           f"+{islem['artis']:.2f} ms")
+        hiz = egilimler.get('dongu_hz')
+        if hiz is not None and hiz['baslangic'] > 0 \
+                and -hiz['artis'] / hiz['baslangic'] > SOAK_MAX_HIZ_DUSUSU:
+            hatalar.append(f"Döngü hızı düşüyor: {hiz['baslangic']:.2f} Hz -> "
+                           f"{hiz['artis']:+.2f} Hz")
+
+        return {
+            'sure_s': self.ornekler[-1]['t'] if self.ornekler else 0.0,
+            'basarili': not hatalar,
+            'hatalar': hatalar,
+            'egilimler': egilimler,
+            'gc': self._gc_ozeti(),
+            'ayirma_artislari': self._ayirma_artislari(),
+            'gecikme': self.kontrolcu.gecikme.ozet(),
+            'ornekler': self.ornekler
+        }
+
+
+def soak_calistir(sure, kayit=None, aralik=SOAK_ORNEK_ARALIGI, isinma=SOAK_ISINMA_SURESI,
+                  tracemalloc_acik=SOAK_TRACEMALLOC, kara_kutu=False):
+    """Kontrol döngüsünü null motorlarla verilen süre çalıştırır ve raporu döndürür.
+
+    Args:
+        sure (float): Çalışma süresi (saniye)
+        kayit (str): Kayıt arşivi/dizini (None ise sentetik kareler)
+        aralik (float): Ölçüm penceresi (saniye)
+        isinma (float): Eğilime katılmayan başlangıç süresi (saniye)
+        tracemalloc_acik (bool): Ayırma kaynakları izlensin mi
+        kara_kutu (bool): Kara kutu kaydedicisi çalışsın mı (kaydedicinin
+            bellek davranışı da sınanacaksa açılır)
+
+    Returns:
+        dict: `SoakMonitor.rapor` çıktısı
+    """
+    kamera = RecordedCamera(kayit) if kayit else SyntheticCamera()
+    motorlar = MotorController(backend=NullMotorBackend())
+    kontrolcu = VehicleController(camera=kamera, motors=motorlar, kayit_aktif=kara_kutu)
+
+    izleyici = SoakMonitor(kontrolcu, aralik, isinma,
+                           SOAK_TRACEMALLOC_DERINLIK if tracemalloc_acik else 0)
+    zamanlayici = threading.Timer(sure, kontrolcu.durdur)
+    zamanlayici.daemon = True
+
+    izleyici.baslat()
+    zamanlayici.start()
+    try:
+        kontrolcu.calistir()
+    finally:
+        zamanlayici.cancel()
+        izleyici.durdur()
+    return izleyici.rapor()
+
+
+def main():
+    """Komut satırı giriş noktası; test başarısızsa 1 ile çıkar."""
+    parser = argparse.ArgumentParser(description="Uzun süreli dayanıklılık testi")
+    parser.add_argument("--sure", type=float, default=3600.0, help="Çalışma süresi (saniye)")
+    parser.add_argument("--kayit", help="Kara kutu arşivi, arşiv dizini veya görüntü dizini "
+                                        "(verilmezse sentetik kareler)")
+    parser.add_argument("--aralik", type=float, default=SOAK_ORNEK_ARALIGI,
+                        help="Ölçüm penceresi (saniye)")
+    parser.add_argument("--isinma", type=float, default=SOAK_ISINMA_SURESI,
+                        help="Eğilime katılmayan başlangıç süresi (saniye)")
+    parser.add_argument("--tracemalloc-kapali", action="store_true",
+                        help="Ayırma kaynaklarını izleme (döngü yavaşlamaz)")
+    parser.add_argument("--kara-kutu", action="store_true",
+                        help="Kara kutu kaydını aç (logs/kayitlar altına arşiv yazar)")
+    parser.add_argument("--json", help="Raporun yazılacağı dosya "
+                                       "(varsayılan logs/soak_<zaman>.json)")
+    parser.add_argument("--log-seviyesi", default="INFO", help="Konsol/dosya log seviyesi")
+    args = parser.parse_args()
+
+    log_ayarla("logs/soak.log", seviye=args.log_seviyesi)
+    basarili = False
+    try:
+        rapor = soak_calistir(args.sure, args.kayit, args.aralik, args.isinma,
+                              not args.tracemalloc_kapali, args.kara_kutu)
+        basarili = rapor['basarili']
+
+        yol = args.json or os.path.join("logs", f"soak_{datetime.now():%Y%m%d-%H%M%S}.json")
+        os.makedirs(os.path.dirname(yol) or ".", exist_ok=True)
+        with open(yol, "w", encoding="utf-8") as f:
+            json.dump(rapor, f, ensure_ascii=False, indent=2)
+
+        print(json.dumps({k: v for k, v in rapor.items() if k != 'ornekler'},
+                         ensure_ascii=False, indent=2))
+        if basarili:
+            logger.info(f"Soak testi başarılı: {yol}")
+        else:
+            logger.error(f"Soak testi başarısız: {'; '.join(rapor['hatalar'])} ({yol})")
+    except Exception as e:
+        logger.error(f"Soak testi hatası: {str(e)}")
+    finally:
+        log_kapat()
+    sys.exit(0 if basarili else 1)
+
+
+if __name__ == "__main__":
+    main()
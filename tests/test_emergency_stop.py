@@ -0,0 +1,94 @@
+"""
+EmergencyStop testleri - kalıcı durdurma kilidi, sıfırlama ve gecikme ölçümü
+"""
+import threading
+import pytest
+from src.control.emergency_stop import EmergencyStop
+from src.control.motor_backends import NullMotorBackend
+from src.control.motor_controller import MotorController
+
+BEKLEME = 2.0
+
+
+@pytest.fixture
+def motorlar():
+    motorlar = MotorController(backend=NullMotorBackend())
+    yield motorlar
+    motorlar.temizle()
+
+
+def acil_durus_kur(motorlar, **secenekler):
+    """Başlatılmış durdurucuyu ve her durdurmada işaretlenen olayı döndürür."""
+    acil_durus = EmergencyStop(motorlar, oncelik=0, **secenekler)
+    durduruldu = threading.Event()
+    acil_durus.dinleyiciler.append(lambda neden, gecikme: durduruldu.set())
+    acil_durus.baslat()
+    return acil_durus, durduruldu
+
+
+def test_kalici_durdurma_komutlari_engeller(motorlar):
+    acil_durus, durduruldu = acil_durus_kur(motorlar)
+    try:
+        motorlar.hiz_ayarla(60, 60, yumusak=False)
+        assert motorlar.backend.sol_oran > 0
+
+        acil_durus.tetikle("test")
+        # Kilit iş parçacığı uyanmadan, tetikleme anında konur
+        assert motorlar.acil_durdu
+        assert durduruldu.wait(BEKLEME)
+        assert (motorlar.backend.sol_oran, motorlar.backend.sag_oran) == (0.0, 0.0)
+
+        motorlar.hiz_ayarla(60, 60, yumusak=False)
+        motorlar.hiz_ayarla(60, 60)
+        assert (motorlar.backend.sol_oran, motorlar.backend.sag_oran) == (0.0, 0.0)
+        assert acil_durus.durdurma_sayisi == 1
+        assert acil_durus.son_neden == "test"
+    finally:
+        acil_durus.kapat()
+
+
+def test_sifirlama_sonrasi_komutlar_uygulanir(motorlar):
+    acil_durus, durduruldu = acil_durus_kur(motorlar)
+    try:
+        acil_durus.tetikle("test")
+        assert durduruldu.wait(BEKLEME)
+
+        acil_durus.sifirla()
+        assert not motorlar.acil_durdu
+        motorlar.hiz_ayarla(60, 60, yumusak=False)
+        assert motorlar.backend.sol_oran > 0
+    finally:
+        acil_durus.kapat()
+
+
+def test_kalici_olmayan_durdurma_kilitlemez(motorlar):
+    acil_durus, durduruldu = acil_durus_kur(motorlar)
+    try:
+        motorlar.hiz_ayarla(60, 60, yumusak=False)
+        acil_durus.tetikle("bekci_durdu_kare", kalici=False)
+        assert not motorlar.acil_durdu
+        assert durduruldu.wait(BEKLEME)
+        assert motorlar.backend.sol_oran == 0.0
+
+        motorlar.hiz_ayarla(60, 60, yumusak=False)
+        assert motorlar.backend.sol_oran > 0
+    finally:
+        acil_durus.kapat()
+
+
+def test_sure_siniri_asimi_sayilir(motorlar):
+    # Her okumada bir saniye ilerleyen saat: ölçülen gecikme sınırı aşar
+    zaman = [0.0]
+
+    def saat():
+        zaman[0] += 1.0
+        return zaman[0]
+
+    acil_durus, durduruldu = acil_durus_kur(motorlar, sure_siniri=0.5, saat=saat)
+    try:
+        acil_durus.tetikle("test")
+        assert durduruldu.wait(BEKLEME)
+        assert acil_durus.sinir_asimi == 1
+        assert acil_durus.son_gecikme == pytest.approx(1.0)
+    finally:
+        acil_durus.kapat()
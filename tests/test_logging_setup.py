@@ -0,0 +1,45 @@
+"""
+RateLimitFilter testleri - bağlı anahtar aralığı ve metin tekrarı bastırma
+"""
+from types import SimpleNamespace
+import pytest
+from src.utils.logging_setup import RateLimitFilter
+
+SEVIYE_INFO = SimpleNamespace(no=20)
+
+
+def kayit(mesaj, satir=10, anahtar=None):
+    """Filtrenin okuduğu alanları taşıyan loguru kaydı benzeri sözlük."""
+    extra = {} if anahtar is None else {"anahtar": anahtar}
+    return {"level": SEVIYE_INFO, "extra": extra, "message": mesaj,
+            "name": "test", "function": "f", "line": satir}
+
+
+@pytest.fixture
+def filtre():
+    return RateLimitFilter(tekrar_araligi=60.0, min_aralik=60.0)
+
+
+def test_ayni_satirdan_farkli_mesajlar_gecer(filtre):
+    assert filtre(kayit("Tabela: dur"))
+    assert filtre(kayit("Tabela: park"))
+
+
+def test_ayni_satirdan_ayni_mesaj_bastirilir(filtre):
+    assert filtre(kayit("Tabela: dur"))
+    assert not filtre(kayit("Tabela: dur"))
+
+
+def test_bagli_anahtar_araligi_uygulanir(filtre):
+    assert filtre(kayit("Sola dönüş", anahtar="motor_komutu"))
+    assert not filtre(kayit("Sağa dönüş", satir=20, anahtar="motor_komutu"))
+
+
+def test_bastirilan_sayisi_sonraki_kayda_eklenir():
+    filtre = RateLimitFilter(tekrar_araligi=60.0, min_aralik=0.0)
+    assert filtre(kayit("a"))
+    assert not filtre(kayit("a"))
+    filtre.tekrar_araligi = 0.0
+    son = kayit("a")
+    assert filtre(son)
+    assert son["message"] == "a (+1 benzer mesaj bastırıldı)"
@@ -0,0 +1,124 @@
+"""
+PerceptionWatchdog testleri - sahte saatle yaş denetimi
+"""
+import pytest
+from src.control.perception_watchdog import PerceptionWatchdog
+
+SURELER = {'kare': (0.2, 0.5), 'serit': (0.3, 0.6)}
+MIN_CARPAN = 0.3
+
+
+class SahteSaat:
+    """Elle ilerletilen monoton saat."""
+
+    def __init__(self):
+        self.zaman = 10.0
+
+    def __call__(self):
+        return self.zaman
+
+
+class SahteMotorlar:
+    """Bekçinin yazdığı hız çarpanlarını kaydeder."""
+
+    def __init__(self):
+        self.carpanlar = []
+
+    def hiz_carpani_ayarla(self, carpan):
+        self.carpanlar.append(carpan)
+
+
+@pytest.fixture
+def saat():
+    return SahteSaat()
+
+
+@pytest.fixture
+def motorlar():
+    return SahteMotorlar()
+
+
+@pytest.fixture
+def bekci(motorlar, saat):
+    bekci = PerceptionWatchdog(motorlar, sureler=SURELER, min_carpan=MIN_CARPAN, saat=saat)
+    bekci.nedenler = []
+    bekci.dinleyiciler.append(bekci.nedenler.append)
+    return bekci
+
+
+def test_bildirim_yokken_izlemez(bekci, motorlar, saat):
+    saat.zaman += 100.0
+    assert bekci.kontrol() == 1.0
+    assert bekci.durum == "normal"
+    assert motorlar.carpanlar == []
+
+
+def test_taze_verilerde_tam_hiz(bekci, motorlar, saat):
+    bekci.bildir('kare')
+    bekci.bildir('serit')
+    saat.zaman += 0.1
+    assert bekci.kontrol() == 1.0
+    assert bekci.durum == "normal"
+    assert motorlar.carpanlar == []
+
+
+def test_yavaslama_sinirindan_sonra_dogrusal_iner(bekci, motorlar, saat):
+    bekci.bildir('kare')
+    # Yavaşlama ile durdurma sınırının ortası
+    carpan = bekci.kontrol(saat.zaman + 0.35)
+    assert carpan == pytest.approx(1.0 - 0.5 * (1.0 - MIN_CARPAN))
+    assert bekci.durum == "yavas"
+    assert motorlar.carpanlar == [pytest.approx(carpan)]
+    assert bekci.tetiklenme_sayilari == {"yavas": 1, "durdu": 0}
+    assert bekci.nedenler == ["bekci_yavas_kare"]
+
+
+def test_durdurma_sinirinda_durur(bekci, motorlar, saat):
+    bekci.bildir('kare')
+    assert bekci.kontrol(saat.zaman + 0.5) == 0.0
+    assert bekci.durum == "durdu"
+    assert motorlar.carpanlar == [0.0]
+    assert bekci.nedenler == ["bekci_durdu_kare"]
+
+
+def test_en_eski_kaynak_belirler(bekci, saat):
+    bekci.bildir('kare', saat.zaman)
+    bekci.bildir('serit', saat.zaman - 0.7)
+    assert bekci.kontrol() == 0.0
+    assert bekci.nedenler == ["bekci_durdu_serit"]
+
+
+def test_kucuk_degisiklikler_yazilmaz(bekci, motorlar, saat):
+    bekci.bildir('kare')
+    bekci.kontrol(saat.zaman + 0.25)
+    bekci.kontrol(saat.zaman + 0.251)
+    assert len(motorlar.carpanlar) == 1
+
+
+def test_yavastan_durmaya_ayri_tetiklenme(bekci, saat):
+    bekci.bildir('kare')
+    bekci.kontrol(saat.zaman + 0.3)
+    bekci.kontrol(saat.zaman + 0.6)
+    assert bekci.tetiklenme_sayilari == {"yavas": 1, "durdu": 1}
+    assert bekci.nedenler == ["bekci_yavas_kare", "bekci_durdu_kare"]
+
+
+def test_tazelenince_tam_hiza_doner(bekci, motorlar, saat):
+    bekci.bildir('kare')
+    saat.zaman += 0.6
+    bekci.kontrol()
+    assert bekci.durum == "durdu"
+
+    bekci.bildir('kare')
+    assert bekci.kontrol() == 1.0
+    assert bekci.durum == "normal"
+    assert motorlar.carpanlar == [0.0, 1.0]
+    # Düzelme dinleyicilere tetiklenme olarak bildirilmez
+    assert bekci.nedenler == ["bekci_durdu_kare"]
+
+
+def test_en_buyuk_yaslar_tutulur(bekci, saat):
+    bekci.bildir('kare')
+    bekci.kontrol(saat.zaman + 0.4)
+    bekci.kontrol(saat.zaman + 0.1)
+    assert bekci.en_buyuk_yaslar['kare'] == pytest.approx(0.4)
@@ -0,0 +1,131 @@
+"""
+QualityGovernor testleri - seviye düşürme, yükseltme ve histerezis
+"""
+import pytest
+from src.utils.quality_governor import QualityGovernor, FakeMetricsSource
+from config.config import (
+    KALITE_SEVIYELERI,
+    KALITE_DEGERLENDIRME_ARALIGI,
+    KALITE_YUKSELTME_BEKLEMESI,
+    KALITE_SICAKLIK_UYARI,
+    KALITE_SICAKLIK_KRITIK
+)
+
+HEDEF_HIZ = 20.0
+BUTCE = 1.0 / HEDEF_HIZ
+
+
+class SahteSaat:
+    """Elle ilerletilen monoton saat."""
+
+    def __init__(self):
+        self.zaman = 100.0
+
+    def __call__(self):
+        return self.zaman
+
+
+@pytest.fixture
+def saat():
+    return SahteSaat()
+
+
+@pytest.fixture
+def kaynak():
+    return FakeMetricsSource(sicaklik=50.0, cpu=0.3)
+
+
+@pytest.fixture
+def yonetici(saat, kaynak):
+    return QualityGovernor(hedef_hiz=HEDEF_HIZ, kaynak=kaynak, saat=saat)
+
+
+def pencere(yonetici, saat, sure, kare=20):
+    """Bir değerlendirme penceresi boyunca aynı süreyi bildirir ve değerlendirmeyi tetikler."""
+    for _ in range(kare):
+        yonetici.dongu_bildir(sure)
+    saat.zaman += KALITE_DEGERLENDIRME_ARALIGI
+    return yonetici.dongu_bildir(sure)
+
+
+def test_baslangic_en_yuksek_seviye(yonetici):
+    assert yonetici.seviye == KALITE_SEVIYELERI[0]
+
+
+def test_butce_asiminda_bir_seviye_iner(yonetici, saat):
+    pencere(yonetici, saat, BUTCE * 1.5)
+    assert yonetici.seviye_indeksi == 1
+
+    pencere(yonetici, saat, BUTCE * 1.5)
+    assert yonetici.seviye_indeksi == 2
+
+
+def test_degerlendirme_araligi_dolmadan_seviye_degismez(yonetici, saat):
+    for _ in range(50):
+        yonetici.dongu_bildir(BUTCE * 3)
+    saat.zaman += KALITE_DEGERLENDIRME_ARALIGI / 2
+    yonetici.dongu_bildir(BUTCE * 3)
+    assert yonetici.seviye_indeksi == 0
+
+
+def test_en_dusuk_seviyenin_altina_inmez(yonetici, saat):
+    for _ in range(len(KALITE_SEVIYELERI) + 2):
+        pencere(yonetici, saat, BUTCE * 2)
+    assert yonetici.seviye_indeksi == len(KALITE_SEVIYELERI) - 1
+
+
+def test_kritik_sicaklikta_en_dusuk_seviyeye_iner(yonetici, saat, kaynak):
+    kaynak.sicaklik_degeri = KALITE_SICAKLIK_KRITIK
+    pencere(yonetici, saat, BUTCE * 0.1)
+    assert yonetici.seviye_indeksi == len(KALITE_SEVIYELERI) - 1
+
+
+def test_uyari_sicakliginda_iner(yonetici, saat, kaynak):
+    kaynak.sicaklik_degeri = KALITE_SICAKLIK_UYARI
+    pencere(yonetici, saat, BUTCE * 0.1)
+    assert yonetici.seviye_indeksi == 1
+
+
+def test_yukseltme_beklemesi_dolmadan_cikmaz(yonetici, saat):
+    pencere(yonetici, saat, BUTCE * 1.5)
+    assert yonetici.seviye_indeksi == 1
+
+    # Bol pay var ama son değişiklikten bu yana bekleme dolmadı
+    pencere(yonetici, saat, BUTCE * 0.1)
+    assert yonetici.seviye_indeksi == 1
+
+    saat.zaman += KALITE_YUKSELTME_BEKLEMESI
+    pencere(yonetici, saat, BUTCE * 0.1)
+    assert yonetici.seviye_indeksi == 0
+
+
+def test_pay_yetersizse_cikmaz(yonetici, saat):
+    pencere(yonetici, saat, BUTCE * 1.5)
+    saat.zaman += KALITE_YUKSELTME_BEKLEMESI
+
+    # Bütçenin altında ama yükseltme payının üstünde: seviye korunur
+    pencere(yonetici, saat, BUTCE * 0.8)
+    assert yonetici.seviye_indeksi == 1
+
+
+def test_sicaklik_histerezisi(yonetici, saat, kaynak):
+    kaynak.sicaklik_degeri = KALITE_SICAKLIK_UYARI
+    pencere(yonetici, saat, BUTCE * 0.1)
+    assert yonetici.seviye_indeksi == 1
+    saat.zaman += KALITE_YUKSELTME_BEKLEMESI
+
+    # Uyarı sınırının hemen altı: inmez ama histerezis bandında olduğundan çıkmaz
+    kaynak.sicaklik_degeri = KALITE_SICAKLIK_UYARI - 1
+    pencere(yonetici, saat, BUTCE * 0.1)
+    assert yonetici.seviye_indeksi == 1
+
+    # Bandın altına soğuyunca çıkar
+    kaynak.sicaklik_degeri = KALITE_SICAKLIK_UYARI - 10
+    pencere(yonetici, saat, BUTCE * 0.1)
+    assert yonetici.seviye_indeksi == 0
+
+
+def test_cpu_siniri_seviye_dusurur(yonetici, saat, kaynak):
+    kaynak.cpu_degeri = 0.99
+    pencere(yonetici, saat, BUTCE * 0.1)
+    assert yonetici.seviye_indeksi == 1
@@ -0,0 +1,138 @@
+"""
+SignTracker testleri - eşleştirme, onay, kayıp ve çözünürlük ölçekleme
+"""
+import numpy as np
+import pytest
+from src.detection.sign_tracker import SignTracker
+
+
+class SahteDedektor:
+    """Her karede verilen tespitleri döndüren dedektör."""
+
+    def __init__(self, genislik=640, yukseklik=480):
+        self.genislik = genislik
+        self.yukseklik = yukseklik
+        self.tespitler = []
+        self.tam_cagri = 0
+        self.pencereler = []
+
+    def cozunurluk_ayarla(self, cozunurluk):
+        self.genislik, self.yukseklik = cozunurluk
+
+    def tabelalari_tespit_et(self, frame):
+        self.tam_cagri += 1
+        return list(self.tespitler)
+
+    def bolgede_tespit_et(self, frame, bolge):
+        self.pencereler.append(bolge)
+        x0, y0, x1, y1 = bolge
+        return [t for t in self.tespitler
+                if t[2][0] >= x0 and t[2][1] >= y0
+                and t[2][0] + t[2][2] <= x1 and t[2][1] + t[2][3] <= y1]
+
+
+@pytest.fixture
+def kare():
+    return np.zeros((480, 640, 3), np.uint8)
+
+
+@pytest.fixture
+def dedektor():
+    return SahteDedektor()
+
+
+def takipci(dedektor, **secenekler):
+    ayarlar = dict(tam_tespit_araligi=1, onay_sayisi=3, kayip_siniri=2,
+                   iou_esigi=0.3, pencere_payi=0.5)
+    ayarlar.update(secenekler)
+    return SignTracker(dedektor, **ayarlar)
+
+
+def test_onay_sayisina_ulasinca_onaylanir(dedektor, kare):
+    izci = takipci(dedektor)
+    onaylananlar = []
+    izci.dinleyiciler.append(onaylananlar.append)
+    dedektor.tespitler = [("dur", 900.0, (100, 100, 30, 30))]
+
+    assert izci.guncelle(kare) == []
+    assert izci.guncelle(kare) == []
+    onayli = izci.guncelle(kare)
+    assert len(onayli) == 1 and onayli[0].tabela_tipi == "dur"
+    assert izci.tespitler() == [("dur", 900.0, (100, 100, 30, 30))]
+
+    # Dinleyici yalnızca ilk onayda çağrılır
+    izci.guncelle(kare)
+    assert onaylananlar == onayli
+
+
+def test_hareket_eden_tabela_ayni_ize_eslesir(dedektor, kare):
+    izci = takipci(dedektor)
+    for i in range(4):
+        dedektor.tespitler = [("dur", 900.0, (100 + 8 * i, 100, 30, 30))]
+        izci.guncelle(kare)
+    assert len(izci.izler) == 1
+    assert izci.izler[0].isabet == 4
+    assert izci.izler[0].hiz[0] > 0
+
+
+def test_farkli_tip_eslesmez(dedektor, kare):
+    izci = takipci(dedektor)
+    dedektor.tespitler = [("dur", 900.0, (100, 100, 30, 30))]
+    izci.guncelle(kare)
+    dedektor.tespitler = [("park", 900.0, (100, 100, 30, 30))]
+    izci.guncelle(kare)
+    assert sorted(iz.tabela_tipi for iz in izci.izler) == ["dur", "park"]
+
+
+def test_uzak_tespit_yeni_iz_acar(dedektor, kare):
+    izci = takipci(dedektor)
+    dedektor.tespitler = [("dur", 900.0, (100, 100, 30, 30))]
+    izci.guncelle(kare)
+    dedektor.tespitler = [("dur", 900.0, (400, 300, 30, 30))]
+    izci.guncelle(kare)
+    assert [iz.iz_no for iz in izci.izler] == [1, 2]
+    assert izci.izler[0].kayip == 1
+
+
+def test_kayip_sinirinda_iz_silinir(dedektor, kare):
+    izci = takipci(dedektor)
+    dedektor.tespitler = [("dur", 900.0, (100, 100, 30, 30))]
+    for _ in range(3):
+        izci.guncelle(kare)
+    assert len(izci.onaylilar()) == 1
+
+    dedektor.tespitler = []
+    izci.guncelle(kare)
+    assert len(izci.onaylilar()) == 1
+    izci.guncelle(kare)
+    assert izci.izler == []
+
+
+def test_ara_karelerde_pencerede_dogrulanir(dedektor, kare):
+    izci = takipci(dedektor, tam_tespit_araligi=3)
+    dedektor.tespitler = [("dur", 900.0, (100, 100, 30, 30))]
+    for _ in range(3):
+        izci.guncelle(kare)
+    assert dedektor.tam_cagri == 1
+    assert len(dedektor.pencereler) == 2
+    x0, y0, x1, y1 = dedektor.pencereler[0]
+    assert x0 <= 100 and y0 <= 100 and x1 >= 130 and y1 >= 130
+    assert len(izci.onaylilar()) == 1
+
+
+def test_cozunurluk_degisince_izler_olceklenir(dedektor, kare):
+    izci = takipci(dedektor)
+    dedektor.tespitler = [("dur", 900.0, (100, 100, 30, 30))]
+    for _ in range(3):
+        izci.guncelle(kare)
+
+    izci.cozunurluk_ayarla((320, 240))
+    assert (dedektor.genislik, dedektor.yukseklik) == (320, 240)
+    iz = izci.onaylilar()[0]
+    assert iz.bbox() == (50, 50, 15, 15)
+    assert iz.alan == pytest.approx(225.0)
+
+    # Küçük karede aynı tabela onaylı izle eşleşmeye devam eder
+    dedektor.tespitler = [("dur", 225.0, (50, 50, 15, 15))]
+    izci.guncelle(np.zeros((240, 320, 3), np.uint8))
+    assert [i.iz_no for i in izci.onaylilar()] == [iz.iz_no]